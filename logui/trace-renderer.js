@@ -4,6 +4,7 @@
  * Handles:
  * - File upload via input or drag-and-drop
  * - JSON parsing and validation
+ * - Streamed traces (.trace.jsonl) rebuilt into the same trace structure
  * - Error handling for invalid files
  * - UI state updates
  */
@@ -70,9 +71,9 @@ function handleDrop(event) {
 
     const file = event.dataTransfer.files[0];
     if (file) {
-        // Verify it's a JSON file
-        if (!file.name.endsWith('.json') && !file.name.endsWith('.trace.json')) {
-            showError('Arquivo inválido. Por favor, selecione um arquivo .json ou .trace.json');
+        // Verify it's a JSON or JSON Lines file
+        if (!file.name.endsWith('.json') && !file.name.endsWith('.jsonl')) {
+            showError('Arquivo inválido. Por favor, selecione um arquivo .trace.json ou .trace.jsonl');
             return;
         }
 
@@ -91,7 +92,9 @@ function loadTraceFile(file) {
     reader.onload = (event) => {
         try {
             const jsonText = event.target.result;
-            const trace = parseJSON(jsonText);
+            const trace = file.name.endsWith('.jsonl')
+                ? parseTraceStream(jsonText)
+                : parseJSON(jsonText);
 
             // Validate trace structure
             if (!validateTrace(trace)) {
@@ -133,6 +136,79 @@ function parseJSON(text) {
     }
 }
 
+/**
+ * Parse a streamed trace (.trace.jsonl) into the .trace.json structure
+ *
+ * Records: "trace" header, "step" (written as each span ends), "turn"
+ * (closes a turn) and "end" (absent if the conversation was interrupted).
+ * Steps of a turn that never closed are ignored.
+ */
+function parseTraceStream(text) {
+    let header = null;
+    let end = null;
+    const stepsByTurn = new Map();
+    const turns = [];
+
+    const lines = text.split('\n');
+    for (let i = 0; i < lines.length; i++) {
+        const line = lines[i].trim();
+        if (!line) {
+            continue;
+        }
+        let record;
+        try {
+            record = JSON.parse(line);
+        } catch (error) {
+            // A partially written last line is expected in interrupted traces
+            if (i >= lines.length - 2) {
+                break;
+            }
+            throw new Error(`JSON inválido na linha ${i + 1}: ${error.message}`);
+        }
+
+        if (record.record === 'trace') {
+            header = record;
+        } else if (record.record === 'step') {
+            const { record: _kind, turn_id, turn_number, ...step } = record;
+            if (!stepsByTurn.has(turn_id)) {
+                stepsByTurn.set(turn_id, []);
+            }
+            stepsByTurn.get(turn_id).push(step);
+        } else if (record.record === 'turn') {
+            turns.push({
+                turn_id: record.turn_id,
+                turn_number: record.turn_number,
+                start_time: record.start_time,
+                end_time: record.end_time,
+                duration_ms: record.duration_ms,
+                steps: stepsByTurn.get(record.turn_id) || [],
+            });
+            stepsByTurn.delete(record.turn_id);
+        } else if (record.record === 'end') {
+            end = record;
+        }
+    }
+
+    if (!header) {
+        throw new Error('Arquivo .jsonl sem cabeçalho de trace');
+    }
+
+    const startTime = header.start_time;
+    const endTime = end ? end.end_time
+        : (turns.length ? turns[turns.length - 1].end_time : startTime);
+    const durationMs = end ? end.duration_ms
+        : Math.max(0, new Date(endTime) - new Date(startTime));
+
+    return {
+        trace_id: header.trace_id,
+        start_time: startTime,
+        end_time: endTime,
+        duration_ms: durationMs,
+        turns: turns,
+        metadata: header.metadata || {},
+    };
+}
+
 /**
  * Validate trace structure
  */
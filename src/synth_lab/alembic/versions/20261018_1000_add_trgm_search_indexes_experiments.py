@@ -0,0 +1,45 @@
+"""add trigram indexes for experiment name/hypothesis search
+
+The experiment list searches with ILIKE '%term%', which a B-tree index
+cannot serve. GIN trigram indexes (pg_trgm) let Postgres use an index
+scan for the substring match instead of scanning every experiment.
+
+Revision ID: add_trgm_search_exp
+Revises: add_synth_group_id_exp
+Create Date: 2026-10-18 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision: str = "add_trgm_search_exp"
+down_revision: Union[str, None] = "add_synth_group_id_exp"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and add GIN trigram indexes on name and hypothesis."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_experiments_name_trgm",
+        "experiments",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_experiments_hypothesis_trgm",
+        "experiments",
+        ["hypothesis"],
+        postgresql_using="gin",
+        postgresql_ops={"hypothesis": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop trigram indexes (the extension is left installed)."""
+    op.drop_index("idx_experiments_hypothesis_trgm", table_name="experiments")
+    op.drop_index("idx_experiments_name_trgm", table_name="experiments")
@@ -0,0 +1,36 @@
+"""add broker_payloads table for spilled NOTIFY payloads
+
+Revision ID: add_broker_payloads
+Revises: add_trgm_search_exp
+Create Date: 2026-10-18 11:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision: str = "add_broker_payloads"
+down_revision: Union[str, None] = "add_trgm_search_exp"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create broker_payloads table."""
+    op.create_table(
+        "broker_payloads",
+        sa.Column("id", sa.String(length=50), nullable=False),
+        sa.Column("exec_id", sa.String(length=100), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.String(length=50), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_broker_payloads_created", "broker_payloads", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop broker_payloads table."""
+    op.drop_index("idx_broker_payloads_created", table_name="broker_payloads")
+    op.drop_table("broker_payloads")
@@ -0,0 +1,40 @@
+"""add research_events table (execution event log for SSE replay)
+
+Revision ID: add_research_events
+Revises: add_broker_payloads
+Create Date: 2026-10-19 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic
+revision: str = "add_research_events"
+down_revision: Union[str, None] = "add_broker_payloads"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create research_events table."""
+    op.create_table(
+        "research_events",
+        sa.Column("seq", sa.BigInteger(), sa.Identity(always=True), nullable=False),
+        sa.Column("exec_id", sa.String(length=100), nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.String(length=50), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["exec_id"], ["research_executions.exec_id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("seq"),
+    )
+    op.create_index("idx_research_events_exec_seq", "research_events", ["exec_id", "seq"])
+
+
+def downgrade() -> None:
+    """Drop research_events table."""
+    op.drop_index("idx_research_events_exec_seq", table_name="research_events")
+    op.drop_table("research_events")
@@ -25,6 +25,8 @@ from synth_lab.infrastructure.config import (
 )
 from synth_lab.infrastructure.database_v2 import get_database_url, init_database_v2
 from synth_lab.infrastructure.phoenix_tracing import maybe_setup_tracing, shutdown_tracing
+from synth_lab.services.avatar_jobs import stop_avatar_job_queues
+from synth_lab.services.media_processing import shutdown_media_processing
 
 
 @asynccontextmanager
@@ -49,6 +51,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
     # Shutdown
     logger.info("Shutting down synth-lab API...")
+    await stop_avatar_job_queues()
+    shutdown_media_processing()
     shutdown_tracing()
 
 
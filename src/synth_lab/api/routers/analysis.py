@@ -8,10 +8,15 @@ References:
     - OpenAPI: specs/019-experiment-refactor/contracts/analysis-api.yaml
 """
 
+import asyncio
+from collections.abc import Callable
 from datetime import datetime, timezone
+from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from loguru import logger
 from pydantic import BaseModel, Field
+from sqlalchemy.exc import SQLAlchemyError
 
 from synth_lab.api.schemas.analysis import ClusterRequest, CutDendrogramRequest
 from synth_lab.api.schemas.analysis_run import (
@@ -21,13 +26,16 @@ from synth_lab.api.schemas.analysis_run import (
     InsightSchema,
     InsightsResponse,
     InterviewSuggestionsResponse,
+    InterviewSuggestionSchema,
     PaginatedSynthOutcomes,
     RegionAnalysisResponse,
+    RegionSchema,
     SynthAttributesSchema,
     SynthOutcomeResponse)
 from synth_lab.domain.entities.analysis_cache import CacheKeys
-from synth_lab.domain.entities.analysis_run import AggregatedOutcomes, AnalysisConfig
+from synth_lab.domain.entities.analysis_run import AggregatedOutcomes, AnalysisConfig, AnalysisRun
 from synth_lab.domain.entities.chart_data import (
+    AttributeCorrelationChart,
     FailureHeatmapChart,
     OutcomeDistributionChart,
     SankeyFlowChart,
@@ -44,7 +52,8 @@ from synth_lab.domain.entities.explainability import (
     ShapExplanation,
     ShapSummary)
 from synth_lab.domain.entities.outlier_result import ExtremeCasesTable, OutlierResult
-from synth_lab.infrastructure.database_v2 import get_session
+from synth_lab.domain.entities.synth_outcome import SynthOutcome
+from synth_lab.infrastructure.database_v2 import DatabaseConfigError, get_session
 from synth_lab.models.pagination import PaginationParams
 from synth_lab.repositories.analysis_cache_repository import AnalysisCacheRepository
 from synth_lab.repositories.analysis_outcome_repository import AnalysisOutcomeRepository
@@ -54,10 +63,19 @@ from synth_lab.repositories.synth_repository import SynthRepository
 from synth_lab.services.analysis.analysis_cache_service import AnalysisCacheService
 from synth_lab.services.analysis.analysis_execution_service import AnalysisExecutionService
 from synth_lab.services.analysis.analysis_service import AnalysisService
+from synth_lab.services.analysis.chart_response_cache import (
+    etag_matches,
+    get_chart_response_cache)
 from synth_lab.services.experiment_service import ExperimentService
+from synth_lab.services.simulation.analyzer import RegionAnalysisResult, RegionAnalyzer
 from synth_lab.services.simulation.chart_data_service import ChartDataService
 from synth_lab.services.simulation.clustering_service import ClusteringService
+from synth_lab.services.simulation.correlation import CorrelationMethod
 from synth_lab.services.simulation.explainability_service import ExplainabilityService
+from synth_lab.services.simulation.outcome_aggregates import (
+    OutcomeAggregates,
+    get_outcome_aggregates)
+from synth_lab.services.simulation.outcome_model import OutcomeModel
 from synth_lab.services.simulation.outlier_service import OutlierService
 
 router = APIRouter()
@@ -98,6 +116,11 @@ def get_cache_service() -> AnalysisCacheService:
     return AnalysisCacheService()
 
 
+def get_region_analyzer() -> RegionAnalyzer:
+    """Get region analyzer instance."""
+    return RegionAnalyzer()
+
+
 def _convert_config_schema_to_domain(schema: AnalysisConfigSchema) -> AnalysisConfig:
     """Convert API schema to domain entity."""
     return AnalysisConfig(
@@ -337,6 +360,12 @@ async def list_outcomes(
 # Region Analysis Endpoints
 # =============================================================================
 
+# Representative synths listed per region
+REPRESENTATIVES_PER_REGION = 5
+
+# min_failure_rate used for interview suggestions (same default as /regions)
+SUGGESTION_MIN_FAILURE_RATE = 0.3
+
 
 @router.get(
     "/{experiment_id}/analysis/regions",
@@ -354,7 +383,7 @@ async def analyze_regions(
     Identifies clusters of synths with high failure rates.
     """
     service = get_analysis_service()
-    analysis = service.get_analysis(experiment_id)
+    analysis = await asyncio.to_thread(service.get_analysis, experiment_id)
 
     if analysis is None:
         raise HTTPException(
@@ -366,9 +395,41 @@ async def analyze_regions(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Analysis must be completed to analyze regions (status: {analysis.status})")
 
-    # TODO: Implement region analysis using clustering
-    # For now, return empty regions
-    return RegionAnalysisResponse(regions=[])
+    result, _ = await _get_region_analysis(analysis.id, min_failure_rate)
+
+    return RegionAnalysisResponse(
+        regions=[
+            RegionSchema(
+                cluster_id=index,
+                synth_count=region.synth_count,
+                avg_failure_rate=region.failed_rate,
+                common_attributes={
+                    "rule_text": region.rule_text,
+                    "rules": [rule.model_dump() for rule in region.rules],
+                    "synth_percentage": region.synth_percentage,
+                    "success_rate": region.success_rate,
+                    "did_not_try_rate": region.did_not_try_rate,
+                    "failure_delta": region.failure_delta,
+                },
+                representative_synths=members[:REPRESENTATIVES_PER_REGION])
+            for index, (region, members) in enumerate(zip(result.regions, result.members))
+        ])
+
+
+async def _get_region_analysis(
+    analysis_id: str, min_failure_rate: float
+) -> tuple[RegionAnalysisResult, list[SynthOutcome]]:
+    """Load outcomes and run (or reuse cached) region analysis off the event loop."""
+    outcome_repo = get_outcome_repository()
+    outcomes, _ = await asyncio.to_thread(outcome_repo.get_outcomes, analysis_id)
+    if not outcomes:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No outcomes found for this analysis")
+
+    result = await asyncio.to_thread(
+        get_region_analyzer().analyze, outcomes, analysis_id, min_failure_rate)
+    return result, outcomes
 
 
 # =============================================================================
@@ -393,7 +454,7 @@ async def get_interview_suggestions(
     based on high-risk regions.
     """
     service = get_analysis_service()
-    analysis = service.get_analysis(experiment_id)
+    analysis = await asyncio.to_thread(service.get_analysis, experiment_id)
 
     if analysis is None:
         raise HTTPException(
@@ -406,9 +467,34 @@ async def get_interview_suggestions(
             detail="Analysis must be completed for interview suggestions "
             f"(status: {analysis.status})")
 
-    # TODO: Implement interview suggestions based on region analysis
-    # For now, return empty suggestions
-    return InterviewSuggestionsResponse(suggestions=[])
+    result, outcomes = await _get_region_analysis(analysis.id, SUGGESTION_MIN_FAILURE_RATE)
+    failure_rates = {outcome.synth_id: outcome.failed_rate for outcome in outcomes}
+
+    # Round-robin over regions (highest failure first), most typical synths first
+    picks: list[tuple[int, str]] = []
+    for rank in range(max_suggestions):
+        for index, members in enumerate(result.members):
+            if rank < len(members) and len(picks) < max_suggestions:
+                picks.append((index, members[rank]))
+
+    synth_names = await asyncio.to_thread(
+        SynthRepository().get_names, [synth_id for _, synth_id in picks])
+    suggestions = []
+    for index, synth_id in picks:
+        region = result.regions[index]
+        suggestions.append(
+            InterviewSuggestionSchema(
+                synth_id=synth_id,
+                synth_name=synth_names.get(synth_id, ""),
+                reason=(
+                    f"Perfil típico da região de alta falha ({region.rule_text}; "
+                    f"{region.failed_rate:.0%} de falha)"
+                ),
+                failure_rate=failure_rates.get(synth_id, region.failed_rate),
+                cluster_id=index)
+        )
+
+    return InterviewSuggestionsResponse(suggestions=suggestions)
 
 
 # =============================================================================
@@ -480,12 +566,113 @@ async def generate_insights(
 # =============================================================================
 # Chart Endpoints
 # =============================================================================
+#
+# Chart responses are cached in memory per (analysis, chart, params) with a
+# strong ETag; polling with If-None-Match gets 304 without database access.
+
+
+def _get_completed_analysis(experiment_id: str) -> AnalysisRun:
+    """Get the experiment's analysis, which must be completed."""
+    analysis = get_analysis_service().get_analysis(experiment_id)
+    if analysis is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No analysis found for experiment {experiment_id}")
+
+    if analysis.status != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Analysis must be completed (status: {analysis.status})")
+
+    return analysis
+
+
+def _get_outcomes(
+    analysis_id: str,
+    min_count: int = 1,
+    detail: str = "No outcomes found for this analysis") -> list[SynthOutcome]:
+    """Load analysis outcomes, requiring at least min_count synths."""
+    outcomes, _ = get_outcome_repository().get_outcomes(analysis_id)
+    if len(outcomes) < min_count:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    return outcomes
+
+
+def _get_aggregates(analysis_id: str) -> OutcomeAggregates:
+    """Load the analysis' shared outcome aggregates (built once per analysis)."""
+    return get_outcome_aggregates(analysis_id, lambda: _get_outcomes(analysis_id))
+
+
+def _get_precomputed(
+    analysis_id: str, cache_key: str, params: dict[str, Any]
+) -> dict[str, Any] | None:
+    """Get pre-computed chart data when params match the pre-computed ones."""
+    cache_service = get_cache_service()
+    if not cache_service.is_default(cache_key, params):
+        return None
+    return cache_service.get_cached(analysis_id, cache_key)
+
+
+def _experiment_version(experiment_id: str) -> str:
+    """
+    Version of the experiment's chart inputs for the chart response cache.
+
+    updated_at changes with every scorecard update, on any worker.
+    """
+    experiment = get_experiment_service().get_experiment(experiment_id)
+    if experiment is None or experiment.updated_at is None:
+        return ""
+    return experiment.updated_at.isoformat()
+
+
+def _chart_response(
+    request: Request,
+    response: Response,
+    experiment_id: str,
+    chart: str,
+    params: dict[str, Any],
+    compute: Callable[[AnalysisRun], Any]) -> Any:
+    """
+    Serve a chart from the response cache, computing it on a miss.
+
+    Args:
+        request: Incoming request (for If-None-Match).
+        response: Outgoing response (ETag headers are set on it).
+        experiment_id: Experiment ID.
+        chart: Chart name used in the cache key.
+        params: Chart parameters (normalized into the cache key).
+        compute: Builds the chart for the experiment's completed analysis.
+
+    Returns:
+        Chart response model, or a 304 Response if the client's copy is current.
+    """
+    chart_cache = get_chart_response_cache()
+
+    known = chart_cache.current_analysis(experiment_id)
+    cached = chart_cache.get(experiment_id, *known, chart, params) if known else None
+    if cached is None:
+        analysis = _get_completed_analysis(experiment_id)
+        version = _experiment_version(experiment_id)
+        chart_cache.set_current_analysis(experiment_id, analysis.id, version)
+        cached = chart_cache.get(experiment_id, analysis.id, version, chart, params)
+        if cached is None:
+            cached = chart_cache.set(
+                experiment_id, analysis.id, version, chart, params, compute(analysis))
+
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return cached.payload
 
 
 @router.get(
     "/{experiment_id}/analysis/charts/try-vs-success",
     response_model=TryVsSuccessChart)
 async def get_try_vs_success_chart(
+    request: Request,
+    response: Response,
     experiment_id: str,
     attempt_rate_threshold: float = Query(
         default=0.5,
@@ -496,110 +683,79 @@ async def get_try_vs_success_chart(
         default=0.5,
         ge=0.0,
         le=1.0,
-        description="Minimum success rate for high performance quadrants")) -> TryVsSuccessChart:
+        description="Minimum success rate for high performance quadrants"),
+    limit: int | None = Query(
+        default=None, ge=1, le=10000, description="Maximum points (default: all)"),
+    offset: int = Query(default=0, ge=0, description="Points to skip")) -> TryVsSuccessChart:
     """
     Get Try vs Success scatter plot data for an analysis.
 
     Each point represents one synth with attempt rate vs success rate.
-    Uses cache for default parameters (0.5, 0.5).
+    Quadrant counts cover all synths; limit/offset page the points.
+    Uses cache for default parameters (0.5, 0.5, all points).
     """
-    service = get_analysis_service()
-
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
-
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
-
-    # Check cache for default parameters
-    is_default = attempt_rate_threshold == 0.5 and success_rate_threshold == 0.5
-    if is_default:
-        cache_service = get_cache_service()
-        cached = cache_service.get_cached(analysis.id, CacheKeys.TRY_VS_SUCCESS)
+    params = {
+        "x_threshold": attempt_rate_threshold,
+        "y_threshold": success_rate_threshold,
+        "limit": limit,
+        "offset": offset,
+    }
+
+    def compute(analysis: AnalysisRun) -> TryVsSuccessChart:
+        cached = _get_precomputed(analysis.id, CacheKeys.TRY_VS_SUCCESS, params)
         if cached:
             return TryVsSuccessChart.model_validate(cached)
 
-    # Compute on-demand (cache miss or custom parameters)
-    chart_service = get_chart_data_service()
-    outcome_repo = get_outcome_repository()
-
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No outcomes found for this analysis")
+        return get_chart_data_service().get_try_vs_success(
+            simulation_id=analysis.id,
+            outcomes=_get_aggregates(analysis.id),
+            **params)
 
-    return chart_service.get_try_vs_success(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        x_threshold=attempt_rate_threshold,
-        y_threshold=success_rate_threshold)
+    return _chart_response(
+        request, response, experiment_id, CacheKeys.TRY_VS_SUCCESS, params, compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/charts/distribution",
     response_model=OutcomeDistributionChart)
 async def get_distribution_chart(
+    request: Request,
+    response: Response,
     experiment_id: str,
     sort_by: str = Query(
         default="success_rate",
         description="Field to sort by: success_rate, failed_rate, did_not_try_rate"),
     order: str = Query(default="desc", description="Sort order: asc or desc"),
-    limit: int = Query(default=50, ge=1, le=1000, description="Maximum results")) -> OutcomeDistributionChart:
+    limit: int = Query(default=50, ge=1, le=1000, description="Maximum results"),
+    offset: int = Query(default=0, ge=0, description="Sorted results to skip")) -> OutcomeDistributionChart:
     """
     Get outcome distribution chart data for an analysis.
 
     Shows distribution of outcomes across synths.
     Uses cache for default parameters.
     """
-    service = get_analysis_service()
-
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
-
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
+    params = {"sort_by": sort_by, "order": order, "limit": limit, "offset": offset}
 
-    # Check cache for default parameters
-    is_default = sort_by == "success_rate" and order == "desc" and limit == 50
-    if is_default:
-        cache_service = get_cache_service()
-        cached = cache_service.get_cached(analysis.id, CacheKeys.DISTRIBUTION)
+    def compute(analysis: AnalysisRun) -> OutcomeDistributionChart:
+        cached = _get_precomputed(analysis.id, CacheKeys.DISTRIBUTION, params)
         if cached:
             return OutcomeDistributionChart.model_validate(cached)
 
-    # Compute on-demand
-    chart_service = get_chart_data_service()
-    outcome_repo = get_outcome_repository()
+        return get_chart_data_service().get_outcome_distribution(
+            simulation_id=analysis.id,
+            outcomes=_get_aggregates(analysis.id),
+            **params)
 
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No outcomes found for this analysis")
-
-    return chart_service.get_outcome_distribution(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        sort_by=sort_by,
-        order=order,
-        limit=limit)
+    return _chart_response(
+        request, response, experiment_id, CacheKeys.DISTRIBUTION, params, compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/charts/failure-heatmap",
     response_model=FailureHeatmapChart)
 async def get_failure_heatmap_chart(
+    request: Request,
+    response: Response,
     experiment_id: str,
     x_axis: str = Query(default="digital_literacy", description="X-axis attribute"),
     y_axis: str = Query(default="trust_mean", description="Y-axis attribute"),
@@ -613,61 +769,33 @@ async def get_failure_heatmap_chart(
     Creates a 2D binned heatmap showing metric values across two attributes.
     Uses cache for default parameters.
     """
-    service = get_analysis_service()
-
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
-
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
-
     valid_metrics = ["failed_rate", "success_rate", "did_not_try_rate"]
     if metric not in valid_metrics:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid metric: {metric}. Must be one of {valid_metrics}")
 
-    # Check cache for default parameters
-    is_default = (
-        x_axis == "digital_literacy"
-        and y_axis == "trust_mean"
-        and bins == 5
-        and metric == "failed_rate"
-    )
-    if is_default:
-        cache_service = get_cache_service()
-        cached = cache_service.get_cached(analysis.id, CacheKeys.HEATMAP)
+    params = {"x_axis": x_axis, "y_axis": y_axis, "bins": bins, "metric": metric}
+
+    def compute(analysis: AnalysisRun) -> FailureHeatmapChart:
+        cached = _get_precomputed(analysis.id, CacheKeys.HEATMAP, params)
         if cached:
             return FailureHeatmapChart.model_validate(cached)
 
-    # Compute on-demand
-    chart_service = get_chart_data_service()
-    outcome_repo = get_outcome_repository()
-
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No outcomes found for this analysis")
+        return get_chart_data_service().get_failure_heatmap(
+            simulation_id=analysis.id,
+            outcomes=_get_outcomes(analysis.id),
+            **params)
 
-    return chart_service.get_failure_heatmap(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        x_axis=x_axis,
-        y_axis=y_axis,
-        bins=bins,
-        metric=metric)
+    return _chart_response(request, response, experiment_id, CacheKeys.HEATMAP, params, compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/charts/scatter",
     response_model=ScatterCorrelationChart)
 async def get_scatter_correlation_chart(
+    request: Request,
+    response: Response,
     experiment_id: str,
     x_axis: str = Query(default="capability_mean", description="X-axis attribute"),
     y_axis: str = Query(default="success_rate", description="Y-axis attribute"),
@@ -678,49 +806,65 @@ async def get_scatter_correlation_chart(
     Shows correlation between two attributes with optional trend line.
     Uses cache for default parameters.
     """
-    service = get_analysis_service()
-
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
+    params = {"x_axis": x_axis, "y_axis": y_axis, "show_trendline": show_trendline}
 
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
-
-    # Check cache for default parameters
-    is_default = x_axis == "capability_mean" and y_axis == "success_rate"
-    if is_default:
-        cache_service = get_cache_service()
-        cached = cache_service.get_cached(analysis.id, CacheKeys.SCATTER)
+    def compute(analysis: AnalysisRun) -> ScatterCorrelationChart:
+        cached = _get_precomputed(analysis.id, CacheKeys.SCATTER, params)
         if cached:
             return ScatterCorrelationChart.model_validate(cached)
 
-    # Compute on-demand
-    chart_service = get_chart_data_service()
-    outcome_repo = get_outcome_repository()
+        return get_chart_data_service().get_scatter_correlation(
+            simulation_id=analysis.id,
+            outcomes=_get_outcomes(analysis.id),
+            **params)
 
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No outcomes found for this analysis")
+    return _chart_response(request, response, experiment_id, CacheKeys.SCATTER, params, compute)
 
-    return chart_service.get_scatter_correlation(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        x_axis=x_axis,
-        y_axis=y_axis,
-        show_trendline=show_trendline)
+
+@router.get(
+    "/{experiment_id}/analysis/charts/attribute-correlations",
+    response_model=AttributeCorrelationChart)
+async def get_attribute_correlations_chart(
+    request: Request,
+    response: Response,
+    experiment_id: str,
+    attributes: list[str] | None = Query(default=None, description="Attributes to correlate"),
+    method: CorrelationMethod = Query(default="pearson", description="pearson or spearman"),
+    synth_ids: list[str] | None = Query(
+        default=None, description="Restrict to a subgroup of synths")) -> AttributeCorrelationChart:
+    """
+    Get correlations of synth attributes with attempt and success rates.
+
+    Supports custom attribute sets, Spearman rank correlation and subgroups.
+    Uses cache for default parameters.
+    """
+    params = {"attributes": attributes, "method": method, "synth_ids": synth_ids}
+
+    def compute(analysis: AnalysisRun) -> AttributeCorrelationChart:
+        cached = _get_precomputed(analysis.id, CacheKeys.CORRELATIONS, params)
+        if cached:
+            return AttributeCorrelationChart.model_validate(cached)
+
+        try:
+            return get_chart_data_service().get_attribute_correlations(
+                simulation_id=analysis.id,
+                outcomes=_get_outcomes(analysis.id),
+                **params)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e))
+
+    return _chart_response(
+        request, response, experiment_id, CacheKeys.CORRELATIONS, params, compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/charts/sankey-flow",
     response_model=SankeyFlowChart)
 async def get_sankey_flow_chart(
+    request: Request,
+    response: Response,
     experiment_id: str) -> SankeyFlowChart:
     """
     Get Sankey flow chart data for an analysis.
@@ -728,46 +872,26 @@ async def get_sankey_flow_chart(
     Shows outcome flow from population through outcomes to root causes.
     3 levels: Population → Outcomes (did_not_try, failed, success) → Root Causes.
     """
-    service = get_analysis_service()
-    experiment_service = get_experiment_service()
-
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
-
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
-
-    # Get experiment to access scorecard
-    experiment = experiment_service.get_experiment(experiment_id)
-    if experiment is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Experiment {experiment_id} not found")
 
-    if experiment.scorecard_data is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Experiment must have a scorecard for Sankey flow analysis")
+    def compute(analysis: AnalysisRun) -> SankeyFlowChart:
+        # Get experiment to access scorecard
+        experiment = get_experiment_service().get_experiment(experiment_id)
+        if experiment is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Experiment {experiment_id} not found")
 
-    # Get outcomes
-    chart_service = get_chart_data_service()
-    outcome_repo = get_outcome_repository()
+        if experiment.scorecard_data is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Experiment must have a scorecard for Sankey flow analysis")
 
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No outcomes found for this analysis")
+        return get_chart_data_service().get_sankey_flow(
+            analysis_id=analysis.id,
+            outcomes=_get_aggregates(analysis.id),
+            scorecard=experiment.scorecard_data)
 
-    return chart_service.get_sankey_flow(
-        analysis_id=analysis.id,
-        outcomes=outcomes,
-        scorecard=experiment.scorecard_data)
+    return _chart_response(request, response, experiment_id, "sankey_flow", {}, compute)
 
 
 # =============================================================================
@@ -897,6 +1021,10 @@ async def create_auto_analysis_clustering(
     First checks database cache for the recommended K. If not found,
     executes Elbow method, detects optimal K, runs K-Means clustering,
     and caches the result.
+
+    Clustering runs in a worker thread so the event loop stays responsive;
+    the elbow curve is computed once (cached by ClusteringService) and
+    reused by the K-Means run.
     """
     service = get_analysis_service()
     clustering_service = get_clustering_service()
@@ -913,14 +1041,14 @@ async def create_auto_analysis_clustering(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Analysis must be completed (status: {analysis.status})")
 
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
+    outcomes, _ = await asyncio.to_thread(outcome_repo.get_outcomes, analysis.id)
     if not outcomes:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No outcomes found for this analysis")
 
-    # Run elbow method first to get recommended K (fast, no LLM)
-    elbow_data = clustering_service.elbow_method(outcomes)
+    # Run elbow method first to get recommended K (no LLM, cached per analysis)
+    elbow_data = await asyncio.to_thread(clustering_service.elbow_method, outcomes)
     recommended_k = clustering_service._detect_knee_point(elbow_data)
 
     # Check database cache for this K
@@ -930,8 +1058,9 @@ async def create_auto_analysis_clustering(
         _analysis_clustering_cache[f"{analysis.id}:kmeans"] = cached
         return cached
 
-    # Not in cache - execute K-Means with the recommended K
-    result = clustering_service.cluster_kmeans(
+    # Not in cache - execute K-Means with the recommended K (reuses cached elbow)
+    result = await asyncio.to_thread(
+        clustering_service.cluster_kmeans,
         simulation_id=analysis.id,
         outcomes=outcomes,
         n_clusters=recommended_k)
@@ -991,39 +1120,31 @@ async def get_analysis_clustering(
     "/{experiment_id}/analysis/clusters/elbow",
     response_model=list)
 async def get_analysis_elbow(
+    request: Request,
+    response: Response,
     experiment_id: str,
     max_k: int = Query(default=10, ge=2, le=20)) -> list:
     """Get elbow method data for K selection."""
-    service = get_analysis_service()
-    clustering_service = get_clustering_service()
-    outcome_repo = get_outcome_repository()
 
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
-
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
-
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="No outcomes found for this analysis")
+    def compute(analysis: AnalysisRun) -> list:
+        return get_clustering_service().elbow_method(_get_outcomes(analysis.id), max_k=max_k)
 
-    return clustering_service.elbow_method(outcomes, max_k=max_k)
+    return _chart_response(
+        request, response, experiment_id, CacheKeys.ELBOW, {"max_k": max_k}, compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/clusters/dendrogram",
     response_model=HierarchicalResult)
 async def get_analysis_dendrogram(
-    experiment_id: str) -> HierarchicalResult:
-    """Get hierarchical clustering dendrogram data."""
+    experiment_id: str,
+    max_depth: int | None = Query(
+        default=None, ge=1, le=20, description="Truncate tree below this depth")) -> HierarchicalResult:
+    """
+    Get hierarchical clustering dendrogram data.
+
+    The full linkage is computed once and cached; max_depth only limits the payload.
+    """
     service = get_analysis_service()
     clustering_service = get_clustering_service()
     outcome_repo = get_outcome_repository()
@@ -1047,10 +1168,13 @@ async def get_analysis_dendrogram(
 
     cache_key = f"{analysis.id}:hierarchical"
     if cache_key not in _analysis_clustering_cache:
-        result = clustering_service.hierarchical(outcomes)
+        result = await asyncio.to_thread(clustering_service.hierarchical, outcomes)
         _analysis_clustering_cache[cache_key] = result
 
-    return _analysis_clustering_cache[cache_key]
+    result = _analysis_clustering_cache[cache_key]
+    if max_depth is not None:
+        return clustering_service.truncate_dendrogram(result, max_depth)
+    return result
 
 
 @router.get(
@@ -1113,8 +1237,14 @@ async def cut_analysis_dendrogram(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cut only available for hierarchical clustering")
 
-    cut_result = clustering_service.cut_dendrogram(hierarchical_result, request.n_clusters)
+    outcomes = None
+    if clustering_service.needs_outcomes_to_cut(hierarchical_result):
+        outcomes = _get_outcomes(analysis.id)
+    cut_result = clustering_service.cut_dendrogram(
+        hierarchical_result, request.n_clusters, outcomes=outcomes)
     _analysis_clustering_cache[cache_key] = cut_result
+    if request.max_depth is not None:
+        return clustering_service.truncate_dendrogram(cut_result, request.max_depth)
     return cut_result
 
 
@@ -1168,106 +1298,109 @@ def get_outlier_service() -> OutlierService:
     return OutlierService()
 
 
-def get_explainability_service() -> ExplainabilityService:
-    """Get explainability service instance."""
-    return ExplainabilityService()
+def get_explainability_service(analysis: AnalysisRun | None = None) -> ExplainabilityService:
+    """
+    Get explainability service instance.
+
+    With an analysis, the service uses the exact simulation model stored
+    with the run (scorecard scores, scenario and sigma at execution time),
+    so explanations match the run even after the scorecard is edited.
+    Runs without a stored model use the surrogate model fitted on the
+    run's outcomes; the experiment's current scorecard is never used.
+    A cache lookup that fails (database unavailable, unreadable snapshot)
+    counts as a miss.
+    """
+    if analysis is None:
+        return ExplainabilityService()
+
+    try:
+        stored = get_cache_repository().get(analysis.id, CacheKeys.OUTCOME_MODEL)
+        if stored is None:
+            return ExplainabilityService()
+        outcome_model = OutcomeModel.from_dict(stored.data)
+    except (DatabaseConfigError, SQLAlchemyError, KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Stored outcome model unavailable for {analysis.id}, using surrogate: {e}")
+        return ExplainabilityService()
+
+    return ExplainabilityService(outcome_model=outcome_model)
 
 
 @router.get(
     "/{experiment_id}/analysis/extreme-cases",
     response_model=ExtremeCasesTable)
 async def get_analysis_extreme_cases(
+    request: Request,
+    response: Response,
     experiment_id: str,
     n_per_category: int = Query(default=10, ge=1, le=50)) -> ExtremeCasesTable:
     """Get extreme cases for qualitative research."""
-    service = get_analysis_service()
-    outlier_service = get_outlier_service()
-    outcome_repo = get_outcome_repository()
-    synth_repo = SynthRepository()
 
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
+    def compute(analysis: AnalysisRun) -> ExtremeCasesTable:
+        outcomes = _get_outcomes(
+            analysis.id, min_count=10, detail="Extreme cases requires at least 10 synths")
+
+        result = get_outlier_service().get_extreme_cases(
+            simulation_id=analysis.id,
+            outcomes=outcomes,
+            n_per_category=n_per_category)
+
+        # Collect all synth IDs to fetch names
+        all_synth_ids = set()
+        for synth in result.worst_failures:
+            all_synth_ids.add(synth.synth_id)
+        for synth in result.best_successes:
+            all_synth_ids.add(synth.synth_id)
+        for synth in result.unexpected_cases:
+            all_synth_ids.add(synth.synth_id)
+
+        # Fetch synth names
+        synth_repo = SynthRepository()
+        synth_names: dict[str, str] = {}
+        for synth_id in all_synth_ids:
+            try:
+                synth_detail = synth_repo.get_by_id(synth_id)
+                synth_names[synth_id] = synth_detail.nome
+            except Exception:
+                synth_names[synth_id] = ""
 
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
+        # Enrich extreme synths with names
+        for synth in result.worst_failures:
+            synth.synth_name = synth_names.get(synth.synth_id, "")
+        for synth in result.best_successes:
+            synth.synth_name = synth_names.get(synth.synth_id, "")
+        for synth in result.unexpected_cases:
+            synth.synth_name = synth_names.get(synth.synth_id, "")
 
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes or len(outcomes) < 10:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Extreme cases requires at least 10 synths")
-
-    result = outlier_service.get_extreme_cases(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        n_per_category=n_per_category)
-
-    # Collect all synth IDs to fetch names
-    all_synth_ids = set()
-    for synth in result.worst_failures:
-        all_synth_ids.add(synth.synth_id)
-    for synth in result.best_successes:
-        all_synth_ids.add(synth.synth_id)
-    for synth in result.unexpected_cases:
-        all_synth_ids.add(synth.synth_id)
-
-    # Fetch synth names
-    synth_names: dict[str, str] = {}
-    for synth_id in all_synth_ids:
-        try:
-            synth_detail = synth_repo.get_by_id(synth_id)
-            synth_names[synth_id] = synth_detail.nome
-        except Exception:
-            synth_names[synth_id] = ""
-
-    # Enrich extreme synths with names
-    for synth in result.worst_failures:
-        synth.synth_name = synth_names.get(synth.synth_id, "")
-    for synth in result.best_successes:
-        synth.synth_name = synth_names.get(synth.synth_id, "")
-    for synth in result.unexpected_cases:
-        synth.synth_name = synth_names.get(synth.synth_id, "")
+        return result
 
-    return result
+    return _chart_response(
+        request,
+        response,
+        experiment_id,
+        CacheKeys.EXTREME_CASES,
+        {"n_per_category": n_per_category},
+        compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/outliers",
     response_model=OutlierResult)
 async def get_analysis_outliers(
+    request: Request,
+    response: Response,
     experiment_id: str,
     contamination: float = Query(default=0.1, ge=0.01, le=0.5)) -> OutlierResult:
     """Get statistical outliers using Isolation Forest."""
-    service = get_analysis_service()
-    outlier_service = get_outlier_service()
-    outcome_repo = get_outcome_repository()
-
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
-
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
+    params = {"contamination": contamination}
 
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes or len(outcomes) < 10:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Outlier detection requires at least 10 synths")
+    def compute(analysis: AnalysisRun) -> OutlierResult:
+        return get_outlier_service().detect_outliers(
+            simulation_id=analysis.id,
+            outcomes=_get_outcomes(
+                analysis.id, min_count=10, detail="Outlier detection requires at least 10 synths"),
+            **params)
 
-    return outlier_service.detect_outliers(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        contamination=contamination)
+    return _chart_response(request, response, experiment_id, CacheKeys.OUTLIERS, params, compute)
 
 
 # =============================================================================
@@ -1279,151 +1412,106 @@ async def get_analysis_outliers(
     "/{experiment_id}/analysis/shap/summary",
     response_model=ShapSummary)
 async def get_analysis_shap_summary(
+    request: Request,
+    response: Response,
     experiment_id: str) -> ShapSummary:
     """Get global SHAP summary showing feature importance."""
-    service = get_analysis_service()
-    explain_service = get_explainability_service()
-    outcome_repo = get_outcome_repository()
 
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
-
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
+    def compute(analysis: AnalysisRun) -> ShapSummary:
+        outcomes = _get_outcomes(
+            analysis.id, min_count=20, detail="SHAP summary requires at least 20 synths")
+        explain_service = get_explainability_service(analysis)
+        return explain_service.get_shap_summary(
+            simulation_id=analysis.id,
+            outcomes=outcomes)
 
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes or len(outcomes) < 20:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="SHAP summary requires at least 20 synths")
-
-    return explain_service.get_shap_summary(
-        simulation_id=analysis.id,
-        outcomes=outcomes)
+    return _chart_response(
+        request, response, experiment_id, CacheKeys.SHAP_SUMMARY, {}, compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/shap/{synth_id}",
     response_model=ShapExplanation)
 async def get_analysis_shap_explanation(
+    request: Request,
+    response: Response,
     experiment_id: str,
     synth_id: str) -> ShapExplanation:
     """Get SHAP explanation for a specific synth."""
-    service = get_analysis_service()
-    explain_service = get_explainability_service()
-    outcome_repo = get_outcome_repository()
-
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
 
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
+    def compute(analysis: AnalysisRun) -> ShapExplanation:
+        outcomes = _get_outcomes(
+            analysis.id, min_count=20, detail="SHAP explanation requires at least 20 synths")
 
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes or len(outcomes) < 20:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="SHAP explanation requires at least 20 synths")
+        # Find the target synth
+        target_synth = next((o for o in outcomes if o.synth_id == synth_id), None)
+        if target_synth is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Synth {synth_id} not found in analysis")
 
-    # Find the target synth
-    target_synth = next((o for o in outcomes if o.synth_id == synth_id), None)
-    if target_synth is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Synth {synth_id} not found in analysis")
+        explain_service = get_explainability_service(analysis)
+        return explain_service.get_shap_explanation(
+            simulation_id=analysis.id,
+            outcomes=outcomes,
+            synth_id=synth_id)
 
-    return explain_service.get_shap_explanation(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        synth_id=synth_id)
+    return _chart_response(
+        request, response, experiment_id, "shap_explanation", {"synth_id": synth_id}, compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/pdp",
     response_model=PDPResult)
 async def get_analysis_pdp(
+    request: Request,
+    response: Response,
     experiment_id: str,
     feature: str = Query(..., description="Feature to analyze"),
     grid_resolution: int = Query(default=20, ge=5, le=100)) -> PDPResult:
     """Get Partial Dependence Plot for a single feature."""
-    service = get_analysis_service()
-    explain_service = get_explainability_service()
-    outcome_repo = get_outcome_repository()
+    params = {"feature": feature, "grid_resolution": grid_resolution}
 
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
+    def compute(analysis: AnalysisRun) -> PDPResult:
+        outcomes = _get_outcomes(
+            analysis.id, min_count=20, detail="PDP requires at least 20 synths")
+        explain_service = get_explainability_service(analysis)
+        return explain_service.get_pdp(
+            simulation_id=analysis.id,
+            outcomes=outcomes,
+            **params)
 
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
-
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes or len(outcomes) < 20:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="PDP requires at least 20 synths")
-
-    return explain_service.get_pdp(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        feature=feature,
-        grid_resolution=grid_resolution)
+    return _chart_response(request, response, experiment_id, "pdp", params, compute)
 
 
 @router.get(
     "/{experiment_id}/analysis/pdp/comparison",
     response_model=PDPComparison)
 async def get_analysis_pdp_comparison(
+    request: Request,
+    response: Response,
     experiment_id: str,
     features: str = Query(..., description="Comma-separated list of features"),
     grid_resolution: int = Query(default=20, ge=5, le=100)) -> PDPComparison:
     """Get PDP comparison for multiple features."""
-    service = get_analysis_service()
-    explain_service = get_explainability_service()
-    outcome_repo = get_outcome_repository()
-
-    analysis = service.get_analysis(experiment_id)
-    if analysis is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No analysis found for experiment {experiment_id}")
-
-    if analysis.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Analysis must be completed (status: {analysis.status})")
-
-    outcomes, _ = outcome_repo.get_outcomes(analysis.id)
-    if not outcomes or len(outcomes) < 20:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="PDP comparison requires at least 20 synths")
-
     feature_list = [f.strip() for f in features.split(",") if f.strip()]
     if not feature_list:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="At least one feature is required")
 
-    return explain_service.get_pdp_comparison(
-        simulation_id=analysis.id,
-        outcomes=outcomes,
-        features=feature_list,
-        grid_resolution=grid_resolution)
+    params = {"features": feature_list, "grid_resolution": grid_resolution}
+
+    def compute(analysis: AnalysisRun) -> PDPComparison:
+        outcomes = _get_outcomes(
+            analysis.id, min_count=20, detail="PDP comparison requires at least 20 synths")
+        explain_service = get_explainability_service(analysis)
+        return explain_service.get_pdp_comparison(
+            simulation_id=analysis.id,
+            outcomes=outcomes,
+            **params)
+
+    return _chart_response(request, response, experiment_id, "pdp_comparison", params, compute)
 
 
 # =============================================================================
@@ -6,10 +6,14 @@ REST endpoints for experiment documents (summary, prfaq, executive_summary).
 References:
     - Service: synth_lab.services.document_service
     - Service: synth_lab.services.executive_summary_service
+    - Streaming: synth_lab.services.document_stream
     - Schemas: synth_lab.api.schemas.documents
 """
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Response
+import asyncio
+
+from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 
 from synth_lab.api.schemas.documents import (
     DocumentAvailabilityResponse,
@@ -21,10 +25,16 @@ from synth_lab.api.schemas.documents import (
     GenerateDocumentRequest,
     GenerateDocumentResponse,
 )
+from synth_lab.api.sse import sse_response
 from synth_lab.domain.entities.experiment_document import DocumentStatus, DocumentType
 from synth_lab.repositories.analysis_repository import AnalysisRepository
 from synth_lab.repositories.experiment_document_repository import DocumentNotFoundError
 from synth_lab.services.document_service import DocumentService
+from synth_lab.services.document_stream import (
+    document_channel,
+    stream_document_events,
+    stream_generation_events,
+)
 from synth_lab.services.executive_summary_service import ExecutiveSummaryService
 
 router = APIRouter()
@@ -162,6 +172,54 @@ async def get_document_markdown(
     return Response(content=markdown, media_type="text/markdown")
 
 
+@router.get(
+    "/{experiment_id}/documents/{document_type}/stream",
+    summary="Follow a document's generation via SSE")
+async def stream_document(
+    experiment_id: str,
+    document_type: DocumentTypeEnum,
+    source_id: str | None = None,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    after: int | None = Query(
+        default=None, ge=0, description="Characters already received (alternative to header)"),
+) -> StreamingResponse:
+    """
+    Stream a document's content while it is generated.
+
+    Sends the persisted partial content, then live tokens, then the final
+    document. Each frame's SSE id is the content offset after it, so a
+    reconnecting EventSource resumes after Last-Event-ID. For a document that
+    is not generating, only document_completed is sent.
+
+    Events:
+        - document_snapshot: Persisted content from the resume offset ({"offset", "text"})
+        - document_delta: New tokens ({"offset", "text"})
+        - document_completed: Final status, markdown_content and error_message
+
+    For exploration/research documents, source_id is required.
+    For executive_summary, source_id should be None.
+    """
+    service = _get_service()
+    domain_type = _map_type(document_type)
+
+    if service.repository.get_by_experiment(experiment_id, domain_type, source_id) is None:
+        raise HTTPException(
+            status_code=404,
+            detail=str(DocumentNotFoundError(experiment_id, domain_type)))
+
+    resume_from = after or 0
+    if last_event_id:
+        try:
+            resume_from = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+
+    return sse_response(stream_document_events(
+        document_channel(experiment_id, domain_type, source_id),
+        lambda: service.repository.get_by_experiment(experiment_id, domain_type, source_id),
+        resume_from=resume_from))
+
+
 @router.post(
     "/{experiment_id}/documents/{document_type}/generate",
     response_model=GenerateDocumentResponse,
@@ -224,6 +282,54 @@ async def generate_document(
         message=f"Started generation of {document_type.value}")
 
 
+@router.post(
+    "/{experiment_id}/documents/{document_type}/generate/stream",
+    summary="Generate a document, streaming its tokens via SSE")
+async def generate_document_stream(
+    experiment_id: str,
+    document_type: DocumentTypeEnum) -> StreamingResponse:
+    """
+    Start generation of the executive summary and stream its tokens.
+
+    The generation runs detached from the request, so it completes even if
+    the client disconnects; reconnect with GET .../executive_summary/stream.
+    Exploration and research summaries stream from their own endpoints.
+
+    Events:
+        - document_delta: New tokens ({"offset", "text"})
+        - document_completed: Final status, markdown_content and error_message
+        - document_error: Generation could not start (e.g. already in progress)
+    """
+    domain_type = _map_type(document_type)
+    if domain_type != DocumentType.EXECUTIVE_SUMMARY:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Streaming generation of {document_type.value} is started from its "
+            "exploration or research endpoint")
+
+    analysis_id = _get_analysis_id(experiment_id)
+    if not analysis_id:
+        raise HTTPException(
+            status_code=400,
+            detail="No completed analysis found for this experiment. "
+            "Run quantitative analysis first.")
+
+    service = _get_service()
+    exec_summary_service = ExecutiveSummaryService()
+
+    async def generate() -> None:
+        await asyncio.to_thread(
+            exec_summary_service.generate_markdown_summary,
+            experiment_id,
+            analysis_id,
+            asyncio.get_running_loop())
+
+    return sse_response(stream_generation_events(
+        document_channel(experiment_id, domain_type),
+        lambda: service.repository.get_by_experiment(experiment_id, domain_type),
+        generate()))
+
+
 @router.delete(
     "/{experiment_id}/documents/{document_type}",
     summary="Delete a document")
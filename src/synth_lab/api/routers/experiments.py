@@ -272,7 +272,9 @@ async def list_experiments(
     search: str | None = Query(default=None, max_length=200, description="Search by name or hypothesis"),
     tag: str | None = Query(default=None, max_length=50, description="Filter by tag name"),
     sort_by: str = Query(default="created_at", pattern="^(created_at|name)$", description="Sort field"),
-    sort_order: str = Query(default="desc", pattern="^(asc|desc)$", description="Sort order")
+    sort_order: str = Query(default="desc", pattern="^(asc|desc)$", description="Sort order"),
+    cursor: str | None = Query(
+        default=None, max_length=500, description="Keyset cursor (pagination.next_cursor)")
 ) -> PaginatedExperimentSummary:
     """
     List all experiments with pagination, search, sorting, and tag filter.
@@ -281,6 +283,7 @@ async def list_experiments(
     - **tag**: Filters experiments by tag name (exact match)
     - **sort_by**: created_at (default) or name
     - **sort_order**: desc (default) or asc
+    - **cursor**: next_cursor of the previous page; pages by keyset instead of offset
 
     Returns a paginated list of experiments with analysis and interview counts.
     """
@@ -291,8 +294,12 @@ async def list_experiments(
         search=search,
         tag=tag,
         sort_by=sort_by,
-        sort_order=sort_order)
-    result = service.list_experiments(params)
+        sort_order=sort_order,
+        cursor=cursor)
+    try:
+        result = service.list_experiments(params)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     # Convert repository summaries to API schemas
     summaries = [
@@ -9,7 +9,8 @@ References:
     - API contract: specs/024-llm-scenario-exploration/contracts/exploration-api.yaml
 """
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from synth_lab.api.schemas.documents import (
@@ -30,7 +31,13 @@ from synth_lab.api.schemas.exploration import (
     exploration_to_response,
     node_to_response,
 )
+from synth_lab.api.sse import sse_response
+from synth_lab.domain.entities.experiment_document import DocumentType
+from synth_lab.domain.entities.scenario_node import NodeStatus
 from synth_lab.repositories.synth_repository import SynthRepository
+from synth_lab.services.document_builder import ExplorationDocumentBuilder
+from synth_lab.services.document_service import DocumentService
+from synth_lab.services.document_stream import document_channel, stream_generation_events
 from synth_lab.services.exploration.action_catalog import get_action_catalog_service
 from synth_lab.services.exploration.exploration_service import (
     ExperimentNotFoundError,
@@ -77,6 +84,11 @@ def get_prfaq_generator_service() -> ExplorationPRFAQGeneratorService:
     return ExplorationPRFAQGeneratorService()
 
 
+def get_document_builder() -> ExplorationDocumentBuilder:
+    """Get exploration document builder instance."""
+    return ExplorationDocumentBuilder()
+
+
 def _document_to_response(doc) -> DocumentDetailResponse:
     """Convert ExperimentDocument to DocumentDetailResponse."""
     return DocumentDetailResponse(
@@ -126,6 +138,7 @@ async def create_exploration(data: ExplorationCreate) -> ExplorationResponse:
             max_llm_calls=data.max_llm_calls,
             n_executions=data.n_executions,
             seed=data.seed,
+            confidence_level=data.confidence_level,
         )
         logger.info(f"Created exploration {exploration.id} for experiment {data.experiment_id}")
         return exploration_to_response(exploration)
@@ -225,33 +238,60 @@ async def get_exploration(exploration_id: str) -> ExplorationResponse:
 
 
 @router.get("/{exploration_id}/tree", response_model=ExplorationTreeResponse)
-async def get_exploration_tree(exploration_id: str) -> ExplorationTreeResponse:
+async def get_exploration_tree(
+    exploration_id: str,
+    root_node_id: str | None = Query(
+        default=None, description="Only return this node and its descendants"
+    ),
+    max_depth: int | None = Query(
+        default=None, ge=0, description="Levels below the root to include"
+    ),
+    node_status: list[NodeStatus] | None = Query(
+        default=None, alias="status", description="Only return nodes with these statuses"
+    ),
+    limit: int | None = Query(default=None, ge=1, le=1000, description="Maximum nodes"),
+    offset: int = Query(default=0, ge=0, description="Number of nodes to skip"),
+) -> ExplorationTreeResponse:
     """
-    Get the complete exploration tree.
+    Get the exploration tree.
 
-    Returns the exploration with all nodes and status counts.
+    Returns the exploration with its nodes and status counts. Without query
+    parameters the complete tree is returned; root_node_id, max_depth, status,
+    limit and offset select a page of a subtree (fetched in a single query)
+    so large explorations can be rendered incrementally.
 
     Args:
         exploration_id: The exploration ID.
+        root_node_id: Subtree root node ID.
+        max_depth: Levels below the subtree root (absolute depth for the whole tree).
+        node_status: Node statuses to include.
+        limit: Maximum nodes to return.
+        offset: Number of matching nodes to skip.
 
     Returns:
-        ExplorationTreeResponse: Complete tree structure.
+        ExplorationTreeResponse: Tree structure (total_nodes counts all matches).
 
     Raises:
-        404: Exploration not found.
+        404: Exploration or subtree root not found.
     """
     service = get_exploration_service()
     try:
-        tree_data = service.get_exploration_tree(exploration_id)
+        tree_data = service.get_exploration_tree(
+            exploration_id,
+            root_node_id=root_node_id,
+            max_depth=max_depth,
+            statuses=[s.value for s in node_status] if node_status else None,
+            limit=limit,
+            offset=offset,
+        )
         return ExplorationTreeResponse(
             exploration=exploration_to_response(tree_data["exploration"]),
             nodes=[node_to_response(node) for node in tree_data["nodes"]],
             node_count_by_status=tree_data["node_count_by_status"],
+            total_nodes=tree_data["total_nodes"],
         )
-    except ExplorationNotFoundError:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=f"Exploration {exploration_id} not found"
-        )
+    except ExplorationNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.get("/{exploration_id}/winning-path", response_model=WinningPathResponse | None)
@@ -298,6 +338,53 @@ async def get_winning_path(exploration_id: str) -> WinningPathResponse | None:
         )
 
 
+# =============================================================================
+# Document Endpoints - Build
+# =============================================================================
+
+
+@router.post(
+    "/{exploration_id}/documents/generate",
+    response_model=list[DocumentDetailResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def generate_exploration_documents(exploration_id: str) -> list[DocumentDetailResponse]:
+    """
+    Generate the summary (with image) and the PRFAQ of an exploration together.
+
+    Both documents share one load of the exploration and are generated
+    concurrently. Documents whose generation failed are returned with
+    status "failed" and an error message.
+
+    Args:
+        exploration_id: The exploration ID.
+
+    Returns:
+        list[DocumentDetailResponse]: Summary and PRFAQ documents.
+
+    Raises:
+        404: Exploration not found.
+        409: Summary or PRFAQ generation already in progress.
+        422: Exploration is not in a completed state.
+    """
+    builder = get_document_builder()
+    try:
+        result = await builder.build(exploration_id)
+        logger.info(
+            f"Generated documents for exploration {exploration_id} "
+            f"(timings: {result.timings_ms})"
+        )
+        return [_document_to_response(doc) for doc in result.documents.values()]
+    except ValueError as e:
+        if "not found" in str(e).lower():
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except SummaryNotCompletedError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except (SummaryGenerationInProgressError, PRFAQGenerationInProgressError) as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
 # =============================================================================
 # Document Endpoints - Summary
 # =============================================================================
@@ -341,6 +428,47 @@ async def generate_exploration_summary(exploration_id: str) -> DocumentDetailRes
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
 
 
+@router.post("/{exploration_id}/documents/summary/generate/stream")
+async def stream_exploration_summary_generation(exploration_id: str) -> StreamingResponse:
+    """
+    Generate the exploration summary, streaming its tokens via SSE.
+
+    The generation runs detached from the request and persists the partial
+    summary as it is written: if the client disconnects, the summary still
+    completes and can be followed again through
+    GET /experiments/{experiment_id}/documents/exploration_summary/stream.
+
+    Events:
+        - document_delta: New tokens ({"offset", "text"}; SSE id = offset after them)
+        - document_completed: Final status, markdown_content (with image) and error_message
+        - document_error: Generation could not start (e.g. not completed, in progress)
+
+    Raises:
+        404: Exploration not found.
+    """
+    try:
+        exploration = get_exploration_service().get_exploration(exploration_id)
+    except ExplorationNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Exploration {exploration_id} not found"
+        )
+
+    experiment_id = exploration.experiment_id
+    builder = get_document_builder()
+    document_repo = DocumentService().repository
+
+    async def generate() -> None:
+        result = await builder.build(
+            exploration_id, documents=(DocumentType.EXPLORATION_SUMMARY,))
+        result.raise_for(DocumentType.EXPLORATION_SUMMARY)
+
+    return sse_response(stream_generation_events(
+        document_channel(experiment_id, DocumentType.EXPLORATION_SUMMARY, exploration_id),
+        lambda: document_repo.get_by_experiment(
+            experiment_id, DocumentType.EXPLORATION_SUMMARY, source_id=exploration_id),
+        generate()))
+
+
 @router.get(
     "/{exploration_id}/documents/summary",
     response_model=DocumentDetailResponse | None,
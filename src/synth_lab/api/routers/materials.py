@@ -427,13 +427,12 @@ async def retry_description(
             detail=f"Cannot retry: current status is {material.description_status.value}",
         )
 
-    # TODO: Queue description generation (Phase 5)
-    # For now, just update status to pending
     service.repository.update_description(
         material_id=material_id,
         description=None,
         status=DescriptionStatus.PENDING,
     )
+    service.schedule_media_processing(material_id, thumbnail=False)
 
     return RetryDescriptionResponse(
         material_id=material_id,
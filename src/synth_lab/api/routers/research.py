@@ -8,9 +8,11 @@ References:
     - SSE Spec: https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events
 """
 
+import json
 from collections.abc import AsyncGenerator
+from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from loguru import logger
 
@@ -19,6 +21,8 @@ from synth_lab.api.schemas.documents import (
     DocumentStatusEnum,
     DocumentTypeEnum,
 )
+from synth_lab.api.sse import sse_response
+from synth_lab.domain.entities.experiment_document import DocumentType
 from synth_lab.models.events import InterviewMessageEvent
 from synth_lab.models.pagination import PaginatedResponse, PaginationParams
 from synth_lab.models.research import (
@@ -31,7 +35,9 @@ from synth_lab.models.research import (
     TranscriptDetail,
     TranscriptSummary,
 )
+from synth_lab.services.document_builder import ResearchDocumentBuilder
 from synth_lab.services.document_service import DocumentService
+from synth_lab.services.document_stream import document_channel, stream_generation_events
 from synth_lab.services.errors import ExecutionNotFoundError
 from synth_lab.services.message_broker import MessageBroker
 from synth_lab.services.research_prfaq_generator_service import (
@@ -78,6 +84,11 @@ def get_prfaq_generator_service() -> ResearchPRFAQGeneratorService:
     return ResearchPRFAQGeneratorService()
 
 
+def get_document_builder() -> ResearchDocumentBuilder:
+    """Get research document builder instance."""
+    return ResearchDocumentBuilder()
+
+
 def _document_to_response(doc) -> DocumentDetailResponse:
     """Convert ExperimentDocument to DocumentDetailResponse."""
     return DocumentDetailResponse(
@@ -158,6 +169,64 @@ async def get_transcript(exec_id: str, synth_id: str) -> TranscriptDetail:
     return service.get_transcript(exec_id, synth_id)
 
 
+# =============================================================================
+# Document Endpoints - Build
+# =============================================================================
+
+
+@router.post(
+    "/{exec_id}/documents/generate",
+    response_model=list[DocumentDetailResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def generate_research_documents(
+    exec_id: str,
+    request: SummaryGenerateRequest | None = None,
+) -> list[DocumentDetailResponse]:
+    """
+    Generate the summary (with image) and the PRFAQ of a research execution.
+
+    Transcripts are loaded once; the PRFAQ is generated from the new summary
+    in memory, concurrently with the summary image. Documents whose
+    generation failed are returned with status "failed" and an error message.
+
+    Args:
+        exec_id: The execution ID.
+
+    Returns:
+        list[DocumentDetailResponse]: Summary and PRFAQ documents.
+
+    Raises:
+        404: Execution not found.
+        409: Summary or PRFAQ generation already in progress.
+        422: Execution is not completed, not linked or has no transcripts.
+    """
+    builder = get_document_builder()
+
+    if request is None:
+        request = SummaryGenerateRequest()
+
+    try:
+        result = await builder.build(exec_id, model=request.model)
+        logger.info(f"Generated documents for execution {exec_id} (timings: {result.timings_ms})")
+        return [_document_to_response(doc) for doc in result.documents.values()]
+    except ExecutionNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Execution not found",
+        )
+    except (ExecutionNotCompletedError, NoTranscriptsError, NotLinkedToExperimentError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        )
+    except (SummaryGenerationInProgressError, PRFAQGenerationInProgressError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e),
+        )
+
+
 # =============================================================================
 # Document Endpoints - Summary
 # =============================================================================
@@ -231,6 +300,57 @@ async def generate_research_summary(
         )
 
 
+@router.post("/{exec_id}/documents/summary/generate/stream")
+async def stream_research_summary_generation(
+    exec_id: str,
+    request: SummaryGenerateRequest | None = None,
+) -> StreamingResponse:
+    """
+    Generate the summary of a research execution, streaming its tokens via SSE.
+
+    The generation runs detached from the request and persists the partial
+    summary as it is written: if the client disconnects, the summary still
+    completes and can be followed again through
+    GET /experiments/{experiment_id}/documents/research_summary/stream.
+
+    Events:
+        - document_delta: New tokens ({"offset", "text"}; SSE id = offset after them)
+        - document_completed: Final status, markdown_content (with image) and error_message
+        - document_error: Generation could not start (e.g. not completed, in progress)
+
+    Raises:
+        404: Execution not found.
+        422: Execution not linked to an experiment.
+    """
+    try:
+        execution = get_research_service().get_execution(exec_id)
+    except ExecutionNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Execution not found")
+    if not execution.experiment_id:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(NotLinkedToExperimentError(exec_id)),
+        )
+
+    if request is None:
+        request = SummaryGenerateRequest()
+
+    experiment_id = execution.experiment_id
+    builder = get_document_builder()
+    document_repo = get_document_service().repository
+
+    async def generate() -> None:
+        result = await builder.build(
+            exec_id, model=request.model, documents=(DocumentType.RESEARCH_SUMMARY,))
+        result.raise_for(DocumentType.RESEARCH_SUMMARY)
+
+    return sse_response(stream_generation_events(
+        document_channel(experiment_id, DocumentType.RESEARCH_SUMMARY, exec_id),
+        lambda: document_repo.get_by_experiment(
+            experiment_id, DocumentType.RESEARCH_SUMMARY, source_id=exec_id),
+        generate()))
+
+
 @router.get(
     "/{exec_id}/documents/summary",
     response_model=DocumentDetailResponse | None,
@@ -432,16 +552,58 @@ async def execute_research(request: ResearchExecuteRequest) -> ResearchExecuteRe
     return await service.execute_research(request)
 
 
+def _event_to_sse(
+    exec_id: str,
+    event_type: str,
+    data: dict,
+    timestamp: datetime,
+    seq: int | None = None,
+    is_replay: bool = False) -> str:
+    """Format a logged or live execution event as an SSE frame (id line = seq)."""
+    if event_type == "message":
+        event = InterviewMessageEvent(
+            event_type="message",
+            exec_id=exec_id,
+            synth_id=data.get("synth_id"),
+            turn_number=data.get("turn_number"),
+            speaker=data.get("speaker"),
+            text=data.get("text"),
+            sentiment=data.get("sentiment"),
+            timestamp=timestamp,
+            is_replay=is_replay)
+        return event.to_sse(seq)
+
+    if event_type == "transcription_completed":
+        data = {
+            "successful_count": data.get("successful_count", 0),
+            "failed_count": data.get("failed_count", 0),
+        }
+    elif event_type == "interview_completed":
+        data = {"synth_id": data.get("synth_id", ""), "total_turns": data.get("total_turns", 0)}
+
+    id_line = f"id: {seq}\n" if seq is not None else ""
+    return f"{id_line}event: {event_type}\ndata: {json.dumps(data)}\n\n"
+
+
 @router.get("/{exec_id}/stream")
-async def stream_research_messages(exec_id: str) -> StreamingResponse:
+async def stream_research_messages(
+    exec_id: str,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    after: int | None = Query(
+        default=None, ge=0, description="Resume after this event ID (alternative to header)"),
+) -> StreamingResponse:
     """
     Stream interview messages in real-time via Server-Sent Events.
 
     Connects to receive real-time updates for all interviews in an execution.
-    First sends any historical messages (replay), then streams live messages.
+    First replays the execution's event log (one ranged query), then streams
+    live messages. Every logged event carries its sequence number as the SSE
+    id, so a reconnecting EventSource resumes after Last-Event-ID without
+    gaps or duplicates.
 
     Events:
         - message: Interview message (interviewer or interviewee turn)
+        - summary_partial: Running synthesis updated (content, interview_count)
         - transcription_completed: All interviews finished, summary generation starting
         - execution_completed: All processing finished (including summary)
 
@@ -462,75 +624,80 @@ async def stream_research_messages(exec_id: str) -> StreamingResponse:
     except ExecutionNotFoundError:
         raise HTTPException(status_code=404, detail="Execution not found")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
-        # 1. REPLAY: Send historical messages from database first
+    resume_after = after or 0
+    if last_event_id:
         try:
-            transcripts_response = research_service.get_transcripts(exec_id)
-            for transcript_summary in transcripts_response.data:
-                # Get full transcript with messages
-                transcript = research_service.get_transcript(exec_id, transcript_summary.synth_id)
-                for i, msg in enumerate(transcript.messages):
-                    event = InterviewMessageEvent(
-                        event_type="message",
-                        exec_id=exec_id,
-                        synth_id=transcript.synth_id,
-                        turn_number=i + 1,
-                        speaker=msg.speaker,  # type: ignore
-                        text=msg.text,
-                        timestamp=transcript.timestamp,
-                        is_replay=True)
-                    yield event.to_sse()
-        except Exception:
-            pass  # No transcripts yet, continue to live streaming
-
-        # 2. If execution already completed, send completion event and exit
-        if execution.status.value in ["completed", "failed"]:
-            yield "event: execution_completed\ndata: {}\n\n"
-            return
-
-        # 3. LIVE: Subscribe to new messages
+            resume_after = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+
+    async def event_generator() -> AsyncGenerator[str, None]:
+        # 1. SUBSCRIBE FIRST: anything published from now on is buffered, and
+        # anything published earlier was logged before, so the replay has it
         queue = broker.subscribe(exec_id)
+        last_seq = resume_after
         try:
+            # 2. REPLAY: event log after the last seen sequence number
+            events = research_service.get_events(exec_id, after_seq=last_seq)
+            for logged in events:
+                yield _event_to_sse(
+                    exec_id, logged.event_type, logged.data, logged.timestamp,
+                    seq=logged.seq, is_replay=True)
+                last_seq = logged.seq
+                if logged.event_type == "execution_completed":
+                    return
+
+            if not events and resume_after == 0:
+                # Executions streamed before the event log existed: replay transcripts
+                for transcript in research_service.get_transcript_details(exec_id):
+                    for i, msg in enumerate(transcript.messages):
+                        yield _event_to_sse(
+                            exec_id,
+                            "message",
+                            {
+                                "synth_id": transcript.synth_id,
+                                "turn_number": i + 1,
+                                "speaker": msg.speaker,
+                                "text": msg.text,
+                            },
+                            transcript.timestamp,
+                            is_replay=True)
+
+            # 3. If execution already completed, send completion event and exit
+            if execution.status.value in ["completed", "failed"]:
+                yield "event: execution_completed\ndata: {}\n\n"
+                return
+
+            # 4. LIVE: skip what the replay already sent; refill from the log if we fell behind
+            dropped = queue.dropped
             while True:
                 message = await queue.get()
-                if message is None:  # Sentinel - execution finished
-                    yield "event: execution_completed\ndata: {}\n\n"
+
+                if queue.dropped != dropped:
+                    dropped = queue.dropped
+                    for logged in research_service.get_events(exec_id, after_seq=last_seq):
+                        yield _event_to_sse(
+                            exec_id, logged.event_type, logged.data, logged.timestamp,
+                            seq=logged.seq, is_replay=True)
+                        last_seq = logged.seq
+                        if logged.event_type == "execution_completed":
+                            return
+
+                if message is None:  # Sentinel - execution finished (or client too slow)
+                    if not queue.disconnected:
+                        yield "event: execution_completed\ndata: {}\n\n"
                     break
 
-                # Handle transcription_completed event (different data structure)
-                if message.event_type == "transcription_completed":
-                    yield (
-                        f"event: transcription_completed\n"
-                        f"data: {{"
-                        f'"successful_count": {message.data.get("successful_count", 0)}, '
-                        f'"failed_count": {message.data.get("failed_count", 0)}'
-                        f"}}\n\n"
-                    )
-                    continue
-
-                # Handle interview_completed event (single interview finished)
-                if message.event_type == "interview_completed":
-                    yield (
-                        f"event: interview_completed\n"
-                        f"data: {{"
-                        f'"synth_id": "{message.data.get("synth_id", "")}", '
-                        f'"total_turns": {message.data.get("total_turns", 0)}'
-                        f"}}\n\n"
-                    )
-                    continue
-
-                # Handle message events
-                event = InterviewMessageEvent(
-                    event_type=message.event_type,
-                    exec_id=exec_id,
-                    synth_id=message.data.get("synth_id"),
-                    turn_number=message.data.get("turn_number"),
-                    speaker=message.data.get("speaker"),
-                    text=message.data.get("text"),
-                    sentiment=message.data.get("sentiment"),
-                    timestamp=message.timestamp,
-                    is_replay=False)
-                yield event.to_sse()
+                if message.seq is not None:
+                    if message.seq <= last_seq:
+                        continue  # Already sent during replay
+                    last_seq = message.seq
+
+                yield _event_to_sse(
+                    exec_id, message.event_type, message.data, message.timestamp,
+                    seq=message.seq)
+                if message.event_type == "execution_completed":
+                    break
         finally:
             broker.unsubscribe(exec_id, queue)
 
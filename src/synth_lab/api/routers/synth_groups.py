@@ -20,6 +20,7 @@ from synth_lab.api.schemas.synth_groups import (
 )
 from synth_lab.models.pagination import PaginatedResponse, PaginationParams
 from synth_lab.repositories.synth_group_repository import SynthGroupSummary
+from synth_lab.services.avatar_service import AvatarService
 from synth_lab.services.synth_group_service import SynthGroupService
 
 router = APIRouter()
@@ -73,6 +74,14 @@ class SynthGroupResponse(BaseModel):
     created_at: datetime
 
 
+class AvatarWarmUpResponse(BaseModel):
+    """Response schema for avatar warm-up of a synth group."""
+
+    group_id: str
+    synth_count: int = Field(description="Synths in the group.")
+    queued: int = Field(description="Synths without avatar queued for generation.")
+
+
 def get_synth_group_service() -> SynthGroupService:
     """Get synth group service instance."""
     return SynthGroupService()
@@ -206,3 +215,24 @@ async def delete_synth_group(group_id: str) -> None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Synth group {group_id} not found"
         )
+
+
+@router.post(
+    "/{group_id}/avatars/warm-up",
+    response_model=AvatarWarmUpResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def warm_up_group_avatars(group_id: str) -> AvatarWarmUpResponse:
+    """
+    Pre-generate avatars for all synths of a group in the background.
+
+    Synths that already have an avatar (or are already queued) are skipped.
+    Returns immediately with the number of synths queued.
+    """
+    if get_synth_group_service().get_group(group_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Synth group {group_id} not found"
+        )
+
+    synth_count, queued = AvatarService().warm_up_group(group_id)
+    return AvatarWarmUpResponse(group_id=group_id, synth_count=synth_count, queued=queued)
@@ -151,6 +151,9 @@ class CutDendrogramRequest(BaseModel):
     """Request body for cutting dendrogram."""
 
     n_clusters: int = Field(ge=2, le=50, description="Number of clusters to cut into.")
+    max_depth: int | None = Field(
+        default=None, ge=1, le=20, description="Truncate returned tree below this depth."
+    )
 
 
 # =============================================================================
@@ -57,6 +57,14 @@ class ExplorationCreate(BaseModel):
         default=None,
         description="Random seed for reproducibility.")
 
+    confidence_level: float | None = Field(
+        default=None,
+        ge=0.5,
+        lt=1.0,
+        description="Confidence level for success_rate intervals; prunes nodes that are "
+        "not significantly better (None = compare point estimates).",
+        json_schema_extra={"example": 0.95})
+
 
 # ========== Response Schemas ==========
 
@@ -78,6 +86,7 @@ class ConfigResponse(BaseModel):
     n_executions: int
     sigma: float
     seed: int | None
+    confidence_level: float | None = None
 
 
 class ExplorationSummary(BaseModel):
@@ -124,6 +133,9 @@ class SimulationResultsResponse(BaseModel):
     success_rate: float
     fail_rate: float
     did_not_try_rate: float
+    success_std_error: float | None = None
+    success_ci_low: float | None = None
+    success_ci_high: float | None = None
 
 
 class ScenarioNodeResponse(BaseModel):
@@ -150,8 +162,11 @@ class ExplorationTreeResponse(BaseModel):
     """Response for exploration tree."""
 
     exploration: ExplorationResponse = Field(description="Exploration data.")
-    nodes: list[ScenarioNodeResponse] = Field(description="All nodes in tree.")
+    nodes: list[ScenarioNodeResponse] = Field(description="Nodes in tree (or requested page).")
     node_count_by_status: dict[str, int] = Field(description="Count by status.")
+    total_nodes: int | None = Field(
+        default=None, description="Nodes matching the subtree/depth/status filters."
+    )
 
 
 class PathStepResponse(BaseModel):
@@ -240,7 +255,8 @@ def exploration_to_response(exploration) -> ExplorationResponse:
             max_llm_calls=exploration.config.max_llm_calls,
             n_executions=exploration.config.n_executions,
             sigma=exploration.config.sigma,
-            seed=exploration.config.seed),
+            seed=exploration.config.seed,
+            confidence_level=exploration.config.confidence_level),
         status=exploration.status.value,
         current_depth=exploration.current_depth,
         total_nodes=exploration.total_nodes,
@@ -257,7 +273,10 @@ def node_to_response(node) -> ScenarioNodeResponse:
         simulation_results = SimulationResultsResponse(
             success_rate=node.simulation_results.success_rate,
             fail_rate=node.simulation_results.fail_rate,
-            did_not_try_rate=node.simulation_results.did_not_try_rate)
+            did_not_try_rate=node.simulation_results.did_not_try_rate,
+            success_std_error=node.simulation_results.success_std_error,
+            success_ci_low=node.simulation_results.success_ci_low,
+            success_ci_high=node.simulation_results.success_ci_high)
 
     return ScenarioNodeResponse(
         id=node.id,
@@ -0,0 +1,26 @@
+"""
+Server-Sent Events responses for synth-lab API.
+
+Wraps SSE frames in a streaming response that proxies do not buffer.
+
+References:
+    - SSE Spec: https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events
+
+Sample usage:
+    return sse_response(stream_document_events(channel, load_document))
+"""
+
+from collections.abc import AsyncIterable
+
+from fastapi.responses import StreamingResponse
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse_response(events: AsyncIterable[str]) -> StreamingResponse:
+    """Wrap SSE frames in a non-buffered streaming response."""
+    return StreamingResponse(events, media_type="text/event-stream", headers=dict(SSE_HEADERS))
@@ -81,6 +81,8 @@ class CacheKeys:
 
     # Phase 5: Explainability
     SHAP_SUMMARY = "shap_summary"
+    # Simulation inputs of the run (scorecard scores, scenario, sigma)
+    OUTCOME_MODEL = "outcome_model"
 
     # AI-Generated Insights (Individual Charts)
     INSIGHT_TRY_VS_SUCCESS = "insight_try_vs_success"
@@ -196,10 +196,10 @@ class AttributeCorrelation(BaseModel):
     attribute: str = Field(description="Attribute name (e.g., 'capability_mean').")
     attribute_label: str = Field(description="Display label in Portuguese.")
     correlation_attempt: float = Field(
-        ge=-1.0, le=1.0, description="Pearson correlation with attempt_rate."
+        ge=-1.0, le=1.0, description="Correlation (Pearson or Spearman) with attempt_rate."
     )
     correlation_success: float = Field(
-        ge=-1.0, le=1.0, description="Pearson correlation with success_rate."
+        ge=-1.0, le=1.0, description="Correlation (Pearson or Spearman) with success_rate."
     )
     p_value_attempt: float = Field(ge=0.0, description="P-value for attempt correlation.")
     p_value_success: float = Field(ge=0.0, description="P-value for success correlation.")
@@ -215,6 +215,9 @@ class AttributeCorrelationChart(BaseModel):
         description="Correlations sorted by abs(correlation_success) desc."
     )
     total_synths: int = Field(description="Total number of synths analyzed.")
+    method: Literal["pearson", "spearman"] = Field(
+        default="pearson", description="Correlation method."
+    )
 
 
 # =============================================================================
@@ -17,9 +17,9 @@ Expected Output:
 """
 
 from datetime import UTC, datetime
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 
 class ClusterProfile(BaseModel):
@@ -108,7 +108,9 @@ class HierarchicalResult(BaseModel):
     linkage_method: str = Field(..., description="Linkage method used")
     features_used: list[str] = Field(..., description="Features used for clustering")
     nodes: list[DendrogramNode] = Field(..., description="Dendrogram nodes")
-    linkage_matrix: list[list[float]] = Field(..., description="Scipy linkage matrix")
+    linkage_matrix: list[list[float]] = Field(
+        ..., description="Scipy linkage matrix (empty when the dendrogram is truncated)"
+    )
     suggested_cuts: list[SuggestedCut] = Field(
         default_factory=list, description="Suggested cut points"
     )
@@ -117,16 +119,25 @@ class HierarchicalResult(BaseModel):
     )
     n_clusters: int | None = Field(None, description="Number of clusters if cut")
     cut_height: float | None = Field(None, description="Cut height if cut applied")
+    n_micro_clusters: int | None = Field(
+        None, description="Micro-clusters linked instead of individual synths (large analyses)"
+    )
+    truncated_depth: int | None = Field(
+        None, description="Depth at which the dendrogram was truncated, if any"
+    )
     created_at: str = Field(
         default_factory=lambda: datetime.now(UTC).isoformat(),
         description="Creation timestamp",
     )
 
+    # Full linkage kept server-side so cuts never recompute it (not serialized)
+    _linkage_tree: Any = PrivateAttr(default=None)
+
     @computed_field
     @property
     def total_synths(self) -> int:
-        """Get total number of synths (leaf nodes)."""
-        return sum(1 for node in self.nodes if node.synth_id is not None)
+        """Get total number of synths (sum of leaf counts)."""
+        return sum(node.count for node in self.nodes if node.left_child is None)
 
     @computed_field
     @property
@@ -157,8 +168,8 @@ class HierarchicalResult(BaseModel):
             if not node:
                 return {"id": str(node_id), "height": 0, "count": 1, "children": None}
 
-            # Leaf node
-            if node.synth_id is not None:
+            # Leaf node (synth, micro-cluster or truncated subtree)
+            if node.left_child is None and node.right_child is None:
                 return {
                     "id": str(node.id),
                     "height": node.distance,
@@ -94,6 +94,8 @@ class ExplorationConfig(BaseModel):
         n_executions: Monte Carlo executions per simulation (10-1000)
         sigma: Standard deviation for noise in simulations
         seed: Random seed for reproducibility
+        confidence_level: Confidence level for success_rate intervals
+            (None compares point estimates only)
     """
 
     beam_width: int = Field(
@@ -136,6 +138,13 @@ class ExplorationConfig(BaseModel):
         description="Random seed for reproducibility.",
     )
 
+    confidence_level: float | None = Field(
+        default=None,
+        ge=0.5,
+        lt=1.0,
+        description="Confidence level for success_rate intervals (None = point estimates).",
+    )
+
 
 class Exploration(BaseModel):
     """
@@ -104,6 +104,9 @@ class SimulationResults(BaseModel):
         success_rate: Rate of successful outcomes [0, 1]
         fail_rate: Rate of failed outcomes [0, 1]
         did_not_try_rate: Rate of did-not-try outcomes [0, 1]
+        success_std_error: Standard error of success_rate (None if not computed)
+        success_ci_low: Lower confidence bound of success_rate (None if not computed)
+        success_ci_high: Upper confidence bound of success_rate (None if not computed)
     """
 
     success_rate: float = Field(
@@ -124,6 +127,26 @@ class SimulationResults(BaseModel):
         description="Rate of did-not-try outcomes.",
     )
 
+    success_std_error: float | None = Field(
+        default=None,
+        ge=0.0,
+        description="Standard error of success_rate.",
+    )
+
+    success_ci_low: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Lower confidence bound of success_rate.",
+    )
+
+    success_ci_high: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Upper confidence bound of success_rate.",
+    )
+
     @model_validator(mode="after")
     def validate_rates_sum(self) -> Self:
         """Ensure rates sum to approximately 1.0."""
@@ -132,6 +155,30 @@ class SimulationResults(BaseModel):
             raise ValueError(f"Rates must sum to 1.0, got {total}")
         return self
 
+    def has_interval(self) -> bool:
+        """Whether a success_rate confidence interval is available."""
+        return self.success_ci_low is not None and self.success_ci_high is not None
+
+    def success_lower_bound(self) -> float:
+        """Lower confidence bound of success_rate (point estimate if unavailable)."""
+        return self.success_ci_low if self.success_ci_low is not None else self.success_rate
+
+    def success_upper_bound(self) -> float:
+        """Upper confidence bound of success_rate (point estimate if unavailable)."""
+        return self.success_ci_high if self.success_ci_high is not None else self.success_rate
+
+    def is_significantly_better_than(self, other: "SimulationResults") -> bool:
+        """
+        Whether success_rate is higher than other's beyond noise, from intervals.
+
+        Fallback for results without per-synth rates (exploration prefers a
+        paired bootstrap over the synths). With intervals on both sides,
+        requires non-overlapping intervals; otherwise compares point estimates.
+        """
+        if self.has_interval() and other.has_interval():
+            return self.success_lower_bound() > other.success_upper_bound()
+        return self.success_rate > other.success_rate
+
 
 class ScenarioNode(BaseModel):
     """
@@ -23,7 +23,7 @@ from openai import APIConnectionError, APIError, AuthenticationError, OpenAI, Ra
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from synth_lab.gen_synth.avatar_image import save_base64_image, split_grid_image
+from synth_lab.gen_synth.avatar_image import decode_base64_image, split_grid_image
 from synth_lab.gen_synth.avatar_prompt import build_prompt
 from synth_lab.infrastructure.phoenix_tracing import get_tracer
 
@@ -258,6 +258,76 @@ def validate_synth_for_avatar(synth: dict[str, Any]) -> bool:
     return True
 
 
+def pad_block_synths(block_synths: list[dict[str, Any]], block_num: int) -> list[dict[str, Any]]:
+    """
+    Completa um bloco com synths temporários até 9.
+
+    Synths temporários (IDs "tempBBII") preenchem o grid 3x3 e são
+    descartados ao dividir a imagem.
+
+    Args:
+        block_synths: Synths reais do bloco (até 9)
+        block_num: Número do bloco (compõe o ID dos temporários)
+
+    Returns:
+        list[dict]: Exatamente 9 synths
+
+    Examples:
+        >>> block = pad_block_synths([{"id": "abc123"}], block_num=1)
+        >>> len(block), block[1]["id"]
+        (9, 'temp0100')
+    """
+    padded = list(block_synths)
+    for i in range(9 - len(padded)):
+        padded.append(
+            {
+                "id": f"temp{block_num:02d}{i:02d}",
+                "descricao": f"Pessoa de {25 + i * 5} anos, profissional brasileiro(a). etnia mista",
+                "demografia": {
+                    "idade": 25 + i * 5,
+                    "genero_biologico": "masculino" if i % 2 == 0 else "feminino",
+                    "raca_etnia": ["branco", "pardo", "preto", "asiatico", "indigena"][i % 5],
+                    "ocupacao": [
+                        "profissional",
+                        "estudante",
+                        "comerciante",
+                        "artista",
+                        "servidor público",
+                    ][i % 5],
+                },
+            }
+        )
+    return padded
+
+
+def create_openai_client(api_key: str | None = None) -> OpenAI:
+    """
+    Cria cliente OpenAI para geração de imagens.
+
+    Args:
+        api_key: Chave API OpenAI (padrão: variável ambiente OPENAI_API_KEY)
+
+    Returns:
+        OpenAI: Cliente configurado
+
+    Raises:
+        ValueError: Se OPENAI_API_KEY não estiver configurada
+        AuthenticationError: Se o cliente não puder ser inicializado
+    """
+    if api_key is None:
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "OPENAI_API_KEY não encontrada. "
+                "Configure com: export OPENAI_API_KEY='sua-chave-aqui'"
+            )
+
+    try:
+        return OpenAI(api_key=api_key)
+    except Exception as e:
+        raise AuthenticationError(f"Erro ao inicializar cliente OpenAI: {e}")
+
+
 def generate_avatar_block(
     synths: list[dict[str, Any]], client: OpenAI, avatar_dir: Path, block_num: int = 1
 ) -> list[str]:
@@ -368,17 +438,15 @@ def generate_avatar_block(
             raise APIError("API retornou resposta sem dados de imagem (b64_json é None)")
         logger.info(f"Imagem gerada, base64 length: {len(image_base64)} chars")
 
-        # Salvar imagem base64 em arquivo temporário
-        logger.info("Salvando imagem do grid 3x3")
-        grid_image_path = save_base64_image(image_base64)
-        logger.debug(f"Imagem salva em: {grid_image_path}")
+        # Decodificar imagem do grid 3x3 em memória (sem arquivo temporário)
+        grid_image = decode_base64_image(image_base64)
 
         # Extrair IDs dos synths
         synth_ids_for_split = [synth["id"] for synth in synths]
 
         # Dividir imagem
         logger.info("Dividindo grid em 9 avatares individuais")
-        avatar_paths = split_grid_image(grid_image_path, str(avatar_dir), synth_ids_for_split)
+        avatar_paths = split_grid_image(grid_image, str(avatar_dir), synth_ids_for_split)
 
         # Atualizar avatar_path no banco de dados para cada synth
         # Nota: avatar_paths pode ter menos de 9 itens se houver synths temporários
@@ -390,10 +458,6 @@ def generate_avatar_block(
             synth_id = Path(avatar_path).stem
             update_avatar_path(synth_id, avatar_path)
 
-        # Limpar arquivo temporário
-        Path(grid_image_path).unlink(missing_ok=True)
-        logger.debug(f"Arquivo temporário removido: {grid_image_path}")
-
         logger.info(f"Bloco {block_num} completo: {len(avatar_paths)} avatares gerados")
 
         if span:
@@ -507,20 +571,8 @@ def generate_avatars(
 
             console.print("[green]Continuando com sobrescrita...[/green]\n")
 
-    # Configurar API key
-    if api_key is None:
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "OPENAI_API_KEY não encontrada. "
-                "Configure com: export OPENAI_API_KEY='sua-chave-aqui'"
-            )
-
     # Inicializar cliente OpenAI
-    try:
-        client = OpenAI(api_key=api_key)
-    except Exception as e:
-        raise AuthenticationError(f"Erro ao inicializar cliente OpenAI: {e}")
+    client = create_openai_client(api_key)
 
     generated_paths = []
 
@@ -550,26 +602,7 @@ def generate_avatars(
                         f"Bloco {block_num}: {len(block_synths)} synths reais + {needed} fallbacks"
                     )
                     # Criar synths temporários para completar o bloco
-                    for i in range(needed):
-                        temp_synth = {
-                            "id": f"temp{block_num:02d}{i:02d}",
-                            "descricao": f"Pessoa de {25 + i * 5} anos, profissional brasileiro(a). etnia mista",
-                            "demografia": {
-                                "idade": 25 + i * 5,
-                                "genero_biologico": "masculino" if i % 2 == 0 else "feminino",
-                                "raca_etnia": ["branco", "pardo", "preto", "asiatico", "indigena"][
-                                    i % 5
-                                ],
-                                "ocupacao": [
-                                    "profissional",
-                                    "estudante",
-                                    "comerciante",
-                                    "artista",
-                                    "servidor público",
-                                ][i % 5],
-                            },
-                        }
-                        block_synths.append(temp_synth)
+                    block_synths = pad_block_synths(block_synths, block_num)
             else:
                 block_synths = synths[start_idx:end_idx]
                 logger.info(f"Bloco {block_num}: {len(block_synths)} synths reais")
@@ -10,6 +10,7 @@ Saída: 9 arquivos PNG salvos em output/synths/avatar/
 """
 
 import base64
+import io
 import re
 import tempfile
 import uuid
@@ -97,7 +98,33 @@ def download_image(url: str, temp_dir: str | None = None) -> str:
     return str(temp_path)
 
 
-def split_grid_image(image_path: str, output_dir: str, synth_ids: list[str]) -> list[str]:
+def decode_base64_image(b64_data: str) -> Image.Image:
+    """
+    Decodifica imagem base64 em memória (sem arquivo temporário).
+
+    Args:
+        b64_data: String base64 da imagem
+
+    Returns:
+        Image.Image: Imagem carregada
+
+    Raises:
+        binascii.Error: Se b64_data não for base64 válido
+        PIL.UnidentifiedImageError: Se os bytes não forem imagem válida
+
+    Examples:
+        >>> # img = decode_base64_image(response.data[0].b64_json)
+        >>> # img.size
+        >>> # (1024, 1024)
+    """
+    img = Image.open(io.BytesIO(base64.b64decode(b64_data)))
+    img.load()
+    return img
+
+
+def split_grid_image(
+    image: str | Image.Image, output_dir: str, synth_ids: list[str]
+) -> list[str]:
     """
     Divide imagem 1024x1024 em grid 3x3 de 9 avatares individuais 341x341.
 
@@ -105,7 +132,8 @@ def split_grid_image(image_path: str, output_dir: str, synth_ids: list[str]) ->
     baseado no ID do synth correspondente.
 
     Args:
-        image_path: Caminho da imagem 1024x1024 de origem
+        image: Caminho da imagem 1024x1024 de origem, ou imagem já carregada
+            em memória (ver decode_base64_image)
         output_dir: Diretório onde salvar avatares individuais
         synth_ids: Lista de exatamente 9 IDs de synth (ordem: left-to-right, top-to-bottom)
 
@@ -114,8 +142,8 @@ def split_grid_image(image_path: str, output_dir: str, synth_ids: list[str]) ->
 
     Raises:
         ValueError: Se synth_ids não contém exatamente 9 IDs
-        FileNotFoundError: Se image_path não existe
-        PIL.UnidentifiedImageError: Se image_path não é imagem válida
+        FileNotFoundError: Se o caminho da imagem não existe
+        PIL.UnidentifiedImageError: Se o arquivo não é imagem válida
 
     Examples:
         >>> # Requer imagem real para teste
@@ -127,8 +155,8 @@ def split_grid_image(image_path: str, output_dir: str, synth_ids: list[str]) ->
     if len(synth_ids) != 9:
         raise ValueError(f"Esperado exatamente 9 synth IDs, recebido {len(synth_ids)}")
 
-    # Abrir imagem
-    img = Image.open(image_path)
+    # Abrir imagem (se não recebida em memória)
+    img = image if isinstance(image, Image.Image) else Image.open(image)
 
     # Calcular dimensão de cada célula (1024 / 3 = 341.33, arredonda para 341)
     cell_width = img.width // 3  # 341 pixels
@@ -252,7 +280,25 @@ if __name__ == "__main__":
     except Exception as e:
         all_validation_failures.append(f"split_grid_image() teste completo: Exceção: {e}")
 
-    # Test 3: download_image function exists and is callable
+    # Test 3: split_grid_image aceita imagem decodificada em memória
+    total_tests += 1
+    try:
+        buffer = io.BytesIO()
+        Image.new("RGB", (1024, 1024), color="red").save(buffer, format="PNG")
+        grid = decode_base64_image(base64.b64encode(buffer.getvalue()).decode())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_ids = [f"test{i:02d}" for i in range(8)] + ["temp0100"]
+            paths = split_grid_image(grid, temp_dir, test_ids)
+            if len(paths) != 8 or len(list(Path(temp_dir).iterdir())) != 8:
+                all_validation_failures.append(
+                    f"split_grid_image(em memória): Esperado 8 arquivos, obtido {len(paths)}"
+                )
+            else:
+                console.print("[green]✓[/green] split_grid_image() divide imagem em memória")
+    except Exception as e:
+        all_validation_failures.append(f"split_grid_image(em memória): Exceção: {e}")
+
+    # Test 4: download_image function exists and is callable
     total_tests += 1
     try:
         # Verify function signature
@@ -8,6 +8,8 @@ Functions:
 - save_synth(): Save synth to database
 - load_synths(): Load all synths from database
 - get_synth_by_id(): Load a single synth by ID
+- get_synths_by_ids(): Load several synths by ID in one query
+- sample_synths(): Randomly sample synths in SQL (ORDER BY random() LIMIT n)
 - count_synths(): Count total synths
 - update_avatar_path(): Update avatar path for a synth
 
@@ -28,6 +30,7 @@ from pathlib import Path
 from typing import Any
 
 from loguru import logger
+from sqlalchemy import func
 
 from synth_lab.domain.entities.synth_group import (
     DEFAULT_SYNTH_GROUP_DESCRIPTION,
@@ -162,6 +165,56 @@ def get_synth_by_id(synth_id: str) -> dict[str, Any] | None:
         return _synth_to_dict(synth)
 
 
+def get_synths_by_ids(synth_ids: list[str]) -> dict[str, dict[str, Any]]:
+    """
+    Load several synths by ID using a single query.
+
+    Args:
+        synth_ids: The synth IDs to load
+
+    Returns:
+        Dict mapping synth_id to synth dictionary. Missing IDs are omitted.
+    """
+    if not synth_ids:
+        return {}
+
+    with get_session() as session:
+        synths = session.query(Synth).filter(Synth.id.in_(synth_ids)).all()
+        return {s.id: _synth_to_dict(s) for s in synths}
+
+
+def sample_synths(
+    limit: int,
+    synth_group_id: str | None = None,
+    synth_ids: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Randomly sample synths in the database.
+
+    Sampling happens in SQL (ORDER BY random() LIMIT n), so only the
+    selected rows are loaded instead of the whole group.
+
+    Args:
+        limit: Maximum number of synths to return
+        synth_group_id: Optional synth group ID to filter by
+        synth_ids: Optional list of candidate synth IDs to sample from
+
+    Returns:
+        List of at most `limit` synth dictionaries, in random order
+    """
+    if synth_ids is not None and not synth_ids:
+        return []
+
+    with get_session() as session:
+        query = session.query(Synth)
+        if synth_group_id:
+            query = query.filter(Synth.synth_group_id == synth_group_id)
+        if synth_ids is not None:
+            query = query.filter(Synth.id.in_(synth_ids))
+        synths = query.order_by(func.random()).limit(limit).all()
+        return [_synth_to_dict(s) for s in synths]
+
+
 def _synth_to_dict(synth: Synth) -> dict[str, Any]:
     """Convert a Synth ORM object to a dictionary."""
     result = {
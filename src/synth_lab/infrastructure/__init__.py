@@ -6,4 +6,5 @@ Contains cross-cutting concerns:
 - database_v2: PostgreSQL connection management via SQLAlchemy
 - llm_client: Centralized OpenAI client with retry logic
 - phoenix_tracing: Observability and tracing setup
+- single_flight: Coalescing of concurrent identical (LLM) calls
 """
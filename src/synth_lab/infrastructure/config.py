@@ -11,6 +11,10 @@ Environment Variables:
     OPENAI_API_KEY: OpenAI API key (required for LLM operations)
     SQL_ECHO: Set to "true" to enable SQL query logging
     WORKERS: Number of workers for connection pool sizing (default: 4)
+    BROKER_BACKEND: SSE message broker backend, "memory" or "postgres" (default: memory)
+        Use "postgres" (LISTEN/NOTIFY) when running more than one worker process.
+    BROKER_QUEUE_SIZE: Max buffered messages per SSE subscriber (default: 1000)
+    BROKER_OVERFLOW_POLICY: drop_oldest, drop_newest or disconnect (default: drop_oldest)
 """
 
 import os
@@ -90,6 +94,23 @@ S3_REGION = os.getenv("REGION", "auto")
 AWS_ACCESS_KEY_ID = os.getenv("ACCESS_KEY_ID", os.getenv("AWS_ACCESS_KEY_ID"))
 AWS_SECRET_ACCESS_KEY = os.getenv("SECRET_ACCESS_KEY", os.getenv("AWS_SECRET_ACCESS_KEY"))
 
+# SSE message broker configuration
+BROKER_BACKEND = os.getenv("BROKER_BACKEND", "memory").lower()
+BROKER_QUEUE_SIZE = int(os.getenv("BROKER_QUEUE_SIZE", "1000"))
+BROKER_OVERFLOW_POLICY = os.getenv("BROKER_OVERFLOW_POLICY", "drop_oldest").lower()
+
+# Avatar generation worker pool
+AVATAR_WORKERS = int(os.getenv("SYNTHLAB_AVATAR_WORKERS", "3"))
+AVATAR_MIN_REQUEST_INTERVAL = float(os.getenv("SYNTHLAB_AVATAR_MIN_REQUEST_INTERVAL", "1.5"))
+AVATAR_BATCH_WINDOW = float(os.getenv("SYNTHLAB_AVATAR_BATCH_WINDOW", "0.5"))
+
+# Material media processing (thumbnails and descriptions)
+MEDIA_WORKERS = int(os.getenv("SYNTHLAB_MEDIA_WORKERS", "2"))
+MEDIA_TASKS_PER_CHILD = int(os.getenv("SYNTHLAB_MEDIA_TASKS_PER_CHILD", "20"))
+MEDIA_TASK_TIMEOUT = float(os.getenv("SYNTHLAB_MEDIA_TASK_TIMEOUT", "120.0"))
+MEDIA_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+MEDIA_VIDEO_PREFIX_BYTES = 4 * 1024 * 1024  # Media data fetched after the moov box (first frame)
+
 # Material upload limits
 MAX_MATERIALS_PER_EXPERIMENT = 10
 MAX_TOTAL_SIZE_PER_EXPERIMENT = 250 * 1024 * 1024  # 250MB
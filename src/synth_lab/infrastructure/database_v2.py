@@ -265,6 +265,10 @@ def init_database_v2() -> None:
     log.info("Initializing PostgreSQL database with SQLAlchemy ORM")
     log.debug(f"Creating tables from Base.metadata ({len(Base.metadata.tables)} tables)")
 
+    # Trigram search indexes on experiments need pg_trgm
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
     Base.metadata.create_all(bind=engine)
 
     table_names = list(Base.metadata.tables.keys())
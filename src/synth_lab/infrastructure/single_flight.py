@@ -0,0 +1,208 @@
+"""
+Single-flight coordination for expensive (LLM) calls.
+
+Concurrent callers asking for the same key share one in-flight call: the
+first caller (leader) runs it, later callers wait and receive the same
+result (or exception). Nothing is kept once the call finishes, so a later
+request runs again.
+
+Keys are tuples naming the operation and its identity, e.g.
+("chart_insight", analysis_id, chart_type).
+
+Sample usage:
+    from synth_lab.infrastructure.single_flight import get_single_flight
+
+    insight = get_single_flight().do(
+        ("chart_insight", analysis_id, chart_type),
+        lambda: generate(analysis_id, chart_type))
+
+    # Several keys served by one call (leader resolves the flights it claimed)
+    flight, is_leader = get_single_flight().claim(("chart_insight", analysis_id, "outliers"))
+    if is_leader:
+        flight.resolve(insight)
+    result = flight.wait()
+
+Expected output:
+    One LLM call per key while it is in flight, regardless of concurrent callers.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class Flight:
+    """An in-flight call; resolved once by its leader."""
+
+    def __init__(self, key: Hashable, registry: "SingleFlight"):
+        self.key = key
+        self._registry = registry
+        self._done = threading.Event()
+        self._result: Any = None
+        self._error: BaseException | None = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the call has finished."""
+        return self._done.is_set()
+
+    def resolve(self, result: Any) -> None:
+        """Publish the result to all waiters."""
+        self._result = result
+        self._finish()
+
+    def fail(self, error: BaseException) -> None:
+        """Publish an error to all waiters."""
+        self._error = error
+        self._finish()
+
+    def wait(self, timeout: float | None = None) -> Any:
+        """
+        Wait for the call to finish.
+
+        Raises:
+            TimeoutError: If the call did not finish within timeout.
+            Exception: The leader's error, if it failed.
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Timed out waiting for in-flight call {self.key!r}")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def _finish(self) -> None:
+        if self._done.is_set():
+            return
+        self._registry._release(self)
+        self._done.set()
+
+
+class SingleFlight:
+    """Thread-safe registry of in-flight calls keyed by request identity."""
+
+    def __init__(self):
+        self._flights: dict[Hashable, Flight] = {}
+        self._lock = threading.Lock()
+        self.logger = logger.bind(component="single_flight")
+
+    def claim(self, key: Hashable) -> tuple[Flight, bool]:
+        """
+        Join the in-flight call for key, or start one.
+
+        Args:
+            key: Request identity.
+
+        Returns:
+            Tuple of (flight, is_leader). The leader must resolve or fail the flight.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.logger.debug(f"Joining in-flight call {key!r}")
+                return flight, False
+            flight = Flight(key, self)
+            self._flights[key] = flight
+            return flight, True
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Request identity.
+            fn: Call to run when no identical call is in flight.
+
+        Returns:
+            Result of fn (shared with concurrent callers).
+        """
+        flight, is_leader = self.claim(key)
+        if not is_leader:
+            return flight.wait()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            flight.fail(e)
+            raise
+        flight.resolve(result)
+        return result
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a call for key is currently running."""
+        with self._lock:
+            return key in self._flights
+
+    def _release(self, flight: Flight) -> None:
+        with self._lock:
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+
+
+_single_flight: SingleFlight | None = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Get the process-wide single-flight registry.
+
+    Returns:
+        SingleFlight: Global instance shared by all services.
+    """
+    global _single_flight
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                _single_flight = SingleFlight()
+    return _single_flight
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: Concurrent identical calls share one execution
+    total_tests += 1
+    calls = []
+
+    def slow_call() -> str:
+        calls.append(1)
+        time.sleep(0.2)
+        return "done"
+
+    sf = SingleFlight()
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: sf.do(("k",), slow_call), range(5)))
+    if len(calls) != 1 or results != ["done"] * 5:
+        all_validation_failures.append(f"Expected 1 call, got {len(calls)}: {results}")
+
+    # Test 2: Finished calls are not cached
+    total_tests += 1
+    sf.do(("k",), slow_call)
+    if len(calls) != 2 or sf.in_flight(("k",)):
+        all_validation_failures.append(f"Expected a new call after completion, got {len(calls)}")
+
+    # Test 3: Errors propagate to the leader
+    total_tests += 1
+    try:
+        sf.do(("err",), lambda: 1 / 0)
+        all_validation_failures.append("Expected ZeroDivisionError")
+    except ZeroDivisionError:
+        pass
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
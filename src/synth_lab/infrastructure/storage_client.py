@@ -26,7 +26,9 @@ Sample usage:
 """
 
 import base64
+from collections.abc import Iterator
 from io import BytesIO
+from pathlib import Path
 from typing import BinaryIO
 
 import boto3
@@ -38,6 +40,7 @@ from synth_lab.infrastructure.config import (
     AWS_ACCESS_KEY_ID,
     AWS_SECRET_ACCESS_KEY,
     BUCKET_NAME,
+    MEDIA_DOWNLOAD_CHUNK_SIZE,
     PRESIGNED_URL_EXPIRATION,
     S3_ENDPOINT_URL,
     S3_REGION,
@@ -263,6 +266,135 @@ def get_object_bytes(object_key: str) -> bytes | None:
         raise
 
 
+def download_object_to_file(
+    object_key: str,
+    path: str | Path,
+    byte_range: tuple[int, int] | None = None,
+    chunk_size: int = MEDIA_DOWNLOAD_CHUNK_SIZE,
+) -> bool:
+    """
+    Stream an object (or a byte range of it) from S3 to a local file.
+
+    The body is written chunk by chunk, so memory use stays at chunk_size
+    regardless of the object size.
+
+    Args:
+        object_key: Full path in bucket
+        path: Local file to write
+        byte_range: Optional inclusive (first, last) byte offsets (HTTP Range)
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        True if written, False if the object was not found
+    """
+    s3 = get_s3_client()
+    params = {"Bucket": BUCKET_NAME, "Key": object_key}
+    if byte_range is not None:
+        params["Range"] = f"bytes={byte_range[0]}-{byte_range[1]}"
+
+    try:
+        response = s3.get_object(**params)
+        with open(path, "wb") as f:
+            for chunk in response["Body"].iter_chunks(chunk_size):
+                f.write(chunk)
+        return True
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            logger.warning(f"Object not found: {object_key}")
+            return False
+        logger.error(f"Error downloading object {object_key}: {e}")
+        raise
+
+
+def get_object_range(object_key: str, first: int, last: int) -> bytes | None:
+    """
+    Download a byte range of an object (e.g. a file header).
+
+    Args:
+        object_key: Full path in bucket
+        first: First byte offset
+        last: Last byte offset (inclusive; clamped by S3 to the object size)
+
+    Returns:
+        Range content as bytes, or None if not found
+    """
+    s3 = get_s3_client()
+
+    try:
+        response = s3.get_object(Bucket=BUCKET_NAME, Key=object_key, Range=f"bytes={first}-{last}")
+        return response["Body"].read()
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            logger.warning(f"Object not found: {object_key}")
+            return None
+        logger.error(f"Error getting range of object {object_key}: {e}")
+        raise
+
+
+# S3 limits for ListObjectsV2 pages and DeleteObjects batches
+MAX_KEYS_PER_REQUEST = 1000
+
+
+def iter_object_key_pages(
+    prefix: str,
+    page_size: int = MAX_KEYS_PER_REQUEST,
+) -> Iterator[list[str]]:
+    """
+    List object keys under a prefix, one page at a time.
+
+    Follows continuation tokens, so every object is listed regardless of
+    how many there are.
+
+    Args:
+        prefix: Key prefix (e.g. "materials/")
+        page_size: Keys per ListObjectsV2 request (max 1000)
+
+    Yields:
+        Object keys of each page
+    """
+    s3 = get_s3_client()
+    paginator = s3.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=BUCKET_NAME,
+        Prefix=prefix,
+        PaginationConfig={"PageSize": min(page_size, MAX_KEYS_PER_REQUEST)},
+    )
+    for page in pages:
+        yield [obj["Key"] for obj in page.get("Contents", [])]
+
+
+def delete_objects(object_keys: list[str]) -> list[str]:
+    """
+    Delete objects in batches of up to 1000 keys per request.
+
+    Args:
+        object_keys: Full paths in bucket
+
+    Returns:
+        Keys that could not be deleted
+    """
+    s3 = get_s3_client()
+    failed: list[str] = []
+
+    for start in range(0, len(object_keys), MAX_KEYS_PER_REQUEST):
+        batch = object_keys[start:start + MAX_KEYS_PER_REQUEST]
+        try:
+            response = s3.delete_objects(
+                Bucket=BUCKET_NAME,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+        except ClientError as e:
+            logger.error(f"Error deleting {len(batch)} objects: {e}")
+            failed.extend(batch)
+            continue
+        for error in response.get("Errors", []):
+            logger.error(f"Error deleting object {error['Key']}: {error.get('Message')}")
+            failed.append(error["Key"])
+
+    logger.info(f"Deleted {len(object_keys) - len(failed)} of {len(object_keys)} objects")
+    return failed
+
+
 if __name__ == "__main__":
     import sys
 
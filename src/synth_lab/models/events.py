@@ -8,7 +8,7 @@ References:
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -41,9 +41,20 @@ class InterviewMessageEvent(BaseModel):
     timestamp: datetime = Field(..., description="Event timestamp")
     is_replay: bool = Field(default=False, description="True if from history replay")
 
-    def to_sse(self) -> str:
-        """Format event as SSE string."""
-        return f"event: {self.event_type}\ndata: {self.model_dump_json()}\n\n"
+    def to_sse(self, event_id: int | None = None) -> str:
+        """Format event as SSE string (with an id line when event_id is given)."""
+        id_line = f"id: {event_id}\n" if event_id is not None else ""
+        return f"{id_line}event: {self.event_type}\ndata: {self.model_dump_json()}\n\n"
+
+
+class ExecutionEvent(BaseModel):
+    """Entry of an execution's append-only event log."""
+
+    seq: int = Field(..., description="Monotonically increasing sequence number (SSE event ID)")
+    exec_id: str = Field(..., description="Execution ID")
+    event_type: str = Field(..., description="Type of event")
+    data: dict[str, Any] = Field(default_factory=dict, description="Event payload")
+    timestamp: datetime = Field(..., description="Event timestamp")
 
 
 if __name__ == "__main__":
@@ -8,7 +8,7 @@ Models are organized by domain:
 - experiment: Experiment, InterviewGuide
 - synth: Synth, SynthGroup
 - analysis: AnalysisRun, SynthOutcome, AnalysisCache
-- research: ResearchExecution, Transcript
+- research: ResearchExecution, Transcript, ResearchEvent, BrokerPayload
 - exploration: Exploration, ScenarioNode
 - insight: ChartInsight, SensitivityResult, RegionAnalysis
 - document: ExperimentDocument
@@ -36,7 +36,12 @@ from synth_lab.models.orm.experiment import Experiment, InterviewGuide
 from synth_lab.models.orm.material import ExperimentMaterial
 from synth_lab.models.orm.exploration import Exploration, ScenarioNode
 from synth_lab.models.orm.insight import ChartInsight, RegionAnalysis, SensitivityResult
-from synth_lab.models.orm.research import ResearchExecution, Transcript
+from synth_lab.models.orm.research import (
+    BrokerPayload,
+    ResearchEvent,
+    ResearchExecution,
+    Transcript,
+)
 from synth_lab.models.orm.synth import Synth, SynthGroup
 from synth_lab.models.orm.tag import ExperimentTag, Tag
 
@@ -62,6 +67,8 @@ __all__ = [
     # Research
     "ResearchExecution",
     "Transcript",
+    "ResearchEvent",
+    "BrokerPayload",
     # Exploration
     "Exploration",
     "ScenarioNode",
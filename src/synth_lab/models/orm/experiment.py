@@ -116,6 +116,17 @@ class Experiment(Base, TimestampMixin, SoftDeleteMixin):
         Index("idx_experiments_name", "name"),
         Index("idx_experiments_status", "status"),
         Index("idx_experiments_synth_group_id", "synth_group_id"),
+        # Trigram indexes for ILIKE '%term%' search (requires pg_trgm)
+        Index(
+            "idx_experiments_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}),
+        Index(
+            "idx_experiments_hypothesis_trgm",
+            "hypothesis",
+            postgresql_using="gin",
+            postgresql_ops={"hypothesis": "gin_trgm_ops"}),
     )
 
     def __repr__(self) -> str:
@@ -1,7 +1,8 @@
 """
 SQLAlchemy ORM models for research executions and transcripts.
 
-These models map to the 'research_executions' and 'transcripts' tables.
+These models map to the 'research_executions', 'transcripts',
+'research_events' and 'broker_payloads' tables.
 
 References:
     - data-model.md: ResearchExecution and Transcript entity definitions
@@ -10,7 +11,17 @@ References:
 
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    JSON,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from synth_lab.models.orm.base import Base
@@ -138,6 +149,67 @@ class Transcript(Base):
         return f"<Transcript(id={self.id!r}, synth_name={self.synth_name!r}, status={self.status!r})>"
 
 
+class ResearchEvent(Base):
+    """
+    Append-only event log entry of a research execution.
+
+    Every event streamed over SSE is recorded here first; seq is the SSE
+    event ID, so clients can resume with Last-Event-ID.
+
+    Attributes:
+        seq: Monotonically increasing sequence number (primary key)
+        exec_id: Link to research execution
+        event_type: SSE event type (message, interview_completed, ...)
+        data: Event payload as JSON
+        created_at: ISO timestamp
+    """
+
+    __tablename__ = "research_events"
+
+    seq: Mapped[int] = mapped_column(BigInteger, Identity(always=True), primary_key=True)
+    exec_id: Mapped[str] = mapped_column(
+        String(100),
+        ForeignKey("research_executions.exec_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    data: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    __table_args__ = (Index("idx_research_events_exec_seq", "exec_id", "seq"),)
+
+    def __repr__(self) -> str:
+        return f"<ResearchEvent(seq={self.seq}, exec_id={self.exec_id!r}, type={self.event_type!r})>"
+
+
+class BrokerPayload(Base):
+    """
+    Spilled message broker payload.
+
+    Postgres NOTIFY payloads are limited to 8000 bytes; larger broker messages
+    are stored here and the notification carries only the row ID. Rows are
+    short-lived and pruned by the publisher.
+
+    Attributes:
+        id: Payload identifier
+        exec_id: Execution the message was published to
+        payload: Encoded broker message (JSON text)
+        created_at: ISO timestamp of creation (used for pruning)
+    """
+
+    __tablename__ = "broker_payloads"
+
+    id: Mapped[str] = mapped_column(String(50), primary_key=True)
+    exec_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[str] = mapped_column(String(50), nullable=False)
+
+    __table_args__ = (Index("idx_broker_payloads_created", "created_at"),)
+
+    def __repr__(self) -> str:
+        return f"<BrokerPayload(id={self.id!r}, exec_id={self.exec_id!r})>"
+
+
 if __name__ == "__main__":
     import sys
 
@@ -3,11 +3,18 @@ Pagination models for synth-lab API.
 
 Provides reusable pagination request/response models for all list endpoints.
 
+Keyset (cursor) pagination: a cursor is an opaque token holding the sort
+value and ID of the last row of the previous page. Unlike offset it costs
+the same on every page and does not skip or repeat rows when items are
+inserted between requests.
+
 References:
     - Pydantic docs: https://docs.pydantic.dev/
 """
 
-from typing import Generic, TypeVar
+import base64
+import json
+from typing import Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -27,6 +34,11 @@ class PaginationParams(BaseModel):
     )
     search: str | None = Field(default=None, max_length=200, description="Search query")
     tag: str | None = Field(default=None, max_length=50, description="Filter by tag name")
+    cursor: str | None = Field(
+        default=None,
+        max_length=500,
+        description="Keyset cursor from a previous page (offset is ignored when set)",
+    )
 
 
 class PaginationMeta(BaseModel):
@@ -36,18 +48,62 @@ class PaginationMeta(BaseModel):
     limit: int = Field(..., description="Items per page")
     offset: int = Field(..., description="Current offset")
     has_next: bool = Field(..., description="Whether there are more items")
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page (when keyset pagination is supported)"
+    )
 
     @classmethod
-    def from_params(cls, total: int, params: PaginationParams) -> "PaginationMeta":
+    def from_params(
+        cls, total: int, params: PaginationParams, next_cursor: str | None = None
+    ) -> "PaginationMeta":
         """Create metadata from params and total count."""
         return cls(
             total=total,
             limit=params.limit,
             offset=params.offset,
             has_next=(params.offset + params.limit) < total,
+            next_cursor=next_cursor,
         )
 
 
+def encode_cursor(sort_value: Any, item_id: str) -> str:
+    """
+    Encode the keyset position after an item.
+
+    Args:
+        sort_value: Value of the sort column for the item (JSON-serializable).
+        item_id: Item ID (tie-breaker for equal sort values).
+
+    Returns:
+        URL-safe opaque cursor string.
+    """
+    raw = json.dumps([sort_value, item_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string.
+
+    Returns:
+        Tuple of (sort_value, item_id).
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, item_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(item_id, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return sort_value, item_id
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response wrapper."""
 
@@ -156,6 +212,20 @@ if __name__ == "__main__":
     except Exception as e:
         all_validation_failures.append(f"Limit validation test failed: {e}")
 
+    # Test 7: Cursor round trip and rejection of malformed cursors
+    total_tests += 1
+    try:
+        cursor = encode_cursor("2026-01-01T00:00:00", "exp_12345678")
+        if decode_cursor(cursor) != ("2026-01-01T00:00:00", "exp_12345678"):
+            all_validation_failures.append(f"Cursor round trip failed: {decode_cursor(cursor)}")
+        try:
+            decode_cursor("not-a-cursor")
+            all_validation_failures.append("Should reject malformed cursor")
+        except ValueError:
+            pass  # Expected
+    except Exception as e:
+        all_validation_failures.append(f"Cursor test failed: {e}")
+
     # Final validation result
     if all_validation_failures:
         print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
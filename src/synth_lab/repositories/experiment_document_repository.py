@@ -13,7 +13,7 @@ References:
 from datetime import datetime
 
 from loguru import logger
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -101,6 +101,8 @@ session: Session | None = None):
         else:
             stmt = stmt.where(ExperimentDocumentORM.source_id.is_(None))
 
+        # Refresh loaded rows: streams poll documents written by other sessions
+        stmt = stmt.execution_options(populate_existing=True)
         orm_doc = self.session.execute(stmt).scalar_one_or_none()
         if orm_doc is None:
             return None
@@ -379,6 +381,40 @@ session: Session | None = None):
             f"-> {status.value} (content: {content_size} chars)"
         )
         return
+    def save_partial_content(
+        self,
+        experiment_id: str,
+        document_type: DocumentType,
+        markdown_content: str,
+        source_id: str | None = None) -> bool:
+        """
+        Persist the partial content of a document that is still generating.
+
+        The update only applies while the status is generating, so a late
+        partial flush can never overwrite a completed or failed document.
+
+        Args:
+            experiment_id: Experiment ID.
+            document_type: Type of document.
+            markdown_content: Content generated so far.
+            source_id: Source ID (exploration_id or exec_id).
+
+        Returns:
+            True if the document was updated.
+        """
+        stmt = update(ExperimentDocumentORM).where(
+            ExperimentDocumentORM.experiment_id == experiment_id,
+            ExperimentDocumentORM.document_type == document_type.value,
+            ExperimentDocumentORM.status == DocumentStatus.GENERATING.value)
+
+        if source_id is not None:
+            stmt = stmt.where(ExperimentDocumentORM.source_id == source_id)
+        else:
+            stmt = stmt.where(ExperimentDocumentORM.source_id.is_(None))
+
+        result = self.session.execute(stmt.values(markdown_content=markdown_content))
+        self._commit()
+        return result.rowcount > 0
     def delete(
         self,
         experiment_id: str,
@@ -13,7 +13,8 @@ References:
 from datetime import datetime
 
 from loguru import logger
-from sqlalchemy import func, select
+from sqlalchemy import String, any_, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Session
 
 from synth_lab.domain.entities.experiment_material import (
@@ -359,6 +360,24 @@ class ExperimentMaterialRepository(BaseRepository):
         orm_materials = list(self.session.execute(stmt).scalars().all())
         return [self._orm_to_entity(orm_mat) for orm_mat in orm_materials]
 
+    def get_existing_ids(self, material_ids: list[str]) -> set[str]:
+        """
+        Get which of the given material IDs exist.
+
+        Runs a single query (WHERE id = ANY(:ids)) for the whole list.
+
+        Args:
+            material_ids: Material IDs to check.
+
+        Returns:
+            The subset of material_ids found in the table.
+        """
+        if not material_ids:
+            return set()
+        ids = literal(list(material_ids), type_=ARRAY(String))
+        stmt = select(ExperimentMaterialORM.id).where(ExperimentMaterialORM.id == any_(ids))
+        return set(self.session.execute(stmt).scalars().all())
+
     def _orm_to_entity(self, orm_mat: ExperimentMaterialORM) -> ExperimentMaterial:
         """Convert ORM model to ExperimentMaterial entity."""
         created_at = orm_mat.created_at
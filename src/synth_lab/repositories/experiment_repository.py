@@ -17,11 +17,17 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from synth_lab.domain.entities.experiment import Experiment, ScorecardData
+from synth_lab.models.orm.analysis import AnalysisRun as AnalysisRunORM
 from synth_lab.models.orm.experiment import Experiment as ExperimentORM
 from synth_lab.models.orm.experiment import InterviewGuide as InterviewGuideORM
-from synth_lab.models.orm.analysis import AnalysisRun as AnalysisRunORM
 from synth_lab.models.orm.research import ResearchExecution as ResearchExecutionORM
-from synth_lab.models.pagination import PaginatedResponse, PaginationMeta, PaginationParams
+from synth_lab.models.pagination import (
+    PaginatedResponse,
+    PaginationMeta,
+    PaginationParams,
+    decode_cursor,
+    encode_cursor,
+)
 from synth_lab.repositories.base import BaseRepository
 
 
@@ -138,61 +144,170 @@ session: Session | None = None):
         return self._list_experiments_orm(params)
 
     def _list_experiments_orm(self, params: PaginationParams) -> PaginatedResponse[ExperimentSummary]:
-        """List experiments using ORM with eager-loaded relationships."""
-        from sqlalchemy import func as sqlfunc, or_
-        from sqlalchemy.orm import joinedload
-        from synth_lab.models.orm.tag import ExperimentTag as ExperimentTagORM, Tag as TagORM
+        """
+        List experiments as one summary query plus one count query.
 
-        # Base query for active experiments with eager-loaded synth_group
-        stmt = select(ExperimentORM).where(ExperimentORM.status == "active").options(
-            joinedload(ExperimentORM.synth_group)
-        )
-        count_where = [ExperimentORM.status == "active"]
+        Relationship flags and interview counts come from correlated
+        subqueries in the same SELECT, and the page's tag names from one
+        extra query (no per-row lazy loads).
+        With params.cursor, pages by keyset (sort column, id) instead of offset.
+        """
+        from sqlalchemy import func as sqlfunc
+        from sqlalchemy import or_
 
-        # Apply tag filter
-        if params.tag:
-            # Join with experiment_tags and tags to filter by tag name
-            stmt = stmt.join(ExperimentTagORM).join(TagORM).where(TagORM.name == params.tag)
-            count_where.append(TagORM.name == params.tag)
+        filters = self._list_filters(params)
 
-        # Apply search filter (name OR hypothesis, case-insensitive)
-        if params.search:
-            search_pattern = f"%{params.search}%"
-            search_filter = or_(
-                ExperimentORM.name.ilike(search_pattern),
-                ExperimentORM.hypothesis.ilike(search_pattern)
-            )
-            stmt = stmt.where(search_filter)
-            count_where.append(search_filter)
-
-        # Apply sorting
-        if params.sort_by == "name":
-            order_col = ExperimentORM.name.asc() if params.sort_order == "asc" else ExperimentORM.name.desc()
-        else:
-            # Default: created_at DESC
-            order_col = ExperimentORM.created_at.asc() if params.sort_order == "asc" else ExperimentORM.created_at.desc()
-        stmt = stmt.order_by(order_col)
-
-        # Get total count (with search and tag filters applied)
-        # Need to rebuild JOINs for count query when tag filter is active
-        # IMPORTANT: JOINs must be applied BEFORE WHERE conditions
-        count_base = select(ExperimentORM)
-        if params.tag:
-            count_base = count_base.join(ExperimentTagORM).join(TagORM)
-        count_base = count_base.where(*count_where)
-        count_stmt = select(sqlfunc.count()).select_from(count_base.subquery())
+        # Total count (with search and tag filters applied)
+        count_stmt = select(sqlfunc.count()).select_from(ExperimentORM).where(*filters)
         total = self.session.execute(count_stmt).scalar() or 0
 
-        # Apply pagination
-        stmt = stmt.limit(params.limit).offset(params.offset)
-        experiments = list(self.session.execute(stmt).scalars().all())
+        # Sort by the requested column with id as tie-breaker (stable keyset order)
+        sort_col = ExperimentORM.name if params.sort_by == "name" else ExperimentORM.created_at
+        descending = params.sort_order != "asc"
+        if descending:
+            stmt_order = (sort_col.desc(), ExperimentORM.id.desc())
+        else:
+            stmt_order = (sort_col.asc(), ExperimentORM.id.asc())
+
+        stmt = self._summary_select().where(*filters).order_by(*stmt_order)
+
+        if params.cursor:
+            last_value, last_id = decode_cursor(params.cursor)
+            if descending:
+                after = or_(
+                    sort_col < last_value,
+                    (sort_col == last_value) & (ExperimentORM.id < last_id))
+            else:
+                after = or_(
+                    sort_col > last_value,
+                    (sort_col == last_value) & (ExperimentORM.id > last_id))
+            stmt = stmt.where(after).limit(params.limit + 1)
+        else:
+            stmt = stmt.limit(params.limit + 1).offset(params.offset)
+
+        rows = list(self.session.execute(stmt).mappings().all())
+        has_more = len(rows) > params.limit
+        rows = rows[:params.limit]
+
+        tags = self._tags_by_experiment([row["id"] for row in rows])
+        summaries = [self._row_to_summary(row, tags.get(row["id"], [])) for row in rows]
 
-        # Convert to summaries with relationship checks
-        summaries = [self._orm_to_summary(exp) for exp in experiments]
-        meta = PaginationMeta.from_params(total, params)
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            sort_value = last["name"] if params.sort_by == "name" else last["created_at"]
+            next_cursor = encode_cursor(sort_value, last["id"])
+
+        meta = PaginationMeta.from_params(total, params, next_cursor=next_cursor)
+        if params.cursor:
+            meta.has_next = has_more
 
         return PaginatedResponse(data=summaries, pagination=meta)
 
+    def get_summary(self, experiment_id: str) -> ExperimentSummary | None:
+        """
+        Get the list summary (flags, counts, tags) of one active experiment.
+
+        Args:
+            experiment_id: Experiment ID.
+
+        Returns:
+            ExperimentSummary if found and active, None otherwise.
+        """
+        stmt = self._summary_select().where(
+            ExperimentORM.id == experiment_id,
+            ExperimentORM.status == "active")
+        row = self.session.execute(stmt).mappings().one_or_none()
+        if row is None:
+            return None
+        tags = self._tags_by_experiment([experiment_id])
+        return self._row_to_summary(row, tags.get(experiment_id, []))
+
+    def _list_filters(self, params: PaginationParams) -> list:
+        """WHERE conditions for status, tag and search filters."""
+        from sqlalchemy import or_
+
+        from synth_lab.models.orm.tag import ExperimentTag as ExperimentTagORM
+        from synth_lab.models.orm.tag import Tag as TagORM
+
+        filters = [ExperimentORM.status == "active"]
+
+        # Tag filter as EXISTS (no join, so rows and counts are never duplicated)
+        if params.tag:
+            filters.append(
+                select(ExperimentTagORM.experiment_id)
+                .join(TagORM, TagORM.id == ExperimentTagORM.tag_id)
+                .where(
+                    ExperimentTagORM.experiment_id == ExperimentORM.id,
+                    TagORM.name == params.tag)
+                .exists())
+
+        # Search filter (name OR hypothesis, case-insensitive; served by trigram indexes)
+        if params.search:
+            search_pattern = f"%{params.search}%"
+            filters.append(or_(
+                ExperimentORM.name.ilike(search_pattern),
+                ExperimentORM.hypothesis.ilike(search_pattern)))
+
+        return filters
+
+    def _tags_by_experiment(self, experiment_ids: list[str]) -> dict[str, list[str]]:
+        """Tag names of the given experiments, in one query."""
+        from synth_lab.models.orm.tag import ExperimentTag as ExperimentTagORM
+        from synth_lab.models.orm.tag import Tag as TagORM
+
+        if not experiment_ids:
+            return {}
+        stmt = (
+            select(ExperimentTagORM.experiment_id, TagORM.name)
+            .join(TagORM, TagORM.id == ExperimentTagORM.tag_id)
+            .where(ExperimentTagORM.experiment_id.in_(experiment_ids)))
+        tags: dict[str, list[str]] = {}
+        for experiment_id, name in self.session.execute(stmt):
+            tags.setdefault(experiment_id, []).append(name)
+        return tags
+
+    def _summary_select(self):
+        """SELECT of summary columns, with relationship data as correlated subqueries."""
+        from sqlalchemy import Text, and_, cast
+        from sqlalchemy import func as sqlfunc
+
+        from synth_lab.models.orm.synth import SynthGroup as SynthGroupORM
+
+        has_analysis = (
+            select(AnalysisRunORM.id)
+            .where(AnalysisRunORM.experiment_id == ExperimentORM.id)
+            .exists())
+        has_interview_guide = (
+            select(InterviewGuideORM.experiment_id)
+            .where(InterviewGuideORM.experiment_id == ExperimentORM.id)
+            .exists())
+        interview_count = (
+            select(sqlfunc.count(ResearchExecutionORM.exec_id))
+            .where(ResearchExecutionORM.experiment_id == ExperimentORM.id)
+            .scalar_subquery())
+        # JSON 'null' and SQL NULL both mean "no scorecard" (works on Postgres and SQLite)
+        has_scorecard = and_(
+            ExperimentORM.scorecard_data.isnot(None),
+            cast(ExperimentORM.scorecard_data, Text) != "null")
+
+        return (
+            select(
+                ExperimentORM.id,
+                ExperimentORM.name,
+                ExperimentORM.hypothesis,
+                ExperimentORM.description,
+                ExperimentORM.synth_group_id,
+                SynthGroupORM.name.label("synth_group_name"),
+                has_scorecard.label("has_scorecard"),
+                has_analysis.label("has_analysis"),
+                has_interview_guide.label("has_interview_guide"),
+                interview_count.label("interview_count"),
+                ExperimentORM.created_at,
+                ExperimentORM.updated_at)
+            .select_from(ExperimentORM)
+            .outerjoin(SynthGroupORM, SynthGroupORM.id == ExperimentORM.synth_group_id))
+
     def update_scorecard(
         self, experiment_id: str, scorecard_data: ScorecardData
     ) -> Experiment | None:
@@ -328,8 +443,8 @@ session: Session | None = None):
             created_at=created_at,
             updated_at=updated_at)
 
-    def _row_to_summary(self, row) -> ExperimentSummary:
-        """Convert a database row to ExperimentSummary."""
+    def _row_to_summary(self, row, tags: list[str]) -> ExperimentSummary:
+        """Convert a summary query row (mapping) and its tag names to ExperimentSummary."""
         created_at = row["created_at"]
         if isinstance(created_at, str):
             created_at = datetime.fromisoformat(created_at)
@@ -338,28 +453,18 @@ session: Session | None = None):
         if isinstance(updated_at, str):
             updated_at = datetime.fromisoformat(updated_at)
 
-        # Check if scorecard is present
-        has_scorecard = False
-        if "scorecard_data" in row.keys() and row["scorecard_data"]:
-            has_scorecard = True
-
-        # Get synth_group_name if available in row, otherwise default to "Unknown"
-        synth_group_name = row.get("synth_group_name", "Unknown")
-
         return ExperimentSummary(
             id=row["id"],
             name=row["name"],
             hypothesis=row["hypothesis"],
             description=row["description"],
             synth_group_id=row["synth_group_id"],
-            synth_group_name=synth_group_name,
-            has_scorecard=has_scorecard,
-            has_analysis=bool(row["has_analysis"]) if "has_analysis" in row.keys() else False,
-            has_interview_guide=(
-                bool(row["has_interview_guide"]) if "has_interview_guide" in row.keys() else False
-            ),
-            interview_count=row["interview_count"] if "interview_count" in row.keys() else 0,
-            tags=[],  # Raw SQL conversion doesn't load tags
+            synth_group_name=row["synth_group_name"] or "Unknown",
+            has_scorecard=bool(row["has_scorecard"]),
+            has_analysis=bool(row["has_analysis"]),
+            has_interview_guide=bool(row["has_interview_guide"]),
+            interview_count=row["interview_count"] or 0,
+            tags=sorted(tags),
             created_at=created_at,
             updated_at=updated_at)
 
@@ -396,59 +501,13 @@ session: Session | None = None):
             created_at=created_at,
             updated_at=updated_at)
 
-    def _orm_to_summary(self, orm_exp: ExperimentORM) -> ExperimentSummary:
-        """Convert ORM model to ExperimentSummary."""
-        created_at = orm_exp.created_at
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-
-        updated_at = orm_exp.updated_at
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
-
-        # Check relationships via lazy loading
-        has_scorecard = orm_exp.scorecard_data is not None
-        has_analysis = orm_exp.analysis_run is not None
-        has_interview_guide = orm_exp.interview_guide is not None
-        interview_count = len(orm_exp.research_executions) if orm_exp.research_executions else 0
-
-        # Get tag names from experiment_tags relationship
-        tags = [et.tag.name for et in orm_exp.experiment_tags] if orm_exp.experiment_tags else []
-
-        # Get synth group name from relationship
-        synth_group_name = "Unknown"
-        try:
-            if orm_exp.synth_group:
-                synth_group_name = orm_exp.synth_group.name
-        except Exception:
-            # If relationship fails to load, use default
-            pass
-
-        return ExperimentSummary(
-            id=orm_exp.id,
-            name=orm_exp.name,
-            hypothesis=orm_exp.hypothesis,
-            description=orm_exp.description,
-            synth_group_id=orm_exp.synth_group_id,
-            synth_group_name=synth_group_name,
-            has_scorecard=has_scorecard,
-            has_analysis=has_analysis,
-            has_interview_guide=has_interview_guide,
-            interview_count=interview_count,
-            tags=tags,
-            created_at=created_at,
-            updated_at=updated_at)
-
 
 if __name__ == "__main__":
     import sys
     import tempfile
     from pathlib import Path
 
-    from synth_lab.domain.entities.experiment import (
-        Experiment,
-        ScorecardData,
-        ScorecardDimension)
+    from synth_lab.domain.entities.experiment import Experiment, ScorecardData, ScorecardDimension
 
     # Validation
     all_validation_failures = []
@@ -14,8 +14,8 @@ References:
 import json
 from datetime import datetime
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, literal, select
+from sqlalchemy.orm import Session, aliased
 
 from synth_lab.domain.entities.exploration import (
     Exploration,
@@ -313,7 +313,8 @@ session: Session | None = None):
         """
         Get the path from root to a specific node.
 
-        Uses recursive CTE to traverse the tree (or in-memory traversal for ORM).
+        Uses a recursive CTE over parent_id, so the whole path is loaded in a
+        single query regardless of depth.
 
         Args:
             node_id: Target node ID.
@@ -321,17 +322,97 @@ session: Session | None = None):
         Returns:
             List of nodes from root to target, ordered by depth.
         """
-        # Build path by traversing parent relationships
-        path = []
-        current = self.session.get(ScenarioNodeORM, node_id)
-        while current is not None:
-            path.append(self._orm_to_node(current))
-            if current.parent_id is None:
-                break
-            current = self.session.get(ScenarioNodeORM, current.parent_id)
-        # Reverse to get root-to-target order
-        path.reverse()
-        return path
+        ancestors = (
+            select(ScenarioNodeORM.id, ScenarioNodeORM.parent_id)
+            .where(ScenarioNodeORM.id == node_id)
+            .cte("ancestors", recursive=True)
+        )
+        parent = aliased(ScenarioNodeORM)
+        ancestors = ancestors.union_all(
+            select(parent.id, parent.parent_id).join(ancestors, parent.id == ancestors.c.parent_id)
+        )
+        stmt = (
+            select(ScenarioNodeORM)
+            .join(ancestors, ScenarioNodeORM.id == ancestors.c.id)
+            .order_by(ScenarioNodeORM.depth.asc())
+        )
+        orm_nodes = list(self.session.execute(stmt).scalars().all())
+        return [self._orm_to_node(n) for n in orm_nodes]
+
+    def get_subtree(
+        self,
+        exploration_id: str,
+        root_id: str | None = None,
+        max_depth: int | None = None,
+        statuses: list[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> tuple[list[ScenarioNode], int]:
+        """
+        Get the nodes of a subtree (or the whole tree) in a single query.
+
+        Descendants of root_id are collected with a recursive CTE that stops
+        descending at max_depth. The total count of matching nodes comes from
+        a window function in the same query.
+
+        Args:
+            exploration_id: Exploration ID.
+            root_id: Subtree root node ID (None for the whole tree).
+            max_depth: Levels below the subtree root to include (0 = root only).
+                For the whole tree this is the absolute node depth.
+            statuses: Only include nodes with these statuses (None for all).
+            limit: Maximum nodes to return (None for all).
+            offset: Number of matching nodes to skip.
+
+        Returns:
+            Tuple of (nodes ordered by depth then creation, total matching nodes).
+        """
+        total_col = func.count().over().label("total")
+
+        if root_id is None:
+            stmt = select(ScenarioNodeORM, total_col).where(
+                ScenarioNodeORM.exploration_id == exploration_id
+            )
+            if max_depth is not None:
+                stmt = stmt.where(ScenarioNodeORM.depth <= max_depth)
+        else:
+            descendants = (
+                select(ScenarioNodeORM.id, literal(0).label("level"))
+                .where(ScenarioNodeORM.id == root_id)
+                .where(ScenarioNodeORM.exploration_id == exploration_id)
+                .cte("descendants", recursive=True)
+            )
+            child = aliased(ScenarioNodeORM)
+            step = select(child.id, (descendants.c.level + 1).label("level")).join(
+                descendants, child.parent_id == descendants.c.id
+            )
+            if max_depth is not None:
+                step = step.where(descendants.c.level < max_depth)
+            descendants = descendants.union_all(step)
+            stmt = select(ScenarioNodeORM, total_col).join(
+                descendants, ScenarioNodeORM.id == descendants.c.id
+            )
+
+        if statuses:
+            stmt = stmt.where(ScenarioNodeORM.node_status.in_(statuses))
+
+        stmt = stmt.order_by(
+            ScenarioNodeORM.depth.asc(), ScenarioNodeORM.created_at.asc(), ScenarioNodeORM.id.asc()
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        if offset:
+            stmt = stmt.offset(offset)
+
+        rows = self.session.execute(stmt).all()
+        if not rows and offset:
+            # Page past the end: no row carries the window count, so count separately
+            count_stmt = select(func.count()).select_from(stmt.limit(None).offset(None).subquery())
+            return [], self.session.execute(count_stmt).scalar() or 0
+
+        total = rows[0].total if rows else 0
+        return [self._orm_to_node(row[0]) for row in rows], total
+
     def count_nodes_by_status(self, exploration_id: str) -> dict[str, int]:
         """
         Count nodes by status for an exploration.
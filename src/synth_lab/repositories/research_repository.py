@@ -10,12 +10,14 @@ References:
 """
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import uuid4
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from synth_lab.models.events import ExecutionEvent
+from synth_lab.models.orm.research import ResearchEvent as ResearchEventORM
 from synth_lab.models.orm.research import ResearchExecution as ResearchExecutionORM
 from synth_lab.models.orm.research import Transcript as TranscriptORM
 from synth_lab.models.pagination import PaginatedResponse, PaginationMeta, PaginationParams
@@ -181,6 +183,73 @@ session: Session | None = None):
 
         return self._orm_to_transcript_detail(orm_transcript)
 
+    def get_transcript_details(self, exec_id: str) -> list[TranscriptDetail]:
+        """
+        Get all transcripts of an execution with their messages in one query.
+
+        Args:
+            exec_id: Execution ID.
+
+        Returns:
+            List of TranscriptDetail, oldest first.
+        """
+        stmt = (
+            select(TranscriptORM)
+            .where(TranscriptORM.exec_id == exec_id)
+            .order_by(TranscriptORM.timestamp.asc())
+        )
+        transcripts_orm = self.session.execute(stmt).scalars().all()
+        return [self._orm_to_transcript_detail(t) for t in transcripts_orm]
+
+    # =========================================================================
+    # Event log
+    # =========================================================================
+
+    def append_event(self, exec_id: str, event_type: str, data: dict) -> ExecutionEvent:
+        """
+        Append an event to the execution's event log.
+
+        Args:
+            exec_id: Execution ID.
+            event_type: SSE event type.
+            data: Event payload (JSON-serializable).
+
+        Returns:
+            The stored event with its assigned sequence number.
+        """
+        orm_event = ResearchEventORM(
+            exec_id=exec_id,
+            event_type=event_type,
+            data=data,
+            created_at=datetime.now(timezone.utc).isoformat())
+        self._add(orm_event)
+        self._flush()
+        self._commit()
+        return self._orm_to_event(orm_event)
+
+    def get_events(
+        self, exec_id: str, after_seq: int = 0, limit: int | None = None
+    ) -> list[ExecutionEvent]:
+        """
+        Get the events of an execution after a sequence number (one ranged query).
+
+        Args:
+            exec_id: Execution ID.
+            after_seq: Only return events with seq greater than this.
+            limit: Maximum number of events.
+
+        Returns:
+            Events ordered by sequence number.
+        """
+        stmt = (
+            select(ResearchEventORM)
+            .where(ResearchEventORM.exec_id == exec_id, ResearchEventORM.seq > after_seq)
+            .order_by(ResearchEventORM.seq.asc())
+        )
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return [self._orm_to_event(e) for e in self.session.execute(stmt).scalars().all()]
+
     # =========================================================================
     # ORM conversion methods
     # =========================================================================
@@ -270,6 +339,15 @@ session: Session | None = None):
             timestamp=timestamp,
             status=orm_transcript.status)
 
+    def _orm_to_event(self, orm_event: ResearchEventORM) -> ExecutionEvent:
+        """Convert ORM model to ExecutionEvent."""
+        return ExecutionEvent(
+            seq=orm_event.seq,
+            exec_id=orm_event.exec_id,
+            event_type=orm_event.event_type,
+            data=orm_event.data or {},
+            timestamp=datetime.fromisoformat(orm_event.created_at))
+
     def _orm_to_transcript_detail(self, orm_transcript: TranscriptORM) -> TranscriptDetail:
         """Convert ORM model to TranscriptDetail."""
         timestamp = orm_transcript.timestamp
@@ -205,6 +205,30 @@ session: Session | None = None):
         if orm_outcome is None:
             return None
         return self._orm_to_outcome(orm_outcome)
+    def get_by_synths_and_analysis(
+        self,
+        synth_ids: list[str],
+        analysis_id: str) -> dict[str, SynthOutcome]:
+        """
+        Get simulation results for several synths in an analysis with one query.
+
+        Used to prefetch interview context for a whole batch of synths.
+
+        Args:
+            synth_ids: The synth IDs.
+            analysis_id: The analysis run ID.
+
+        Returns:
+            Dict mapping synth_id to SynthOutcome. Synths without outcome are omitted.
+        """
+        if not synth_ids:
+            return {}
+
+        stmt = select(SynthOutcomeORM).where(
+            SynthOutcomeORM.synth_id.in_(synth_ids),
+            SynthOutcomeORM.analysis_id == analysis_id)
+        orm_outcomes = self.session.execute(stmt).scalars().all()
+        return {o.synth_id: self._orm_to_outcome(o) for o in orm_outcomes}
     def get_analysis_statistics(self, analysis_id: str) -> dict | None:
         """
         Get aggregated statistics for an analysis.
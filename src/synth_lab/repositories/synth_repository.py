@@ -155,6 +155,21 @@ session: Session | None = None):
         if orm_synth is None:
             raise SynthNotFoundError(synth_id)
         return self._orm_to_detail(orm_synth)
+
+    def get_names(self, synth_ids: list[str]) -> dict[str, str]:
+        """
+        Get the names of several synths in one query.
+
+        Args:
+            synth_ids: Synth IDs.
+
+        Returns:
+            Mapping of synth ID to name (unknown IDs are omitted).
+        """
+        if not synth_ids:
+            return {}
+        stmt = select(SynthORM.id, SynthORM.nome).where(SynthORM.id.in_(synth_ids))
+        return {synth_id: nome for synth_id, nome in self.session.execute(stmt)}
     def search(
         self,
         where_clause: str | None = None,
@@ -21,6 +21,10 @@ from synth_lab.repositories.analysis_outcome_repository import AnalysisOutcomeRe
 from synth_lab.services.simulation.chart_data_service import ChartDataService
 from synth_lab.services.simulation.clustering_service import ClusteringService
 from synth_lab.services.simulation.explainability_service import ExplainabilityService
+from synth_lab.services.simulation.outcome_aggregates import (
+    OutcomeAggregates,
+    get_outcome_aggregate_cache,
+)
 from synth_lab.services.simulation.outlier_service import OutlierService
 
 
@@ -34,19 +38,25 @@ class AnalysisCacheService:
 
     # Default parameters for cached charts
     DEFAULT_PARAMS = {
-        CacheKeys.TRY_VS_SUCCESS: {"x_threshold": 0.5, "y_threshold": 0.5},
-        CacheKeys.DISTRIBUTION: {"sort_by": "success_rate", "order": "desc", "limit": 50},
+        CacheKeys.TRY_VS_SUCCESS: {"x_threshold": 0.5, "y_threshold": 0.5, "offset": 0},
+        CacheKeys.DISTRIBUTION: {
+            "sort_by": "success_rate",
+            "order": "desc",
+            "limit": 50,
+            "offset": 0,
+        },
         CacheKeys.HEATMAP: {
-            "x_axis": "digital_literacy",
-            "y_axis": "domain_expertise",
+            "x_axis": "capability_mean",
+            "y_axis": "trust_mean",
             "bins": 5,
             "metric": "failed_rate",
         },
         CacheKeys.SCATTER: {
-            "x_axis": "digital_literacy",
+            "x_axis": "trust_mean",
             "y_axis": "success_rate",
+            "show_trendline": True,
         },
-        CacheKeys.CORRELATIONS: {},
+        CacheKeys.CORRELATIONS: {"method": "pearson"},
         CacheKeys.EXTREME_CASES: {"n_per_category": 5},
         CacheKeys.OUTLIERS: {"contamination": 0.1},
         CacheKeys.SHAP_SUMMARY: {"features": None},
@@ -92,11 +102,15 @@ class AnalysisCacheService:
         results: dict[str, bool] = {}
         cache_entries: dict[str, dict[str, Any]] = {}
 
+        # Shared aggregates for overview charts (also reused by chart endpoints)
+        aggregates = OutcomeAggregates.from_outcomes(outcomes)
+        get_outcome_aggregate_cache().set(analysis_id, aggregates)
+
         # Phase 1: Overview charts
         try:
             chart = self.chart_service.get_try_vs_success(
                 simulation_id=analysis_id,
-                outcomes=outcomes,
+                outcomes=aggregates,
                 **self.DEFAULT_PARAMS[CacheKeys.TRY_VS_SUCCESS])
             cache_entries[CacheKeys.TRY_VS_SUCCESS] = chart.model_dump()
             results[CacheKeys.TRY_VS_SUCCESS] = True
@@ -107,7 +121,7 @@ class AnalysisCacheService:
         try:
             chart = self.chart_service.get_outcome_distribution(
                 simulation_id=analysis_id,
-                outcomes=outcomes,
+                outcomes=aggregates,
                 **self.DEFAULT_PARAMS[CacheKeys.DISTRIBUTION])
             cache_entries[CacheKeys.DISTRIBUTION] = chart.model_dump()
             results[CacheKeys.DISTRIBUTION] = True
@@ -141,7 +155,8 @@ class AnalysisCacheService:
         try:
             chart = self.chart_service.get_attribute_correlations(
                 simulation_id=analysis_id,
-                outcomes=outcomes)
+                outcomes=outcomes,
+                **self.DEFAULT_PARAMS[CacheKeys.CORRELATIONS])
             cache_entries[CacheKeys.CORRELATIONS] = chart.model_dump()
             results[CacheKeys.CORRELATIONS] = True
         except Exception as e:
@@ -245,6 +260,28 @@ class AnalysisCacheService:
 
         return results
 
+    def is_default(self, cache_key: str, params: dict[str, Any]) -> bool:
+        """
+        Check whether chart parameters match the pre-computed ones.
+
+        Parameters set to None (feature defaults) are ignored on both sides.
+
+        Args:
+            cache_key: Cache key (e.g., 'heatmap').
+            params: Request parameters, named as in the chart service call.
+
+        Returns:
+            True if the cached entry answers these parameters.
+        """
+        defaults = self.DEFAULT_PARAMS.get(cache_key)
+        if defaults is None:
+            return False
+
+        def _given(values: dict[str, Any]) -> dict[str, Any]:
+            return {k: v for k, v in values.items() if v is not None}
+
+        return _given(params) == _given(defaults)
+
     def get_cached(
         self,
         analysis_id: str,
@@ -28,10 +28,16 @@ from synth_lab.domain.entities.feature_scorecard import (
     FeatureScorecard,
     ScorecardDimension,
     ScorecardIdentification)
+from synth_lab.domain.entities.analysis_cache import CacheKeys
+from synth_lab.repositories.analysis_cache_repository import AnalysisCacheRepository
 from synth_lab.repositories.analysis_outcome_repository import AnalysisOutcomeRepository
 from synth_lab.repositories.analysis_repository import AnalysisRepository
 from synth_lab.repositories.experiment_repository import ExperimentRepository
+from synth_lab.services.analysis.chart_response_cache import get_chart_response_cache
+from synth_lab.services.simulation.outcome_aggregates import get_outcome_aggregate_cache
 from synth_lab.services.simulation.engine import MonteCarloEngine
+from synth_lab.services.simulation.explainability_service import ExplainabilityService
+from synth_lab.services.simulation.outcome_model import OutcomeModel
 
 
 class AnalysisExecutionService:
@@ -41,10 +47,12 @@ class AnalysisExecutionService:
         self,
         analysis_repo: AnalysisRepository | None = None,
         experiment_repo: ExperimentRepository | None = None,
-        outcome_repo: AnalysisOutcomeRepository | None = None):
+        outcome_repo: AnalysisOutcomeRepository | None = None,
+        cache_repo: AnalysisCacheRepository | None = None):
         self.analysis_repo = analysis_repo or AnalysisRepository()
         self.experiment_repo = experiment_repo or ExperimentRepository()
         self.outcome_repo = outcome_repo or AnalysisOutcomeRepository()
+        self.cache_repo = cache_repo or AnalysisCacheRepository()
         self.logger = logger.bind(component="analysis_execution_service")
 
     def execute_analysis(
@@ -90,6 +98,8 @@ class AnalysisExecutionService:
         # Delete existing analysis if present
         existing = self.analysis_repo.get_by_experiment_id(experiment_id)
         if existing:
+            get_chart_response_cache().invalidate_experiment(experiment_id)
+            get_outcome_aggregate_cache().invalidate(existing.id)
             self.outcome_repo.delete_outcomes(existing.id)
             self.analysis_repo.delete(existing.id)
             self.logger.info(f"Deleted existing analysis {existing.id}")
@@ -121,6 +131,12 @@ class AnalysisExecutionService:
             # Convert experiment scorecard to simulation format
             scorecard = self._convert_scorecard(experiment)
             scenario = self._load_default_scenario()
+            scorecard_scores = {
+                "complexity": scorecard.complexity.score,
+                "initial_effort": scorecard.initial_effort.score,
+                "perceived_risk": scorecard.perceived_risk.score,
+                "time_to_value": scorecard.time_to_value.score,
+            }
 
             # Execute Monte Carlo simulation
             import time
@@ -147,6 +163,20 @@ class AnalysisExecutionService:
             ]
             self.outcome_repo.save_outcomes(analysis.id, outcome_dicts)
 
+            # Exact simulation model of this run. Stored with the run so
+            # explanations keep describing it after the scorecard is edited.
+            outcome_model = OutcomeModel(
+                scorecard_scores=scorecard_scores,
+                scenario={
+                    "trust_modifier": scenario.trust_modifier,
+                    "friction_modifier": scenario.friction_modifier,
+                    "motivation_modifier": scenario.motivation_modifier,
+                    "task_criticality": scenario.task_criticality,
+                },
+                sigma=config.sigma)
+            self.cache_repo.save(
+                analysis.id, CacheKeys.OUTCOME_MODEL, outcome_model.to_dict())
+
             # Update analysis with results
             aggregated = AggregatedOutcomes(
                 did_not_try_rate=results.aggregated_did_not_try,
@@ -167,7 +197,8 @@ class AnalysisExecutionService:
             )
 
             # Pre-compute chart cache for fast retrieval
-            self._pre_compute_cache(analysis.id)
+            # (explainability uses the exact simulation model of this run)
+            self._pre_compute_cache(analysis.id, outcome_model=outcome_model)
 
             return updated_analysis or analysis
 
@@ -376,7 +407,9 @@ class AnalysisExecutionService:
             w_risk=0.25,
             w_time_to_value=0.25)
 
-    def _pre_compute_cache(self, analysis_id: str) -> None:
+    def _pre_compute_cache(
+        self, analysis_id: str, outcome_model: OutcomeModel | None = None
+    ) -> None:
         """
         Pre-compute chart cache for an analysis in background thread.
 
@@ -386,6 +419,7 @@ class AnalysisExecutionService:
 
         Args:
             analysis_id: Analysis ID to cache charts for.
+            outcome_model: Optional exact simulation model for SHAP/PDP.
         """
         logger_ref = self.logger  # Capture logger for thread
 
@@ -395,7 +429,8 @@ class AnalysisExecutionService:
                     AnalysisCacheService)
 
                 # Create fresh cache service (with new DB connection for thread safety)
-                cache_service = AnalysisCacheService()
+                cache_service = AnalysisCacheService(
+                    explainability_service=ExplainabilityService(outcome_model=outcome_model))
                 results = cache_service.pre_compute_all(analysis_id)
 
                 success_count = sum(1 for v in results.values() if v)
@@ -444,10 +479,11 @@ class AnalysisExecutionService:
 
     async def _generate_insights_parallel(self, analysis_id: str) -> None:
         """
-        Generate insights for all 7 chart types in parallel using asyncio.
+        Generate insights for all cached chart types in parallel using asyncio.
 
-        Creates concurrent tasks for each chart type to minimize total generation time.
-        After all insights complete, generates executive summary.
+        Charts are grouped into batches answered by one LLM call each, and the
+        batches run concurrently. After all insights complete, generates
+        executive summary.
 
         Args:
             analysis_id: Analysis ID to generate insights for.
@@ -462,10 +498,11 @@ class AnalysisExecutionService:
                 AnalysisCacheRepository)
             from synth_lab.services.executive_summary_service import (
                 ExecutiveSummaryService)
-            from synth_lab.services.insight_service import InsightService
+            from synth_lab.services.insight_service import (
+                INSIGHT_BATCH_SIZE,
+                InsightService)
 
             cache_repo = AnalysisCacheRepository()
-            insight_service = InsightService(cache_repo=cache_repo)
             summary_service = ExecutiveSummaryService(cache_repo=cache_repo)
 
             # Map chart_type to cache_key (only charts with pre-computed cache)
@@ -481,61 +518,45 @@ class AnalysisExecutionService:
             }
 
             # Filter to only charts that actually exist in cache
-            cached_entries = cache_repo.get_all(analysis_id)
-            cached_keys = {entry.cache_key for entry in cached_entries}
+            cached_data = {entry.cache_key: entry.data for entry in cache_repo.get_all(analysis_id)}
 
-            chart_types = [
-                chart_type
+            charts = {
+                chart_type: cached_data[cache_key]
                 for chart_type, cache_key in CHART_TYPE_TO_CACHE_KEY.items()
-                if cache_key in cached_keys
-            ]
+                if cache_key in cached_data
+            }
 
-            skipped = [
-                chart_type
-                for chart_type, cache_key in CHART_TYPE_TO_CACHE_KEY.items()
-                if cache_key not in cached_keys
-            ]
+            skipped = [ct for ct in CHART_TYPE_TO_CACHE_KEY if ct not in charts]
             if skipped:
                 logger_ref.debug(
                     f"Skipping insights for charts not in cache: {skipped}"
                 )
 
+            # Several charts per LLM call; batches run in parallel threads, each
+            # with its own service (repository sessions are not thread-safe)
+            chart_types = list(charts)
+            batches = [
+                {ct: charts[ct] for ct in chart_types[i : i + INSIGHT_BATCH_SIZE]}
+                for i in range(0, len(chart_types), INSIGHT_BATCH_SIZE)
+            ]
             logger_ref.info(
-                f"Generating insights for {len(chart_types)} charts: {analysis_id}"
+                f"Generating insights for {len(charts)} charts in {len(batches)} "
+                f"LLM calls: {analysis_id}"
             )
 
-            # Generate all insights in parallel
-            async def generate_single_insight(chart_type: str) -> None:
+            async def generate_batch(batch: dict[str, Any]) -> None:
                 try:
-                    # Get cache key for this chart type
-                    cache_key = CHART_TYPE_TO_CACHE_KEY.get(chart_type)
-                    if cache_key is None:
-                        logger_ref.warning(f"No cache key mapping for {chart_type}, skipping")
-                        return
-
-                    # Get chart data from cache
-                    cache_entry = cache_repo.get(analysis_id, cache_key)
-                    if cache_entry is None:
-                        logger_ref.warning(
-                            f"No cache entry for {cache_key} in analysis {analysis_id}, skipping"
-                        )
-                        return
-
-                    chart_data = cache_entry.data
-
-                    # Generate insight
-                    insight = insight_service.generate_insight(
-                        analysis_id, chart_type, chart_data
-                    )
-                    logger_ref.info(
-                        f"Generated {chart_type} insight for {analysis_id}: {insight.status}"
+                    insights = await asyncio.to_thread(
+                        lambda: InsightService().generate_insights(analysis_id, batch)
                     )
+                    for chart_type, insight in insights.items():
+                        logger_ref.info(
+                            f"Generated {chart_type} insight for {analysis_id}: {insight.status}"
+                        )
                 except Exception as e:
-                    logger_ref.error(f"Failed to generate {chart_type} insight: {e}")
+                    logger_ref.error(f"Failed to generate {list(batch)} insights: {e}")
 
-            # Run all tasks in parallel
-            tasks = [generate_single_insight(ct) for ct in chart_types]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*(generate_batch(b) for b in batches), return_exceptions=True)
 
             logger_ref.info(f"All chart insights completed for {analysis_id}")
 
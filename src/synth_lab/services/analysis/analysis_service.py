@@ -19,6 +19,8 @@ from synth_lab.domain.entities.analysis_run import (
     AnalysisRun)
 from synth_lab.repositories.analysis_repository import AnalysisRepository
 from synth_lab.repositories.experiment_repository import ExperimentRepository
+from synth_lab.services.analysis.chart_response_cache import get_chart_response_cache
+from synth_lab.services.simulation.outcome_aggregates import get_outcome_aggregate_cache
 
 
 class AnalysisService:
@@ -186,6 +188,10 @@ class AnalysisService:
         Returns:
             True if deleted, False if not found.
         """
+        get_chart_response_cache().invalidate_experiment(experiment_id)
+        existing = self.analysis_repo.get_by_experiment_id(experiment_id)
+        if existing is not None:
+            get_outcome_aggregate_cache().invalidate(existing.id)
         return self.analysis_repo.delete_by_experiment_id(experiment_id)
 
     def rerun_analysis(
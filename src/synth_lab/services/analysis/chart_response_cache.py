@@ -0,0 +1,194 @@
+"""
+In-memory chart response cache for analysis chart endpoints.
+
+Keeps computed chart responses per (analysis_id, experiment version, chart,
+normalized params) with a strong ETag, so repeated polling is answered from
+memory (or with 304 Not Modified) without touching the database.
+
+The experiment version is its updated_at, which changes with the scorecard
+(Sankey and SHAP/PDP charts depend on it). Entries are bounded (LRU) and
+invalidated in-process when the analysis is re-run or deleted, or the
+scorecard changes. The experiment -> (analysis, version) lookup expires
+after a short TTL, so changes made by other processes are picked up: a new
+version yields new keys and ETags instead of serving stale charts.
+
+References:
+    - Router: api/routers/analysis.py (chart endpoints)
+    - Pre-computed charts: services/analysis/analysis_cache_service.py
+
+Sample usage:
+    from synth_lab.services.analysis.chart_response_cache import get_chart_response_cache
+
+    cache = get_chart_response_cache()
+    cache.set_current_analysis("exp_12345678", "ana_12345678", "2026-01-05T10:00:00")
+    entry = cache.set(
+        "exp_12345678", "ana_12345678", "2026-01-05T10:00:00", "heatmap", {"bins": 5}, chart)
+    entry.etag  # '"3f2a..."'
+
+Expected output:
+    CachedChart with the response model and its strong ETag.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_core import to_json
+
+# Max chart responses kept in memory (least recently used evicted)
+CHART_CACHE_MAX_ENTRIES = 512
+
+# Seconds an experiment -> (analysis, version) lookup is trusted without the database
+ANALYSIS_INDEX_TTL_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class CachedChart:
+    """Chart response with its strong ETag."""
+
+    payload: Any
+    etag: str
+
+
+def normalize_params(params: dict[str, Any]) -> str:
+    """Canonical JSON for chart parameters (key order independent)."""
+    return json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches an ETag.
+
+    Uses weak comparison (RFC 9110), as required for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ChartResponseCache:
+    """Thread-safe LRU cache of chart responses with experiment invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = CHART_CACHE_MAX_ENTRIES,
+        analysis_ttl_seconds: float = ANALYSIS_INDEX_TTL_SECONDS):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of chart responses kept.
+            analysis_ttl_seconds: Lifetime of an experiment -> (analysis, version) lookup.
+        """
+        self._entries: OrderedDict[tuple[str, str, str, str, str], CachedChart] = OrderedDict()
+        self._analyses: dict[str, tuple[str, str, float]] = {}
+        self._max_entries = max_entries
+        self._analysis_ttl = analysis_ttl_seconds
+        self._lock = threading.Lock()
+
+    def current_analysis(self, experiment_id: str) -> tuple[str, str] | None:
+        """Completed analysis ID and version of an experiment, if known and not expired."""
+        with self._lock:
+            known = self._analyses.get(experiment_id)
+            if known is None:
+                return None
+            analysis_id, version, expires_at = known
+            if time.monotonic() >= expires_at:
+                del self._analyses[experiment_id]
+                return None
+            return analysis_id, version
+
+    def set_current_analysis(self, experiment_id: str, analysis_id: str, version: str) -> None:
+        """Record the completed analysis and version (updated_at) of an experiment."""
+        with self._lock:
+            previous = self._analyses.get(experiment_id)
+            if previous is not None and previous[:2] != (analysis_id, version):
+                self._drop_experiment_entries(experiment_id)
+            self._analyses[experiment_id] = (
+                analysis_id, version, time.monotonic() + self._analysis_ttl)
+
+    def get(
+        self,
+        experiment_id: str,
+        analysis_id: str,
+        version: str,
+        chart: str,
+        params: dict[str, Any]) -> CachedChart | None:
+        """Get a cached chart response (or None)."""
+        key = (experiment_id, analysis_id, version, chart, normalize_params(params))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        experiment_id: str,
+        analysis_id: str,
+        version: str,
+        chart: str,
+        params: dict[str, Any],
+        payload: Any) -> CachedChart:
+        """
+        Store a chart response and compute its ETag.
+
+        Args:
+            experiment_id: Experiment ID.
+            analysis_id: Analysis the chart was computed from.
+            version: Experiment version (updated_at) the chart was computed at.
+            chart: Chart name (e.g., CacheKeys.HEATMAP).
+            params: Chart parameters.
+            payload: Response model (or list of models).
+
+        Returns:
+            Stored CachedChart.
+        """
+        body = to_json(payload)
+        digest = hashlib.sha256(
+            b"\0".join([analysis_id.encode(), version.encode(), chart.encode(), body]))
+        entry = CachedChart(payload=payload, etag=f'"{digest.hexdigest()[:32]}"')
+
+        key = (experiment_id, analysis_id, version, chart, normalize_params(params))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate_experiment(self, experiment_id: str) -> None:
+        """Drop the analysis lookup and all chart responses of an experiment."""
+        with self._lock:
+            self._analyses.pop(experiment_id, None)
+            self._drop_experiment_entries(experiment_id)
+
+    def clear(self) -> None:
+        """Remove everything."""
+        with self._lock:
+            self._entries.clear()
+            self._analyses.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop_experiment_entries(self, experiment_id: str) -> None:
+        for key in [k for k in self._entries if k[0] == experiment_id]:
+            del self._entries[key]
+
+
+_chart_response_cache = ChartResponseCache()
+
+
+def get_chart_response_cache() -> ChartResponseCache:
+    """Get the process-wide chart response cache."""
+    return _chart_response_cache
@@ -0,0 +1,370 @@
+"""
+Avatar generation job queue.
+
+Avatars are generated 9 at a time: one gpt-image-1 call draws a 3x3 grid
+that is split into per-synth PNGs. AvatarJobQueue is a long-lived,
+process-wide queue of synths waiting for an avatar:
+
+- Jobs are deduplicated by synth_id: a synth already queued or being
+  generated is not queued again, and every caller gets the same result.
+- A dispatcher fills each block with up to 9 waiting synths, whichever
+  request queued them (interview batches, synth group warm-ups), waiting
+  briefly for more before a partial block is padded with placeholders.
+  While all workers are busy, synths accumulate into fuller blocks.
+- Up to `workers` blocks are generated concurrently (each in a worker
+  thread) and image requests are spaced by a rate limiter.
+
+References:
+    - Block generation: gen_synth/avatar_generator.py (generate_avatar_block)
+    - Callers: services/avatar_service.py, api/routers/synth_groups.py (warm-up)
+
+Sample usage:
+    from synth_lab.services.avatar_jobs import get_avatar_job_queue
+
+    queue = get_avatar_job_queue()
+    paths = await queue.ensure(synths)  # wait for the avatars
+    queued = queue.warm_up(synths)      # generate in the background
+
+Expected output:
+    paths == {"abc123": Path("output/synths/avatar/abc123.png"), ...}
+    queued == 12
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from synth_lab.infrastructure.config import (
+    AVATAR_BATCH_WINDOW,
+    AVATAR_MIN_REQUEST_INTERVAL,
+    AVATAR_WORKERS,
+    AVATARS_DIR,
+)
+
+# Avatars per generated image (3x3 grid)
+BLOCK_SIZE = 9
+
+# (synths, avatar_dir, block_num) -> saved avatar paths; blocking
+BlockGenerator = Callable[..., list[str]]
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def generate_block(synths: list[dict[str, Any]], avatar_dir: Path, block_num: int) -> list[str]:
+    """
+    Generate avatars for up to 9 synths with one image request (blocking).
+
+    Args:
+        synths: Synths of the block (padded with placeholders up to 9).
+        avatar_dir: Directory where avatars are saved.
+        block_num: Block number (logging and placeholder IDs).
+
+    Returns:
+        Paths of the saved avatars (placeholders excluded).
+    """
+    from synth_lab.gen_synth.avatar_generator import (
+        create_openai_client,
+        generate_avatar_block,
+        pad_block_synths,
+    )
+
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = create_openai_client()
+    return generate_avatar_block(
+        pad_block_synths(synths, block_num), _client, avatar_dir, block_num=block_num)
+
+
+class RequestRateLimiter:
+    """Spaces requests at least min_interval seconds apart."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._next_at = 0.0
+
+    async def acquire(self) -> None:
+        """Wait for the next request slot."""
+        # Slot is reserved before awaiting, so concurrent callers queue up
+        now = time.monotonic()
+        start = max(now, self._next_at)
+        self._next_at = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class AvatarJobQueue:
+    """Deduplicating avatar queue served by a bounded pool of block workers."""
+
+    def __init__(
+        self,
+        avatar_dir: Path | None = None,
+        workers: int = AVATAR_WORKERS,
+        min_interval: float = AVATAR_MIN_REQUEST_INTERVAL,
+        batch_window: float = AVATAR_BATCH_WINDOW,
+        generate: BlockGenerator | None = None):
+        """
+        Initialize queue (the dispatcher starts on first use).
+
+        Args:
+            avatar_dir: Directory where avatars are saved (default: AVATARS_DIR).
+            workers: Number of blocks generated concurrently.
+            min_interval: Minimum seconds between image requests.
+            batch_window: Seconds a partial block waits for more synths.
+            generate: Block generator (default: generate_block).
+        """
+        self.avatar_dir = Path(avatar_dir or AVATARS_DIR)
+        self.workers = max(1, workers)
+        self.batch_window = batch_window
+        self._generate = generate
+        self._limiter = RequestRateLimiter(min_interval)
+        self._pending: dict[str, asyncio.Future] = {}
+        self._queue: asyncio.Queue | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._block_count = 0
+        self.logger = logger.bind(component="avatar_jobs")
+
+    @property
+    def pending_count(self) -> int:
+        """Synths queued or being generated."""
+        return len(self._pending)
+
+    def submit(self, synths: list[dict[str, Any]]) -> dict[str, asyncio.Future]:
+        """
+        Queue synths that have no avatar yet.
+
+        Synths without 'id', with an existing avatar file or already queued
+        are not queued again (queued ones share the pending result).
+
+        Args:
+            synths: Synth dictionaries.
+
+        Returns:
+            Dict of synth_id -> future resolving to the avatar path
+            (None if generation failed), for synths without an avatar.
+        """
+        self._start()
+        futures: dict[str, asyncio.Future] = {}
+        for synth in synths:
+            synth_id = synth.get("id")
+            if not synth_id or synth_id in futures:
+                continue
+            future = self._pending.get(synth_id)
+            if future is None:
+                if (self.avatar_dir / f"{synth_id}.png").exists():
+                    continue
+                future = self._loop.create_future()
+                self._pending[synth_id] = future
+                self._queue.put_nowait((synth, future))
+            futures[synth_id] = future
+        return futures
+
+    async def ensure(self, synths: list[dict[str, Any]]) -> dict[str, Path]:
+        """
+        Queue synths without avatar and wait for their generation.
+
+        Args:
+            synths: Synth dictionaries.
+
+        Returns:
+            Dict of synth_id -> avatar path for the generated avatars.
+        """
+        futures = self.submit(synths)
+        if not futures:
+            return {}
+        # Shielded: a cancelled caller must not cancel avatars shared with others
+        paths = await asyncio.gather(*(asyncio.shield(f) for f in futures.values()))
+        return {
+            synth_id: path for synth_id, path in zip(futures, paths) if path is not None
+        }
+
+    def warm_up(self, synths: list[dict[str, Any]]) -> int:
+        """
+        Queue synths without avatar for background generation.
+
+        Args:
+            synths: Synth dictionaries.
+
+        Returns:
+            Number of synths queued or already pending.
+        """
+        return len(self.submit(synths))
+
+    async def stop(self) -> None:
+        """Stop the dispatcher and workers (pending jobs are dropped)."""
+        tasks = [*self._running, *([self._dispatcher] if self._dispatcher else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._running.clear()
+        self._dispatcher = None
+        self._loop = None
+        self._pending.clear()
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        # First use, or a new event loop: jobs of a previous loop cannot resume
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._pending.clear()
+        self._running.clear()
+        self._dispatcher = loop.create_task(self._dispatch(), name="avatar-dispatcher")
+
+    async def _dispatch(self) -> None:
+        while True:
+            # Wait for a free worker first, so jobs accumulate into fuller blocks
+            await self._slots.acquire()
+            block = await self._next_block()
+            task = self._loop.create_task(self._run_block(block))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _next_block(self) -> list[tuple[dict[str, Any], asyncio.Future]]:
+        """Wait for a job, then gather up to a full block within the batch window."""
+        block = [await self._queue.get()]
+        deadline = self._loop.time() + self.batch_window
+        while len(block) < BLOCK_SIZE:
+            if not self._queue.empty():
+                block.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            try:
+                block.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except TimeoutError:
+                break
+        return block
+
+    async def _run_block(self, block: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        self._block_count += 1
+        block_num = self._block_count
+        synths = [synth for synth, _ in block]
+        paths: dict[str, Path] = {}
+        try:
+            await self._limiter.acquire()
+            generate = self._generate or generate_block
+            saved = await asyncio.to_thread(
+                generate, synths=synths, avatar_dir=self.avatar_dir, block_num=block_num)
+            paths = {Path(path).stem: Path(path) for path in saved}
+            self.logger.info(f"Avatar block {block_num}: {len(paths)}/{len(synths)} generated")
+        except Exception as e:
+            # Avatars are helpful but not essential: callers get None
+            self.logger.warning(f"Avatar block {block_num} failed ({len(synths)} synths): {e}")
+        finally:
+            self._slots.release()
+            for synth, future in block:
+                self._pending.pop(synth["id"], None)
+                if not future.done():
+                    future.set_result(paths.get(synth["id"]))
+
+
+_queues: dict[Path, AvatarJobQueue] = {}
+
+
+def get_avatar_job_queue(avatar_dir: Path | None = None) -> AvatarJobQueue:
+    """Get the process-wide avatar queue for a directory (default: AVATARS_DIR)."""
+    key = Path(avatar_dir or AVATARS_DIR)
+    if key not in _queues:
+        _queues[key] = AvatarJobQueue(avatar_dir=key)
+    return _queues[key]
+
+
+async def stop_avatar_job_queues() -> None:
+    """Stop the dispatchers and workers of all avatar queues."""
+    for queue in list(_queues.values()):
+        await queue.stop()
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+
+    all_validation_failures = []
+    total_tests = 0
+
+    def synth(synth_id: str) -> dict[str, Any]:
+        return {"id": synth_id, "nome": synth_id}
+
+    async def scenario(avatar_dir: Path) -> tuple[list[list[str]], dict, dict, int]:
+        blocks: list[list[str]] = []
+
+        def fake_generate(synths: list[dict], avatar_dir: Path, block_num: int) -> list[str]:
+            time.sleep(0.01)
+            blocks.append([s["id"] for s in synths])
+            saved = []
+            for s in synths:
+                path = avatar_dir / f"{s['id']}.png"
+                path.write_bytes(b"png")
+                saved.append(str(path))
+            return saved
+
+        (avatar_dir / "exists.png").write_bytes(b"png")
+        queue = AvatarJobQueue(
+            avatar_dir, workers=2, min_interval=0, batch_window=0.05, generate=fake_generate)
+        # Two requests overlap (s3 in both) and fill blocks together
+        first = queue.ensure([synth(f"s{i}") for i in range(5)] + [synth("exists")])
+        second = queue.ensure([synth(f"s{i}") for i in range(3, 8)])
+        queued = queue.warm_up([synth("s1"), synth("w1")])
+        results = await asyncio.gather(first, second)
+        await queue.stop()
+        return blocks, results[0], results[1], queued
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        blocks, first, second, queued = asyncio.run(scenario(Path(temp_dir)))
+
+    # Test 1: Each synth generated once; existing avatars skipped
+    total_tests += 1
+    generated = [synth_id for block in blocks for synth_id in block]
+    if sorted(generated) != sorted({f"s{i}" for i in range(8)} | {"w1"}):
+        all_validation_failures.append(f"Unexpected generated synths: {generated}")
+
+    # Test 2: Requests batched into a single block
+    total_tests += 1
+    if len(blocks) != 1:
+        all_validation_failures.append(f"Expected 1 block, got {len(blocks)}: {blocks}")
+
+    # Test 3: Callers get paths for their own synths (shared ones included)
+    total_tests += 1
+    if set(first) != {f"s{i}" for i in range(5)} or set(second) != {f"s{i}" for i in range(3, 8)}:
+        all_validation_failures.append(f"Wrong results: {sorted(first)}, {sorted(second)}")
+    if queued != 2:
+        all_validation_failures.append(f"Warm-up should report 2 queued, got {queued}")
+
+    # Test 4: Rate limiter spaces request slots
+    total_tests += 1
+
+    async def slots() -> list[float]:
+        limiter = RequestRateLimiter(0.05)
+        start = time.monotonic()
+
+        async def one() -> float:
+            await limiter.acquire()
+            return time.monotonic() - start
+
+        return await asyncio.gather(one(), one(), one())
+
+    times = sorted(asyncio.run(slots()))
+    if times[2] < 0.09:
+        all_validation_failures.append(f"Requests not spaced: {times}")
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
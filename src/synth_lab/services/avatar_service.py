@@ -5,6 +5,7 @@ Ensures synths have avatars generated before interviews or other operations.
 
 References:
     - Avatar Generator: synth_lab.gen_synth.avatar_generator
+    - Avatar job queue: synth_lab.services.avatar_jobs
     - Config: synth_lab.infrastructure.config.AVATARS_DIR
 
 Sample Input:
@@ -22,19 +23,22 @@ from typing import Any, Awaitable, Callable
 from loguru import logger
 
 from synth_lab.infrastructure.config import AVATARS_DIR
+from synth_lab.services.avatar_jobs import AvatarJobQueue, get_avatar_job_queue
 
 
 class AvatarService:
     """Service for ensuring synths have avatar images."""
 
-    def __init__(self, avatars_dir: Path | None = None):
+    def __init__(self, avatars_dir: Path | None = None, job_queue: AvatarJobQueue | None = None):
         """
         Initialize avatar service.
 
         Args:
             avatars_dir: Directory for avatar files (default: AVATARS_DIR from config)
+            job_queue: Avatar job queue (default: process-wide queue for avatars_dir)
         """
         self.avatars_dir = avatars_dir or AVATARS_DIR
+        self.job_queue = job_queue or get_avatar_job_queue(self.avatars_dir)
         self.logger = logger.bind(component="avatar_service")
 
     async def ensure_avatars_for_synths(
@@ -57,7 +61,9 @@ class AvatarService:
             Dict mapping synth_id to avatar file path for newly generated avatars.
 
         Note:
-            - Avatars are generated in batches of 9 (OpenAI API optimization)
+            - Avatars are generated in batches of 9 (OpenAI API optimization),
+              shared with other requests through the avatar job queue
+            - Synths already queued by another request are not generated twice
             - Synths without 'id' field are skipped
             - Avatar generation errors are logged but don't fail the operation
         """
@@ -92,24 +98,12 @@ class AvatarService:
         if on_generation_start:
             await on_generation_start(count_to_generate)
 
-        # Import avatar generator
-        import asyncio
-
-        from synth_lab.gen_synth.avatar_generator import generate_avatars
-
         generated_paths: dict[str, Path] = {}
 
         try:
-            # Run avatar generation in a separate thread to avoid blocking the event loop
-            # generate_avatars uses time.sleep() and synchronous API calls
-            path_strings = await asyncio.to_thread(generate_avatars, synths=synths_without_avatar)
-            self.logger.info(f"Successfully generated {len(path_strings)} avatar files")
-
-            # Build result dict - convert strings to Path objects
-            for path_str in path_strings:
-                path = Path(path_str)
-                synth_id = path.stem  # filename without extension
-                generated_paths[synth_id] = path
+            # Blocks are generated by the queue's workers (in threads, rate limited)
+            generated_paths = await self.job_queue.ensure(synths_without_avatar)
+            self.logger.info(f"Successfully generated {len(generated_paths)} avatar files")
 
             # Notify generation complete
             if on_generation_complete:
@@ -123,6 +117,28 @@ class AvatarService:
 
         return generated_paths
 
+    def warm_up_group(self, synth_group_id: str) -> tuple[int, int]:
+        """
+        Queue avatar generation for all synths of a group (non-blocking).
+
+        Must be called from the event loop; avatars are generated in the
+        background by the avatar job queue.
+
+        Args:
+            synth_group_id: Synth group ID.
+
+        Returns:
+            Tuple of (synths in the group, synths queued for generation).
+        """
+        from synth_lab.gen_synth.storage import load_synths
+
+        synths = load_synths(synth_group_id=synth_group_id)
+        queued = self.job_queue.warm_up(synths)
+        self.logger.info(
+            f"Avatar warm-up for group {synth_group_id}: {queued} of {len(synths)} synths queued"
+        )
+        return len(synths), queued
+
     def get_avatar_path(self, synth_id: str) -> Path | None:
         """
         Get avatar file path for a synth.
@@ -21,6 +21,13 @@ from synth_lab.models.chat import ChatRequest, ChatResponse
 from synth_lab.repositories.research_repository import ResearchRepository
 from synth_lab.repositories.synth_repository import SynthRepository
 from synth_lab.services.chat.instructions import format_chat_instructions
+from synth_lab.services.persona_prompt_cache import (
+    CHAT_SYSTEM_PROMPT,
+    PersonaPrompt,
+    PersonaPromptCache,
+    get_persona_prompt_cache,
+    synth_version,
+)
 
 # Phoenix/OpenTelemetry tracer for observability
 _tracer = get_tracer("chat-service")
@@ -33,7 +40,8 @@ class ChatService:
         self,
         research_repo: ResearchRepository | None = None,
         synths_repo: SynthRepository | None = None,
-        llm_client = None
+        llm_client = None,
+        prompt_cache: PersonaPromptCache | None = None
     ):
         """Initialize chat service with dependencies.
 
@@ -41,29 +49,59 @@ class ChatService:
             research_repo: Repository for research data (optional, defaults to new instance)
             synths_repo: Repository for synth data (optional, defaults to new instance)
             llm_client: LLM client (optional, defaults to global singleton)
+            prompt_cache: Rendered system prompt cache (optional, defaults to global singleton)
         """
         self.llm_client = llm_client or get_llm_client()
         self.research_repo = research_repo or ResearchRepository()
         self.synths_repo = synths_repo or SynthRepository()
+        self.prompt_cache = (
+            prompt_cache if prompt_cache is not None else get_persona_prompt_cache())
         self.logger = logger.bind(component="chat_service")
 
-    def _build_messages(self, synth_id: str, request: ChatRequest) -> tuple[list[dict], str]:
+    def _system_prompt(self, synth_id: str, exec_id: str) -> PersonaPrompt:
         """
-        Build LLM messages with synth context.
+        Get the rendered system prompt for a synth's chat.
+
+        The prompt (persona + interview transcript) is rendered once per
+        (synth, synth version, execution) and reused for every message, so
+        follow-up messages skip the database and send a byte-identical prefix.
 
         Args:
             synth_id: ID of the synth to chat with.
-            request: Chat request with message and history.
+            exec_id: Execution whose interview transcript is the context.
 
         Returns:
-            Tuple of (messages list, synth first name).
+            PersonaPrompt with the system prompt and synth first name.
         """
+        version = self.prompt_cache.known_version(synth_id)
+        if version is not None:
+            cached = self.prompt_cache.get(synth_id, version, exec_id, CHAT_SYSTEM_PROMPT)
+            if cached is not None:
+                return cached
+
         # Load synth profile
         synth = self.synths_repo.get_by_id(synth_id)
+        version = synth_version(synth.model_dump(mode="json"))
+        return self.prompt_cache.get_or_render(
+            synth_id, version, exec_id, CHAT_SYSTEM_PROMPT,
+            lambda: self._render_system_prompt(synth_id, synth, exec_id))
+
+    def _render_system_prompt(self, synth_id: str, synth, exec_id: str) -> PersonaPrompt:
+        """
+        Render the chat system prompt for a synth.
+
+        Args:
+            synth_id: ID of the synth to chat with.
+            synth: Synth details.
+            exec_id: Execution whose interview transcript is the context.
+
+        Returns:
+            PersonaPrompt with the system prompt and synth first name.
+        """
         synth_first_name = synth.nome.split()[0] if synth.nome else "Synth"
 
         # Load interview transcript
-        transcript = self.research_repo.get_transcript(request.exec_id, synth_id)
+        transcript = self.research_repo.get_transcript(exec_id, synth_id)
 
         # Format interview history for context
         interview_history = self._format_transcript(transcript)
@@ -101,9 +139,24 @@ EFEITO ESPERADO: {cc.efeito_esperado or 'N/A'}"""
             synth_cognitive_contract=cognitive_contract_str,
             interview_history=interview_history)
 
-        # Build messages for LLM
+        return PersonaPrompt(synth_name=synth_first_name, text=system_prompt)
+
+    def _build_messages(self, synth_id: str, request: ChatRequest) -> tuple[list[dict], str]:
+        """
+        Build LLM messages with synth context.
+
+        Args:
+            synth_id: ID of the synth to chat with.
+            request: Chat request with message and history.
+
+        Returns:
+            Tuple of (messages list, synth first name).
+        """
+        system_prompt = self._system_prompt(synth_id, request.exec_id)
+
+        # Build messages for LLM (system prompt first: stable prefix for prompt caching)
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": system_prompt.text},
         ]
 
         # Add chat history as alternating user/assistant messages
@@ -114,7 +167,7 @@ EFEITO ESPERADO: {cc.efeito_esperado or 'N/A'}"""
         # Add current message
         messages.append({"role": "user", "content": request.message})
 
-        return messages, synth_first_name
+        return messages, system_prompt.synth_name
 
     def generate_response(self, synth_id: str, request: ChatRequest) -> ChatResponse:
         """
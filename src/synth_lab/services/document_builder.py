@@ -0,0 +1,832 @@
+"""
+Document build orchestration for explorations and research executions.
+
+Builds the summary (with its cover image) and the PR-FAQ of one source as a
+single DocumentPipeline run. Inputs are loaded once and shared in memory;
+independent generations run concurrently:
+
+    Exploration:  summary_text (streamed) ──► image (from partial summary)
+                  material_urls ──► prfaq_text
+
+    Research:     synths ──► summary_text ──► image
+                  material_urls ──────────┴──► prfaq_text (in-memory summary)
+
+The exploration image prompt is built from the streamed summary as soon as
+enough content past the executive summary has arrived, so the image is
+generated while the summary is still being written. Per-stage timings are
+persisted in each document's metadata under "stage_timings_ms".
+Summary tokens are streamed to SSE subscribers and the partial summary is
+persisted while it is written (services/document_stream.py). Repository
+calls run in worker threads, one at a time per builder, so a build never
+blocks the event loop on the database.
+
+References:
+    - Pipeline: services/document_pipeline.py
+    - Summary services: exploration_summary_generator_service.py,
+      research_summary_generator_service.py
+    - PR-FAQ services: exploration_prfaq_generator_service.py,
+      research_prfaq_generator_service.py
+    - Image: services/summary_image_service.py
+
+Sample usage:
+    from synth_lab.services.document_builder import ExplorationDocumentBuilder
+
+    result = await ExplorationDocumentBuilder().build("expl_12345678")
+    summary = result.documents[DocumentType.EXPLORATION_SUMMARY]
+
+Expected output:
+    summary.metadata["stage_timings_ms"] == {
+        "load": {"start": 0.0, "duration": 41.2},
+        "summary_text": {"start": 41.5, "duration": 9120.3},
+        "image": {"start": 41.6, "duration": 14877.0}, ...
+    }
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from loguru import logger
+
+from synth_lab.domain.entities.experiment_document import (
+    DocumentStatus,
+    DocumentType,
+    ExperimentDocument,
+)
+from synth_lab.domain.entities.exploration import Exploration
+from synth_lab.domain.entities.scenario_node import ScenarioNode
+from synth_lab.gen_synth.storage import get_synths_by_ids
+from synth_lab.infrastructure.llm_client import LLMClient, get_llm_client
+from synth_lab.models.research import ResearchExecutionDetail, TranscriptDetail
+from synth_lab.repositories.experiment_document_repository import (
+    ExperimentDocumentRepository,
+)
+from synth_lab.repositories.experiment_material_repository import (
+    ExperimentMaterialRepository,
+)
+from synth_lab.repositories.experiment_repository import ExperimentRepository
+from synth_lab.repositories.exploration_repository import ExplorationRepository
+from synth_lab.repositories.research_repository import ResearchRepository
+from synth_lab.services.document_pipeline import (
+    DocumentPipeline,
+    PartialText,
+    PipelineResult,
+    PipelineStage,
+    stream_completion,
+)
+from synth_lab.services.document_stream import DocumentStreamWriter, document_channel
+from synth_lab.services.exploration_prfaq_generator_service import (
+    ExplorationPRFAQGeneratorService,
+    PRFAQGenerationInProgressError,
+)
+from synth_lab.services.exploration_summary_generator_service import (
+    ExplorationNotCompletedError,
+    ExplorationSummaryGeneratorService,
+    SummaryGenerationInProgressError,
+)
+from synth_lab.services.exploration_utils import get_winning_path
+from synth_lab.services.materials_context import presign_material_urls
+from synth_lab.services.research_agentic.runner import ConversationMessage, InterviewResult
+from synth_lab.services.research_agentic.summarizer import summarize_interviews
+from synth_lab.services.research_prfaq.generator import generate_prfaq_from_content
+from synth_lab.services.research_prfaq_generator_service import (
+    PRFAQGenerationInProgressError as ResearchPRFAQInProgressError,
+)
+from synth_lab.services.research_prfaq_generator_service import SummaryNotFoundError
+from synth_lab.services.research_summary_generator_service import (
+    ExecutionNotCompletedError,
+    NotLinkedToExperimentError,
+    NoTranscriptsError,
+    ResearchSummaryGeneratorService,
+)
+from synth_lab.services.research_summary_generator_service import (
+    SummaryGenerationInProgressError as ResearchSummaryInProgressError,
+)
+from synth_lab.services.summary_image_service import (
+    SummaryImageService,
+    extract_image_prompt,
+    get_summary_image_service,
+)
+
+# Image generation starts once the streamed summary has this many characters
+# of image-relevant content (executive summary and recommendations excluded)
+IMAGE_PROMPT_MIN_CHARS = 1200
+
+EXPLORATION_DOCUMENTS = (DocumentType.EXPLORATION_SUMMARY, DocumentType.EXPLORATION_PRFAQ)
+RESEARCH_DOCUMENTS = (DocumentType.RESEARCH_SUMMARY, DocumentType.RESEARCH_PRFAQ)
+
+_T = TypeVar("_T")
+
+_log = logger.bind(component="document_builder")
+
+
+@dataclass
+class DocumentBuildResult:
+    """Documents produced by one build, with generation errors and timings."""
+
+    documents: dict[DocumentType, ExperimentDocument] = field(default_factory=dict)
+    errors: dict[DocumentType, BaseException] = field(default_factory=dict)
+    timings_ms: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def raise_for(self, document_type: DocumentType) -> ExperimentDocument:
+        """Return a document, re-raising its generation error if it failed."""
+        if document_type in self.errors:
+            raise self.errors[document_type]
+        return self.documents[document_type]
+
+
+def image_prompt_ready(text: str) -> bool:
+    """Whether a partial summary has enough content for the image prompt."""
+    return len(extract_image_prompt(text)) >= IMAGE_PROMPT_MIN_CHARS
+
+
+def extract_headline(markdown: str) -> str | None:
+    """First level-1 heading of a markdown document."""
+    for line in markdown.split("\n"):
+        if line.startswith("# "):
+            return line[2:].strip()
+    return None
+
+
+async def _in_thread(lock: threading.Lock, fn: Callable[..., _T], *args: Any) -> _T:
+    """Run blocking repository calls in a worker thread, one call at a time per lock."""
+    def call() -> _T:
+        with lock:
+            return fn(*args)
+
+    return await asyncio.to_thread(call)
+
+
+def _reserve_documents(
+    document_repo: ExperimentDocumentRepository,
+    experiment_id: str,
+    source_id: str,
+    requests: dict[DocumentType, tuple[str, Callable[[], Exception]]]) -> dict:
+    """
+    Create pending records for all requested documents.
+
+    Args:
+        document_repo: Document repository.
+        experiment_id: Experiment ID.
+        source_id: Exploration or execution ID.
+        requests: Document type -> (model, in-progress error factory).
+
+    Returns:
+        Document type -> pending ExperimentDocument.
+
+    Raises:
+        The in-progress error of the first document already being generated.
+        Records reserved before the conflict are marked failed.
+    """
+    for document_type, (_, in_progress) in requests.items():
+        existing = document_repo.get_by_experiment(
+            experiment_id, document_type, source_id=source_id)
+        if existing and existing.status == DocumentStatus.GENERATING:
+            raise in_progress()
+
+    pending: dict[DocumentType, ExperimentDocument] = {}
+    for document_type, (model, in_progress) in requests.items():
+        doc = document_repo.create_pending(
+            experiment_id=experiment_id,
+            document_type=document_type,
+            source_id=source_id,
+            model=model)
+        if doc is None:
+            for reserved in pending:
+                document_repo.update_status(
+                    experiment_id=experiment_id,
+                    document_type=reserved,
+                    status=DocumentStatus.FAILED,
+                    source_id=source_id,
+                    error_message="Build cancelled: another generation is in progress")
+            raise in_progress()
+        pending[document_type] = doc
+    return pending
+
+
+def _finalize_documents(
+    document_repo: ExperimentDocumentRepository,
+    experiment_id: str,
+    source_id: str,
+    outputs: dict[DocumentType, tuple[str | None, BaseException | None, dict]],
+    timings_ms: dict[str, dict[str, float]]) -> DocumentBuildResult:
+    """
+    Persist the outcome of every built document.
+
+    Args:
+        document_repo: Document repository.
+        experiment_id: Experiment ID.
+        source_id: Exploration or execution ID.
+        outputs: Document type -> (content, error, metadata).
+        timings_ms: Stage timings of the build.
+
+    Returns:
+        DocumentBuildResult with the saved documents.
+    """
+    result = DocumentBuildResult(timings_ms=timings_ms)
+    for document_type, (content, error, metadata) in outputs.items():
+        metadata = {**metadata, "stage_timings_ms": timings_ms}
+        if error is None:
+            document_repo.update_status(
+                experiment_id=experiment_id,
+                document_type=document_type,
+                status=DocumentStatus.COMPLETED,
+                source_id=source_id,
+                markdown_content=content,
+                metadata=metadata)
+        else:
+            result.errors[document_type] = error
+            document_repo.update_status(
+                experiment_id=experiment_id,
+                document_type=document_type,
+                status=DocumentStatus.FAILED,
+                source_id=source_id,
+                error_message=str(error),
+                metadata=metadata)
+        result.documents[document_type] = document_repo.get_by_experiment(
+            experiment_id, document_type, source_id=source_id)
+    return result
+
+
+class _PartialSaver:
+    """
+    Persists a streamed summary's partial content off the event loop.
+
+    Called on the loop, each save runs in a worker thread. A save that comes
+    due while the previous one is still running is skipped: the next one
+    catches up, and the build stores the final content itself.
+    """
+
+    def __init__(
+        self,
+        document_repo: ExperimentDocumentRepository,
+        lock: threading.Lock,
+        experiment_id: str,
+        document_type: DocumentType,
+        source_id: str):
+        self._document_repo = document_repo
+        self._lock = lock
+        self._experiment_id = experiment_id
+        self._document_type = document_type
+        self._source_id = source_id
+        self._task: asyncio.Future | None = None
+
+    def __call__(self, text: str) -> None:
+        """Save the text generated so far (DocumentStreamWriter persist hook)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._save(text)  # Already off the loop
+            return
+        if self._task is not None and not self._task.done():
+            return
+        self._task = loop.run_in_executor(None, self._save, text)
+        self._task.add_done_callback(self._log_failure)
+
+    def _save(self, text: str) -> None:
+        """Blocking save, serialized with the build's other repository calls."""
+        with self._lock:
+            self._document_repo.save_partial_content(
+                self._experiment_id, self._document_type, text, source_id=self._source_id)
+
+    def _log_failure(self, task: asyncio.Future) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            _log.warning(
+                f"Failed to persist partial {self._document_type.value} "
+                f"for {self._source_id}: {task.exception()}")
+
+
+def _summary_writer(
+    document_repo: ExperimentDocumentRepository,
+    lock: threading.Lock,
+    experiment_id: str,
+    document_type: DocumentType,
+    source_id: str) -> DocumentStreamWriter:
+    """Writer streaming a summary's tokens and persisting its partial content."""
+    return DocumentStreamWriter(
+        document_channel(experiment_id, document_type, source_id),
+        persist=_PartialSaver(document_repo, lock, experiment_id, document_type, source_id))
+
+
+def _elapsed_ms(origin: float) -> dict[str, float]:
+    """Timing entry for a step that started at origin and ends now."""
+    return {"start": 0.0, "duration": round((time.perf_counter() - origin) * 1000, 1)}
+
+
+@dataclass
+class ExplorationBuildContext:
+    """Inputs shared by all documents of an exploration build."""
+
+    exploration: Exploration
+    experiment_name: str
+    materials: list
+    winning_path: list[ScenarioNode]
+    metadata: dict[str, Any]
+
+
+@dataclass
+class ResearchBuildContext:
+    """Inputs shared by all documents of a research build."""
+
+    execution: ResearchExecutionDetail
+    experiment_id: str
+    summary_title: str
+    materials: list
+    transcripts: list[TranscriptDetail] = field(default_factory=list)
+    saved_summary: str | None = None
+
+
+class ExplorationDocumentBuilder:
+    """Builds exploration summary, cover image and PR-FAQ concurrently."""
+
+    def __init__(
+        self,
+        exploration_repo: ExplorationRepository | None = None,
+        document_repo: ExperimentDocumentRepository | None = None,
+        experiment_repo: ExperimentRepository | None = None,
+        material_repo: ExperimentMaterialRepository | None = None,
+        llm_client: LLMClient | None = None,
+        image_service: SummaryImageService | None = None,
+    ):
+        """
+        Initialize builder.
+
+        Args:
+            exploration_repo: Repository for exploration data.
+            document_repo: Repository for document storage.
+            experiment_repo: Repository for experiment data.
+            material_repo: Repository for experiment materials.
+            llm_client: LLM client for content generation.
+            image_service: Service for generating summary images.
+        """
+        self._exploration_repo = exploration_repo or ExplorationRepository()
+        self._document_repo = document_repo or ExperimentDocumentRepository()
+        self._experiment_repo = experiment_repo or ExperimentRepository()
+        self._material_repo = material_repo
+        self._llm_client = llm_client or get_llm_client()
+        self._image_service = image_service or get_summary_image_service()
+        # Prompt builders of the single-document services
+        self._summary_prompts = ExplorationSummaryGeneratorService(llm_client=self._llm_client)
+        self._prfaq_prompts = ExplorationPRFAQGeneratorService(llm_client=self._llm_client)
+        # Serializes repository calls, which run in worker threads
+        self._db_lock = threading.Lock()
+        self._logger = logger.bind(component="exploration_document_builder")
+
+    def _load(self, exploration_id: str) -> ExplorationBuildContext:
+        """
+        Load and validate everything the documents need.
+
+        Raises:
+            ValueError: If exploration not found or has no nodes.
+            ExplorationNotCompletedError: If exploration is not completed.
+        """
+        exploration = self._exploration_repo.get_exploration_by_id(exploration_id)
+        if exploration is None:
+            raise ValueError(f"Exploration {exploration_id} not found")
+        if exploration.status not in ExplorationSummaryGeneratorService.COMPLETED_STATUSES:
+            raise ExplorationNotCompletedError(exploration_id, exploration.status.value)
+
+        experiment = self._experiment_repo.get_by_id(exploration.experiment_id)
+        materials = []
+        if experiment:
+            material_repo = self._material_repo or ExperimentMaterialRepository()
+            materials = material_repo.list_by_experiment(exploration.experiment_id)
+
+        winning_path = get_winning_path(self._exploration_repo, exploration_id)
+        if not winning_path:
+            raise ValueError(f"No nodes found for exploration {exploration_id}")
+
+        baseline_rate = winning_path[0].get_success_rate() or 0
+        final_rate = winning_path[-1].get_success_rate() or 0
+        improvement = (
+            ((final_rate - baseline_rate) / baseline_rate * 100) if baseline_rate > 0 else 0
+        )
+        return ExplorationBuildContext(
+            exploration=exploration,
+            experiment_name=experiment.name if experiment else "Experimento",
+            materials=materials,
+            winning_path=winning_path,
+            metadata={
+                "source": "exploration",
+                "exploration_id": exploration_id,
+                "winning_path_nodes": [n.id for n in winning_path],
+                "path_length": len(winning_path),
+                "baseline_success_rate": baseline_rate,
+                "final_success_rate": final_rate,
+                "improvement_percentage": round(improvement, 1),
+            })
+
+    async def build(
+        self,
+        exploration_id: str,
+        documents: tuple[DocumentType, ...] = EXPLORATION_DOCUMENTS) -> DocumentBuildResult:
+        """
+        Build exploration documents.
+
+        Args:
+            exploration_id: ID of the exploration.
+            documents: Document types to build (summary and/or PR-FAQ).
+
+        Returns:
+            DocumentBuildResult; documents whose generation failed are saved
+            as failed and their errors reported in result.errors.
+
+        Raises:
+            ValueError: If exploration not found or has no nodes.
+            ExplorationNotCompletedError: If exploration is not completed.
+            SummaryGenerationInProgressError: If the summary is already generating.
+            PRFAQGenerationInProgressError: If the PR-FAQ is already generating.
+        """
+        origin = time.perf_counter()
+        context = await _in_thread(self._db_lock, self._load, exploration_id)
+        experiment_id = context.exploration.experiment_id
+        with_summary = DocumentType.EXPLORATION_SUMMARY in documents
+        with_prfaq = DocumentType.EXPLORATION_PRFAQ in documents
+
+        requests = {}
+        if with_summary:
+            requests[DocumentType.EXPLORATION_SUMMARY] = (
+                "gpt-4o-mini", lambda: SummaryGenerationInProgressError(exploration_id))
+        if with_prfaq:
+            requests[DocumentType.EXPLORATION_PRFAQ] = (
+                "gpt-4o-mini", lambda: PRFAQGenerationInProgressError(exploration_id))
+        pending = await _in_thread(
+            self._db_lock, _reserve_documents, self._document_repo, experiment_id,
+            exploration_id, requests)
+        load_timing = _elapsed_ms(origin)
+
+        stages = []
+        writer = None
+        if with_summary:
+            writer = _summary_writer(
+                self._document_repo, self._db_lock, experiment_id,
+                DocumentType.EXPLORATION_SUMMARY, exploration_id)
+            partial = PartialText(on_append=writer.write)
+            summary_doc_id = pending[DocumentType.EXPLORATION_SUMMARY].id
+
+            async def summary_text(artifacts: dict) -> str:
+                prompt = self._summary_prompts._build_prompt(
+                    context.exploration, context.winning_path, context.experiment_name,
+                    materials=context.materials)
+                return await stream_completion(
+                    self._llm_client,
+                    partial,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.7,
+                    max_tokens=2000,
+                    operation_name="Generate Exploration Summary")
+
+            async def image(artifacts: dict) -> tuple:
+                prefix = await partial.wait_for(image_prompt_ready)
+                path = await self._image_service.generate_image(
+                    markdown_content=prefix,
+                    experiment_id=experiment_id,
+                    doc_id=summary_doc_id,
+                    materials=context.materials)
+                return path, len(prefix)
+
+            stages += [PipelineStage("summary_text", summary_text), PipelineStage("image", image)]
+
+        if with_prfaq:
+            async def material_urls(artifacts: dict) -> dict:
+                return await asyncio.to_thread(presign_material_urls, context.materials)
+
+            async def prfaq_text(artifacts: dict) -> str:
+                prompt = self._prfaq_prompts._build_prompt(
+                    context.exploration, context.winning_path, context.experiment_name,
+                    context.materials, artifacts["material_urls"])
+                return await self._llm_client.complete_async(
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.7,
+                    max_tokens=3000,
+                    operation_name="Generate Exploration PRFAQ")
+
+            stages += [
+                PipelineStage("material_urls", material_urls),
+                PipelineStage("prfaq_text", prfaq_text, after=("material_urls",)),
+            ]
+
+        try:
+            run = await DocumentPipeline(stages).run(origin=origin)
+            timings = {"load": load_timing, **run.timings_ms}
+
+            outputs = {}
+            if with_summary:
+                outputs[DocumentType.EXPLORATION_SUMMARY] = self._summary_output(context, run)
+            if with_prfaq:
+                outputs[DocumentType.EXPLORATION_PRFAQ] = (
+                    run.artifacts.get("prfaq_text"), run.error_for("prfaq_text"),
+                    context.metadata)
+
+            result = await _in_thread(
+                self._db_lock, _finalize_documents, self._document_repo, experiment_id,
+                exploration_id, outputs, timings)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        self._logger.info(
+            f"Built {len(outputs)} documents for exploration {exploration_id} "
+            f"({len(result.errors)} failed)")
+        return result
+
+    def _summary_output(
+        self, context: ExplorationBuildContext, run: PipelineResult) -> tuple:
+        """Summary content with the cover image appended, if one was generated."""
+        error = run.error_for("summary_text")
+        if error is not None:
+            return None, error, context.metadata
+        content = run.artifacts["summary_text"]
+        metadata = dict(context.metadata)
+        image_path, prompt_chars = run.artifacts.get("image") or (None, 0)
+        if image_path is not None:
+            content = self._image_service.append_image_to_markdown(content, image_path)
+            metadata["image_prompt_chars"] = prompt_chars
+        return content, None, metadata
+
+
+class ResearchDocumentBuilder:
+    """Builds research summary, cover image and PR-FAQ with shared inputs."""
+
+    def __init__(
+        self,
+        research_repo: ResearchRepository | None = None,
+        document_repo: ExperimentDocumentRepository | None = None,
+        experiment_repo: ExperimentRepository | None = None,
+        material_repo: ExperimentMaterialRepository | None = None,
+        image_service: SummaryImageService | None = None,
+    ):
+        """
+        Initialize builder.
+
+        Args:
+            research_repo: Repository for research execution data.
+            document_repo: Repository for document storage.
+            experiment_repo: Repository for experiment data.
+            material_repo: Repository for experiment materials.
+            image_service: Service for generating summary images.
+        """
+        self._research_repo = research_repo or ResearchRepository()
+        self._document_repo = document_repo or ExperimentDocumentRepository()
+        self._experiment_repo = experiment_repo or ExperimentRepository()
+        self._material_repo = material_repo or ExperimentMaterialRepository()
+        self._image_service = image_service or get_summary_image_service()
+        # Serializes repository calls, which run in worker threads
+        self._db_lock = threading.Lock()
+        self._logger = logger.bind(component="research_document_builder")
+
+    def _load(self, exec_id: str, with_summary: bool) -> ResearchBuildContext:
+        """
+        Load and validate everything the documents need.
+
+        Raises:
+            ExecutionNotFoundError: If execution not found.
+            ExecutionNotCompletedError: If the summary is requested and the
+                execution is not completed.
+            NotLinkedToExperimentError: If execution not linked to experiment.
+            NoTranscriptsError: If the summary is requested and there are no transcripts.
+            SummaryNotFoundError: If only the PR-FAQ is requested and no summary exists.
+        """
+        execution = self._research_repo.get_execution(exec_id)
+        completed = execution.status.value in ResearchSummaryGeneratorService.COMPLETED_STATUSES
+        if with_summary and not completed:
+            raise ExecutionNotCompletedError(exec_id, execution.status.value)
+        if not execution.experiment_id:
+            raise NotLinkedToExperimentError(exec_id)
+        experiment_id = execution.experiment_id
+
+        transcripts = []
+        saved_summary = None
+        if with_summary:
+            transcripts = self._research_repo.get_transcript_details(exec_id)
+            if not transcripts:
+                raise NoTranscriptsError(exec_id)
+        else:
+            saved = self._document_repo.get_by_experiment(
+                experiment_id, DocumentType.RESEARCH_SUMMARY, source_id=exec_id)
+            if not saved or saved.status != DocumentStatus.COMPLETED or not saved.markdown_content:
+                raise SummaryNotFoundError(exec_id)
+            saved_summary = saved.markdown_content
+
+        experiment = self._experiment_repo.get_by_id(experiment_id)
+        return ResearchBuildContext(
+            execution=execution,
+            experiment_id=experiment_id,
+            summary_title=experiment.name if experiment else execution.topic_name,
+            materials=self._material_repo.list_by_experiment(experiment_id),
+            transcripts=transcripts,
+            saved_summary=saved_summary)
+
+    async def build(
+        self,
+        exec_id: str,
+        model: str = "gpt-4.1-mini",
+        prfaq_model: str = "gpt-4o-mini",
+        documents: tuple[DocumentType, ...] = RESEARCH_DOCUMENTS) -> DocumentBuildResult:
+        """
+        Build research documents.
+
+        When only the PR-FAQ is requested, it is generated from the saved
+        summary; otherwise from the summary produced in the same build.
+
+        Args:
+            exec_id: ID of the execution.
+            model: LLM model for the summary.
+            prfaq_model: LLM model for the PR-FAQ.
+            documents: Document types to build (summary and/or PR-FAQ).
+
+        Returns:
+            DocumentBuildResult; documents whose generation failed are saved
+            as failed and their errors reported in result.errors.
+
+        Raises:
+            ExecutionNotFoundError: If execution not found.
+            ExecutionNotCompletedError: If execution is not completed.
+            NotLinkedToExperimentError: If execution not linked to experiment.
+            NoTranscriptsError: If execution has no transcripts.
+            SummaryNotFoundError: If only the PR-FAQ is requested and no summary exists.
+            SummaryGenerationInProgressError: If the summary is already generating.
+            PRFAQGenerationInProgressError: If the PR-FAQ is already generating.
+        """
+        origin = time.perf_counter()
+        with_summary = DocumentType.RESEARCH_SUMMARY in documents
+        with_prfaq = DocumentType.RESEARCH_PRFAQ in documents
+
+        context = await _in_thread(self._db_lock, self._load, exec_id, with_summary)
+        execution = context.execution
+        experiment_id = context.experiment_id
+        transcripts = context.transcripts
+        materials = context.materials
+        summary_title = context.summary_title
+
+        artifacts: dict[str, Any] = {}
+        requests = {}
+        summary_metadata = {}
+        if with_summary:
+            summary_metadata = {
+                "source": "research",
+                "exec_id": exec_id,
+                "transcript_count": len(transcripts),
+                "topic_name": execution.topic_name,
+            }
+            requests[DocumentType.RESEARCH_SUMMARY] = (
+                model, lambda: ResearchSummaryInProgressError(exec_id))
+        else:
+            artifacts["summary_text"] = context.saved_summary
+        if with_prfaq:
+            requests[DocumentType.RESEARCH_PRFAQ] = (
+                prfaq_model, lambda: ResearchPRFAQInProgressError(exec_id))
+
+        pending = await _in_thread(
+            self._db_lock, _reserve_documents, self._document_repo, experiment_id, exec_id,
+            requests)
+        load_timing = _elapsed_ms(origin)
+
+        stages = []
+        writer = None
+        if with_summary:
+            writer = _summary_writer(
+                self._document_repo, self._db_lock, experiment_id,
+                DocumentType.RESEARCH_SUMMARY, exec_id)
+
+            async def synths(artifacts: dict) -> dict:
+                ids = [t.synth_id for t in transcripts]
+                return await asyncio.to_thread(get_synths_by_ids, ids)
+
+            async def summary_text(artifacts: dict) -> str:
+                interview_results = [
+                    (
+                        InterviewResult(
+                            messages=[
+                                ConversationMessage(
+                                    speaker=msg.speaker,
+                                    text=msg.text,
+                                    internal_notes=msg.internal_notes)
+                                for msg in t.messages
+                            ],
+                            synth_id=t.synth_id,
+                            synth_name=t.synth_name or t.synth_id,
+                            topic_guide_name=execution.topic_name,
+                            trace_path=None,
+                            total_turns=t.turn_count),
+                        artifacts["synths"].get(
+                            t.synth_id, {"id": t.synth_id, "nome": t.synth_name}),
+                    )
+                    for t in transcripts
+                ]
+                return await summarize_interviews(
+                    interview_results=interview_results,
+                    topic_guide_name=summary_title,
+                    model=model,
+                    materials=materials,
+                    on_delta=writer.write)
+
+            async def image(artifacts: dict) -> tuple:
+                path = await self._image_service.generate_image(
+                    markdown_content=artifacts["summary_text"],
+                    experiment_id=experiment_id,
+                    doc_id=pending[DocumentType.RESEARCH_SUMMARY].id)
+                return path, len(artifacts["summary_text"])
+
+            stages += [
+                PipelineStage("synths", synths),
+                PipelineStage("summary_text", summary_text, after=("synths",)),
+                PipelineStage("image", image, after=("summary_text",)),
+            ]
+
+        if with_prfaq:
+            async def material_urls(artifacts: dict) -> dict:
+                return await asyncio.to_thread(presign_material_urls, materials)
+
+            async def prfaq_text(artifacts: dict) -> str:
+                return await asyncio.to_thread(
+                    generate_prfaq_from_content,
+                    summary_content=artifacts["summary_text"],
+                    batch_id=exec_id,
+                    model=prfaq_model,
+                    experiment_id=experiment_id,
+                    materials=materials,
+                    materials_urls=artifacts["material_urls"])
+
+            prfaq_after = ("material_urls", "summary_text") if with_summary else ("material_urls",)
+            stages += [
+                PipelineStage("material_urls", material_urls),
+                PipelineStage("prfaq_text", prfaq_text, after=prfaq_after),
+            ]
+
+        try:
+            run = await DocumentPipeline(stages).run(artifacts, origin=origin)
+            timings = {"load": load_timing, **run.timings_ms}
+
+            outputs = {}
+            if with_summary:
+                error = run.error_for("summary_text")
+                content = run.artifacts.get("summary_text")
+                image_path, _ = run.artifacts.get("image") or (None, 0)
+                if error is None and image_path is not None:
+                    content = self._image_service.append_image_to_markdown(content, image_path)
+                outputs[DocumentType.RESEARCH_SUMMARY] = (content, error, summary_metadata)
+            if with_prfaq:
+                prfaq = run.artifacts.get("prfaq_text")
+                outputs[DocumentType.RESEARCH_PRFAQ] = (
+                    prfaq,
+                    run.error_for("prfaq_text"),
+                    {
+                        "source": "research",
+                        "exec_id": exec_id,
+                        "topic_name": execution.topic_name,
+                        "headline": extract_headline(prfaq) if prfaq else None,
+                    })
+
+            result = await _in_thread(
+                self._db_lock, _finalize_documents, self._document_repo, experiment_id,
+                exec_id, outputs, timings)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        self._logger.info(
+            f"Built {len(outputs)} documents for execution {exec_id} "
+            f"({len(result.errors)} failed)")
+        return result
+
+
+if __name__ == "__main__":
+    import sys
+
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: Image prompt waits for content past the executive summary
+    total_tests += 1
+    executive_only = "# T\n\n## Resumo Executivo\n" + "x" * 5000
+    with_section = executive_only + "\n\n## Características Principais\n" + "y" * 1300
+    if image_prompt_ready(executive_only) or not image_prompt_ready(with_section):
+        all_validation_failures.append("image_prompt_ready should ignore the executive summary")
+
+    # Test 2: Headline extraction
+    total_tests += 1
+    headline = extract_headline("intro\n# Checkout Expresso: Rápido\n## FAQ")
+    if headline != "Checkout Expresso: Rápido":
+        all_validation_failures.append("extract_headline should return the first H1")
+
+    # Test 3: Build result re-raises per-document errors
+    total_tests += 1
+    result = DocumentBuildResult(errors={DocumentType.EXPLORATION_PRFAQ: RuntimeError("llm")})
+    try:
+        result.raise_for(DocumentType.EXPLORATION_PRFAQ)
+        all_validation_failures.append("raise_for should re-raise the document error")
+    except RuntimeError:
+        pass
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
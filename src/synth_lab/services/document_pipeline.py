@@ -0,0 +1,347 @@
+"""
+Dependency-graph pipeline for document generation.
+
+A document build is a set of named stages (load inputs, generate text,
+generate image, ...) with explicit dependencies. DocumentPipeline starts
+every stage at once as an asyncio task; each stage waits only for the
+stages it depends on, so independent generations run concurrently.
+Stage results are stored in a shared in-memory artifacts dict, and each
+stage's start offset and duration are recorded for persistence on the
+generated documents.
+
+PartialText lets a consumer start from a streamed, partial LLM output
+(e.g. the image prompt from the first sections of a summary) while the
+producer keeps streaming.
+
+References:
+    - Builders: services/document_builder.py
+    - LLM streaming: infrastructure/llm_client.py (complete_stream)
+
+Sample usage:
+    from synth_lab.services.document_pipeline import DocumentPipeline, PipelineStage
+
+    pipeline = DocumentPipeline([
+        PipelineStage("summary", generate_summary),
+        PipelineStage("prfaq", generate_prfaq),
+        PipelineStage("save", save_documents, after=("summary", "prfaq")),
+    ])
+    result = await pipeline.run({"context": context})
+
+Expected output:
+    result.artifacts["summary"] == "# Síntese ..."
+    result.timings_ms == {"summary": {"start": 0.1, "duration": 5321.4}, ...}
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+
+from synth_lab.infrastructure.llm_client import LLMClient
+
+StageFunc = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+class StageSkippedError(Exception):
+    """Raised for a stage whose dependency failed."""
+
+    def __init__(self, stage: str, dependency: str):
+        self.stage = stage
+        self.dependency = dependency
+        super().__init__(f"Stage {stage} skipped: dependency {dependency} failed")
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """A named pipeline step and the stages it must wait for."""
+
+    name: str
+    run: StageFunc
+    after: tuple[str, ...] = ()
+
+
+@dataclass
+class PipelineResult:
+    """Artifacts, per-stage timings and errors of a pipeline run."""
+
+    artifacts: dict[str, Any]
+    timings_ms: dict[str, dict[str, float]] = field(default_factory=dict)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+
+    def error_for(self, *stages: str) -> BaseException | None:
+        """First error among the given stages (skips count as their cause)."""
+        for stage in stages:
+            error = self.errors.get(stage)
+            while isinstance(error, StageSkippedError):
+                error = self.errors.get(error.dependency)
+            if error is not None:
+                return error
+        return None
+
+
+class DocumentPipeline:
+    """Runs stages concurrently, each as soon as its dependencies finish."""
+
+    def __init__(self, stages: list[PipelineStage]):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages to run.
+
+        Raises:
+            ValueError: If names repeat, a dependency is unknown or the graph has a cycle.
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        for stage in stages:
+            unknown = set(stage.after) - self.stages.keys()
+            if unknown:
+                raise ValueError(f"Stage {stage.name} depends on unknown stages: {unknown}")
+        self._check_acyclic()
+        self.logger = logger.bind(component="document_pipeline")
+
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if stage dependencies form a cycle."""
+        remaining = {name: set(stage.after) for name, stage in self.stages.items()}
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Stage dependencies form a cycle: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+    async def run(
+        self,
+        artifacts: dict[str, Any] | None = None,
+        origin: float | None = None) -> PipelineResult:
+        """
+        Run all stages.
+
+        Stage failures do not propagate: they are recorded in the result and
+        dependent stages are skipped with StageSkippedError.
+
+        Args:
+            artifacts: Initial shared artifacts (stage results are added by name).
+            origin: time.perf_counter() value that timings are relative to
+                (default: pipeline start).
+
+        Returns:
+            PipelineResult with artifacts, timings and errors.
+        """
+        result = PipelineResult(artifacts=artifacts if artifacts is not None else {})
+        origin = time.perf_counter() if origin is None else origin
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run_stage(stage: PipelineStage) -> Any:
+            for dependency in stage.after:
+                try:
+                    await tasks[dependency]
+                except Exception:
+                    raise StageSkippedError(stage.name, dependency) from None
+            start = time.perf_counter()
+            try:
+                value = await stage.run(result.artifacts)
+            finally:
+                result.timings_ms[stage.name] = {
+                    "start": round((start - origin) * 1000, 1),
+                    "duration": round((time.perf_counter() - start) * 1000, 1),
+                }
+            result.artifacts[stage.name] = value
+            return value
+
+        for stage in self.stages.values():
+            tasks[stage.name] = asyncio.create_task(run_stage(stage), name=stage.name)
+
+        outcomes = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for name, outcome in zip(tasks, outcomes):
+            if isinstance(outcome, BaseException):
+                result.errors[name] = outcome
+                if not isinstance(outcome, StageSkippedError):
+                    self.logger.warning(f"Stage {name} failed: {outcome}")
+        return result
+
+
+class PartialText:
+    """Text that grows while an LLM streams it; consumers can wait on a prefix."""
+
+    def __init__(self, on_append: Callable[[str], None] | None = None) -> None:
+        """
+        Initialize buffer.
+
+        Args:
+            on_append: Called with every chunk (e.g. to stream it to clients).
+        """
+        self._parts: list[str] = []
+        self._on_append = on_append
+        self._changed = asyncio.Event()
+        self.done = False
+        self.error: BaseException | None = None
+
+    @property
+    def text(self) -> str:
+        """Text received so far."""
+        return "".join(self._parts)
+
+    def append(self, chunk: str) -> None:
+        """Add a streamed chunk and wake waiters."""
+        self._parts.append(chunk)
+        self._changed.set()
+        if self._on_append is not None:
+            self._on_append(chunk)
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Mark the stream complete (or failed) and wake waiters."""
+        self.done = True
+        self.error = error
+        self._changed.set()
+
+    async def wait_for(self, predicate: Callable[[str], bool]) -> str:
+        """
+        Wait until the text so far satisfies predicate or the stream ends.
+
+        Args:
+            predicate: Condition on the partial text.
+
+        Returns:
+            The partial (or complete) text.
+
+        Raises:
+            The stream's error if it failed before the predicate held.
+        """
+        while True:
+            self._changed.clear()
+            text = self.text
+            if predicate(text):
+                return text
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return text
+            await self._changed.wait()
+
+
+async def stream_completion(
+    llm_client: LLMClient,
+    partial: PartialText,
+    messages: list[dict[str, str]],
+    **kwargs: Any) -> str:
+    """
+    Stream a chat completion into a PartialText.
+
+    The blocking OpenAI stream is consumed in a worker thread; chunks are
+    handed to the event loop as they arrive.
+
+    Args:
+        llm_client: LLM client.
+        partial: Buffer that receives the chunks.
+        messages: Chat messages.
+        **kwargs: Passed to LLMClient.complete_stream.
+
+    Returns:
+        The complete text.
+    """
+    loop = asyncio.get_running_loop()
+
+    def consume() -> None:
+        for chunk in llm_client.complete_stream(messages=messages, **kwargs):
+            loop.call_soon_threadsafe(partial.append, chunk)
+
+    # Chunk callbacks are queued before the thread's result, so none are lost
+    try:
+        await asyncio.to_thread(consume)
+    except BaseException as e:
+        partial.finish(error=e)
+        raise
+    partial.finish()
+    return partial.text
+
+
+if __name__ == "__main__":
+    import sys
+
+    all_validation_failures = []
+    total_tests = 0
+
+    async def scenario() -> tuple[PipelineResult, list[str]]:
+        order: list[str] = []
+        partial = PartialText()
+
+        async def summary(artifacts: dict) -> str:
+            for chunk in ["# T\n", "## A\n", "long section\n", "## B\n"]:
+                partial.append(chunk)
+                await asyncio.sleep(0.01)
+            partial.finish()
+            order.append("summary")
+            return partial.text
+
+        async def image(artifacts: dict) -> str:
+            prefix = await partial.wait_for(lambda t: "long section" in t)
+            order.append("image")
+            return prefix
+
+        async def prfaq(artifacts: dict) -> str:
+            order.append("prfaq")
+            return "prfaq"
+
+        async def broken(artifacts: dict) -> None:
+            raise RuntimeError("boom")
+
+        async def after_broken(artifacts: dict) -> None:
+            order.append("after_broken")
+
+        pipeline = DocumentPipeline([
+            PipelineStage("summary", summary),
+            PipelineStage("image", image),
+            PipelineStage("prfaq", prfaq),
+            PipelineStage("save", lambda a: asyncio.sleep(0, result="saved"), after=("summary",)),
+            PipelineStage("broken", broken),
+            PipelineStage("after_broken", after_broken, after=("broken",)),
+        ])
+        return await pipeline.run(), order
+
+    result, order = asyncio.run(scenario())
+
+    # Test 1: Independent stages run concurrently; image starts from partial text
+    total_tests += 1
+    if order[:2] != ["prfaq", "image"] or "## B" in result.artifacts["image"]:
+        all_validation_failures.append(f"Unexpected order/prefix: {order}")
+
+    # Test 2: Dependencies are respected and timings recorded
+    total_tests += 1
+    if result.artifacts.get("save") != "saved" or set(result.timings_ms) < {"summary", "save"}:
+        all_validation_failures.append(f"Missing artifacts/timings: {result.timings_ms}")
+
+    # Test 3: Failures skip dependents and are reported by cause
+    total_tests += 1
+    if "after_broken" in order or str(result.error_for("after_broken")) != "boom":
+        all_validation_failures.append(f"Failure handling wrong: {result.errors}")
+
+    # Test 4: Cycles are rejected
+    total_tests += 1
+    def noop(artifacts: dict) -> Awaitable[None]:
+        return asyncio.sleep(0)
+
+    try:
+        DocumentPipeline([
+            PipelineStage("a", noop, after=("b",)),
+            PipelineStage("b", noop, after=("a",)),
+        ])
+        all_validation_failures.append("Cycle should raise ValueError")
+    except ValueError:
+        pass
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
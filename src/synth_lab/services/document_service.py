@@ -252,6 +252,24 @@ class DocumentService:
             f"({len(markdown_content)} chars)"
         )
 
+    def save_partial(
+        self,
+        experiment_id: str,
+        document_type: DocumentType,
+        markdown_content: str,
+        source_id: str | None = None) -> None:
+        """
+        Persist the content generated so far for a document still generating.
+
+        Args:
+            experiment_id: Experiment ID.
+            document_type: Type of document.
+            markdown_content: Partial content.
+            source_id: Source ID (exploration_id or exec_id).
+        """
+        self.repository.save_partial_content(
+            experiment_id, document_type, markdown_content, source_id)
+
     def fail_generation(
         self,
         experiment_id: str,
@@ -0,0 +1,463 @@
+"""
+Token streaming for document generation.
+
+While a document (summary, executive summary) is being generated, its text
+is published through the MessageBroker on a per-document channel and the
+partial content is persisted on the document row every few seconds.
+Clients follow the generation over SSE: they first receive the persisted
+partial text as a snapshot, then live deltas. Every delta carries its
+character offset, so a client that reconnects (SSE id / Last-Event-ID =
+offset) or falls behind is resumed from the persisted text without gaps or
+duplicates. When the generation ends, the stream sends the final stored
+document.
+
+Generations started from a streaming request run detached from the
+request (stream_generation_events starts them before the response is
+sent), so a dropped connection does not waste the LLM call: the document
+still completes and can be re-attached to.
+
+References:
+    - Broker: services/message_broker.py
+    - Document persistence: repositories/experiment_document_repository.py
+    - SSE Spec: https://developer.mozilla.org/en-US/docs/Web/API/Server-sent_events
+
+Sample usage:
+    from synth_lab.services.document_stream import DocumentStreamWriter, document_channel
+
+    channel = document_channel(experiment_id, DocumentType.RESEARCH_SUMMARY, exec_id)
+    writer = DocumentStreamWriter(channel, persist=save_partial)
+    for chunk in llm_client.complete_stream(messages):
+        writer.write(chunk)
+    complete_generation(writer.text)
+    writer.close()
+
+Expected output:
+    event: document_delta
+    id: 200
+    data: {"offset": 0, "text": "# Síntese ..."}
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from typing import Any
+
+from loguru import logger
+
+from synth_lab.domain.entities.experiment_document import (
+    DocumentStatus,
+    DocumentType,
+    ExperimentDocument,
+)
+from synth_lab.services.message_broker import BrokerMessage, MessageBroker
+
+# SSE event types
+DOCUMENT_SNAPSHOT = "document_snapshot"
+DOCUMENT_DELTA = "document_delta"
+DOCUMENT_COMPLETED = "document_completed"
+DOCUMENT_ERROR = "document_error"
+
+# Publish buffered tokens after this delay or this many characters
+PUBLISH_INTERVAL_SECONDS = 0.1
+PUBLISH_MAX_CHARS = 200
+
+# Persist the partial document at most this often
+PERSIST_INTERVAL_SECONDS = 2.0
+
+_log = logger.bind(component="document_stream")
+
+# Subscriptions of generation streams that were never consumed are dropped
+# this long after the generation ends
+ABANDONED_STREAM_GRACE_SECONDS = 30.0
+
+# Detached generations (kept referenced until they finish)
+_detached_tasks: set[asyncio.Task] = set()
+
+
+def document_channel(
+    experiment_id: str,
+    document_type: DocumentType,
+    source_id: str | None = None) -> str:
+    """Broker key of a document's token stream."""
+    return f"doc:{experiment_id}:{document_type.value}:{source_id or '-'}"
+
+
+def _sse(event_type: str, data: dict[str, Any], offset: int | None = None) -> str:
+    """Format an SSE frame (id line = character offset after this frame)."""
+    id_line = f"id: {offset}\n" if offset is not None else ""
+    return f"event: {event_type}\n{id_line}data: {json.dumps(data)}\n\n"
+
+
+def _completed_sse(document: ExperimentDocument | None) -> str:
+    """Final frame with the stored document."""
+    if document is None:
+        return _sse(DOCUMENT_ERROR, {"error": "Document not found"})
+    content = document.markdown_content or ""
+    return _sse(
+        DOCUMENT_COMPLETED,
+        {
+            "status": document.status.value,
+            "markdown_content": content,
+            "error_message": document.error_message,
+        },
+        len(content))
+
+
+class DocumentStreamWriter:
+    """
+    Publishes a document's tokens as batched deltas and persists the partial text.
+
+    Can be written from the event loop thread or from a worker thread; in the
+    latter case messages are handed to the loop given at construction. Without
+    a loop, tokens are only persisted.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        persist: Callable[[str], Any] | None = None,
+        broker: MessageBroker | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+        publish_interval: float = PUBLISH_INTERVAL_SECONDS,
+        publish_max_chars: int = PUBLISH_MAX_CHARS,
+        persist_interval: float = PERSIST_INTERVAL_SECONDS):
+        """
+        Initialize writer.
+
+        Args:
+            channel: Broker key (see document_channel).
+            persist: Saves the text generated so far (best effort).
+            broker: Message broker (defaults to the singleton).
+            loop: Event loop that publishes (default: the running loop, if any).
+            publish_interval: Seconds between delta messages.
+            publish_max_chars: Buffered characters that force a delta message.
+            persist_interval: Seconds between partial saves.
+        """
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        self.channel = channel
+        self.persist = persist
+        self.broker = broker or MessageBroker()
+        self.loop = loop
+        self.publish_interval = publish_interval
+        self.publish_max_chars = publish_max_chars
+        self.persist_interval = persist_interval
+        self._parts: list[str] = []
+        self._pending: list[str] = []
+        self._length = 0
+        self._published = 0
+        self._last_publish = time.monotonic()
+        self._last_persist = self._last_publish
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def text(self) -> str:
+        """Text written so far."""
+        return "".join(self._parts)
+
+    def write(self, chunk: str) -> None:
+        """Add a token chunk; publishes and persists when the intervals elapse."""
+        if not chunk:
+            return
+        self._parts.append(chunk)
+        self._pending.append(chunk)
+        self._length += len(chunk)
+        now = time.monotonic()
+        if (
+            self._length - self._published >= self.publish_max_chars
+            or now - self._last_publish >= self.publish_interval
+        ):
+            self.flush()
+        if self.persist is not None and now - self._last_persist >= self.persist_interval:
+            self._last_persist = now
+            try:
+                self.persist(self.text)
+            except Exception as e:
+                _log.warning(f"Failed to persist partial document {self.channel}: {e}")
+
+    def flush(self) -> None:
+        """Publish buffered tokens as one delta."""
+        self._last_publish = time.monotonic()
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        offset = self._published
+        self._published += len(text)
+        self._dispatch(self.broker.publish(
+            self.channel,
+            BrokerMessage(event_type=DOCUMENT_DELTA, data={"offset": offset, "text": text})))
+
+    def close(self) -> None:
+        """Publish remaining tokens and end the channel's streams.
+
+        Call after the final document is stored: streams reload it on close.
+        """
+        self.flush()
+        self._dispatch(self.broker.close_execution(self.channel))
+
+    def _dispatch(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a broker coroutine on the writer's loop, preserving call order."""
+        if self.loop is None or self.loop.is_closed():
+            coro.close()
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            task = self.loop.create_task(coro)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+def _drain(pending: dict[int, str], offset: int) -> tuple[str, int]:
+    """Take the contiguous text at offset from pending deltas."""
+    out: list[str] = []
+    progressed = True
+    while progressed:
+        progressed = False
+        for start in sorted(pending):
+            text = pending[start]
+            end = start + len(text)
+            if end <= offset:
+                del pending[start]
+            elif start <= offset:
+                out.append(text[offset - start:])
+                offset = end
+                del pending[start]
+                progressed = True
+    return "".join(out), offset
+
+
+async def stream_document_events(
+    channel: str,
+    load_document: Callable[[], ExperimentDocument | None],
+    resume_from: int = 0,
+    broker: MessageBroker | None = None) -> AsyncGenerator[str, None]:
+    """
+    SSE frames following a document's generation.
+
+    Events:
+        - document_snapshot: Persisted partial text from the resume offset
+        - document_delta: New tokens ({"offset", "text"})
+        - document_completed: Final status, markdown_content and error_message
+        - document_error: The document is missing
+
+    Args:
+        channel: Broker key (see document_channel).
+        load_document: Loads the stored document.
+        resume_from: Characters the client already has (Last-Event-ID).
+        broker: Message broker (defaults to the singleton).
+
+    Yields:
+        SSE frames.
+    """
+    broker = broker or MessageBroker()
+    # Subscribe first: tokens published from now on are buffered, earlier
+    # ones are covered by the persisted text (or a reload on gaps)
+    queue = broker.subscribe(channel)
+    offset = resume_from
+    try:
+        document = load_document()
+        if document is None or document.status != DocumentStatus.GENERATING:
+            yield _completed_sse(document)
+            return
+        content = document.markdown_content or ""
+        if len(content) > offset:
+            yield _sse(DOCUMENT_SNAPSHOT, {"offset": offset, "text": content[offset:]},
+                       len(content))
+            offset = len(content)
+        async for frame in _follow(queue, load_document, offset, time.monotonic()):
+            yield frame
+    finally:
+        broker.unsubscribe(channel, queue)
+
+
+def stream_generation_events(
+    channel: str,
+    load_document: Callable[[], ExperimentDocument | None],
+    generation: Coroutine[Any, Any, Any],
+    broker: MessageBroker | None = None) -> AsyncGenerator[str, None]:
+    """
+    Start a document generation now and return the SSE frames following it.
+
+    Subscribes before starting, so no event of the generation is missed, and
+    starts it detached (see start_detached), so it runs even if the client
+    goes away before the frames are consumed. The stored document, possibly
+    an earlier version, is not replayed. Must be called on the event loop.
+
+    Events:
+        - document_delta: New tokens ({"offset", "text"})
+        - document_completed: Final status, markdown_content and error_message
+        - document_error: Generation could not start or failed
+
+    Args:
+        channel: Broker key (see document_channel).
+        load_document: Loads the stored document.
+        generation: Generation coroutine.
+        broker: Message broker (defaults to the singleton).
+
+    Returns:
+        Async generator of SSE frames.
+    """
+    broker = broker or MessageBroker()
+    queue = broker.subscribe(channel)
+    task = start_detached(channel, generation, broker)
+    consumed = False
+
+    def drop_if_unconsumed() -> None:
+        if not consumed:
+            broker.unsubscribe(channel, queue)
+
+    task.add_done_callback(lambda t: t.get_loop().call_later(
+        ABANDONED_STREAM_GRACE_SECONDS, drop_if_unconsumed))
+
+    async def frames() -> AsyncGenerator[str, None]:
+        nonlocal consumed
+        consumed = True
+        try:
+            async for frame in _follow(queue, load_document, 0):
+                yield frame
+        finally:
+            broker.unsubscribe(channel, queue)
+
+    return frames()
+
+
+async def _follow(
+    queue: asyncio.Queue,
+    load_document: Callable[[], ExperimentDocument | None],
+    offset: int,
+    last_reload: float = 0.0) -> AsyncGenerator[str, None]:
+    """
+    Frames for the deltas of a subscribed queue until the generation ends.
+
+    The caller owns the subscription and unsubscribes the queue.
+    """
+    pending: dict[int, str] = {}
+    while True:
+        message = await queue.get()
+        if message is None:  # Sentinel - generation finished (or client too slow)
+            if not queue.disconnected:
+                yield _completed_sse(load_document())
+            return
+        if message.event_type == DOCUMENT_ERROR:
+            yield _sse(DOCUMENT_ERROR, message.data)
+            return
+        if message.event_type != DOCUMENT_DELTA:
+            continue
+
+        pending[message.data["offset"]] = message.data["text"]
+        delta_offset = offset
+        text, offset = _drain(pending, offset)
+        if text:
+            yield _sse(DOCUMENT_DELTA, {"offset": delta_offset, "text": text}, offset)
+
+        # Gap (dropped or reordered deltas): refill from the persisted text
+        now = time.monotonic()
+        if pending and now - last_reload >= PERSIST_INTERVAL_SECONDS:
+            last_reload = now
+            document = load_document()
+            content = document.markdown_content if document else ""
+            if content and len(content) > offset:
+                yield _sse(DOCUMENT_SNAPSHOT, {"offset": offset, "text": content[offset:]},
+                           len(content))
+                offset = len(content)
+                delta_offset = offset
+                text, offset = _drain(pending, offset)
+                if text:
+                    yield _sse(DOCUMENT_DELTA, {"offset": delta_offset, "text": text}, offset)
+
+
+def start_detached(
+    channel: str,
+    coro: Coroutine[Any, Any, Any],
+    broker: MessageBroker | None = None) -> asyncio.Task:
+    """
+    Run a document generation independently of the request that started it.
+
+    Errors are published on the channel as document_error; the channel is
+    always closed when the generation ends.
+
+    Args:
+        channel: Broker key of the generated document.
+        coro: Generation coroutine.
+        broker: Message broker (defaults to the singleton).
+
+    Returns:
+        The generation task.
+    """
+    broker = broker or MessageBroker()
+
+    async def run() -> None:
+        try:
+            await coro
+        except Exception as e:
+            _log.error(f"Detached generation for {channel} failed: {e}")
+            await broker.publish(channel, BrokerMessage(DOCUMENT_ERROR, {"error": str(e)}))
+        finally:
+            await broker.close_execution(channel)
+
+    task = asyncio.get_running_loop().create_task(run(), name=channel)
+    _detached_tasks.add(task)
+    task.add_done_callback(_detached_tasks.discard)
+    return task
+
+
+if __name__ == "__main__":
+    import sys
+
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: Channel keys identify experiment, type and source
+    total_tests += 1
+    key = document_channel("exp_1", DocumentType.RESEARCH_SUMMARY, "exec_1")
+    if key != "doc:exp_1:research_summary:exec_1":
+        all_validation_failures.append(f"Unexpected channel: {key}")
+
+    # Test 2: Drain merges overlapping and out-of-order deltas
+    total_tests += 1
+    text, end = _drain({5: "fgh", 0: "abcde", 3: "de"}, 2)
+    if (text, end) != ("cdefgh", 8):
+        all_validation_failures.append(f"Unexpected drain: {(text, end)}")
+
+    # Test 3: Writer batches tokens into contiguous deltas and closes the channel
+    total_tests += 1
+
+    async def write_tokens() -> list:
+        broker = MessageBroker()
+        broker.clear()
+        queue = broker.subscribe("doc:val")
+        writer = DocumentStreamWriter("doc:val", broker=broker, publish_max_chars=4,
+                                      publish_interval=60)
+        for token in ["ab", "cd", "e", "fgh"]:
+            writer.write(token)
+        writer.close()
+        await asyncio.sleep(0)
+        received = []
+        while not queue.empty():
+            received.append(queue.get_nowait())
+        broker.unsubscribe("doc:val", queue)
+        return received
+
+    received = asyncio.run(write_tokens())
+    deltas = [(m.data["offset"], m.data["text"]) for m in received if m is not None]
+    if deltas != [(0, "abcd"), (4, "efgh")] or received[-1] is not None:
+        all_validation_failures.append(f"Unexpected deltas: {received}")
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
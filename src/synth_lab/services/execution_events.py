@@ -0,0 +1,187 @@
+"""
+Execution event publishing for research SSE streams.
+
+Every event of a research execution is first appended to the execution's
+event log (research_events), which assigns a monotonically increasing
+sequence number, and then published through the MessageBroker with that
+sequence number. Append and publish are serialized per execution, so live
+subscribers see events in sequence order; the stream endpoint can then
+replay the log with one ranged query and switch to live delivery, using
+the sequence number to drop duplicates. Appends run in a worker thread, so
+the event loop never waits on the INSERT.
+
+References:
+    - Event log: synth_lab.models.orm.research.ResearchEvent
+    - Broker: services/message_broker.py
+    - SSE endpoint: api/routers/research.py
+
+Sample usage:
+    from synth_lab.services.execution_events import ExecutionEventPublisher
+
+    publisher = ExecutionEventPublisher(research_repo)
+    await publisher.emit(exec_id, "message", {"synth_id": "synth_001", "text": "Olá"})
+    await publisher.close(exec_id)
+
+Expected output:
+    ExecutionEvent(seq=42, exec_id=..., event_type="message", ...) per emit.
+"""
+
+import asyncio
+import threading
+from typing import Any
+
+from loguru import logger
+
+from synth_lab.models.events import ExecutionEvent
+from synth_lab.repositories.research_repository import ResearchRepository
+from synth_lab.services.message_broker import BrokerMessage, MessageBroker
+
+# Event type that ends a stream (replayed from the log for finished executions)
+EXECUTION_COMPLETED = "execution_completed"
+
+
+class ExecutionEventPublisher:
+    """Appends execution events to the event log and publishes them live."""
+
+    def __init__(self, repository: ResearchRepository, broker: MessageBroker | None = None):
+        """
+        Initialize publisher.
+
+        Args:
+            repository: Research repository used to append events. Its session
+                is used from worker threads, so it should not be shared with
+                code running on the event loop.
+            broker: Message broker (defaults to the singleton).
+        """
+        self.repository = repository
+        self.broker = broker or MessageBroker()
+        self._locks: dict[str, asyncio.Lock] = {}
+        # The repository session is not thread-safe
+        self._append_lock = threading.Lock()
+        self.logger = logger.bind(component="execution_events")
+
+    async def emit(self, exec_id: str, event_type: str, data: dict[str, Any]) -> ExecutionEvent:
+        """
+        Log an event and publish it to SSE subscribers.
+
+        Args:
+            exec_id: Execution ID.
+            event_type: SSE event type.
+            data: Event payload.
+
+        Returns:
+            The logged event.
+        """
+        lock = self._locks.get(exec_id)
+        if lock is None:
+            lock = self._locks[exec_id] = asyncio.Lock()
+        async with lock:
+            event = await asyncio.to_thread(self._append, exec_id, event_type, data)
+            await self.broker.publish(
+                exec_id,
+                BrokerMessage(
+                    event_type=event_type,
+                    data=data,
+                    timestamp=event.timestamp,
+                    seq=event.seq))
+        return event
+
+    def _append(self, exec_id: str, event_type: str, data: dict[str, Any]) -> ExecutionEvent:
+        """Append an event to the log (runs in a worker thread)."""
+        with self._append_lock:
+            return self.repository.append_event(exec_id, event_type, data)
+
+    async def close(self, exec_id: str) -> None:
+        """
+        Log the completion event and end all live streams of an execution.
+
+        Also drops the execution's lock, so long-lived publishers do not
+        accumulate one per execution.
+
+        Args:
+            exec_id: Execution ID.
+        """
+        try:
+            await self.emit(exec_id, EXECUTION_COMPLETED, {})
+        except Exception as e:
+            self.logger.error(f"Failed to log completion of {exec_id}: {e}")
+        finally:
+            await self.broker.close_execution(exec_id)
+            self._locks.pop(exec_id, None)
+
+
+if __name__ == "__main__":
+    import sys
+    from datetime import UTC, datetime
+    from unittest.mock import MagicMock
+
+    all_validation_failures = []
+    total_tests = 0
+
+    class FakeRepository:
+        def __init__(self) -> None:
+            self.events: list[ExecutionEvent] = []
+
+        def append_event(self, exec_id: str, event_type: str, data: dict) -> ExecutionEvent:
+            event = ExecutionEvent(
+                seq=len(self.events) + 1,
+                exec_id=exec_id,
+                event_type=event_type,
+                data=data,
+                timestamp=datetime.now(UTC))
+            self.events.append(event)
+            return event
+
+    async def run_scenario() -> tuple[list, dict]:
+        broker = MessageBroker()
+        broker.clear()
+        queue = broker.subscribe("exec_val")
+        publisher = ExecutionEventPublisher(FakeRepository(), broker)  # type: ignore[arg-type]
+        await asyncio.gather(*[
+            publisher.emit("exec_val", "message", {"i": i}) for i in range(5)
+        ])
+        await publisher.close("exec_val")
+        received = []
+        while not queue.empty():
+            received.append(queue.get_nowait())
+        broker.unsubscribe("exec_val", queue)
+        return received, publisher._locks
+
+    received, remaining_locks = asyncio.run(run_scenario())
+
+    # Test 1: Live messages carry increasing sequence numbers
+    total_tests += 1
+    seqs = [m.seq for m in received if m is not None]
+    if seqs != sorted(seqs) or len(seqs) != 6:
+        all_validation_failures.append(f"Sequence numbers out of order: {seqs}")
+
+    # Test 2: Completion is logged, then the stream is closed
+    total_tests += 1
+    if received[-2].event_type != EXECUTION_COMPLETED or received[-1] is not None:
+        all_validation_failures.append(f"Unexpected stream end: {received[-2:]}")
+    if remaining_locks:
+        all_validation_failures.append(f"Lock kept after close: {remaining_locks}")
+
+    # Test 3: Close still ends the stream when logging fails
+    total_tests += 1
+    failing = MagicMock()
+    failing.append_event.side_effect = RuntimeError("db down")
+    broker = MessageBroker()
+    broker.clear()
+
+    async def close_with_failure() -> object:
+        queue = broker.subscribe("exec_fail")
+        await ExecutionEventPublisher(failing, broker).close("exec_fail")
+        return queue.get_nowait()
+
+    if asyncio.run(close_with_failure()) is not None:
+        all_validation_failures.append("Close should send the sentinel even if logging fails")
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
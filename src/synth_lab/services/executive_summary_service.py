@@ -31,6 +31,8 @@ Expected output:
     Markdown string or ExecutiveSummary (legacy)
 """
 
+import asyncio
+
 from loguru import logger
 from openinference.semconv.trace import OpenInferenceSpanKindValues, SpanAttributes
 
@@ -40,8 +42,10 @@ from synth_lab.domain.entities.experiment_document import DocumentStatus, Docume
 from synth_lab.infrastructure.config import REASONING_MODEL
 from synth_lab.infrastructure.llm_client import LLMClient, get_llm_client
 from synth_lab.infrastructure.phoenix_tracing import get_tracer
+from synth_lab.infrastructure.single_flight import get_single_flight
 from synth_lab.repositories.analysis_cache_repository import AnalysisCacheRepository
 from synth_lab.services.document_service import DocumentService
+from synth_lab.services.document_stream import DocumentStreamWriter, document_channel
 
 _tracer = get_tracer()
 
@@ -248,17 +252,24 @@ Sintetize os seguintes {len(insights)} insights de gráficos em um resumo execut
 """
 
     def generate_markdown_summary(
-        self, experiment_id: str, analysis_id: str
+        self,
+        experiment_id: str,
+        analysis_id: str,
+        loop: asyncio.AbstractEventLoop | None = None,
     ) -> str:
         """
         Generate executive summary as markdown and store in experiment_documents.
 
         This is the new v16 method that generates free-form markdown output
-        and stores it in the centralized experiment_documents table.
+        and stores it in the centralized experiment_documents table. Tokens are
+        streamed to document stream subscribers and the partial markdown is
+        persisted while it is generated.
 
         Args:
             experiment_id: Experiment ID (e.g., "exp_12345678")
             analysis_id: Analysis ID (e.g., "ana_12345678")
+            loop: Event loop that publishes streamed tokens, when called from a
+                worker thread (default: the running loop, if any)
 
         Returns:
             Markdown string with the executive summary
@@ -266,6 +277,18 @@ Sintetize os seguintes {len(insights)} insights de gráficos em um resumo execut
         Raises:
             ValueError: If less than 2 completed insights available
         """
+        # Concurrent requests (automatic generation + UI) share one LLM call
+        return get_single_flight().do(
+            ("executive_summary", experiment_id, analysis_id),
+            lambda: self._generate_markdown_summary(experiment_id, analysis_id, loop))
+
+    def _generate_markdown_summary(
+        self,
+        experiment_id: str,
+        analysis_id: str,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> str:
+        """Generate and store the markdown summary (no coalescing)."""
         span_name = f"ExecutiveSummary Markdown | exp_{experiment_id[:12]}"
         with _tracer.start_as_current_span(
             span_name,
@@ -276,6 +299,7 @@ Sintetize os seguintes {len(insights)} insights de gráficos em um resumo execut
                 "operation.type": "executive_summary_markdown",
                 "output.format": "markdown",
             }):
+            writer = None
             try:
                 # Mark as generating (prevents concurrent generation)
                 pending = self.document_service.start_generation(
@@ -293,6 +317,13 @@ Sintetize os seguintes {len(insights)} insights de gráficos em um resumo execut
                         )
                     raise ValueError("Executive summary generation already in progress")
 
+                # Streams tokens to subscribers and persists the partial markdown
+                writer = DocumentStreamWriter(
+                    document_channel(experiment_id, DocumentType.EXECUTIVE_SUMMARY),
+                    persist=lambda text: self.document_service.save_partial(
+                        experiment_id, DocumentType.EXECUTIVE_SUMMARY, text),
+                    loop=loop)
+
                 # Retrieve all insights
                 all_insights = self.cache_repo.get_all_chart_insights(analysis_id)
                 completed_insights = [
@@ -318,9 +349,12 @@ Sintetize os seguintes {len(insights)} insights de gráficos em um resumo execut
                     f"Generating markdown executive summary for {experiment_id} "
                     f"from {len(completed_insights)} insights"
                 )
-                markdown_content = self.llm.complete(
+                for chunk in self.llm.complete_stream(
                     messages=[{"role": "user", "content": prompt}],
-                    model=REASONING_MODEL)
+                    model=REASONING_MODEL,
+                    operation_name="ExecutiveSummary Markdown Stream"):
+                    writer.write(chunk)
+                markdown_content = writer.text
 
                 # Strip any markdown code fence wrapper from LLM response
                 markdown_content = _strip_markdown_fence(markdown_content)
@@ -362,6 +396,10 @@ Sintetize os seguintes {len(insights)} insights de gráficos em um resumo execut
                     DocumentType.EXECUTIVE_SUMMARY,
                     str(e))
                 raise
+            finally:
+                # Streams reload the stored document when the channel closes
+                if writer is not None:
+                    writer.close()
 
     async def generate_markdown_summary_background(
         self, experiment_id: str, analysis_id: str
@@ -372,13 +410,19 @@ Sintetize os seguintes {len(insights)} insights de gráficos em um resumo execut
         This method is designed to be called as a FastAPI background task.
         It catches all exceptions and handles them internally without re-raising,
         as background tasks should not propagate exceptions to the caller.
+        Generation runs in a worker thread so the event loop keeps serving
+        requests (and streaming tokens) meanwhile.
 
         Args:
             experiment_id: Experiment ID (e.g., "exp_12345678")
             analysis_id: Analysis ID (e.g., "ana_12345678")
         """
         try:
-            self.generate_markdown_summary(experiment_id, analysis_id)
+            await asyncio.to_thread(
+                self.generate_markdown_summary,
+                experiment_id,
+                analysis_id,
+                asyncio.get_running_loop())
             self.logger.info(f"Executive summary generated for {experiment_id}")
         except Exception as e:
             # Error already logged and document marked as failed in generate_markdown_summary
@@ -13,6 +13,7 @@ from synth_lab.models.pagination import PaginatedResponse, PaginationParams
 from synth_lab.repositories.experiment_repository import (
     ExperimentRepository,
     ExperimentSummary)
+from synth_lab.services.analysis.chart_response_cache import get_chart_response_cache
 
 
 class ExperimentService:
@@ -107,15 +108,7 @@ class ExperimentService:
         Returns:
             ExperimentSummary with counts if found, None otherwise.
         """
-        # List experiments and filter by ID to get counts
-        params = PaginationParams(limit=200, offset=0)
-        result = self.repository.list_experiments(params)
-
-        for exp in result.data:
-            if exp.id == experiment_id:
-                return exp
-
-        return None
+        return self.repository.get_summary(experiment_id)
 
     def list_experiments(
         self, params: PaginationParams | None = None
@@ -184,6 +177,7 @@ class ExperimentService:
         Returns:
             True if deleted, False if not found.
         """
+        get_chart_response_cache().invalidate_experiment(experiment_id)
         return self.repository.delete(experiment_id)
 
     def update_scorecard(
@@ -200,6 +194,8 @@ class ExperimentService:
         Returns:
             Updated experiment if found, None otherwise.
         """
+        # Sankey and SHAP/PDP charts are computed from the scorecard
+        get_chart_response_cache().invalidate_experiment(experiment_id)
         return self.repository.update_scorecard(experiment_id, scorecard_data)
 
     def get_experiment_with_scorecard(self, experiment_id: str) -> Experiment | None:
@@ -144,7 +144,8 @@ class ActionProposalService:
                 "parent_action": path[-2].action_applied if len(path) > 1 else None,
                 "materials_count": len(materials) if materials else 0,
             }):
-            prompt = self._build_prompt(node, experiment, max_proposals, materials=materials)
+            prompt = self._build_prompt(
+                node, experiment, max_proposals, materials=materials, path=path)
 
             self.logger.info(
                 f"Generating proposals for node {node.id} "
@@ -217,7 +218,8 @@ EXEMPLOS de short_action:
         node: ScenarioNode,
         experiment: Experiment,
         max_proposals: int,
-        materials: list | None = None) -> str:
+        materials: list | None = None,
+        path: list[ScenarioNode] | None = None) -> str:
         """Build the user prompt for the LLM.
 
         Args:
@@ -225,6 +227,7 @@ EXEMPLOS de short_action:
             experiment: The experiment context
             max_proposals: Maximum number of proposals to generate
             materials: Optional list of ExperimentMaterial objects to include
+            path: Root-to-node path, if already loaded (fetched otherwise)
 
         Returns:
             Formatted prompt string
@@ -242,7 +245,8 @@ EXEMPLOS de short_action:
         results = node.simulation_results
 
         # Get path from root to current node (for action history)
-        path = self.repository.get_path_to_node(node.id)
+        if path is None:
+            path = self.repository.get_path_to_node(node.id)
 
         # Build prompt
         prompt_parts = [
@@ -90,7 +90,8 @@ class ExplorationService:
         max_depth: int = 5,
         max_llm_calls: int = 20,
         n_executions: int = 100,
-        seed: int | None = None) -> Exploration:
+        seed: int | None = None,
+        confidence_level: float | None = None) -> Exploration:
         """
         Start a new exploration from an experiment.
 
@@ -105,6 +106,8 @@ class ExplorationService:
             max_llm_calls: Maximum LLM calls allowed.
             n_executions: Monte Carlo executions per simulation.
             seed: Random seed for reproducibility.
+            confidence_level: Confidence level for success_rate intervals; enables
+                significance-based pruning and early stopping (None = off).
 
         Returns:
             The created exploration.
@@ -137,7 +140,8 @@ class ExplorationService:
             max_depth=max_depth,
             max_llm_calls=max_llm_calls,
             n_executions=n_executions,
-            seed=seed)
+            seed=seed,
+            confidence_level=confidence_level)
 
         exploration = Exploration(
             experiment_id=experiment_id,
@@ -192,23 +196,73 @@ class ExplorationService:
             raise ExplorationNotFoundError(f"Exploration {exploration_id} not found")
         return exploration
 
-    def get_exploration_tree(self, exploration_id: str) -> dict:
+    def get_exploration_tree(
+        self,
+        exploration_id: str,
+        root_node_id: str | None = None,
+        max_depth: int | None = None,
+        statuses: list[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> dict:
         """
-        Get the complete exploration tree.
+        Get the exploration tree, or a filtered page of a subtree.
+
+        Without filters, the complete tree is loaded in one query and status
+        counts are derived from it. Counts always cover the whole exploration
+        and only include statuses that are present.
 
         Args:
             exploration_id: The exploration ID.
+            root_node_id: Only return this node and its descendants.
+            max_depth: Levels below the subtree root (absolute depth for the whole tree).
+            statuses: Only return nodes with these statuses.
+            limit: Maximum nodes to return.
+            offset: Number of matching nodes to skip.
 
         Returns:
-            Dictionary with exploration, nodes, and status counts.
+            Dictionary with exploration, nodes, total_nodes and status counts.
+
+        Raises:
+            ExplorationNotFoundError: If the exploration (or subtree root) doesn't exist.
         """
         exploration = self.get_exploration(exploration_id)
-        nodes = self.tree_manager.get_all_nodes(exploration_id)
-        status_counts = self.exploration_repo.count_nodes_by_status(exploration_id)
+        nodes, total = self.tree_manager.get_subtree(
+            exploration_id,
+            root_id=root_node_id,
+            max_depth=max_depth,
+            statuses=statuses,
+            limit=limit,
+            offset=offset,
+        )
+        if root_node_id is not None and total == 0:
+            root = self.exploration_repo.get_node_by_id(root_node_id)
+            if root is None or root.exploration_id != exploration_id:
+                raise ExplorationNotFoundError(
+                    f"Node {root_node_id} not found in exploration {exploration_id}"
+                )
+
+        is_full_tree = (
+            root_node_id is None and max_depth is None and not statuses and limit is None
+            and not offset
+        )
+        if is_full_tree:
+            status_counts: dict[str, int] = {}
+            for node in nodes:
+                status = node.node_status.value
+                status_counts[status] = status_counts.get(status, 0) + 1
+        else:
+            status_counts = {
+                status: count
+                for status, count in self.exploration_repo.count_nodes_by_status(
+                    exploration_id).items()
+                if count
+            }
 
         return {
             "exploration": exploration,
             "nodes": nodes,
+            "total_nodes": total,
             "node_count_by_status": status_counts,
         }
 
@@ -295,7 +349,8 @@ class ExplorationService:
             tree_manager=self.tree_manager,
             seed=exploration.config.seed,
             n_executions=exploration.config.n_executions,
-            sigma=exploration.config.sigma)
+            sigma=exploration.config.sigma,
+            confidence_level=exploration.config.confidence_level)
 
         self.logger.info(f"Starting exploration loop for {exploration_id}")
 
@@ -324,7 +379,8 @@ class ExplorationService:
                 exploration.mark_completed(ExplorationStatus.GOAL_ACHIEVED)
                 break
 
-            if result.termination_reason == "no_viable_paths":
+            # No child beat its parent beyond noise: no path is worth expanding
+            if result.termination_reason in ("no_viable_paths", "no_significant_improvement"):
                 exploration.mark_completed(ExplorationStatus.NO_VIABLE_PATHS)
                 break
 
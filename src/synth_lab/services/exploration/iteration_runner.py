@@ -9,6 +9,16 @@ Orchestrates a single iteration of the exploration loop:
 5. Apply beam search
 6. Check termination conditions
 
+With a confidence level configured, simulations report success_rate
+confidence intervals: children that are not significantly better than their
+parent are not kept for expansion, and Pareto dominance on success_rate
+ignores differences within noise. Significance bootstraps the paired
+per-synth difference (both nodes simulate the same synths) and requires its
+interval to exclude 0. Per-synth rates are kept in memory for the frontier
+only; the root, whose results come from the analysis, is simulated once to
+get them. An iteration whose children all fail that test ends the
+exploration early (no_significant_improvement).
+
 References:
     - Spec: specs/024-llm-scenario-exploration/spec.md
     - Data model: specs/024-llm-scenario-exploration/data-model.md
@@ -27,6 +37,7 @@ import asyncio
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 from loguru import logger
 
 from synth_lab.domain.entities.experiment import Experiment
@@ -36,6 +47,7 @@ from synth_lab.repositories.exploration_repository import ExplorationRepository
 from synth_lab.services.exploration.action_proposal_service import ActionProposalService
 from synth_lab.services.exploration.simulation_adapter import SimulationAdapter
 from synth_lab.services.exploration.tree_manager import TreeManager
+from synth_lab.services.simulation.uncertainty import paired_difference_lower_bounds
 
 
 @dataclass
@@ -62,6 +74,22 @@ class NodeWithSimulation:
     exec_time: float = 0.0
 
 
+@dataclass
+class PairedBounds:
+    """Paired-difference lower bounds between nodes with per-synth rates."""
+
+    rows: dict[str, int]
+    lower_bounds: np.ndarray
+
+    def compares(self, a_id: str, b_id: str) -> bool:
+        """Whether both nodes have paired data."""
+        return a_id in self.rows and b_id in self.rows
+
+    def is_better(self, a_id: str, b_id: str) -> bool:
+        """Whether a's success_rate is significantly higher than b's."""
+        return bool(self.lower_bounds[self.rows[a_id], self.rows[b_id]] > 0.0)
+
+
 class IterationRunner:
     """
     Runs a single iteration of the exploration loop.
@@ -77,7 +105,8 @@ class IterationRunner:
         proposal_service: ActionProposalService | None = None,
         seed: int | None = None,
         n_executions: int = 100,
-        sigma: float = 0.1):
+        sigma: float = 0.1,
+        confidence_level: float | None = None):
         """
         Initialize the iteration runner.
 
@@ -88,6 +117,8 @@ class IterationRunner:
             seed: Random seed for simulations.
             n_executions: Monte Carlo executions per simulation.
             sigma: Standard deviation for simulation noise.
+            confidence_level: Confidence level for significance checks
+                (None compares point estimates).
         """
         self.repository = repository or ExplorationRepository()
         self.tree_manager = tree_manager or TreeManager(self.repository)
@@ -95,7 +126,11 @@ class IterationRunner:
         self.simulation_adapter = SimulationAdapter(
             seed=seed,
             n_executions=n_executions,
-            sigma=sigma)
+            sigma=sigma,
+            confidence_level=confidence_level)
+        self.confidence_level = confidence_level
+        # Per-synth success rates by node ID, for paired significance tests
+        self._synth_rates: dict[str, dict[str, float]] = {}
         self.logger = logger.bind(component="iteration_runner")
 
     async def run_iteration(
@@ -161,9 +196,17 @@ class IterationRunner:
 
         self.logger.debug(f"Created {len(all_new_nodes)} child nodes")
 
-        # Run simulations in parallel for all new nodes
+        # Run simulations in parallel for all new nodes, plus parents that
+        # still need per-synth rates for paired comparisons (the root)
         if all_new_nodes:
-            await self._run_simulations_parallel(all_new_nodes, synths)
+            parents_without_rates = []
+            if self.confidence_level is not None:
+                parents_without_rates = [
+                    NodeWithSimulation(node=n)
+                    for n in nodes_to_expand
+                    if n.id not in self._synth_rates
+                ]
+            await self._run_simulations_parallel(all_new_nodes + parents_without_rates, synths)
 
         # Update nodes with simulation results
         for nws in all_new_nodes:
@@ -190,14 +233,25 @@ class IterationRunner:
                     )
                     break
 
+        # Drop children that are not significantly better than their parent
+        pruned_count = 0
+        if self.confidence_level is not None and not goal_achieved:
+            pruned_count = self._prune_insignificant_children(nodes_to_expand, all_new_nodes)
+
         # Apply Pareto dominance filter
-        dominated_count = self._apply_pareto_filter(exploration.id)
+        dominated_count = pruned_count + self._apply_pareto_filter(exploration.id)
 
         # Apply beam search (keep top K by success_rate)
         self._apply_beam_search(exploration.id, beam_width)
 
         # Get updated frontier and best success rate
         new_frontier = self.tree_manager.get_frontier(exploration.id)
+        frontier_ids = {n.id for n in new_frontier}
+        self._synth_rates = {
+            node_id: rates
+            for node_id, rates in self._synth_rates.items()
+            if node_id in frontier_ids
+        }
         best_success_rate = self._get_best_success_rate(exploration.id)
 
         # Handle goal achievement
@@ -214,6 +268,15 @@ class IterationRunner:
                 frontier_size=len(new_frontier),
                 goal_achieved=True)
 
+        # Stop early when no child improved beyond noise
+        termination_reason = None
+        if all_new_nodes and pruned_count == len(all_new_nodes):
+            termination_reason = "no_significant_improvement"
+            self.logger.info(
+                f"No child significantly better than its parent "
+                f"(confidence={self.confidence_level:.0%}); stopping early"
+            )
+
         # Build result
         return IterationResult(
             iteration_number=iteration_number,
@@ -222,7 +285,8 @@ class IterationRunner:
             nodes_dominated=dominated_count,
             llm_calls_made=llm_calls,
             best_success_rate=best_success_rate,
-            frontier_size=len(new_frontier))
+            frontier_size=len(new_frontier),
+            termination_reason=termination_reason)
 
     async def _run_simulations_parallel(
         self,
@@ -234,17 +298,84 @@ class IterationRunner:
         async def simulate_node(nws: NodeWithSimulation) -> None:
             # Run simulation in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
-            sim_results, exec_time = await loop.run_in_executor(
+            sim_results, exec_time, synth_rates = await loop.run_in_executor(
                 None,
-                self.simulation_adapter.run_simulation,
+                self.simulation_adapter.run_simulation_with_synth_rates,
                 nws.node.scorecard_params,
                 synths)
             nws.sim_results = sim_results
             nws.exec_time = exec_time
+            if self.confidence_level is not None:
+                self._synth_rates[nws.node.id] = synth_rates
 
         # Run all simulations concurrently
         await asyncio.gather(*[simulate_node(nws) for nws in nodes])
 
+    def _prune_insignificant_children(
+        self,
+        parents: list[ScenarioNode],
+        children: list[NodeWithSimulation]) -> int:
+        """
+        Mark children that are not significantly better than their parent.
+
+        Such children differ from the parent only within simulation noise,
+        so expanding them spends LLM calls on noise. Children without paired
+        per-synth rates (for them or their parent) are kept.
+
+        Returns:
+            Number of children marked as dominated.
+        """
+        bounds = self._paired_bounds([p.id for p in parents] + [c.node.id for c in children])
+        pruned = 0
+        for nws in children:
+            parent_id = nws.node.parent_id
+            if nws.sim_results is None or not bounds.compares(nws.node.id, parent_id):
+                continue
+            if not bounds.is_better(nws.node.id, parent_id):
+                nws.node.mark_dominated()
+                self.repository.update_node_status(nws.node.id, NodeStatus.DOMINATED)
+                pruned += 1
+
+        if pruned:
+            self.logger.debug(f"Pruned {pruned} children not significantly better than parent")
+        return pruned
+
+    def _paired_bounds(self, node_ids: list[str]) -> PairedBounds:
+        """
+        Bootstrap paired-difference bounds between all nodes with per-synth rates.
+
+        All pairs share one set of resamples (see paired_difference_lower_bounds),
+        so comparing k nodes costs one bootstrap instead of k² of them.
+        """
+        ids = [n for n in dict.fromkeys(node_ids) if n in self._synth_rates]
+        if self.confidence_level is None or len(ids) < 2:
+            return PairedBounds(rows={}, lower_bounds=np.empty((0, 0)))
+
+        synth_ids = [
+            s for s in self._synth_rates[ids[0]]
+            if all(s in self._synth_rates[n] for n in ids[1:])
+        ]
+        if not synth_ids:
+            return PairedBounds(rows={}, lower_bounds=np.empty((0, 0)))
+
+        values = np.array([[self._synth_rates[n][s] for s in synth_ids] for n in ids])
+        lower_bounds = paired_difference_lower_bounds(
+            values, confidence=self.confidence_level, seed=self.simulation_adapter.seed)
+        return PairedBounds(rows={n: i for i, n in enumerate(ids)}, lower_bounds=lower_bounds)
+
+    def _is_significantly_better(
+        self, a: ScenarioNode, b: ScenarioNode, bounds: PairedBounds | None = None) -> bool:
+        """
+        Whether a's success_rate is higher than b's beyond simulation noise.
+
+        With per-synth rates for both nodes, the bootstrap interval of the
+        paired difference must exclude 0. Otherwise falls back to
+        SimulationResults.is_significantly_better_than.
+        """
+        if bounds is not None and bounds.compares(a.id, b.id):
+            return bounds.is_better(a.id, b.id)
+        return a.simulation_results.is_significantly_better_than(b.simulation_results)
+
     def _apply_pareto_filter(self, exploration_id: str) -> int:
         """
         Apply Pareto dominance filter to active nodes.
@@ -255,6 +386,9 @@ class IterationRunner:
         - A.perceived_risk <= B.perceived_risk
         - AND at least one strict inequality
 
+        With confidence intervals, success_rate comparisons only count
+        significant differences.
+
         Returns:
             Number of nodes marked as dominated.
         """
@@ -262,6 +396,7 @@ class IterationRunner:
         if len(nodes) < 2:
             return 0
 
+        bounds = self._paired_bounds([n.id for n in nodes])
         dominated_ids: set[str] = set()
 
         for i, node_a in enumerate(nodes):
@@ -272,9 +407,9 @@ class IterationRunner:
                 if node_b.id in dominated_ids:
                     continue
 
-                if self._dominates(node_a, node_b):
+                if self._dominates(node_a, node_b, bounds):
                     dominated_ids.add(node_b.id)
-                elif self._dominates(node_b, node_a):
+                elif self._dominates(node_b, node_a, bounds):
                     dominated_ids.add(node_a.id)
                     break
 
@@ -287,24 +422,23 @@ class IterationRunner:
 
         return len(dominated_ids)
 
-    def _dominates(self, a: ScenarioNode, b: ScenarioNode) -> bool:
-        """Check if node A dominates node B."""
+    def _dominates(
+        self, a: ScenarioNode, b: ScenarioNode, bounds: PairedBounds | None = None) -> bool:
+        """Check if node A dominates node B (bounds: paired comparisons, if any)."""
         if not a.simulation_results or not b.simulation_results:
             return False
 
-        a_sr = a.simulation_results.success_rate
-        b_sr = b.simulation_results.success_rate
         a_cx = a.scorecard_params.complexity
         b_cx = b.scorecard_params.complexity
         a_pr = a.scorecard_params.perceived_risk
         b_pr = b.scorecard_params.perceived_risk
 
         # A must be >= B in all objectives
-        if a_sr < b_sr or a_cx > b_cx or a_pr > b_pr:
+        if self._is_significantly_better(b, a, bounds) or a_cx > b_cx or a_pr > b_pr:
             return False
 
         # A must be strictly better in at least one objective
-        return a_sr > b_sr or a_cx < b_cx or a_pr < b_pr
+        return self._is_significantly_better(a, b, bounds) or a_cx < b_cx or a_pr < b_pr
 
     def _apply_beam_search(self, exploration_id: str, beam_width: int) -> None:
         """
@@ -43,7 +43,8 @@ class SimulationAdapter:
         self,
         seed: int | None = None,
         sigma: float = 0.1,
-        n_executions: int = 100):
+        n_executions: int = 100,
+        confidence_level: float | None = None):
         """
         Initialize the simulation adapter.
 
@@ -51,10 +52,13 @@ class SimulationAdapter:
             seed: Random seed for reproducibility.
             sigma: Standard deviation for state sampling noise.
             n_executions: Number of Monte Carlo executions per synth.
+            confidence_level: Confidence level for success_rate intervals
+                (None = point estimates only).
         """
         self.seed = seed
         self.sigma = sigma
         self.n_executions = n_executions
+        self.confidence_level = confidence_level
         self.engine = MonteCarloEngine(seed=seed, sigma=sigma)
         self.logger = logger.bind(component="simulation_adapter")
 
@@ -72,6 +76,27 @@ class SimulationAdapter:
         Returns:
             Tuple of (SimulationResults, execution_time_seconds).
         """
+        sim_results, exec_time, _ = self.run_simulation_with_synth_rates(
+            scorecard_params, synths)
+        return sim_results, exec_time
+
+    def run_simulation_with_synth_rates(
+        self,
+        scorecard_params: ScorecardParams,
+        synths: list[dict[str, Any]]) -> tuple[SimulationResults, float, dict[str, float]]:
+        """
+        Run Monte Carlo simulation and also return per-synth success rates.
+
+        The per-synth rates feed paired significance tests between nodes; they
+        are not part of SimulationResults, so they are never persisted.
+
+        Args:
+            scorecard_params: The scorecard parameters to simulate.
+            synths: List of synth dicts with simulation_attributes.
+
+        Returns:
+            Tuple of (SimulationResults, execution_time_seconds, success rate by synth ID).
+        """
         # Convert ScorecardParams to FeatureScorecard
         scorecard = self._params_to_scorecard(scorecard_params)
 
@@ -93,20 +118,26 @@ class SimulationAdapter:
             synths=synths,
             scorecard=scorecard,
             scenario=scenario,
-            n_executions=self.n_executions)
+            n_executions=self.n_executions,
+            confidence_level=self.confidence_level)
 
         # Convert results to exploration SimulationResults
+        success_interval = engine_results.aggregated_intervals.get("success")
         sim_results = SimulationResults(
             success_rate=engine_results.aggregated_success,
             fail_rate=engine_results.aggregated_failed,
-            did_not_try_rate=engine_results.aggregated_did_not_try)
+            did_not_try_rate=engine_results.aggregated_did_not_try,
+            success_std_error=success_interval.std_error if success_interval else None,
+            success_ci_low=success_interval.ci_low if success_interval else None,
+            success_ci_high=success_interval.ci_high if success_interval else None)
 
         self.logger.debug(
             f"Simulation complete: success_rate={sim_results.success_rate:.2%}, "
             f"time={engine_results.execution_time_seconds:.3f}s"
         )
 
-        return sim_results, engine_results.execution_time_seconds
+        synth_success_rates = {o.synth_id: o.success_rate for o in engine_results.synth_outcomes}
+        return sim_results, engine_results.execution_time_seconds, synth_success_rates
 
     def run_simulation_for_node(
         self,
@@ -168,6 +168,38 @@ class TreeManager:
         """
         return self.repository.get_path_to_node(node_id)
 
+    def get_subtree(
+        self,
+        exploration_id: str,
+        root_id: str | None = None,
+        max_depth: int | None = None,
+        statuses: list[str] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> tuple[list[ScenarioNode], int]:
+        """
+        Get a (filtered, paginated) subtree in a single query.
+
+        Args:
+            exploration_id: The exploration ID.
+            root_id: Subtree root node ID (None for the whole tree).
+            max_depth: Levels below the subtree root to include.
+            statuses: Only include nodes with these statuses.
+            limit: Maximum nodes to return.
+            offset: Number of matching nodes to skip.
+
+        Returns:
+            Tuple of (nodes, total matching nodes).
+        """
+        return self.repository.get_subtree(
+            exploration_id,
+            root_id=root_id,
+            max_depth=max_depth,
+            statuses=statuses,
+            limit=limit,
+            offset=offset,
+        )
+
     def get_all_nodes(self, exploration_id: str) -> list[ScenarioNode]:
         """
         Get all nodes in an exploration.
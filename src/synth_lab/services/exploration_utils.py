@@ -54,9 +54,15 @@ def get_winning_path(
         )
     )
 
-    # Get path from winner to root
-    winner = leaf_nodes[0]
-    return repo.get_path_to_node(winner.id)
+    # Walk parents of the winner through the already-loaded nodes
+    nodes_by_id = {n.id: n for n in all_nodes}
+    path = []
+    current = nodes_by_id.get(leaf_nodes[0].id)
+    while current is not None:
+        path.append(current)
+        current = nodes_by_id.get(current.parent_id) if current.parent_id else None
+    path.reverse()
+    return path
 
 
 if __name__ == "__main__":
@@ -9,6 +9,10 @@ References:
     - Repository: src/synth_lab/repositories/analysis_cache_repository.py
     - Spec: specs/023-quantitative-ai-insights/spec.md (User Story 1, 3)
 
+Concurrent requests for the same analysis and chart share one in-flight LLM
+call (infrastructure/single_flight.py). generate_insights() answers several
+charts with a single structured LLM call.
+
 Sample usage:
     from synth_lab.services.insight_service import InsightService
 
@@ -16,6 +20,10 @@ Sample usage:
     chart_data = {"quadrants": [...], "total_synths": 500}
     insight = service.generate_insight("ana_12345678", "try_vs_success", chart_data)
 
+    # Several charts in one LLM call
+    insights = service.generate_insights(
+        "ana_12345678", {"try_vs_success": chart_data, "outliers": outliers_data})
+
 Expected output:
     ChartInsight with summary field containing the AI-generated insight
 """
@@ -29,6 +37,7 @@ from openinference.semconv.trace import OpenInferenceSpanKindValues, SpanAttribu
 from synth_lab.domain.entities.chart_insight import ChartInsight
 from synth_lab.infrastructure.llm_client import LLMClient, get_llm_client
 from synth_lab.infrastructure.phoenix_tracing import get_tracer
+from synth_lab.infrastructure.single_flight import get_single_flight
 from synth_lab.repositories.analysis_cache_repository import AnalysisCacheRepository
 from synth_lab.repositories.analysis_repository import AnalysisRepository
 from synth_lab.repositories.experiment_repository import ExperimentRepository
@@ -38,6 +47,10 @@ _tracer = get_tracer()
 # Model for chart insights (fast, no reasoning)
 INSIGHT_MODEL = "gpt-4.1-mini"
 
+# Max charts answered by one batched LLM call (keeps each response well within
+# output limits: ~400 tokens per chart)
+INSIGHT_BATCH_SIZE = 3
+
 
 class InsightService:
     """Service for generating AI-powered chart insights."""
@@ -102,6 +115,122 @@ class InsightService:
         Returns:
             ChartInsight with status="completed" or status="failed"
         """
+        return get_single_flight().do(
+            ("chart_insight", analysis_id, chart_type),
+            lambda: self._generate_insight(analysis_id, chart_type, chart_data))
+
+    def generate_insights(
+        self,
+        analysis_id: str,
+        charts: dict[str, dict[str, Any]]) -> dict[str, ChartInsight]:
+        """
+        Generate insights for several charts with one LLM call.
+
+        Charts whose insight is already being generated (same analysis and
+        chart) wait for that call instead of being sent again. Charts missing
+        from the batched response are generated individually.
+
+        Args:
+            analysis_id: Analysis ID (e.g., "ana_12345678")
+            charts: Chart data by chart type
+
+        Returns:
+            ChartInsight by chart type (status="completed" or status="failed")
+        """
+        single_flight = get_single_flight()
+        flights = {
+            chart_type: single_flight.claim(("chart_insight", analysis_id, chart_type))
+            for chart_type in charts
+        }
+        leading = {
+            chart_type: charts[chart_type]
+            for chart_type, (_, is_leader) in flights.items()
+            if is_leader
+        }
+
+        try:
+            if leading:
+                generated = self._generate_insight_batch(analysis_id, leading)
+                for chart_type in leading:
+                    flights[chart_type][0].resolve(generated[chart_type])
+        except BaseException as e:
+            for chart_type in leading:
+                flights[chart_type][0].fail(e)
+            raise
+
+        return {chart_type: flight.wait() for chart_type, (flight, _) in flights.items()}
+
+    def _generate_insight_batch(
+        self,
+        analysis_id: str,
+        charts: dict[str, dict[str, Any]]) -> dict[str, ChartInsight]:
+        """
+        Generate insights for several charts in a single structured LLM call.
+
+        Args:
+            analysis_id: Analysis ID
+            charts: Chart data by chart type
+
+        Returns:
+            ChartInsight by chart type
+        """
+        if len(charts) == 1:
+            chart_type, chart_data = next(iter(charts.items()))
+            return {chart_type: self._generate_insight(analysis_id, chart_type, chart_data)}
+
+        span_name = f"ChartInsight batch ({len(charts)}) | ana_{analysis_id[:12]}"
+        with _tracer.start_as_current_span(
+            span_name,
+            attributes={
+                SpanAttributes.OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.CHAIN.value,
+                "analysis.id": analysis_id,
+                "chart.types": ",".join(charts),
+                "operation.type": "chart_insight_batch",
+                "llm.model": INSIGHT_MODEL,
+            }):
+            results: dict[str, ChartInsight] = {}
+            try:
+                hypothesis = self._get_hypothesis(analysis_id)
+                prompt = self._build_batch_prompt(charts, hypothesis)
+
+                self.logger.info(
+                    f"Generating {len(charts)} insights in one call (analysis: {analysis_id})")
+                llm_response_str = self.llm.complete_json(
+                    messages=[{"role": "user", "content": prompt}],
+                    model=INSIGHT_MODEL)
+                llm_insights = json.loads(llm_response_str).get("insights", {})
+
+                for chart_type in charts:
+                    summary = (llm_insights.get(chart_type) or {}).get("resumo_key_findings", "")
+                    if not summary:
+                        continue
+                    insight = ChartInsight(
+                        analysis_id=analysis_id,
+                        chart_type=chart_type,
+                        summary=summary,
+                        status="completed",
+                        model=INSIGHT_MODEL)
+                    self.cache_repo.store_chart_insight(insight)
+                    results[chart_type] = insight
+
+            except Exception as e:
+                self.logger.warning(
+                    f"Batched insight generation failed, generating individually: {e}")
+
+            # Charts missing from the batched response
+            for chart_type, chart_data in charts.items():
+                if chart_type not in results:
+                    results[chart_type] = self._generate_insight(
+                        analysis_id, chart_type, chart_data)
+
+            return results
+
+    def _generate_insight(
+        self,
+        analysis_id: str,
+        chart_type: str,
+        chart_data: dict[str, Any]) -> ChartInsight:
+        """Generate insight for one chart (LLM call, no coalescing)."""
         span_name = f"ChartInsight {chart_type} | ana_{analysis_id[:12]}"
         with _tracer.start_as_current_span(
             span_name,
@@ -217,6 +346,52 @@ class InsightService:
 
         return builder(chart_data, hypothesis)
 
+    def _build_batch_prompt(
+        self, charts: dict[str, dict[str, Any]], hypothesis: str
+    ) -> str:
+        """
+        Build one LLM prompt covering several charts.
+
+        Each chart keeps its own instructions and output format; the hypothesis
+        is sent once.
+
+        Args:
+            charts: Chart data by chart type
+            hypothesis: Experiment hypothesis for context
+
+        Returns:
+            Formatted prompt string
+        """
+        sections = []
+        for chart_type, chart_data in charts.items():
+            chart_prompt = self._build_prompt_for_chart_type(
+                chart_type, chart_data, "Ver hipótese no início.")
+            sections.append(f'<chart type="{chart_type}">\n{chart_prompt}</chart>')
+        chart_keys = ", ".join(f'"{chart_type}"' for chart_type in charts)
+
+        return (
+            f"Você vai analisar {len(charts)} gráficos da mesma simulação. Cada análise é "
+            "independente e tem suas próprias instruções e formato de saída.\n"
+            "\n"
+            "**Hipótese:**\n"
+            f"{hypothesis}\n"
+            "\n"
+            f"{chr(10).join(sections)}\n"
+            "\n"
+            "**Formato de Saída (JSON):**\n"
+            f"Responda com um único JSON com uma entrada por gráfico ({chart_keys}), "
+            "cada uma no formato pedido para aquele gráfico:\n"
+            """{
+  "insights": {
+    "<tipo_do_grafico>": {
+      "problem_understanding": "...",
+      "trends_observed": "...",
+      "resumo_key_findings": "..."
+    }
+  }
+}
+""")
+
     def _build_prompt_try_vs_success(
         self, chart_data: dict[str, Any], hypothesis: str
     ) -> str:
@@ -0,0 +1,217 @@
+"""
+Orphaned material file cleanup for synth-lab.
+
+Finds S3 objects under materials/ and thumbnails/ whose material no longer
+exists in experiment_materials and deletes them. Works page by page:
+
+- Listing follows ListObjectsV2 continuation tokens (no 1000-key limit).
+- Each page's material IDs are checked with one query (id = ANY(:ids)).
+- Orphans are removed with batched DeleteObjects requests.
+
+Progress is logged and passed to an optional callback after every page.
+Deleting keys that were already listed does not disturb the listing, which
+is ordered by key.
+
+References:
+    - Service: synth_lab.services.material_service (cleanup_orphaned_files)
+    - Storage: synth_lab.infrastructure.storage_client
+    - Repository: synth_lab.repositories.experiment_material_repository
+    - ListObjectsV2: https://docs.aws.amazon.com/AmazonS3/latest/API/API_ListObjectsV2.html
+    - DeleteObjects: https://docs.aws.amazon.com/AmazonS3/latest/API/API_DeleteObjects.html
+
+Sample usage:
+    from synth_lab.services.material_cleanup import OrphanedFileCleanup
+
+    report = OrphanedFileCleanup(repository, progress=print).run(dry_run=True)
+    report.to_dict()
+
+Expected output:
+    {"orphaned_materials": 3, "orphaned_thumbnails": 1, "deleted_files": 0,
+     "failed_deletions": 0, "scanned_files": 2481, "dry_run": True}
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from botocore.exceptions import BotoCoreError, ClientError
+from loguru import logger
+
+from synth_lab.infrastructure.storage_client import (
+    MAX_KEYS_PER_REQUEST,
+    delete_objects,
+    iter_object_key_pages,
+)
+from synth_lab.repositories.experiment_material_repository import ExperimentMaterialRepository
+
+MATERIALS_PREFIX = "materials/"
+THUMBNAILS_PREFIX = "thumbnails/"
+
+
+@dataclass
+class CleanupProgress:
+    """Running totals for one prefix."""
+
+    prefix: str
+    pages: int = 0
+    scanned: int = 0
+    orphaned: int = 0
+    deleted: int = 0
+    failed: int = 0
+    error: str | None = None
+
+
+@dataclass
+class CleanupReport:
+    """Result of a cleanup run."""
+
+    dry_run: bool
+    materials: CleanupProgress = field(default_factory=lambda: CleanupProgress(MATERIALS_PREFIX))
+    thumbnails: CleanupProgress = field(
+        default_factory=lambda: CleanupProgress(THUMBNAILS_PREFIX))
+
+    def to_dict(self) -> dict:
+        """Summary counts (cleanup_orphaned_files result)."""
+        return {
+            "orphaned_materials": self.materials.orphaned,
+            "orphaned_thumbnails": self.thumbnails.orphaned,
+            "deleted_files": self.materials.deleted + self.thumbnails.deleted,
+            "failed_deletions": self.materials.failed + self.thumbnails.failed,
+            "scanned_files": self.materials.scanned + self.thumbnails.scanned,
+            "dry_run": self.dry_run,
+        }
+
+
+def material_id_from_key(object_key: str) -> str | None:
+    """
+    Material ID of a material or thumbnail object key.
+
+    Keys look like materials/{exp_id}/{mat_id}.{ext} and
+    thumbnails/{exp_id}/{mat_id}.png.
+
+    Returns:
+        The material ID, or None if the key does not follow that layout.
+    """
+    parts = object_key.split("/")
+    if len(parts) < 3:
+        return None
+    return parts[2].split(".")[0] or None
+
+
+class OrphanedFileCleanup:
+    """Page-by-page scan and removal of S3 files without a material record."""
+
+    def __init__(
+        self,
+        repository: ExperimentMaterialRepository,
+        page_size: int = MAX_KEYS_PER_REQUEST,
+        progress: Callable[[CleanupProgress], None] | None = None,
+    ):
+        """
+        Initialize cleanup.
+
+        Args:
+            repository: Material repository (for the ID existence checks).
+            page_size: Keys listed (and checked) per page, max 1000.
+            progress: Called with the prefix's running totals after each page.
+        """
+        self.repository = repository
+        self.page_size = page_size
+        self.progress = progress
+        self.logger = logger.bind(component="material_cleanup")
+
+    def run(self, dry_run: bool = True) -> CleanupReport:
+        """
+        Scan materials/ and thumbnails/ and delete orphaned files.
+
+        Args:
+            dry_run: If True, only count orphaned files (default).
+
+        Returns:
+            CleanupReport with per-prefix totals.
+        """
+        report = CleanupReport(dry_run=dry_run)
+        for totals in (report.materials, report.thumbnails):
+            try:
+                for keys in iter_object_key_pages(totals.prefix, self.page_size):
+                    self._process_page(keys, totals, dry_run)
+            except (ClientError, BotoCoreError) as e:
+                totals.error = str(e)
+                self.logger.error(f"Failed to list {totals.prefix} in S3: {e}")
+
+        summary = report.to_dict()
+        if dry_run:
+            self.logger.info(
+                f"Dry run: Found {summary['orphaned_materials']} orphaned materials "
+                f"and {summary['orphaned_thumbnails']} orphaned thumbnails "
+                f"in {summary['scanned_files']} files")
+        else:
+            self.logger.info(
+                f"Cleaned up {summary['deleted_files']} orphaned files from S3 "
+                f"({summary['failed_deletions']} failed)")
+        return report
+
+    def _process_page(self, keys: list[str], totals: CleanupProgress, dry_run: bool) -> None:
+        if not keys:
+            return
+        material_ids = {key: material_id_from_key(key) for key in keys}
+        candidates = sorted({mid for mid in material_ids.values() if mid})
+        existing = self.repository.get_existing_ids(candidates)
+        orphans = [
+            key for key, mid in material_ids.items() if mid and mid not in existing
+        ]
+
+        totals.pages += 1
+        totals.scanned += len(keys)
+        totals.orphaned += len(orphans)
+        if orphans and not dry_run:
+            failed = delete_objects(orphans)
+            totals.deleted += len(orphans) - len(failed)
+            totals.failed += len(failed)
+
+        self.logger.debug(
+            f"{totals.prefix} page {totals.pages}: {len(keys)} files, "
+            f"{len(orphans)} orphaned ({totals.scanned} scanned so far)")
+        if self.progress is not None:
+            self.progress(totals)
+
+
+if __name__ == "__main__":
+    import sys
+
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: Material IDs from material and thumbnail keys
+    total_tests += 1
+    cases = {
+        "materials/exp_1/mat_a1b2c3d4e5f6.png": "mat_a1b2c3d4e5f6",
+        "thumbnails/exp_1/mat_a1b2c3d4e5f6.png": "mat_a1b2c3d4e5f6",
+        "materials/stray.png": None,
+        "materials/exp_1/": None,
+    }
+    for key, expected in cases.items():
+        if material_id_from_key(key) != expected:
+            all_validation_failures.append(f"{key}: {material_id_from_key(key)}")
+
+    # Test 2: Report summary
+    total_tests += 1
+    report = CleanupReport(dry_run=False)
+    report.materials.scanned, report.materials.orphaned, report.materials.deleted = 10, 3, 2
+    report.materials.failed = 1
+    report.thumbnails.scanned, report.thumbnails.orphaned, report.thumbnails.deleted = 5, 1, 1
+    summary = report.to_dict()
+    expected = {
+        "orphaned_materials": 3, "orphaned_thumbnails": 1, "deleted_files": 3,
+        "failed_deletions": 1, "scanned_files": 15, "dry_run": False,
+    }
+    if summary != expected:
+        all_validation_failures.append(f"Summary: {summary}")
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
@@ -9,17 +9,17 @@ References:
     - Repository: synth_lab.repositories.experiment_material_repository
     - Entity: synth_lab.domain.entities.experiment_material
     - Storage: synth_lab.infrastructure.storage_client
+    - Media processing: synth_lab.services.media_processing
     - Pillow: https://pillow.readthedocs.io/en/stable/
     - pdf2image: https://pdf2image.readthedocs.io/en/latest/
     - moviepy: https://zulko.github.io/moviepy/
 """
 
+from collections.abc import Callable
 from datetime import datetime, timezone
-from io import BytesIO
 
-from botocore.exceptions import ClientError, BotoCoreError
+from botocore.exceptions import BotoCoreError, ClientError
 from loguru import logger
-from PIL import Image
 
 from synth_lab.domain.entities.experiment_material import (
     DescriptionStatus,
@@ -36,8 +36,6 @@ from synth_lab.infrastructure.storage_client import (
     delete_object,
     generate_upload_url,
     generate_view_url,
-    get_object_bytes,
-    get_s3_client,
     upload_object,
 )
 from synth_lab.repositories.experiment_material_repository import (
@@ -45,6 +43,17 @@ from synth_lab.repositories.experiment_material_repository import (
     MaterialLimitExceededError,
     MaterialNotFoundError,
 )
+from synth_lab.services.material_cleanup import CleanupProgress, OrphanedFileCleanup
+from synth_lab.services.media_processing import (
+    extract_document_text,
+    process_stored_media,
+    render_document_thumbnail,
+    render_image_thumbnail,
+    render_video_frame,
+    render_video_thumbnail,
+    render_vision_image,
+    submit_media_job,
+)
 
 
 class UnsupportedFileTypeError(Exception):
@@ -246,26 +255,36 @@ class MaterialService:
             f"Confirmed upload for material {material_id} in experiment {experiment_id}"
         )
 
-        # Generate thumbnail (T043)
-        # This runs synchronously for now; can be made async in Phase 7
-        try:
-            self.generate_thumbnail(material_id)
-        except Exception as e:
-            self.logger.warning(
-                f"Thumbnail generation failed for {material_id}: {e}")
-            # Don't fail the upload if thumbnail generation fails
-
-        # Generate AI description
-        # This runs synchronously for now; can be made async in Phase 7
+        # Generate thumbnail (T043) and AI description in the background
         try:
-            self.generate_description(material_id)
+            self.schedule_media_processing(material_id)
         except Exception as e:
             self.logger.warning(
-                f"Description generation failed for {material_id}: {e}")
-            # Don't fail the upload if description generation fails
+                f"Could not queue media processing for {material_id}: {e}")
+            # Don't fail the upload if thumbnail/description scheduling fails
 
         return updated_material
 
+    def schedule_media_processing(
+        self,
+        material_id: str,
+        thumbnail: bool = True,
+        description: bool = True,
+    ) -> None:
+        """
+        Queue thumbnail and/or description generation for a material.
+
+        Runs in the background media executor with its own service (and
+        database session); results are saved on the material record.
+
+        Args:
+            material_id: Material ID.
+            thumbnail: Generate the thumbnail.
+            description: Generate the AI description.
+        """
+        submit_media_job(_process_material_media, material_id, thumbnail, description)
+        self.logger.debug(f"Queued media processing for material {material_id}")
+
     def get_material(self, material_id: str) -> ExperimentMaterial:
         """
         Get a material by ID.
@@ -602,29 +621,17 @@ class MaterialService:
         Returns:
             PNG bytes of thumbnail, or None if failed.
         """
-        image_bytes = get_object_bytes(object_key)
-        if image_bytes is None:
-            self.logger.error(f"Could not download image {object_key}")
-            return None
-
         try:
-            with Image.open(BytesIO(image_bytes)) as img:
-                # Convert to RGB if necessary (for PNG with transparency)
-                if img.mode in ("RGBA", "P"):
-                    img = img.convert("RGB")
-
-                # Use thumbnail() to maintain aspect ratio
-                img.thumbnail(size, Image.Resampling.LANCZOS)
-
-                # Save to bytes
-                output = BytesIO()
-                img.save(output, format="PNG", optimize=True)
-                return output.getvalue()
-
+            thumbnail = process_stored_media(
+                object_key, FileType.IMAGE, render_image_thumbnail, size)
         except Exception as e:
             self.logger.error(f"Failed to process image {object_key}: {e}")
             return None
 
+        if thumbnail is None:
+            self.logger.error(f"Could not download image {object_key}")
+        return thumbnail
+
     def _generate_video_thumbnail(
         self,
         object_key: str,
@@ -633,7 +640,8 @@ class MaterialService:
         """
         Generate thumbnail from video by extracting first frame.
 
-        Uses moviepy to extract frame at t=0.
+        Uses moviepy to extract frame at t=0. Fast-start videos are only
+        downloaded up to their first frames.
 
         Args:
             object_key: S3 object key for the video.
@@ -642,37 +650,18 @@ class MaterialService:
         Returns:
             PNG bytes of thumbnail, or None if failed.
         """
-        video_bytes = get_object_bytes(object_key)
-        if video_bytes is None:
-            self.logger.error(f"Could not download video {object_key}")
-            return None
-
         try:
-            # moviepy requires a file, so we use a temp file
-            import tempfile
-            from moviepy.editor import VideoFileClip
-
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=True) as tmp:
-                tmp.write(video_bytes)
-                tmp.flush()
-
-                with VideoFileClip(tmp.name) as clip:
-                    # Extract frame at t=0
-                    frame = clip.get_frame(0)
-
-                    # Convert numpy array to PIL Image
-                    img = Image.fromarray(frame)
-                    img.thumbnail(size, Image.Resampling.LANCZOS)
-
-                    output = BytesIO()
-                    img.save(output, format="PNG", optimize=True)
-                    return output.getvalue()
-
+            thumbnail = process_stored_media(
+                object_key, FileType.VIDEO, render_video_thumbnail, size)
         except Exception as e:
             self.logger.error(
                 f"Failed to extract video frame from {object_key}: {e}")
             return None
 
+        if thumbnail is None:
+            self.logger.error(f"Could not download video {object_key}")
+        return thumbnail
+
     def _generate_document_thumbnail(
         self,
         object_key: str,
@@ -690,37 +679,17 @@ class MaterialService:
         Returns:
             PNG bytes of thumbnail, or None if failed.
         """
-        doc_bytes = get_object_bytes(object_key)
-        if doc_bytes is None:
-            self.logger.error(f"Could not download document {object_key}")
-            return None
-
         try:
-            from pdf2image import convert_from_bytes
-
-            # Convert only first page
-            images = convert_from_bytes(
-                doc_bytes,
-                first_page=1,
-                last_page=1,
-                dpi=72,  # Low DPI for thumbnail
-            )
-
-            if not images:
-                self.logger.error(f"No pages extracted from {object_key}")
-                return None
-
-            img = images[0]
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-
-            output = BytesIO()
-            img.save(output, format="PNG", optimize=True)
-            return output.getvalue()
-
+            thumbnail = process_stored_media(
+                object_key, FileType.DOCUMENT, render_document_thumbnail, size)
         except Exception as e:
             self.logger.error(f"Failed to render PDF {object_key}: {e}")
             return None
 
+        if thumbnail is None:
+            self.logger.error(f"Could not download document {object_key}")
+        return thumbnail
+
     # -------------------------------------------------------------------------
     # AI Description Generation
     # -------------------------------------------------------------------------
@@ -804,17 +773,19 @@ class MaterialService:
             Description text, or None if failed.
         """
         import base64
+
         from synth_lab.infrastructure.llm_client import get_llm_client
         from synth_lab.infrastructure.phoenix_tracing import get_tracer
 
         _tracer = get_tracer("material-description")
 
-        image_bytes = get_object_bytes(object_key)
-        if image_bytes is None:
-            self.logger.error(f"Could not download image {object_key}")
-            return None
-
         try:
+            image_bytes = process_stored_media(
+                object_key, FileType.IMAGE, render_vision_image)
+            if image_bytes is None:
+                self.logger.error(f"Could not download image {object_key}")
+                return None
+
             # Encode image to base64
             image_base64 = base64.b64encode(image_bytes).decode("utf-8")
 
@@ -872,33 +843,22 @@ class MaterialService:
             Description text, or None if failed.
         """
         import base64
-        import tempfile
-        from moviepy.editor import VideoFileClip
+
         from synth_lab.infrastructure.llm_client import get_llm_client
         from synth_lab.infrastructure.phoenix_tracing import get_tracer
 
         _tracer = get_tracer("material-description")
 
-        video_bytes = get_object_bytes(object_key)
-        if video_bytes is None:
-            self.logger.error(f"Could not download video {object_key}")
-            return None
-
         try:
             # Extract first frame
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=True) as tmp:
-                tmp.write(video_bytes)
-                tmp.flush()
-
-                with VideoFileClip(tmp.name) as clip:
-                    frame = clip.get_frame(0)
-                    img = Image.fromarray(frame)
+            frame_bytes = process_stored_media(
+                object_key, FileType.VIDEO, render_video_frame)
+            if frame_bytes is None:
+                self.logger.error(f"Could not download video {object_key}")
+                return None
 
-                    # Convert frame to base64
-                    output = BytesIO()
-                    img.save(output, format="PNG")
-                    frame_base64 = base64.b64encode(
-                        output.getvalue()).decode("utf-8")
+            # Convert frame to base64
+            frame_base64 = base64.b64encode(frame_bytes).decode("utf-8")
 
             # Prepare messages for vision API
             messages = [
@@ -958,30 +918,14 @@ class MaterialService:
 
         _tracer = get_tracer("material-description")
 
-        doc_bytes = get_object_bytes(object_key)
-        if doc_bytes is None:
-            self.logger.error(f"Could not download document {object_key}")
-            return None
-
         try:
-            # Extract text from PDF
-            from pdf2image import convert_from_bytes
-            import pytesseract
-
-            # Convert first page to image
-            images = convert_from_bytes(
-                doc_bytes,
-                first_page=1,
-                last_page=1,
-                dpi=150,
-            )
-
-            if not images:
-                self.logger.error(f"No pages extracted from {object_key}")
+            # OCR the first page
+            text = process_stored_media(
+                object_key, FileType.DOCUMENT, extract_document_text)
+            if text is None:
+                self.logger.error(f"Could not download document {object_key}")
                 return None
 
-            # OCR the first page
-            text = pytesseract.image_to_string(images[0])
             text_preview = text[:1000]  # First 1000 chars
 
             # Generate description
@@ -1016,115 +960,47 @@ class MaterialService:
                 f"Failed to generate document description for {object_key}: {e}")
             return None
 
-    def cleanup_orphaned_files(self, dry_run: bool = True) -> dict:
+    def cleanup_orphaned_files(
+        self,
+        dry_run: bool = True,
+        progress: Callable[[CleanupProgress], None] | None = None,
+    ) -> dict:
         """
         Clean up S3 files that have no corresponding database records.
 
         Finds files in materials/ and thumbnails/ directories that don't
         have matching records in experiment_materials table and deletes them.
+        Listing is paginated, IDs are checked one page per query and
+        deletions are batched (see services/material_cleanup.py).
 
         Args:
             dry_run: If True, only list files without deleting (default).
+            progress: Optional callback with running totals after each page.
 
         Returns:
-            Dict with counts of orphaned_materials, orphaned_thumbnails, deleted_files.
-
-        Note:
-            This operation requires listing all S3 objects and querying the database.
-            Use with caution in production.
+            Dict with counts of orphaned_materials, orphaned_thumbnails,
+            deleted_files, failed_deletions and scanned_files.
         """
         try:
-            from botocore.exceptions import ClientError
-            s3 = get_s3_client()
-
-            orphaned_materials = []
-            orphaned_thumbnails = []
-            deleted_count = 0
-
-            # List all materials in S3
-            try:
-                materials_response = s3.list_objects_v2(
-                    Bucket=config.BUCKET_NAME,
-                    Prefix="materials/"
-                )
-
-                if 'Contents' in materials_response:
-                    for obj in materials_response['Contents']:
-                        object_key = obj['Key']
-                        # Extract material_id from path: materials/exp_id/mat_id.ext
-                        parts = object_key.split('/')
-                        if len(parts) >= 3:
-                            filename = parts[2]
-                            # Extract material_id (before first dot)
-                            material_id = filename.split('.')[0]
-
-                            # Check if material exists in database
-                            material = self.repository.get_by_id(material_id)
-                            if material is None:
-                                orphaned_materials.append(object_key)
-                                if not dry_run:
-                                    try:
-                                        delete_object(object_key)
-                                        deleted_count += 1
-                                        self.logger.info(f"Deleted orphaned material: {object_key}")
-                                    except Exception as e:
-                                        self.logger.error(f"Failed to delete {object_key}: {e}")
-            except ClientError as e:
-                self.logger.error(f"Failed to list materials in S3: {e}")
-
-            # List all thumbnails in S3
-            try:
-                thumbnails_response = s3.list_objects_v2(
-                    Bucket=config.BUCKET_NAME,
-                    Prefix="thumbnails/"
-                )
-
-                if 'Contents' in thumbnails_response:
-                    for obj in thumbnails_response['Contents']:
-                        object_key = obj['Key']
-                        # Extract material_id from path: thumbnails/exp_id/mat_id.png
-                        parts = object_key.split('/')
-                        if len(parts) >= 3:
-                            filename = parts[2]
-                            # Extract material_id (before first dot)
-                            material_id = filename.split('.')[0]
-
-                            # Check if material exists in database
-                            material = self.repository.get_by_id(material_id)
-                            if material is None:
-                                orphaned_thumbnails.append(object_key)
-                                if not dry_run:
-                                    try:
-                                        delete_object(object_key)
-                                        deleted_count += 1
-                                        self.logger.info(f"Deleted orphaned thumbnail: {object_key}")
-                                    except Exception as e:
-                                        self.logger.error(f"Failed to delete {object_key}: {e}")
-            except ClientError as e:
-                self.logger.error(f"Failed to list thumbnails in S3: {e}")
-
-            result = {
-                "orphaned_materials": len(orphaned_materials),
-                "orphaned_thumbnails": len(orphaned_thumbnails),
-                "deleted_files": deleted_count,
-                "dry_run": dry_run,
-            }
-
-            if dry_run:
-                self.logger.info(
-                    f"Dry run: Found {len(orphaned_materials)} orphaned materials "
-                    f"and {len(orphaned_thumbnails)} orphaned thumbnails")
-            else:
-                self.logger.info(
-                    f"Cleaned up {deleted_count} orphaned files from S3")
-
-            return result
-
+            cleanup = OrphanedFileCleanup(self.repository, progress=progress)
+            return cleanup.run(dry_run=dry_run).to_dict()
         except Exception as e:
             self.logger.error(f"Cleanup job failed: {e}")
             raise
 
 
+def _process_material_media(material_id: str, thumbnail: bool, description: bool) -> None:
+    """Background job: generate a material's thumbnail and/or description."""
+    service = MaterialService()
+    try:
+        if thumbnail:
+            service.generate_thumbnail(material_id)
+        if description:
+            service.generate_description(material_id)
+    finally:
+        service.repository.close()
+
+
 if __name__ == "__main__":
     import sys
 
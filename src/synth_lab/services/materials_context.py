@@ -373,6 +373,33 @@ def _format_for_exploration(contexts: list[MaterialContext]) -> str:
     return "\n".join(lines)
 
 
+def presign_material_urls(materials: list | None, expires_in: int = 7200) -> dict[str, str]:
+    """
+    Generate presigned view URLs for materials that have an uploaded file.
+
+    Materials whose URL cannot be signed are skipped (logged as warnings).
+
+    Args:
+        materials: List of ExperimentMaterial objects.
+        expires_in: URL validity in seconds (default: 2 hours).
+
+    Returns:
+        Dict mapping material ID to presigned URL.
+    """
+    from synth_lab.infrastructure.storage_client import generate_view_url
+
+    urls: dict[str, str] = {}
+    for mat in materials or []:
+        if not mat.file_url:
+            continue
+        object_key = "/".join(mat.file_url.split("/")[4:])
+        try:
+            urls[mat.id] = generate_view_url(object_key, expires_in=expires_in)
+        except Exception as e:
+            logger.warning(f"Failed to generate URL for {mat.id}: {e}")
+    return urls
+
+
 # ============================================================================
 # Validation Functions
 # ============================================================================
@@ -0,0 +1,373 @@
+"""
+Media processing for experiment materials (thumbnails and descriptions).
+
+Materials are never loaded whole into the API worker's memory:
+
+- Objects are streamed from S3 to a temporary file in fixed-size chunks.
+- MP4/MOV videos whose index (moov box) precedes the media data are only
+  fetched up to the first frames, using ranged reads. Other videos, and
+  partial downloads that fail to decode, fall back to the full object.
+- Decoding (Pillow, moviepy/ffmpeg, pdf2image, tesseract) runs in a bounded
+  process pool, so large frames and pages do not grow the API process and
+  concurrent uploads cannot run more than MEDIA_WORKERS decoders at once.
+- Thumbnail and description jobs run on a background executor, off the
+  request path (see MaterialService.schedule_media_processing).
+
+References:
+    - Service: services/material_service.py
+    - Storage: infrastructure/storage_client.py
+    - ISO BMFF boxes (MP4): ISO/IEC 14496-12
+    - ProcessPoolExecutor: https://docs.python.org/3/library/concurrent.futures.html
+
+Sample usage:
+    from synth_lab.services.media_processing import (
+        process_stored_media, render_video_thumbnail)
+
+    png = process_stored_media(
+        "materials/exp_123/mat_456.mp4", FileType.VIDEO, render_video_thumbnail, (200, 200))
+
+Expected output:
+    b"\\x89PNG..." (None if the object does not exist)
+"""
+
+import multiprocessing
+import struct
+import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+from PIL import Image
+
+from synth_lab.domain.entities.experiment_material import FileType
+from synth_lab.infrastructure.config import (
+    MEDIA_TASK_TIMEOUT,
+    MEDIA_TASKS_PER_CHILD,
+    MEDIA_VIDEO_PREFIX_BYTES,
+    MEDIA_WORKERS,
+)
+from synth_lab.infrastructure.storage_client import download_object_to_file, get_object_range
+
+# Bytes read to find the top-level MP4 boxes
+MP4_HEADER_BYTES = 64 * 1024
+
+# Vision models downscale larger images to fit this box anyway
+VISION_MAX_SIDE = 2048
+
+_log = logger.bind(component="media_processing")
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+_jobs: ThreadPoolExecutor | None = None
+
+
+# -----------------------------------------------------------------------------
+# Decoding tasks (run in the process pool; arguments and results are picklable)
+# -----------------------------------------------------------------------------
+
+
+def _to_png(img: Image.Image) -> bytes:
+    output = BytesIO()
+    img.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+def render_image_thumbnail(path: str, size: tuple[int, int]) -> bytes:
+    """PNG thumbnail of an image file (aspect ratio preserved)."""
+    with Image.open(path) as img:
+        # JPEGs can be decoded directly at a reduced scale
+        img.draft("RGB", (size[0] * 2, size[1] * 2))
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+        img.thumbnail(size, Image.Resampling.LANCZOS)
+        return _to_png(img)
+
+
+def render_vision_image(path: str, max_side: int = VISION_MAX_SIDE) -> bytes:
+    """PNG of an image file, downscaled to fit max_side (for vision models)."""
+    with Image.open(path) as img:
+        img.draft("RGB", (max_side, max_side))
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGB")
+        img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        return _to_png(img)
+
+
+def _first_frame(path: str) -> Image.Image:
+    from moviepy.editor import VideoFileClip
+
+    with VideoFileClip(path, audio=False) as clip:
+        return Image.fromarray(clip.get_frame(0))
+
+
+def render_video_thumbnail(path: str, size: tuple[int, int]) -> bytes:
+    """PNG thumbnail of a video's first frame."""
+    img = _first_frame(path)
+    img.thumbnail(size, Image.Resampling.LANCZOS)
+    return _to_png(img)
+
+
+def render_video_frame(path: str, max_side: int = VISION_MAX_SIDE) -> bytes:
+    """PNG of a video's first frame, downscaled to fit max_side."""
+    img = _first_frame(path)
+    img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+    return _to_png(img)
+
+
+def _first_page(path: str, dpi: int) -> Image.Image:
+    from pdf2image import convert_from_path
+
+    pages = convert_from_path(path, first_page=1, last_page=1, dpi=dpi)
+    if not pages:
+        raise ValueError("No pages extracted from document")
+    return pages[0]
+
+
+def render_document_thumbnail(path: str, size: tuple[int, int]) -> bytes:
+    """PNG thumbnail of a PDF's first page."""
+    img = _first_page(path, dpi=72)
+    img.thumbnail(size, Image.Resampling.LANCZOS)
+    return _to_png(img)
+
+
+def extract_document_text(path: str, dpi: int = 150) -> str:
+    """OCR text of a PDF's first page."""
+    import pytesseract
+
+    return pytesseract.image_to_string(_first_page(path, dpi=dpi))
+
+
+# -----------------------------------------------------------------------------
+# Fetching
+# -----------------------------------------------------------------------------
+
+
+def mp4_moov_end(header: bytes) -> int | None:
+    """
+    End offset of the moov box, if it comes before the media data.
+
+    Walks the top-level ISO BMFF boxes (size + type) in the file header.
+
+    Args:
+        header: First bytes of the file.
+
+    Returns:
+        Offset just past the moov box, or None if mdat comes first, the
+        file is not MP4/MOV or the boxes do not fit in the header.
+    """
+    offset = 0
+    while offset + 8 <= len(header):
+        size, box_type = struct.unpack(">I4s", header[offset:offset + 8])
+        if size == 1:
+            if offset + 16 > len(header):
+                return None
+            size = struct.unpack(">Q", header[offset + 8:offset + 16])[0]
+        if box_type == b"moov":
+            return offset + size if size >= 8 else None
+        if box_type == b"mdat" or size < 8:
+            return None
+        offset += size
+    return None
+
+
+def fetch_media(object_key: str, file_type: FileType, path: Path) -> bool | None:
+    """
+    Download a material to a local file.
+
+    Videos with their index first are fetched only up to the first frames.
+
+    Args:
+        object_key: S3 object key.
+        file_type: Material file type.
+        path: Local file to write.
+
+    Returns:
+        True if the whole object was written, False if only a prefix was,
+        None if the object was not found.
+    """
+    if file_type == FileType.VIDEO:
+        header = get_object_range(object_key, 0, MP4_HEADER_BYTES - 1)
+        if header is None:
+            return None
+        moov_end = mp4_moov_end(header)
+        if moov_end is not None:
+            last = moov_end + MEDIA_VIDEO_PREFIX_BYTES - 1
+            if not download_object_to_file(object_key, path, byte_range=(0, last)):
+                return None
+            return False
+
+    return True if download_object_to_file(object_key, path) else None
+
+
+# -----------------------------------------------------------------------------
+# Execution
+# -----------------------------------------------------------------------------
+
+
+def get_media_pool() -> ProcessPoolExecutor | None:
+    """
+    Get the decoding process pool (None when MEDIA_WORKERS is 0: run in-process).
+
+    Workers are spawned (not forked from the threaded API process) and
+    replaced after MEDIA_TASKS_PER_CHILD tasks, returning decoder memory.
+    """
+    global _pool
+    if MEDIA_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=MEDIA_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=MEDIA_TASKS_PER_CHILD,
+            )
+        return _pool
+
+
+def _reset_pool(broken: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def run_media_task(task: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a decoding task in the process pool and wait for its result.
+
+    Raises:
+        TimeoutError: If the task exceeds MEDIA_TASK_TIMEOUT.
+        Exception: The task's error.
+    """
+    pool = get_media_pool()
+    if pool is None:
+        return task(*args)
+    try:
+        return pool.submit(task, *args).result(timeout=MEDIA_TASK_TIMEOUT)
+    except BrokenProcessPool:
+        # A worker died (e.g. killed for memory): next task gets a fresh pool
+        _reset_pool(pool)
+        raise
+
+
+def process_stored_media(
+    object_key: str,
+    file_type: FileType,
+    task: Callable[..., Any],
+    *args: Any) -> Any:
+    """
+    Download a material to a temporary file and run a decoding task on it.
+
+    Args:
+        object_key: S3 object key.
+        file_type: Material file type.
+        task: Decoding task; called as task(local_path, *args).
+        *args: Extra task arguments.
+
+    Returns:
+        The task's result, or None if the object was not found.
+    """
+    suffix = Path(object_key).suffix
+    with tempfile.TemporaryDirectory(prefix="synthlab_media_") as workdir:
+        path = Path(workdir) / f"source{suffix}"
+        complete = fetch_media(object_key, file_type, path)
+        if complete is None:
+            return None
+        try:
+            return run_media_task(task, str(path), *args)
+        except Exception as e:
+            if complete:
+                raise
+            _log.info(f"Partial download of {object_key} not decodable ({e}); fetching all")
+        if not download_object_to_file(object_key, path):
+            return None
+        return run_media_task(task, str(path), *args)
+
+
+def submit_media_job(job: Callable[..., Any], *args: Any) -> Future:
+    """
+    Run a media job (download, decode, LLM call, save) in the background.
+
+    Errors are logged; the returned future can be ignored.
+    """
+    global _jobs
+    with _pool_lock:
+        if _jobs is None:
+            _jobs = ThreadPoolExecutor(
+                max_workers=max(1, MEDIA_WORKERS), thread_name_prefix="media-job")
+        executor = _jobs
+
+    def run() -> Any:
+        try:
+            return job(*args)
+        except Exception as e:
+            _log.error(f"Media job {getattr(job, '__name__', job)} failed: {e}")
+            return None
+
+    return executor.submit(run)
+
+
+def shutdown_media_processing() -> None:
+    """Stop the background executor and the process pool."""
+    global _pool, _jobs
+    with _pool_lock:
+        pool, jobs = _pool, _jobs
+        _pool = _jobs = None
+    if jobs is not None:
+        jobs.shutdown(wait=False, cancel_futures=True)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+if __name__ == "__main__":
+    import sys
+
+    all_validation_failures = []
+    total_tests = 0
+
+    def box(box_type: bytes, size: int) -> bytes:
+        return struct.pack(">I4s", size, box_type) + b"\0" * (min(size, 64) - 8)
+
+    # Test 1: moov before mdat (fast start) -> end of moov
+    total_tests += 1
+    header = box(b"ftyp", 32) + struct.pack(">I4s", 1000, b"moov")
+    if mp4_moov_end(header) != 1032:
+        all_validation_failures.append(f"Fast start: {mp4_moov_end(header)}")
+
+    # Test 2: mdat first (moov at the end) -> full download
+    total_tests += 1
+    header = box(b"ftyp", 32) + struct.pack(">I4s", 50_000_000, b"mdat")
+    if mp4_moov_end(header) is not None:
+        all_validation_failures.append("mdat first should need the full file")
+
+    # Test 3: 64-bit box sizes and non-MP4 data
+    total_tests += 1
+    header = box(b"ftyp", 24) + struct.pack(">I4sQ", 1, b"free", 16) + box(b"moov", 100)
+    if mp4_moov_end(header) != 140:
+        all_validation_failures.append(f"Large size box: {mp4_moov_end(header)}")
+    if mp4_moov_end(b"\x1aE\xdf\xa3 not an mp4 file") is not None:
+        all_validation_failures.append("Non-MP4 header should return None")
+
+    # Test 4: Thumbnail task renders a bounded PNG
+    total_tests += 1
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = Path(temp_dir) / "image.jpg"
+        Image.new("RGB", (1600, 900), color="red").save(source, format="JPEG")
+        with Image.open(BytesIO(render_image_thumbnail(str(source), (200, 200)))) as thumb:
+            if thumb.format != "PNG" or max(thumb.size) != 200:
+                all_validation_failures.append(f"Thumbnail: {thumb.format} {thumb.size}")
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
@@ -3,14 +3,51 @@ Message broker for real-time SSE streaming.
 
 Singleton pub/sub broker for interview messages during research execution.
 
+Delivery across processes is handled by a pluggable backend:
+    - memory: in-process fan-out (single worker)
+    - postgres: Postgres LISTEN/NOTIFY, so an SSE client connected to any
+      worker receives messages published by an interview running on another.
+      Payloads larger than the NOTIFY limit are spilled to broker_payloads.
+
+Each subscriber gets a bounded queue. Publishers never wait on slow
+clients: when a queue is full the overflow policy drops the oldest or the
+newest message, or disconnects the subscriber. The end-of-execution
+sentinel is always delivered.
+
 References:
     - asyncio.Queue: https://docs.python.org/3/library/asyncio-queue.html
+    - NOTIFY: https://www.postgresql.org/docs/current/sql-notify.html
+    - psycopg2 notifications: https://www.psycopg.org/docs/advanced.html#async-notify
 """
 
 import asyncio
+import json
+import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
-from typing import Any
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import Any, Protocol
+
+from loguru import logger
+
+from synth_lab.infrastructure.config import (
+    BROKER_BACKEND,
+    BROKER_OVERFLOW_POLICY,
+    BROKER_QUEUE_SIZE,
+)
+
+# Postgres channel shared by all workers
+NOTIFY_CHANNEL = "synth_lab_broker"
+
+# Spill payloads above this size (NOTIFY limit is 8000 bytes)
+NOTIFY_PAYLOAD_LIMIT = 7500
+
+# Spilled payloads older than this are pruned
+SPILL_RETENTION = timedelta(minutes=10)
+
+# Delay before re-establishing a lost LISTEN connection
+LISTEN_RECONNECT_DELAY_SECONDS = 2.0
 
 
 @dataclass
@@ -20,49 +57,385 @@ class BrokerMessage:
     event_type: str
     data: dict[str, Any]
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    seq: int | None = None  # Event log sequence number, when the event was logged
+
+
+class OverflowPolicy(str, Enum):
+    """What a full subscriber queue does with a new message."""
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    DISCONNECT = "disconnect"
+
+
+class SubscriberQueue(asyncio.Queue):
+    """Bounded subscriber queue applying an overflow policy on offer()."""
+
+    def __init__(self, maxsize: int, policy: OverflowPolicy):
+        super().__init__(maxsize=maxsize)
+        self.policy = policy
+        self.dropped = 0
+        self.disconnected = False
+
+    def offer(self, message: "BrokerMessage | None") -> bool:
+        """
+        Enqueue without waiting, applying the overflow policy when full.
+
+        The None sentinel always gets in (the oldest message makes room).
+
+        Args:
+            message: Message to deliver, or None to signal end of stream.
+
+        Returns:
+            True if the message was enqueued.
+        """
+        if self.disconnected:
+            return False
+        if not self.full():
+            self.put_nowait(message)
+            return True
+
+        if message is None or self.policy == OverflowPolicy.DROP_OLDEST:
+            self.get_nowait()
+            self.dropped += 1
+            self.put_nowait(message)
+            return True
+
+        self.dropped += 1
+        if self.policy == OverflowPolicy.DISCONNECT:
+            # Slow client: discard its backlog and end its stream
+            while not self.empty():
+                self.get_nowait()
+            self.put_nowait(None)
+            self.disconnected = True
+        return False
+
+
+class BrokerBackend(Protocol):
+    """Transport that delivers published messages to subscribers (in any worker)."""
+
+    def ensure_listening(self) -> None:
+        """Start receiving messages in the current event loop (called on subscribe)."""
+
+    async def publish(self, exec_id: str, message: BrokerMessage | None) -> None:
+        """Publish a message (None = end of execution)."""
+
+
+Deliver = Callable[[str, "BrokerMessage | None"], None]
+
+
+class InMemoryBrokerBackend:
+    """Delivers messages to subscribers of this process only."""
+
+    def __init__(self, deliver: Deliver, wants: Callable[[str], bool]):
+        self._deliver = deliver
+        self._wants = wants
+
+    def ensure_listening(self) -> None:
+        """Nothing to start for in-process delivery."""
+
+    async def publish(self, exec_id: str, message: BrokerMessage | None) -> None:
+        """Fan out to local subscribers."""
+        if self._wants(exec_id):
+            self._deliver(exec_id, message)
+
+
+def encode_message(exec_id: str, message: BrokerMessage | None) -> str:
+    """Encode a broker message as JSON for NOTIFY."""
+    if message is None:
+        return json.dumps({"exec_id": exec_id, "close": True})
+    return json.dumps(
+        {
+            "exec_id": exec_id,
+            "event_type": message.event_type,
+            "data": message.data,
+            "timestamp": message.timestamp.isoformat(),
+            "seq": message.seq,
+        },
+        default=str,
+    )
+
+
+def decode_message(payload: dict[str, Any]) -> BrokerMessage | None:
+    """Decode a message produced by encode_message (None for the close sentinel)."""
+    if payload.get("close"):
+        return None
+    return BrokerMessage(
+        event_type=payload["event_type"],
+        data=payload["data"],
+        timestamp=datetime.fromisoformat(payload["timestamp"]),
+        seq=payload.get("seq"),
+    )
+
+
+class PostgresBrokerBackend:
+    """
+    Delivers messages to subscribers in all workers via LISTEN/NOTIFY.
+
+    Every worker keeps one dedicated autocommit connection listening on
+    NOTIFY_CHANNEL, read from the event loop with add_reader. Notifications
+    are decoded in order by a dispatcher task and fanned out locally.
+    Publishing runs NOTIFY in a worker thread so the event loop never blocks
+    on the database.
+    """
+
+    def __init__(
+        self,
+        deliver: Deliver,
+        wants: Callable[[str], bool],
+        channel: str = NOTIFY_CHANNEL,
+        engine: Any = None):
+        self._deliver = deliver
+        self._wants = wants
+        self._channel = channel
+        self._engine = engine
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._raw_connection: Any = None
+        self._inbox: asyncio.Queue[str] | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self.logger = logger.bind(component="message_broker")
+
+    def _get_engine(self) -> Any:
+        if self._engine is None:
+            from synth_lab.infrastructure.database_v2 import get_engine
+
+            self._engine = get_engine()
+        return self._engine
+
+    @property
+    def _connection(self) -> Any:
+        return self._raw_connection.driver_connection
+
+    # ----- Listening -----
+
+    def ensure_listening(self) -> None:
+        """Start (or restart for a new event loop) the LISTEN connection."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._raw_connection is not None:
+            return
+        self._stop_listening()
+        self._loop = loop
+        self._inbox = asyncio.Queue()
+        self._dispatcher = loop.create_task(self._dispatch_loop())
+        self._listen()
+
+    def _listen(self) -> None:
+        """Open a dedicated connection, LISTEN and register it with the loop."""
+        raw = self._get_engine().raw_connection()
+        raw.detach()  # Not returned to the pool: it stays in LISTEN mode
+        raw.driver_connection.autocommit = True
+        with raw.driver_connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {self._channel}")
+        self._raw_connection = raw
+        self._loop.add_reader(self._connection.fileno(), self._on_readable)
+        self.logger.info(f"Listening for broker messages on channel {self._channel}")
+
+    def _stop_listening(self) -> None:
+        """Unregister and close the LISTEN connection and dispatcher."""
+        if self._raw_connection is not None:
+            try:
+                if self._loop is not None and not self._loop.is_closed():
+                    self._loop.remove_reader(self._connection.fileno())
+                self._raw_connection.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing LISTEN connection: {e}")
+            self._raw_connection = None
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+
+    def _on_readable(self) -> None:
+        """Read pending notifications into the inbox (runs in the event loop)."""
+        try:
+            self._connection.poll()
+        except Exception as e:
+            self.logger.warning(f"LISTEN connection lost, reconnecting: {e}")
+            self._loop.remove_reader(self._connection.fileno())
+            self._raw_connection = None
+            self._loop.call_later(LISTEN_RECONNECT_DELAY_SECONDS, self._reconnect)
+            return
+
+        notifies = self._connection.notifies
+        while notifies:
+            self._inbox.put_nowait(notifies.pop(0).payload)
+
+    def _reconnect(self) -> None:
+        if self._raw_connection is not None:
+            return
+        try:
+            self._listen()
+        except Exception as e:
+            self.logger.warning(f"LISTEN reconnect failed: {e}")
+            self._loop.call_later(LISTEN_RECONNECT_DELAY_SECONDS, self._reconnect)
+
+    async def _dispatch_loop(self) -> None:
+        """Decode notifications in arrival order and deliver them locally."""
+        while True:
+            raw_payload = await self._inbox.get()
+            try:
+                payload = json.loads(raw_payload)
+                exec_id = payload["exec_id"]
+                if not self._wants(exec_id):
+                    continue  # No subscriber in this worker
+                if "spill_id" in payload:
+                    spilled = await asyncio.to_thread(self._load_spilled, payload["spill_id"])
+                    if spilled is None:
+                        self.logger.warning(f"Spilled payload {payload['spill_id']} not found")
+                        continue
+                    payload = json.loads(spilled)
+                self._deliver(exec_id, decode_message(payload))
+            except Exception as e:
+                self.logger.error(f"Failed to dispatch broker notification: {e}")
+
+    # ----- Publishing -----
+
+    async def publish(self, exec_id: str, message: BrokerMessage | None) -> None:
+        """NOTIFY all workers (spilling large payloads to broker_payloads)."""
+        await asyncio.to_thread(self._notify, exec_id, encode_message(exec_id, message))
+
+    def _notify(self, exec_id: str, payload: str) -> None:
+        from sqlalchemy import delete, insert, text
+
+        from synth_lab.models.orm.research import BrokerPayload
+
+        with self._get_engine().begin() as conn:
+            if len(payload.encode("utf-8")) > NOTIFY_PAYLOAD_LIMIT:
+                now = datetime.now(UTC)
+                spill_id = uuid.uuid4().hex
+                conn.execute(
+                    delete(BrokerPayload).where(
+                        BrokerPayload.created_at < (now - SPILL_RETENTION).isoformat()))
+                conn.execute(
+                    insert(BrokerPayload).values(
+                        id=spill_id, exec_id=exec_id, payload=payload, created_at=now.isoformat()))
+                payload = json.dumps({"exec_id": exec_id, "spill_id": spill_id})
+            # Delivered on commit, so the spilled row is visible to listeners
+            conn.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self._channel, "payload": payload})
+
+    def _load_spilled(self, spill_id: str) -> str | None:
+        from sqlalchemy import select
+
+        from synth_lab.models.orm.research import BrokerPayload
+
+        with self._get_engine().connect() as conn:
+            return conn.execute(
+                select(BrokerPayload.payload).where(BrokerPayload.id == spill_id)
+            ).scalar_one_or_none()
+
+    def close(self) -> None:
+        """Stop listening."""
+        self._stop_listening()
+        self._loop = None
+
+
+def create_broker_backend(
+    name: str, deliver: Deliver, wants: Callable[[str], bool]) -> BrokerBackend:
+    """
+    Create a broker backend by name.
+
+    Args:
+        name: "memory" or "postgres".
+        deliver: Local fan-out callback (exec_id, message).
+        wants: Whether this process has subscribers for an exec_id.
+
+    Returns:
+        Broker backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name == "memory":
+        return InMemoryBrokerBackend(deliver, wants)
+    if name == "postgres":
+        return PostgresBrokerBackend(deliver, wants)
+    raise ValueError(f"Unknown broker backend: {name} (expected 'memory' or 'postgres')")
 
 
 class MessageBroker:
     """Singleton broker for pub/sub of interview messages.
 
     Allows multiple SSE clients to subscribe to execution events.
-    Each execution has its own list of subscriber queues.
+    Each execution has its own list of bounded subscriber queues; the
+    backend decides how published messages reach them.
     """
 
     _instance: "MessageBroker | None" = None
-    _subscribers: dict[str, list[asyncio.Queue[BrokerMessage | None]]]
+    _subscribers: dict[str, list[SubscriberQueue]]
+    _backend: BrokerBackend
 
     def __new__(cls) -> "MessageBroker":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._subscribers = {}
+            cls._instance._queue_size = BROKER_QUEUE_SIZE
+            cls._instance._policy = OverflowPolicy(BROKER_OVERFLOW_POLICY)
+            cls._instance._backend = create_broker_backend(
+                BROKER_BACKEND, cls._instance._deliver, cls._instance.has_subscribers)
+            cls._instance.logger = logger.bind(component="message_broker")
         return cls._instance
 
-    def subscribe(self, exec_id: str) -> asyncio.Queue[BrokerMessage | None]:
+    def configure(
+        self,
+        backend: str | None = None,
+        queue_size: int | None = None,
+        policy: OverflowPolicy | str | None = None) -> None:
+        """
+        Override backend and queue settings (applies to new subscriptions).
+
+        Args:
+            backend: Backend name ("memory" or "postgres").
+            queue_size: Max buffered messages per subscriber.
+            policy: Overflow policy for full queues.
+        """
+        if backend is not None:
+            if isinstance(self._backend, PostgresBrokerBackend):
+                self._backend.close()
+            self._backend = create_broker_backend(backend, self._deliver, self.has_subscribers)
+        if queue_size is not None:
+            self._queue_size = queue_size
+        if policy is not None:
+            self._policy = OverflowPolicy(policy)
+
+    def subscribe(self, exec_id: str) -> SubscriberQueue:
         """Subscribe to messages for an execution.
 
         Args:
             exec_id: Execution ID to subscribe to
 
         Returns:
-            Queue that will receive messages for this execution
+            Bounded queue that will receive messages for this execution
         """
-        if exec_id not in self._subscribers:
-            self._subscribers[exec_id] = []
-        queue: asyncio.Queue[BrokerMessage | None] = asyncio.Queue()
-        self._subscribers[exec_id].append(queue)
+        self._backend.ensure_listening()
+        queue = SubscriberQueue(self._queue_size, self._policy)
+        self._subscribers.setdefault(exec_id, []).append(queue)
         return queue
 
     async def publish(self, exec_id: str, message: BrokerMessage) -> None:
         """Publish a message to all subscribers for an execution.
 
+        Does not wait for slow subscribers (see OverflowPolicy).
+
         Args:
             exec_id: Execution ID to publish to
             message: Message to publish
         """
-        if exec_id in self._subscribers:
-            for queue in self._subscribers[exec_id]:
-                await queue.put(message)
+        await self._backend.publish(exec_id, message)
+
+    def _deliver(self, exec_id: str, message: BrokerMessage | None) -> None:
+        """Fan a message out to this process' subscriber queues."""
+        for queue in self._subscribers.get(exec_id, []):
+            already_dropping = queue.dropped > 0
+            queue.offer(message)
+            if queue.dropped and not already_dropping:
+                self.logger.warning(
+                    f"Subscriber of {exec_id} is not keeping up "
+                    f"(policy={queue.policy.value}, queue size={queue.maxsize})")
+
+    def has_subscribers(self, exec_id: str) -> bool:
+        """Whether this process has subscribers for an execution."""
+        return bool(self._subscribers.get(exec_id))
 
     def unsubscribe(self, exec_id: str, queue: asyncio.Queue[BrokerMessage | None]) -> None:
         """Unsubscribe a queue from an execution.
@@ -87,9 +460,7 @@ class MessageBroker:
         Args:
             exec_id: Execution ID that completed
         """
-        if exec_id in self._subscribers:
-            for queue in self._subscribers[exec_id]:
-                await queue.put(None)
+        await self._backend.publish(exec_id, None)
 
     def get_subscriber_count(self, exec_id: str) -> int:
         """Get number of subscribers for an execution.
@@ -236,6 +607,48 @@ if __name__ == "__main__":
     except Exception as e:
         all_validation_failures.append(f"BrokerMessage test failed: {e}")
 
+    # Test 8: Bounded queue overflow policies
+    total_tests += 1
+    try:
+        msgs = [BrokerMessage(event_type="message", data={"i": i}) for i in range(3)]
+
+        oldest = SubscriberQueue(2, OverflowPolicy.DROP_OLDEST)
+        for m in msgs:
+            oldest.offer(m)
+        if [oldest.get_nowait().data["i"] for _ in range(2)] != [1, 2]:
+            all_validation_failures.append("drop_oldest should keep the newest messages")
+
+        newest = SubscriberQueue(2, OverflowPolicy.DROP_NEWEST)
+        for m in msgs:
+            newest.offer(m)
+        newest.offer(None)
+        if newest.qsize() != 2 or newest.dropped != 2:
+            all_validation_failures.append(
+                f"drop_newest: size={newest.qsize()}, dropped={newest.dropped}")
+        items = [newest.get_nowait() for _ in range(2)]
+        if items[-1] is not None:
+            all_validation_failures.append("Sentinel must always be delivered")
+
+        slow = SubscriberQueue(2, OverflowPolicy.DISCONNECT)
+        for m in msgs:
+            slow.offer(m)
+        if not slow.disconnected or slow.get_nowait() is not None:
+            all_validation_failures.append("disconnect should end the stream with the sentinel")
+    except Exception as e:
+        all_validation_failures.append(f"Overflow policy test failed: {e}")
+
+    # Test 9: NOTIFY payload round trip
+    total_tests += 1
+    try:
+        msg = BrokerMessage(event_type="message", data={"text": "Olá"})
+        decoded = decode_message(json.loads(encode_message("exec_1", msg)))
+        if decoded != msg:
+            all_validation_failures.append(f"Round trip mismatch: {decoded}")
+        if decode_message(json.loads(encode_message("exec_1", None))) is not None:
+            all_validation_failures.append("Close sentinel should decode to None")
+    except Exception as e:
+        all_validation_failures.append(f"Encoding test failed: {e}")
+
     # Final validation result
     if all_validation_failures:
         print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
@@ -0,0 +1,234 @@
+"""
+In-memory cache of pre-rendered synth persona prompts.
+
+Chat and interview prompts start with the synth's persona (identity,
+interests, cognitive contract); the chat prompt also embeds the synth's
+interview transcript. Rendering them needs the synth (and transcript)
+from the database, so they are cached per (synth_id, synth version,
+exec_id, kind) and reused for every chat message and interview turn.
+
+Returning the same rendered text keeps the prompt prefix byte-identical
+between calls, which is what lets the provider's prompt caching apply.
+
+The synth version is a fingerprint of the synth data, so an edited synth
+gets new entries. The synth_id -> version lookup expires after a short TTL,
+so edits made by other processes are picked up.
+
+References:
+    - Chat: services/chat/service.py
+    - Interviews: services/research_agentic/runner.py
+    - OpenAI prompt caching: https://platform.openai.com/docs/guides/prompt-caching
+
+Sample usage:
+    from synth_lab.services.persona_prompt_cache import (
+        CHAT_SYSTEM_PROMPT, PersonaPrompt, get_persona_prompt_cache, synth_version)
+
+    cache = get_persona_prompt_cache()
+    prompt = cache.get_or_render(
+        synth_id, synth_version(synth_data), exec_id, CHAT_SYSTEM_PROMPT,
+        lambda: PersonaPrompt(synth_name="Maria", text=render(synth_data)))
+
+Expected output:
+    PersonaPrompt(synth_name="Maria", text="Você é Maria Silva, 34 anos, ...")
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+# Prompt kinds
+CHAT_SYSTEM_PROMPT = "chat_system_prompt"
+INTERVIEWEE_PERSONA = "interviewee_persona"
+
+# Max rendered prompts kept in memory (least recently used evicted)
+PERSONA_CACHE_MAX_ENTRIES = 1024
+
+# Seconds a synth_id -> version lookup is trusted without the database
+SYNTH_VERSION_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class PersonaPrompt:
+    """Rendered prompt and the synth's display name."""
+
+    synth_name: str
+    text: str
+
+
+def synth_version(synth_data: dict[str, Any]) -> str:
+    """Fingerprint of a synth's data (changes whenever the synth is edited)."""
+    payload = json.dumps(synth_data, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class PersonaPromptCache:
+    """Thread-safe LRU cache of rendered persona prompts."""
+
+    def __init__(
+        self,
+        max_entries: int = PERSONA_CACHE_MAX_ENTRIES,
+        version_ttl_seconds: float = SYNTH_VERSION_TTL_SECONDS):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of rendered prompts kept.
+            version_ttl_seconds: Lifetime of a synth_id -> version lookup.
+        """
+        self._entries: OrderedDict[tuple[str, str, str, str], PersonaPrompt] = OrderedDict()
+        self._versions: dict[str, tuple[str, float]] = {}
+        self._max_entries = max_entries
+        self._version_ttl = version_ttl_seconds
+        self._lock = threading.Lock()
+
+    def known_version(self, synth_id: str) -> str | None:
+        """Version of a synth, if seen recently (no database access)."""
+        with self._lock:
+            known = self._versions.get(synth_id)
+            if known is None:
+                return None
+            version, expires_at = known
+            if time.monotonic() >= expires_at:
+                del self._versions[synth_id]
+                return None
+            return version
+
+    def get(
+        self, synth_id: str, version: str, exec_id: str | None, kind: str
+    ) -> PersonaPrompt | None:
+        """Get a rendered prompt (or None)."""
+        key = (synth_id, version, exec_id or "", kind)
+        with self._lock:
+            prompt = self._entries.get(key)
+            if prompt is not None:
+                self._entries.move_to_end(key)
+            return prompt
+
+    def set(
+        self,
+        synth_id: str,
+        version: str,
+        exec_id: str | None,
+        kind: str,
+        prompt: PersonaPrompt) -> PersonaPrompt:
+        """
+        Store a rendered prompt and record the synth's current version.
+
+        Args:
+            synth_id: Synth ID.
+            version: Synth version (see synth_version).
+            exec_id: Execution whose transcript the prompt embeds (None if none).
+            kind: Prompt kind (e.g., CHAT_SYSTEM_PROMPT).
+            prompt: Rendered prompt.
+
+        Returns:
+            The stored prompt.
+        """
+        key = (synth_id, version, exec_id or "", kind)
+        with self._lock:
+            previous = self._versions.get(synth_id)
+            if previous is not None and previous[0] != version:
+                self._drop_synth_entries(synth_id)
+            self._versions[synth_id] = (version, time.monotonic() + self._version_ttl)
+            self._entries[key] = prompt
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return prompt
+
+    def get_or_render(
+        self,
+        synth_id: str,
+        version: str,
+        exec_id: str | None,
+        kind: str,
+        render: Callable[[], PersonaPrompt]) -> PersonaPrompt:
+        """Get a rendered prompt, rendering and storing it on a miss."""
+        prompt = self.get(synth_id, version, exec_id, kind)
+        if prompt is None:
+            prompt = self.set(synth_id, version, exec_id, kind, render())
+        return prompt
+
+    def invalidate_synth(self, synth_id: str) -> None:
+        """Drop the version lookup and all prompts of a synth."""
+        with self._lock:
+            self._versions.pop(synth_id, None)
+            self._drop_synth_entries(synth_id)
+
+    def clear(self) -> None:
+        """Remove everything."""
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop_synth_entries(self, synth_id: str) -> None:
+        for key in [k for k in self._entries if k[0] == synth_id]:
+            del self._entries[key]
+
+
+_persona_prompt_cache = PersonaPromptCache()
+
+
+def get_persona_prompt_cache() -> PersonaPromptCache:
+    """Get the process-wide persona prompt cache."""
+    return _persona_prompt_cache
+
+
+if __name__ == "__main__":
+    import sys
+
+    all_validation_failures = []
+    total_tests = 0
+
+    cache = PersonaPromptCache(max_entries=2)
+    synth = {"id": "abc123", "nome": "Maria Silva", "psicografia": {"interesses": ["café"]}}
+    version = synth_version(synth)
+    renders: list[str] = []
+
+    def render() -> PersonaPrompt:
+        renders.append("x")
+        return PersonaPrompt(synth_name="Maria", text="Você é Maria Silva")
+
+    # Test 1: Second lookup is served from memory with the identical string
+    total_tests += 1
+    first = cache.get_or_render("abc123", version, "exec_1", CHAT_SYSTEM_PROMPT, render)
+    second = cache.get_or_render("abc123", version, "exec_1", CHAT_SYSTEM_PROMPT, render)
+    if len(renders) != 1 or first.text is not second.text:
+        all_validation_failures.append(f"Expected one render, got {len(renders)}")
+
+    # Test 2: Version is known without the synth; edits change the version
+    total_tests += 1
+    edited = {**synth, "nome": "Maria Souza"}
+    if cache.known_version("abc123") != version or synth_version(edited) == version:
+        all_validation_failures.append("Version lookup or fingerprint wrong")
+
+    # Test 3: A new version drops the synth's old prompts
+    total_tests += 1
+    cache.set("abc123", synth_version(edited), "exec_1", CHAT_SYSTEM_PROMPT, render())
+    if cache.get("abc123", version, "exec_1", CHAT_SYSTEM_PROMPT) is not None or len(cache) != 1:
+        all_validation_failures.append("Old version should be dropped")
+
+    # Test 4: LRU eviction
+    total_tests += 1
+    cache.set("s2", "v", None, INTERVIEWEE_PERSONA, render())
+    cache.set("s3", "v", None, INTERVIEWEE_PERSONA, render())
+    if len(cache) != 2 or cache.get("abc123", synth_version(edited), "exec_1",
+                                    CHAT_SYSTEM_PROMPT) is not None:
+        all_validation_failures.append(f"LRU eviction failed: {len(cache)} entries")
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
@@ -28,6 +28,7 @@ from openai.types.shared import Reasoning
 from synth_lab.infrastructure.llm_client import supports_reasoning_effort
 
 from .instructions import (
+    format_interviewee_history,
     format_interviewee_instructions,
     format_interviewee_reviewer_instructions,
     format_interviewer_instructions,
@@ -134,7 +135,8 @@ def create_interviewee(
     initial_context: str = "",
     model: str = "gpt-4o-mini",
     reasoning_effort: str = "low",
-    materials: list | None = None) -> Agent:
+    materials: list | None = None,
+    instructions_prefix: str | None = None) -> Agent:
     """
     Create an interviewee agent.
 
@@ -151,13 +153,19 @@ def create_interviewee(
         model: LLM model to use
         reasoning_effort: Reasoning effort level ("low", "medium", "high")
         materials: Optional list of ExperimentMaterial objects to include in prompt
+        instructions_prefix: Pre-rendered instructions up to the conversation
+            history (see format_interviewee_prefix); reused across turns so the
+            prompt prefix stays byte-identical
 
     Returns:
         Configured Agent instance
     """
-    instructions = format_interviewee_instructions(
-        synth, conversation_history, available_images, initial_context, materials
-    )
+    if instructions_prefix is not None:
+        instructions = instructions_prefix + format_interviewee_history(conversation_history)
+    else:
+        instructions = format_interviewee_instructions(
+            synth, conversation_history, available_images, initial_context, materials
+        )
     synth_name = synth.get("nome", "Participante")
 
     # Build tools list - include materials tool if materials provided
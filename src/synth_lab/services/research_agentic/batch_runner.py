@@ -51,7 +51,14 @@ from rich.progress import (
 from synth_lab.infrastructure.config import AVATARS_DIR
 from synth_lab.infrastructure.phoenix_tracing import get_tracer
 
-from .runner import ConversationMessage, InterviewGuideData, InterviewResult, run_interview
+from .runner import (
+    ConversationMessage,
+    InterviewGuideData,
+    InterviewResult,
+    SimulationPrefetch,
+    prefetch_simulation_data,
+    run_interview)
+from .incremental_summarizer import IncrementalSummarizer
 from .summarizer import summarize_interviews
 
 # Phoenix/OpenTelemetry tracer for observability
@@ -77,19 +84,30 @@ class BatchResult:
     total_failed: int
 
 
-def load_all_synths(synth_group_id: str | None = None) -> list[dict[str, Any]]:
+def load_all_synths(
+    synth_group_id: str | None = None,
+    limit: int | None = None,
+    synth_ids: list[str] | None = None) -> list[dict[str, Any]]:
     """
     Load synths from the database, optionally filtered by group.
 
+    When `limit` is given, the random sample is drawn in SQL so only the
+    selected synths are loaded instead of the whole group.
+
     Args:
         synth_group_id: Optional synth group ID to filter by
+        limit: Optional maximum number of synths (randomly sampled)
+        synth_ids: Optional list of candidate synth IDs (only used with limit)
 
     Returns:
         List of synth dictionaries
     """
-    from synth_lab.gen_synth.storage import load_synths
+    from synth_lab.gen_synth.storage import load_synths, sample_synths
 
-    return load_synths(synth_group_id=synth_group_id)
+    if limit is None:
+        return load_synths(synth_group_id=synth_group_id)
+
+    return sample_synths(limit=limit, synth_group_id=synth_group_id, synth_ids=synth_ids)
 
 
 def get_timestamp_gmt3() -> str:
@@ -204,7 +222,10 @@ async def run_single_interview_safe(
     additional_context: str | None = None,
     guide_name: str = "interview",
     analysis_id: str | None = None,
-    materials: list | None = None) -> tuple[InterviewResult | None, dict[str, Any], Exception | None]:
+    materials: list | None = None,
+    simulation_data: SimulationPrefetch | None = None,
+    incremental_summarizer: IncrementalSummarizer | None = None,
+) -> tuple[InterviewResult | None, dict[str, Any], Exception | None]:
     """
     Run a single interview with error handling and semaphore control.
 
@@ -224,6 +245,10 @@ async def run_single_interview_safe(
         skip_interviewee_review: Whether to skip the interviewee response reviewer.
         additional_context: Optional additional context to complement the research scenario.
         guide_name: Name identifier for the guide (for logging/tracing).
+        analysis_id: Optional analysis ID to fetch simulation results for context.
+        materials: Optional list of ExperimentMaterial objects to include in the interview.
+        simulation_data: Optional simulation data prefetched for the whole batch.
+        incremental_summarizer: Optional running summarizer fed with the completed interview.
 
     Returns:
         Tuple of (result or None, synth_data, error or None)
@@ -247,7 +272,7 @@ async def run_single_interview_safe(
             try:
                 # Generate trace path for debugging (still saved to filesystem)
                 timestamp = get_timestamp_gmt3()
-                trace_path = f"output/traces/batch_{batch_id}/{synth_id}_{timestamp}.trace.json"
+                trace_path = f"output/traces/batch_{batch_id}/{synth_id}_{timestamp}.trace.jsonl"
 
                 # Ensure trace directory exists
                 Path(trace_path).parent.mkdir(parents=True, exist_ok=True)
@@ -265,7 +290,9 @@ async def run_single_interview_safe(
                     additional_context=additional_context,
                     guide_name=guide_name,
                     analysis_id=analysis_id,
-                    materials=materials)
+                    materials=materials,
+                    synth=synth,
+                    simulation_data=simulation_data)
 
                 logger.info(f"Completed interview with {synth_name} ({synth_id})")
                 progress.advance(task_id)
@@ -273,6 +300,10 @@ async def run_single_interview_safe(
                     span.set_attribute("status", "success")
                     span.set_attribute("total_turns", result.total_turns)
 
+                # Fold into the running synthesis (non-blocking)
+                if incremental_summarizer is not None:
+                    incremental_summarizer.add(result, synth)
+
                 # Notify that this individual interview completed (with result for immediate persistence)
                 if on_interview_completed and exec_id:
                     await on_interview_completed(exec_id, synth_id, result.total_turns, result)
@@ -308,7 +339,8 @@ async def run_batch_interviews(
     additional_context: str | None = None,
     guide_name: str = "interview",
     analysis_id: str | None = None,
-    materials: list | None = None) -> BatchResult:
+    materials: list | None = None,
+    incremental_summarizer: IncrementalSummarizer | None = None) -> BatchResult:
     """
     Run multiple interviews in parallel with progress tracking.
 
@@ -339,6 +371,9 @@ async def run_batch_interviews(
         guide_name: Name identifier for the guide (for logging/tracing).
         analysis_id: Optional analysis ID to fetch simulation results for context.
         materials: Optional list of ExperimentMaterial objects to include in all interviews.
+        incremental_summarizer: Optional IncrementalSummarizer. When provided, each
+            completed interview is folded into a running synthesis and the summary
+            (if generate_summary) is finalized from it instead of summarized from scratch.
 
     Returns:
         BatchResult with all interview results and summary
@@ -361,13 +396,27 @@ async def run_batch_interviews(
     # Use provided exec_id or generate batch ID for grouping outputs
     batch_id = exec_id if exec_id else f"batch_{guide_name}_{get_timestamp_gmt3()}"
 
-    # Load synths and select which ones to interview
-    all_synths = load_all_synths(synth_group_id=synth_group_id)
+    # Sample synths in SQL (one query) and select which ones to interview
+    all_synths = load_all_synths(
+        synth_group_id=synth_group_id,
+        limit=max_interviews,
+        synth_ids=synth_ids)
     synths_to_interview = _select_synths_for_interview(
         all_synths=all_synths,
         synth_ids=synth_ids,
         max_interviews=max_interviews)
 
+    # Prefetch simulation outcomes and statistics once for the whole batch
+    simulation_data: SimulationPrefetch | None = None
+    if analysis_id:
+        simulation_data = prefetch_simulation_data(
+            synth_ids=[s["id"] for s in synths_to_interview if s.get("id")],
+            analysis_id=analysis_id)
+        logger.info(
+            f"Prefetched simulation data for {len(simulation_data.outcomes)} synths "
+            f"from {analysis_id}"
+        )
+
     # Start avatar generation in background (non-blocking)
     # Avatars will be generated while interviews run in parallel
     avatar_task = asyncio.create_task(
@@ -420,7 +469,9 @@ async def run_batch_interviews(
                 additional_context=additional_context,
                 guide_name=guide_name,
                 analysis_id=analysis_id,
-                materials=materials)
+                materials=materials,
+                simulation_data=simulation_data,
+                incremental_summarizer=incremental_summarizer)
             for synth in synths_to_interview
         ]
 
@@ -465,11 +516,15 @@ async def run_batch_interviews(
         logger.info(f"Starting summary generation for {len(successful_interviews)} interviews")
 
         try:
-            # Summarizer uses gpt-4o-mini for faster generation
-            summary = await summarize_interviews(
-                interview_results=successful_interviews,
-                topic_guide_name=guide_name,
-                model="gpt-4o-mini")
+            if incremental_summarizer is not None:
+                # Running synthesis already covers the interviews; only the final call remains
+                summary = await incremental_summarizer.finalize()
+            else:
+                # Summarizer uses gpt-4o-mini for faster generation
+                summary = await summarize_interviews(
+                    interview_results=successful_interviews,
+                    topic_guide_name=guide_name,
+                    model="gpt-4o-mini")
             logger.info(
                 f"Summary generated successfully. Length: {len(summary) if summary else 0} chars"
             )
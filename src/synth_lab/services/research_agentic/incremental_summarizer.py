@@ -0,0 +1,263 @@
+"""
+Incremental (online) summarizer for batch interviews.
+
+Folds each completed interview into a running synthesis while the batch is
+still running, so the final report only needs one summarizer call after the
+last interview finishes. Partial syntheses can be streamed to SSE clients.
+
+Pipeline per interview:
+1. Digest the interview (map stage from summarizer, cached per content)
+2. Fold pending digests into the running synthesis (one fold at a time)
+
+finalize() waits for in-flight work and runs the summarizer on the running
+synthesis plus any digests that were not folded yet.
+
+Digesting and folding start with the first interview, so every batch
+streams partial syntheses. Callers can opt out for tiny batches with
+online_threshold: up to that many interviews are buffered and finalize()
+summarizes them in a single call, as summarize_interviews does.
+
+References:
+- Map-reduce summarization: summarizer.digest_interviews
+- asyncio Tasks: https://docs.python.org/3/library/asyncio-task.html
+
+Sample usage:
+```python
+from .incremental_summarizer import IncrementalSummarizer
+
+summarizer = IncrementalSummarizer(topic_guide_name="checkout", on_partial=publish)
+summarizer.add(result, synth_data)   # from on_interview_completed
+...
+summary = await summarizer.finalize()
+```
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from agents import Runner
+from loguru import logger
+from openinference.semconv.trace import OpenInferenceSpanKindValues, SpanAttributes
+
+from synth_lab.infrastructure.phoenix_tracing import get_tracer
+
+from .runner import InterviewResult
+from .summarizer import (
+    create_summarizer_agent,
+    digest_interviews,
+    format_interview_for_summary,
+    run_text_agent,
+    summarize_interviews,
+)
+
+# Phoenix/OpenTelemetry tracer for observability
+_tracer = get_tracer("incremental-summarizer")
+
+# Fold step: merge new interview digests into the running synthesis
+RUNNING_SYNTHESIS_INSTRUCTIONS = """
+Você é um especialista em síntese de pesquisa UX qualitativa e mantém uma síntese
+em andamento sobre "{topic_guide}" enquanto as entrevistas terminam.
+
+Atualize a síntese atual incorporando as notas das novas entrevistas. Produza a
+nova síntese em tópicos (máximo ~700 palavras) com:
+- Padrões recorrentes (indique quantas pessoas e quais perfis)
+- Divergências relevantes (com nome da pessoa e contexto)
+- Tensões entre perfis
+- Citações-chave literais, atribuídas à pessoa
+- Ausências notáveis
+
+Preserve nomes, citações e referências a materiais ([descrição](mat_XXXXXX)).
+Não descarte achados anteriores que continuem válidos.
+
+## Síntese atual ({interview_count} entrevistas)
+
+{running_synthesis}
+
+## Novas entrevistas
+
+{new_digests}
+"""
+
+
+class IncrementalSummarizer:
+    """
+    Running synthesis of a batch of interviews, updated as each one completes.
+
+    Digests run concurrently; folds into the running synthesis are serialized
+    and batch every digest that arrived while the previous fold was running.
+    """
+
+    def __init__(
+        self,
+        topic_guide_name: str,
+        model: str = "gpt-4o-mini",
+        materials: list | None = None,
+        on_partial: Callable[[str, int], Awaitable[None]] | None = None,
+        online_threshold: int = 0):
+        """
+        Initialize the incremental summarizer.
+
+        Args:
+            topic_guide_name: Name of the topic guide (used in the report title)
+            model: LLM model to use for digests, folds and the final summary
+            materials: Optional list of ExperimentMaterial objects for the final prompt
+            on_partial: Optional async callback called after each fold
+                Signature: (running_synthesis, interview_count) -> None
+            online_threshold: Opt-out for tiny batches: interviews are buffered
+                until the count exceeds it, and batches that never do are
+                summarized in a single call by finalize() (default 0: digest
+                and fold from the first interview)
+        """
+        self.topic_guide_name = topic_guide_name
+        self.model = model
+        self.materials = materials
+        self.on_partial = on_partial
+        self.online_threshold = online_threshold
+
+        self.running_synthesis: str = ""
+        self.folded_count: int = 0
+        self._pending_digests: list[str] = []
+        self._digest_tasks: set[asyncio.Task] = set()
+        self._fold_task: asyncio.Task | None = None
+        self._interview_count = 0
+        self._buffered: list[tuple[InterviewResult, dict[str, Any]]] | None = []
+
+    @property
+    def interview_count(self) -> int:
+        """Number of interviews added so far."""
+        return self._interview_count
+
+    def add(self, result: InterviewResult, synth_data: dict[str, Any]) -> None:
+        """
+        Add a completed interview. Returns immediately; work runs in background.
+
+        Args:
+            result: Completed interview result
+            synth_data: Synth data dictionary (for the interview header)
+        """
+        self._interview_count += 1
+        if self._buffered is not None:
+            self._buffered.append((result, synth_data))
+            if self._interview_count <= self.online_threshold:
+                return
+            # Batch is large enough for online folding: start with the buffered ones
+            buffered, self._buffered = self._buffered, None
+            for buffered_result, buffered_synth in buffered:
+                self._start_digest(buffered_result, buffered_synth)
+            return
+        self._start_digest(result, synth_data)
+
+    def _start_digest(self, result: InterviewResult, synth_data: dict[str, Any]) -> None:
+        formatted = format_interview_for_summary(result, synth_data)
+        task = asyncio.create_task(self._digest(formatted, result.synth_id))
+        self._digest_tasks.add(task)
+        task.add_done_callback(self._digest_tasks.discard)
+
+    async def _digest(self, formatted: str, synth_id: str) -> None:
+        """Digest one interview and schedule a fold."""
+        try:
+            digests = await digest_interviews([formatted], model=self.model)
+        except Exception as e:
+            # Keep the raw interview so it still reaches the final summary
+            logger.warning(f"Failed to digest interview {synth_id}, using transcript: {e}")
+            digests = [formatted]
+
+        self._pending_digests.extend(digests)
+        if self._fold_task is None or self._fold_task.done():
+            self._fold_task = asyncio.create_task(self._fold_loop())
+
+    async def _fold_loop(self) -> None:
+        """Fold pending digests into the running synthesis until none are left."""
+        while self._pending_digests:
+            new_digests = self._pending_digests
+            self._pending_digests = []
+            try:
+                synthesis = await run_text_agent(
+                    name="Running Synthesis",
+                    instructions=RUNNING_SYNTHESIS_INSTRUCTIONS.format(
+                        topic_guide=self.topic_guide_name,
+                        interview_count=self.folded_count,
+                        running_synthesis=self.running_synthesis or "(vazia)",
+                        new_digests="\n\n---\n\n".join(new_digests)),
+                    model=self.model,
+                    user_input="Atualize a síntese com as novas entrevistas.")
+            except Exception as e:
+                # Put digests back so finalize() still includes them
+                logger.warning(f"Failed to fold {len(new_digests)} digests: {e}")
+                self._pending_digests = new_digests + self._pending_digests
+                return
+
+            self.running_synthesis = synthesis
+            self.folded_count += len(new_digests)
+            logger.debug(f"Running synthesis updated: {self.folded_count} interviews folded")
+
+            if self.on_partial:
+                try:
+                    await self.on_partial(self.running_synthesis, self.folded_count)
+                except Exception as e:
+                    logger.warning(f"Partial summary callback failed: {e}")
+
+    async def finalize(self) -> str:
+        """
+        Wait for in-flight work and generate the final synthesis report.
+
+        Returns:
+            Synthesis report as markdown string
+        """
+        if self._buffered is not None:
+            # Small batch: one summarizer call over the full interviews
+            return await summarize_interviews(
+                self._buffered,
+                topic_guide_name=self.topic_guide_name,
+                model=self.model,
+                materials=self.materials)
+
+        with _tracer.start_as_current_span(
+            f"Finalize incremental summary: {self.topic_guide_name}",
+            attributes={
+                SpanAttributes.OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.AGENT.value,
+                "topic_guide": self.topic_guide_name,
+                "interview_count": self._interview_count,
+                "model": self.model,
+            }) as span:
+            if self._digest_tasks:
+                await asyncio.gather(*list(self._digest_tasks), return_exceptions=True)
+            if self._fold_task is not None:
+                await asyncio.gather(self._fold_task, return_exceptions=True)
+
+            # Digests left unfolded (late arrivals or fold errors) go straight to the summarizer
+            parts = []
+            if self.running_synthesis:
+                parts.append(
+                    f"(Síntese parcial de {self.folded_count} entrevistas)\n\n"
+                    f"{self.running_synthesis}"
+                )
+            if self._pending_digests:
+                parts.append("\n\n---\n\n".join(self._pending_digests))
+            interviews_content = "\n\n---\n\n".join(parts)
+
+            if span:
+                span.set_attribute("content_length", len(interviews_content))
+                span.set_attribute("folded_count", self.folded_count)
+
+            summarizer = create_summarizer_agent(
+                topic_guide_name=self.topic_guide_name,
+                interviews_content=interviews_content,
+                model=self.model,
+                reasoning_effort="medium",
+                materials=self.materials)
+            result = await Runner.run(
+                summarizer,
+                input=(
+                    "Analise as entrevistas fornecidas e gere o relatório de síntese "
+                    "conforme as diretrizes."))
+
+            summary = result.final_output
+            logger.info(
+                f"Incremental summary finalized: {len(summary)} chars, "
+                f"{self._interview_count} interviews"
+            )
+            if span:
+                span.set_attribute("summary_length", len(summary))
+            return summary
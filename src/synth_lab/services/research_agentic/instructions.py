@@ -96,7 +96,9 @@ Se for o início da entrevista, faça uma breve introdução e a primeira pergun
 """
 
 # Interviewee: Synthetic persona being interviewed
-INTERVIEWEE_INSTRUCTIONS = """
+# Split so the per-interview prefix (persona, context, rules) is rendered once
+# and stays byte-identical across turns
+INTERVIEWEE_PERSONA = """
 Você é {synth_name}, {synth_idade} anos, {synth_genero}.
 
 QUEM VOCÊ É:
@@ -114,6 +116,9 @@ INTERESSES: {synth_interesses}
 CONTRATO COGNITIVO (Como você responde em entrevistas):
 {synth_cognitive_contract}
 
+"""
+
+INTERVIEWEE_CONTEXT = """\
 Dado o contexto abaixo sobre sua experiência prévia com o tema, seu comportamento
 e respostas devem ser influenciados por ele. Tenha pré-disposição a voltar a
 experimentar, a não ser que a experiência prévia seja extremamente negativa.
@@ -154,7 +159,9 @@ IMPORTANTE:
 - "internal_notes": Antes de cada ação ou resposta, gere um pensamento interno
   avaliando o cenário com base na sua PERSONALIDADE (Big Five).
 
-## Histórico da Conversa
+"""
+
+INTERVIEWEE_HISTORY = """## Histórico da Conversa
 {conversation_history}
 
 Mas saiba que você tem leves falhas memória; pode até acontecer contradições ou
@@ -165,6 +172,8 @@ ja tenha vivido.
 Responda à última pergunta do entrevistador do seu jeito.
 """
 
+INTERVIEWEE_INSTRUCTIONS = INTERVIEWEE_PERSONA + INTERVIEWEE_CONTEXT + INTERVIEWEE_HISTORY
+
 # Interviewer Reviewer: Adapts interviewer responses to professional tone
 INTERVIEWER_REVIEWER_INSTRUCTIONS = """
 Nao faca nada, apenas escreva na sua resposta: 
@@ -274,24 +283,17 @@ def format_interviewer_instructions(
         max_turns=max_turns)
 
 
-def format_interviewee_instructions(
-    synth: dict,
-    conversation_history: str,
-    available_images: list[str] | None = None,
-    initial_context: str = "",
-    materials: list | None = None) -> str:
+def format_interviewee_persona(synth: dict) -> str:
     """
-    Format interviewee instructions with complete persona context.
+    Format the persona block of the interviewee instructions.
+
+    Depends only on the synth, so it can be cached per synth version.
 
     Args:
         synth: Complete synth data dictionary from database
-        conversation_history: Formatted conversation history string
-        available_images: Optional list of available image filenames
-        initial_context: Pre-generated context about prior experience
-        materials: Optional list of ExperimentMaterial objects to include in prompt
 
     Returns:
-        Formatted instructions string with all persona details
+        Persona block (identity, interests and cognitive contract)
     """
     # Extract key persona attributes with defaults
     nome = synth.get("nome", "Participante")
@@ -332,6 +334,41 @@ EFEITO ESPERADO: {contract_efeito}"""
     else:
         cognitive_contract_str = "Não informado"
 
+    return INTERVIEWEE_PERSONA.format(
+        synth_name=nome,
+        synth_idade=idade,
+        synth_genero=genero,
+        synth_ocupacao=ocupacao,
+        synth_escolaridade=escolaridade,
+        synth_cidade=cidade,
+        synth_estado=estado,
+        synth_descricao=descricao,
+        synth_interesses=interesses_str,
+        synth_cognitive_contract=cognitive_contract_str)
+
+
+def format_interviewee_prefix(
+    synth: dict,
+    available_images: list[str] | None = None,
+    initial_context: str = "",
+    materials: list | None = None,
+    persona: str | None = None) -> str:
+    """
+    Format the part of the interviewee instructions that is fixed for an interview.
+
+    Args:
+        synth: Complete synth data dictionary from database
+        available_images: Optional list of available image filenames
+        initial_context: Pre-generated context about prior experience
+        materials: Optional list of ExperimentMaterial objects to include in prompt
+        persona: Pre-rendered persona block (default: rendered from synth)
+
+    Returns:
+        Instructions up to the conversation history
+    """
+    if persona is None:
+        persona = format_interviewee_persona(synth)
+
     # Format initial context section (prior experience)
     if initial_context:
         initial_context_section = f"""
@@ -369,20 +406,38 @@ quiser analisá-la visualmente antes de responder.
         )
         available_images_section = available_images_section + "\n" + materials_section
 
-    return INTERVIEWEE_INSTRUCTIONS.format(
-        synth_name=nome,
-        synth_idade=idade,
-        synth_genero=genero,
-        synth_ocupacao=ocupacao,
-        synth_escolaridade=escolaridade,
-        synth_cidade=cidade,
-        synth_estado=estado,
-        synth_descricao=descricao,
-        synth_interesses=interesses_str,
-        synth_cognitive_contract=cognitive_contract_str,
+    return persona + INTERVIEWEE_CONTEXT.format(
+        synth_name=synth.get("nome", "Participante"),
         initial_context_section=initial_context_section,
-        available_images_section=available_images_section,
-        conversation_history=conversation_history)
+        available_images_section=available_images_section)
+
+
+def format_interviewee_history(conversation_history: str) -> str:
+    """Format the per-turn tail of the interviewee instructions."""
+    return INTERVIEWEE_HISTORY.format(conversation_history=conversation_history)
+
+
+def format_interviewee_instructions(
+    synth: dict,
+    conversation_history: str,
+    available_images: list[str] | None = None,
+    initial_context: str = "",
+    materials: list | None = None) -> str:
+    """
+    Format interviewee instructions with complete persona context.
+
+    Args:
+        synth: Complete synth data dictionary from database
+        conversation_history: Formatted conversation history string
+        available_images: Optional list of available image filenames
+        initial_context: Pre-generated context about prior experience
+        materials: Optional list of ExperimentMaterial objects to include in prompt
+
+    Returns:
+        Formatted instructions string with all persona details
+    """
+    prefix = format_interviewee_prefix(synth, available_images, initial_context, materials)
+    return prefix + format_interviewee_history(conversation_history)
 
 
 def format_interviewer_reviewer_instructions(raw_response: str) -> str:
@@ -24,23 +24,35 @@ import json
 import random
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from synth_lab.domain.entities.synth_outcome import SynthOutcome
 
-from agents import Runner, add_trace_processor, trace
+from agents import Runner, gen_trace_id, trace
 from loguru import logger
 from rich.console import Console
 
+from synth_lab.services.persona_prompt_cache import (
+    INTERVIEWEE_PERSONA,
+    PersonaPrompt,
+    get_persona_prompt_cache,
+    synth_version,
+)
 from synth_lab.trace_visualizer import SpanStatus, SpanType, Tracer
 
 from .agent_definitions import (
     create_interviewee,
     create_interviewee_reviewer,
     create_interviewer)
-from .tracing_bridge import TraceVisualizerProcessor
+from .instructions import format_interviewee_persona, format_interviewee_prefix
+from .tracing_bridge import TraceVisualizerProcessor, get_trace_router
+
+# Maximum length of string attributes kept in interview traces (prompts grow every turn)
+TRACE_MAX_ATTRIBUTE_CHARS = 50_000
+
+# Completed turns kept in memory by streamed tracers (older ones are only on disk)
+TRACE_MAX_RETAINED_TURNS = 2
 
 # Console for colored output
 _console = Console()
@@ -383,35 +395,71 @@ Responda APENAS com a experiência gerada, sem explicações adicionais."""
     return f"[EXPERIÊNCIA PRÉVIA - {sentiment.upper()}]: {generated_context}"
 
 
-def _get_simulation_context_for_synth(synth_id: str, analysis_id: str) -> str:
+@dataclass
+class SimulationPrefetch:
+    """
+    Simulation data for an analysis, fetched once and shared by many interviews.
+
+    Built by `prefetch_simulation_data()` so a batch of interviews does not
+    query the outcome of each synth and the analysis average separately.
+    """
+
+    analysis_id: str
+    outcomes: dict[str, "SynthOutcome"] = field(default_factory=dict)
+    avg_success_rate: float | None = None
+
+
+def prefetch_simulation_data(synth_ids: list[str], analysis_id: str) -> SimulationPrefetch:
     """
-    Fetch simulation results and format as context for interview.
+    Fetch simulation outcomes and analysis statistics for a set of synths.
+
+    Uses one query for all outcomes and one query for the analysis statistics.
 
     Args:
-        synth_id: The synth ID
+        synth_ids: The synth IDs that will be interviewed
         analysis_id: The analysis ID to fetch results from
 
     Returns:
-        Formatted simulation context string, or empty string if not found
+        SimulationPrefetch (empty if the data could not be fetched)
     """
     from synth_lab.repositories.synth_outcome_repository import SynthOutcomeRepository
+
+    try:
+        with SynthOutcomeRepository() as repo:
+            outcomes = repo.get_by_synths_and_analysis(synth_ids, analysis_id)
+            stats = repo.get_analysis_statistics(analysis_id)
+    except Exception as e:
+        logger.warning(f"Failed to prefetch simulation data for {analysis_id}: {e}")
+        return SimulationPrefetch(analysis_id=analysis_id)
+
+    return SimulationPrefetch(
+        analysis_id=analysis_id,
+        outcomes=outcomes,
+        avg_success_rate=stats["avg_success_rate"] if stats else None)
+
+
+def _format_simulation_context_for_outcome(outcome: "SynthOutcome | None") -> str:
+    """
+    Format a synth simulation outcome as context for interview.
+
+    Args:
+        outcome: The synth outcome (None if the synth has no simulation results)
+
+    Returns:
+        Formatted simulation context string, or empty string if not available
+    """
     from synth_lab.services.research_agentic.context_formatter import (
         create_simulation_context_from_outcome,
         format_simulation_context)
 
-    try:
-        repo = SynthOutcomeRepository()
-        outcome = repo.get_by_synth_and_analysis(synth_id, analysis_id)
-
-        if outcome is None:
-            logger.debug(f"No simulation results for synth {synth_id} in analysis {analysis_id}")
-            return ""
+    if outcome is None:
+        return ""
 
+    try:
         context = create_simulation_context_from_outcome(outcome)
         return format_simulation_context(context)
-
     except Exception as e:
-        logger.warning(f"Failed to fetch simulation context: {e}")
+        logger.warning(f"Failed to format simulation context: {e}")
         return ""
 
 
@@ -475,7 +523,9 @@ async def run_interview(
     additional_context: str | None = None,
     guide_name: str = "interview",
     analysis_id: str | None = None,
-    materials: list | None = None) -> InterviewResult:
+    materials: list | None = None,
+    synth: dict[str, Any] | None = None,
+    simulation_data: SimulationPrefetch | None = None) -> InterviewResult:
     """
     Run an agentic interview with orchestrated turn-taking.
 
@@ -488,7 +538,7 @@ async def run_interview(
         synth_id: ID of the synthetic persona to interview
         interview_guide: InterviewGuideData with context_definition, questions, examples
         max_turns: Maximum number of conversation turns
-        trace_path: Path to save trace file (optional)
+        trace_path: Path to save trace file (optional; .jsonl is written incrementally)
         model: LLM model to use for all agents
         verbose: Whether to print conversation to console
         exec_id: Execution ID for SSE streaming (optional)
@@ -503,6 +553,9 @@ async def run_interview(
             interviewee prompt for coherent behavior.
         materials: Optional list of ExperimentMaterial objects to include in prompts.
             When provided, materials are accessible to both interviewer and interviewee.
+        synth: Optional pre-loaded synth data. When omitted, the synth is loaded by ID.
+        simulation_data: Optional prefetched simulation data for analysis_id (see
+            prefetch_simulation_data). When omitted, it is fetched for this synth only.
 
     Returns:
         InterviewResult with conversation and metadata
@@ -521,8 +574,9 @@ async def run_interview(
     )
     ```
     """
-    # Load synth data
-    synth = load_synth(synth_id)
+    # Load synth data (unless already loaded by the caller)
+    if synth is None:
+        synth = load_synth(synth_id)
     synth_name = synth.get("nome", "Participante")
 
     # Build topic guide from interview_guide data
@@ -537,23 +591,18 @@ async def run_interview(
     avg_success_rate: float | None = None
 
     if analysis_id:
-        from synth_lab.domain.entities.synth_outcome import SynthOutcome
-        from synth_lab.repositories.synth_outcome_repository import SynthOutcomeRepository
-
-        outcome_repo = SynthOutcomeRepository()
+        if simulation_data is None or simulation_data.analysis_id != analysis_id:
+            simulation_data = prefetch_simulation_data([synth_id], analysis_id)
 
-        # Get synth's simulation outcome
-        synth_outcome = outcome_repo.get_by_synth_and_analysis(synth_id, analysis_id)
-
-        # Get analysis statistics for comparison
-        stats = outcome_repo.get_analysis_statistics(analysis_id)
-        if stats:
-            avg_success_rate = stats["avg_success_rate"]
+        synth_outcome = simulation_data.outcomes.get(synth_id)
+        avg_success_rate = simulation_data.avg_success_rate
 
         # Get formatted simulation context for interviewee prompt
-        simulation_context_text = _get_simulation_context_for_synth(synth_id, analysis_id)
+        simulation_context_text = _format_simulation_context_for_outcome(synth_outcome)
         if simulation_context_text:
             logger.info(f"Using simulation context for {synth_name} from {analysis_id}")
+        else:
+            logger.debug(f"No simulation results for synth {synth_id} in analysis {analysis_id}")
         if synth_outcome and avg_success_rate is not None:
             logger.info(
                 f"Simulation data: success={synth_outcome.success_rate:.0%}, "
@@ -569,8 +618,20 @@ async def run_interview(
     # If we have simulation context, prepend it
     initial_context: str = simulation_context_text
 
+    # Interviewee instructions up to the history are rendered once (after the
+    # initial context exists) from the cached persona, then reused every turn
+    persona = get_persona_prompt_cache().get_or_render(
+        synth_id,
+        synth_version(synth),
+        None,
+        INTERVIEWEE_PERSONA,
+        lambda: PersonaPrompt(synth_name=synth_name, text=format_interviewee_persona(synth)))
+    interviewee_prefix: str | None = None
+
     # Initialize tracer for visualization
+    # .jsonl paths are streamed turn by turn; other paths are saved at the end
     trace_id = f"agentic-interview-{synth_id}"
+    stream_trace = bool(trace_path) and trace_path.endswith(".jsonl")
     tracer = Tracer(
         trace_id=trace_id,
         metadata={
@@ -579,18 +640,22 @@ async def run_interview(
             "guide_name": guide_name,
             "model": model,
             "max_turns": str(max_turns),
-        })
+        },
+        max_attribute_chars=TRACE_MAX_ATTRIBUTE_CHARS,
+        stream_path=trace_path if stream_trace else None,
+        max_retained_turns=TRACE_MAX_RETAINED_TURNS if stream_trace else None)
 
-    # Add custom trace processor to capture SDK traces
-    processor = TraceVisualizerProcessor(tracer, verbose=False)
-    add_trace_processor(processor)
+    # Route SDK spans of this interview's trace to our processor
+    sdk_trace_id = gen_trace_id()
+    trace_router = get_trace_router()
+    trace_router.register(sdk_trace_id, TraceVisualizerProcessor(tracer, verbose=False))
 
     try:
         # Main interview loop
         # Each "turn" is a complete exchange: interviewer question + interviewee answer
         turns = 0
 
-        with trace(f"Interview with {synth_name}"):
+        with trace(f"Interview with {synth_name}", trace_id=sdk_trace_id):
             while turns < max_turns:
                 with tracer.start_turn(turn_number=turns + 1):
                     # === PART 1: Interviewer asks a question ===
@@ -671,12 +736,19 @@ async def run_interview(
                             "speaker": "interviewee",
                             "turn_number": turns + 1,
                         }) as span:
+                        if interviewee_prefix is None:
+                            interviewee_prefix = format_interviewee_prefix(
+                                synth,
+                                initial_context=initial_context,
+                                materials=materials,
+                                persona=persona.text)
                         interviewee = create_interviewee(
                             synth=shared_memory.synth,
                             conversation_history=shared_memory.format_history(),
                             initial_context=initial_context,
                             model=model,
-                            materials=materials)
+                            materials=materials,
+                            instructions_prefix=interviewee_prefix)
 
                         # Log request
                         span.set_attribute(
@@ -737,15 +809,16 @@ async def run_interview(
                 turns += 1
 
     finally:
-        # Save trace
-        if trace_path and tracer._turns:
-            Path(trace_path).parent.mkdir(parents=True, exist_ok=True)
-            tracer.save_trace(trace_path)
+        # Stop routing (also shuts the processor down)
+        trace_router.unregister(sdk_trace_id)
+
+        # Save trace in the background writer (does not block the event loop)
+        if stream_trace:
+            tracer.close_stream()
+        elif trace_path and tracer._turns:
+            tracer.save_trace_async(trace_path)
             if verbose:
-                logger.info(f"Trace saved to: {trace_path}")
-
-        # Cleanup processor
-        processor.shutdown()
+                logger.info(f"Trace saving to: {trace_path}")
 
     return InterviewResult(
         messages=shared_memory.conversation,
@@ -4,6 +4,11 @@ Summarizer agent for batch interview analysis.
 This module provides the summarization agent that analyzes multiple interviews
 to identify patterns, divergences, tensions, and insights across personas.
 
+Large batches use a hierarchical (map-reduce) pipeline:
+1. Map: each interview is condensed into a digest (cached per interview content)
+2. Reduce: digests are merged in chunks concurrently into partial syntheses,
+   recursively, until they fit in the final summarizer call
+
 References:
 - OpenAI Agents SDK: https://openai.github.io/openai-agents-python/agents/
 - UX Research Synthesis Best Practices
@@ -21,10 +26,15 @@ print(summary)
 ```
 """
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from agents import Agent, ModelSettings, Runner
 from loguru import logger
+from openai.types.responses import ResponseTextDeltaEvent
 from openai.types.shared import Reasoning
 from openinference.semconv.trace import OpenInferenceSpanKindValues, SpanAttributes
 
@@ -36,6 +46,18 @@ from .runner import InterviewResult
 # Phoenix/OpenTelemetry tracer for observability
 _tracer = get_tracer("summarizer")
 
+# Batches larger than this use the map-reduce pipeline
+MAP_REDUCE_THRESHOLD = 12
+
+# Number of digests merged by each partial synthesis call
+REDUCE_CHUNK_SIZE = 8
+
+# Maximum concurrent LLM calls in map and reduce stages
+MAX_CONCURRENT_SUMMARY_CALLS = 8
+
+# Maximum number of interview digests kept in memory
+DIGEST_CACHE_MAX_ENTRIES = 2048
+
 # Summarizer system prompt based on user requirements
 SUMMARIZER_INSTRUCTIONS = """
 Você é um especialista em síntese de pesquisa UX qualitativa. Sua tarefa é analisar múltiplas entrevistas e gerar um relatório de síntese focado em insights acionáveis.
@@ -123,6 +145,86 @@ Isso permite que os leitores visualizem os materiais referenciados.
 """
 
 
+# Map stage: condense a single interview, keeping evidence for the final synthesis
+INTERVIEW_DIGEST_INSTRUCTIONS = """
+Você é um pesquisador UX que prepara notas de campo para uma síntese posterior.
+Condense a entrevista abaixo em notas objetivas (máximo ~250 palavras), preservando:
+
+- Perfil da pessoa (idade, ocupação, localização) em uma linha
+- Situações concretas relatadas (quando, onde, como)
+- Fricções, motivações e emoções expressas
+- Opiniões que divergem do esperado
+- 2 a 3 citações curtas e literais, com o contexto em que foram ditas
+- Referências a materiais no formato [descrição](mat_XXXXXX), se houver
+
+Não interprete nem generalize: registre apenas o que aparece na entrevista.
+
+{interview_content}
+"""
+
+# Reduce stage: merge a chunk of digests (or partial syntheses) into one
+PARTIAL_SYNTHESIS_INSTRUCTIONS = """
+Você é um especialista em síntese de pesquisa UX qualitativa.
+Abaixo estão notas condensadas de um subconjunto de entrevistas sobre "{topic_guide}".
+
+Produza uma síntese parcial em tópicos (máximo ~500 palavras) com:
+- Padrões recorrentes (indique quantas pessoas e quais perfis)
+- Divergências relevantes (com nome da pessoa e contexto)
+- Tensões entre perfis
+- Citações-chave literais, atribuídas à pessoa
+- Ausências notáveis
+
+Preserve nomes, citações e referências a materiais ([descrição](mat_XXXXXX)).
+Essa síntese será combinada com outras, então não escreva recomendações.
+
+{partials_content}
+"""
+
+
+class InterviewDigestCache:
+    """
+    In-memory LRU cache of per-interview digests (map stage outputs).
+
+    Keyed by a hash of the model and the formatted interview, so re-summarizing
+    a batch after adding interviews only digests the new ones.
+    """
+
+    def __init__(self, max_entries: int = DIGEST_CACHE_MAX_ENTRIES):
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._max_entries = max_entries
+
+    @staticmethod
+    def make_key(formatted_interview: str, model: str) -> str:
+        """Build the cache key for a formatted interview."""
+        payload = f"{model}\n{formatted_interview}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached digest, marking it as recently used."""
+        digest = self._entries.get(key)
+        if digest is not None:
+            self._entries.move_to_end(key)
+        return digest
+
+    def set(self, key: str, digest: str) -> None:
+        """Store a digest, evicting the least recently used entry if full."""
+        self._entries[key] = digest
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached digests."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Module-level cache shared by all summarization calls in this process
+_digest_cache = InterviewDigestCache()
+
+
 def _get_model_settings(model: str, reasoning_effort: str = "medium") -> ModelSettings | None:
     """
     Get model settings with reasoning effort configured.
@@ -234,19 +336,141 @@ def create_summarizer_agent(
     return Agent(**agent_kwargs)
 
 
+def _chunk(items: list[str], size: int) -> list[list[str]]:
+    """Split a list into consecutive chunks of at most `size` items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+async def run_text_agent(name: str, instructions: str, model: str, user_input: str) -> str:
+    """Run a single-shot agent and return its final text output."""
+    agent_kwargs = {
+        "name": name,
+        "instructions": instructions,
+        "model": model,
+    }
+    model_settings = _get_model_settings(model, reasoning_effort="low")
+    if model_settings is not None:
+        agent_kwargs["model_settings"] = model_settings
+
+    result = await Runner.run(Agent(**agent_kwargs), input=user_input)
+    return result.final_output
+
+
+async def digest_interviews(
+    formatted_interviews: list[str],
+    model: str = "gpt-4o-mini",
+    max_concurrent: int = MAX_CONCURRENT_SUMMARY_CALLS,
+    cache: InterviewDigestCache | None = None) -> list[str]:
+    """
+    Map stage: condense each formatted interview into a short digest.
+
+    Digests are cached per interview content; only uncached interviews hit the LLM.
+
+    Args:
+        formatted_interviews: Interviews formatted by format_interview_for_summary
+        model: LLM model to use
+        max_concurrent: Maximum concurrent LLM calls
+        cache: Digest cache (defaults to the module-level cache)
+
+    Returns:
+        List of digests, in the same order as the input
+    """
+    cache = cache if cache is not None else _digest_cache
+    keys = [InterviewDigestCache.make_key(text, model) for text in formatted_interviews]
+    digests: list[str | None] = [cache.get(key) for key in keys]
+
+    pending = [i for i, digest in enumerate(digests) if digest is None]
+    logger.info(
+        f"Digesting {len(pending)} interviews "
+        f"({len(formatted_interviews) - len(pending)} cached)"
+    )
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def digest_one(index: int) -> None:
+        async with semaphore:
+            digest = await run_text_agent(
+                name="Interview Digest",
+                instructions=INTERVIEW_DIGEST_INSTRUCTIONS.format(
+                    interview_content=formatted_interviews[index]),
+                model=model,
+                user_input="Gere as notas condensadas desta entrevista.")
+        cache.set(keys[index], digest)
+        digests[index] = digest
+
+    await asyncio.gather(*(digest_one(i) for i in pending))
+    return [d or "" for d in digests]
+
+
+async def reduce_digests(
+    digests: list[str],
+    topic_guide_name: str,
+    model: str = "gpt-4o-mini",
+    chunk_size: int = REDUCE_CHUNK_SIZE,
+    max_concurrent: int = MAX_CONCURRENT_SUMMARY_CALLS) -> list[str]:
+    """
+    Reduce stage: merge digests in chunks until at most `chunk_size` remain.
+
+    Each level merges chunks concurrently into partial syntheses.
+
+    Args:
+        digests: Interview digests (or partial syntheses from a previous level)
+        topic_guide_name: Name of the topic guide used
+        model: LLM model to use
+        chunk_size: Number of items merged per partial synthesis
+        max_concurrent: Maximum concurrent LLM calls
+
+    Returns:
+        At most `chunk_size` partial syntheses covering all digests
+    """
+    chunk_size = max(chunk_size, 2)
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def merge_chunk(chunk: list[str]) -> str:
+        async with semaphore:
+            return await run_text_agent(
+                name="Partial Synthesis",
+                instructions=PARTIAL_SYNTHESIS_INSTRUCTIONS.format(
+                    topic_guide=topic_guide_name,
+                    partials_content="\n\n---\n\n".join(chunk)),
+                model=model,
+                user_input="Gere a síntese parcial destas entrevistas.")
+
+    level = digests
+    depth = 0
+    while len(level) > chunk_size:
+        depth += 1
+        chunks = _chunk(level, chunk_size)
+        logger.info(f"Reduce level {depth}: merging {len(level)} items in {len(chunks)} chunks")
+        level = list(await asyncio.gather(*(merge_chunk(c) for c in chunks)))
+    return level
+
+
 async def summarize_interviews(
     interview_results: list[tuple[InterviewResult, dict[str, Any]]],
     topic_guide_name: str,
     model: str = "gpt-4o-mini",
-    materials: list | None = None) -> str:
+    materials: list | None = None,
+    map_reduce_threshold: int = MAP_REDUCE_THRESHOLD,
+    chunk_size: int = REDUCE_CHUNK_SIZE,
+    max_concurrent: int = MAX_CONCURRENT_SUMMARY_CALLS,
+    on_delta: Callable[[str], None] | None = None) -> str:
     """
     Summarize multiple interview results into a synthesis report.
 
+    Batches up to `map_reduce_threshold` interviews are sent to the summarizer
+    in a single call. Larger batches are digested per interview (map, cached)
+    and merged hierarchically (reduce) before the final summarizer call.
+
     Args:
         interview_results: List of tuples (InterviewResult, synth_data)
         topic_guide_name: Name of the topic guide used
         model: LLM model to use for summarization
         materials: Optional list of ExperimentMaterial objects to include in prompt
+        map_reduce_threshold: Batch size above which map-reduce is used
+        chunk_size: Number of digests merged per partial synthesis
+        max_concurrent: Maximum concurrent LLM calls in map and reduce stages
+        on_delta: Called with each text delta of the final report as it streams
 
     Returns:
         Synthesis report as markdown string
@@ -258,8 +482,11 @@ async def summarize_interviews(
     print(summary)
     ```
     """
+    use_map_reduce = len(interview_results) > map_reduce_threshold
     logger.info(
-        f"Summarizing {len(interview_results)} interviews with model={model}")
+        f"Summarizing {len(interview_results)} interviews with model={model} "
+        f"(map_reduce={use_map_reduce})"
+    )
 
     with _tracer.start_as_current_span(
         f"Summarize {len(interview_results)} interviews: {topic_guide_name}",
@@ -268,6 +495,7 @@ async def summarize_interviews(
             "topic_guide": topic_guide_name,
             "interview_count": len(interview_results),
             "model": model,
+            "map_reduce": use_map_reduce,
         }) as span:
         # Format all interviews
         interviews_content_parts = []
@@ -277,7 +505,23 @@ async def summarize_interviews(
             formatted = format_interview_for_summary(result, synth_data)
             interviews_content_parts.append(formatted)
 
-        interviews_content = "\n".join(interviews_content_parts)
+        if use_map_reduce:
+            digests = await digest_interviews(
+                interviews_content_parts,
+                model=model,
+                max_concurrent=max_concurrent)
+            partials = await reduce_digests(
+                digests,
+                topic_guide_name=topic_guide_name,
+                model=model,
+                chunk_size=chunk_size,
+                max_concurrent=max_concurrent)
+            interviews_content = (
+                f"(Notas condensadas de {len(interview_results)} entrevistas)\n\n"
+                + "\n\n---\n\n".join(partials)
+            )
+        else:
+            interviews_content = "\n".join(interviews_content_parts)
         logger.info(
             f"Formatted interviews content length: {len(interviews_content)} chars")
 
@@ -295,9 +539,17 @@ async def summarize_interviews(
 
         # Run summarization
         logger.info("Running summarizer agent...")
-        result = await Runner.run(
-            summarizer,
-            input="Analise as entrevistas fornecidas e gere o relatório de síntese conforme as diretrizes.")
+        instruction = (
+            "Analise as entrevistas fornecidas e gere o relatório de síntese "
+            "conforme as diretrizes.")
+        if on_delta is None:
+            result = await Runner.run(summarizer, input=instruction)
+        else:
+            result = Runner.run_streamed(summarizer, input=instruction)
+            async for event in result.stream_events():
+                if event.type == "raw_response_event" and isinstance(
+                        event.data, ResponseTextDeltaEvent):
+                    on_delta(event.data.delta)
 
         summary = result.final_output
         logger.info(f"Summary generated: {len(summary)} characters")
@@ -9,21 +9,31 @@ References:
 - OpenAI Agents SDK Tracing: https://openai.github.io/openai-agents-python/tracing/
 - Trace Visualizer: src/synth_lab/trace_visualizer/
 
+A single TraceRouter is registered with the SDK per process. Each interview
+registers its TraceVisualizerProcessor under its own SDK trace_id, and the
+router dispatches every span only to the processor of the trace it belongs to,
+so per-span work does not grow with the number of concurrent interviews.
+
 Sample usage:
 ```python
-from agents import add_trace_processor
-from .tracing_bridge import TraceVisualizerProcessor
+from agents import gen_trace_id, trace
+from .tracing_bridge import TraceVisualizerProcessor, get_trace_router
 
-# Create processor with our tracer
+# Route spans of this SDK trace to our processor
+sdk_trace_id = gen_trace_id()
 processor = TraceVisualizerProcessor(tracer)
-add_trace_processor(processor)
-
-# Now all agent runs will be captured in trace_visualizer format
+with get_trace_router().route(sdk_trace_id, processor):
+    with trace("Interview", trace_id=sdk_trace_id):
+        ...  # all agent runs are captured in trace_visualizer format
 ```
 """
 
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
 from typing import Any
 
+from agents import add_trace_processor
 from agents.tracing import Span, Trace, TracingProcessor
 from loguru import logger
 
@@ -253,6 +263,105 @@ class TraceVisualizerProcessor(TracingProcessor):
         pass  # No buffering in this implementation
 
 
+class TraceRouter(TracingProcessor):
+    """
+    Multiplexing tracing processor that routes SDK events by trace_id.
+
+    Registered once with the Agents SDK (see get_trace_router). Processors are
+    attached per SDK trace with route(); events of unrouted traces are ignored.
+    Lookup is a dict access, so each span costs O(1) regardless of how many
+    interviews are running concurrently.
+    """
+
+    def __init__(self):
+        self._routes: dict[str, TracingProcessor] = {}
+        self._lock = threading.Lock()
+
+    def register(self, trace_id: str, processor: TracingProcessor) -> None:
+        """Route events of an SDK trace to a processor."""
+        with self._lock:
+            self._routes[trace_id] = processor
+
+    def unregister(self, trace_id: str) -> None:
+        """Stop routing events of an SDK trace and shut its processor down."""
+        with self._lock:
+            processor = self._routes.pop(trace_id, None)
+        if processor is not None:
+            processor.shutdown()
+
+    @contextmanager
+    def route(self, trace_id: str, processor: TracingProcessor) -> Generator[None, None, None]:
+        """Context manager that registers a processor for the duration of a block."""
+        self.register(trace_id, processor)
+        try:
+            yield
+        finally:
+            self.unregister(trace_id)
+
+    @property
+    def route_count(self) -> int:
+        """Number of SDK traces currently routed."""
+        return len(self._routes)
+
+    def _get(self, trace_id: str | None) -> TracingProcessor | None:
+        if trace_id is None:
+            return None
+        return self._routes.get(trace_id)
+
+    def on_trace_start(self, trace: Trace) -> None:
+        processor = self._get(trace.trace_id)
+        if processor is not None:
+            processor.on_trace_start(trace)
+
+    def on_trace_end(self, trace: Trace) -> None:
+        processor = self._get(trace.trace_id)
+        if processor is not None:
+            processor.on_trace_end(trace)
+
+    def on_span_start(self, span: Span[Any]) -> None:
+        processor = self._get(getattr(span, "trace_id", None))
+        if processor is not None:
+            processor.on_span_start(span)
+
+    def on_span_end(self, span: Span[Any]) -> None:
+        processor = self._get(getattr(span, "trace_id", None))
+        if processor is not None:
+            processor.on_span_end(span)
+
+    def shutdown(self) -> None:
+        """Called when the application stops."""
+        with self._lock:
+            processors = list(self._routes.values())
+            self._routes.clear()
+        for processor in processors:
+            processor.shutdown()
+
+    def force_flush(self) -> None:
+        """Force processing of any queued items."""
+        for processor in list(self._routes.values()):
+            processor.force_flush()
+
+
+_router: TraceRouter | None = None
+_router_lock = threading.Lock()
+
+
+def get_trace_router() -> TraceRouter:
+    """
+    Get the process-wide TraceRouter, registering it with the SDK on first use.
+
+    Returns:
+        The singleton TraceRouter
+    """
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = TraceRouter()
+            add_trace_processor(_router)
+            logger.debug("[TraceRouter] Registered process-wide trace router")
+        return _router
+
+
 def extract_span_attributes(span: Span[Any]) -> dict[str, Any]:
     """
     Extract attributes from an OpenAI Agents SDK span for trace_visualizer.
@@ -33,6 +33,7 @@ from synth_lab.infrastructure.phoenix_tracing import get_tracer
 from synth_lab.repositories.experiment_material_repository import (
     ExperimentMaterialRepository,
 )
+from synth_lab.services.materials_context import presign_material_urls
 
 from .prompts import get_few_shot_examples, get_system_prompt
 
@@ -45,7 +46,9 @@ def generate_prfaq_from_content(
     batch_id: str,
     model: str = "gpt-4.1-mini",
     api_key: Optional[str] = None,
-    experiment_id: Optional[str] = None) -> str:
+    experiment_id: Optional[str] = None,
+    materials: Optional[list] = None,
+    materials_urls: Optional[dict] = None) -> str:
     """Generate PR-FAQ Markdown from research summary content using OpenAI API.
 
     Args:
@@ -54,6 +57,8 @@ def generate_prfaq_from_content(
         model: OpenAI model to use (default: gpt-4.1-mini)
         api_key: OpenAI API key (default: from OPENAI_API_KEY env var)
         experiment_id: Optional experiment ID to fetch and include materials
+        materials: Already loaded materials (skips fetching by experiment_id)
+        materials_urls: Presigned URLs for the given materials
 
     Returns:
         String containing Markdown-formatted PR-FAQ document
@@ -63,27 +68,16 @@ def generate_prfaq_from_content(
     """
     logger.info(f"Starting PR-FAQ Markdown generation for batch {batch_id}")
 
-    # Fetch materials if experiment_id is provided
-    materials = None
-    materials_urls = {}
-    if experiment_id:
+    # Fetch materials if experiment_id is provided and none were passed in
+    materials_urls = dict(materials_urls or {})
+    if materials is None and experiment_id:
         logger.debug(f"Fetching materials for experiment {experiment_id}")
         material_repo = ExperimentMaterialRepository()
         materials = material_repo.list_by_experiment(experiment_id)
         logger.info(f"Loaded {len(materials)} materials for experiment {experiment_id}")
 
         # Generate presigned URLs for materials (valid for 2 hours)
-        from synth_lab.infrastructure.storage_client import generate_view_url
-        for mat in materials:
-            if mat.file_url:
-                url_parts = mat.file_url.split("/")
-                object_key = "/".join(url_parts[4:])
-                try:
-                    materials_urls[mat.id] = generate_view_url(object_key, expires_in=7200)
-                    logger.debug(f"Generated presigned URL for {mat.id}")
-                except Exception as e:
-                    logger.warning(f"Failed to generate URL for {mat.id}: {e}")
-
+        materials_urls = presign_material_urls(materials, expires_in=7200)
         logger.info(f"Generated {len(materials_urls)} presigned URLs for materials")
 
     with _tracer.start_as_current_span(
@@ -10,12 +10,13 @@ References:
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone
 
 from openinference.semconv.trace import OpenInferenceSpanKindValues, SpanAttributes
 
 from synth_lab.domain.entities.experiment_document import ExperimentDocument
 from synth_lab.infrastructure.phoenix_tracing import get_tracer
+from synth_lab.models.events import ExecutionEvent
 from synth_lab.models.pagination import PaginatedResponse, PaginationParams
 from synth_lab.models.research import (
     ExecutionStatus,
@@ -32,7 +33,7 @@ from synth_lab.repositories.interview_guide_repository import (
     InterviewGuideRepository,
 )
 from synth_lab.repositories.research_repository import ResearchRepository
-from synth_lab.services.message_broker import BrokerMessage, MessageBroker
+from synth_lab.services.execution_events import ExecutionEventPublisher
 from synth_lab.services.research_agentic.runner import (
     ConversationMessage,
     InterviewGuideData,
@@ -136,6 +137,31 @@ class ResearchService:
         """
         return self.research_repo.get_transcript(exec_id, synth_id)
 
+    def get_transcript_details(self, exec_id: str) -> list[TranscriptDetail]:
+        """
+        Get all transcripts of an execution with messages (single query).
+
+        Args:
+            exec_id: Execution ID.
+
+        Returns:
+            List of TranscriptDetail, oldest first.
+        """
+        return self.research_repo.get_transcript_details(exec_id)
+
+    def get_events(self, exec_id: str, after_seq: int = 0) -> list[ExecutionEvent]:
+        """
+        Get logged execution events after a sequence number.
+
+        Args:
+            exec_id: Execution ID.
+            after_seq: Last sequence number already seen (0 for all).
+
+        Returns:
+            Events ordered by sequence number.
+        """
+        return self.research_repo.get_events(exec_id, after_seq=after_seq)
+
     async def generate_summary(
         self, exec_id: str, model: str = "gpt-4.1-mini"
     ) -> ExperimentDocument:
@@ -393,38 +419,38 @@ class ResearchService:
         from loguru import logger
 
         from synth_lab.services.research_agentic.batch_runner import run_batch_interviews
+        from synth_lab.services.research_agentic.incremental_summarizer import (
+            IncrementalSummarizer,
+        )
 
-        # Setup message broker for SSE streaming
-        broker = MessageBroker()
+        # Event log + broker for SSE streaming (replayable by sequence number);
+        # appends run in worker threads, so they get a session of their own
+        events = ExecutionEventPublisher(ResearchRepository())
 
         async def on_message(
             exec_id: str, synth_id: str, turn: int, msg: ConversationMessage
         ) -> None:
             """Publish interview message to SSE subscribers."""
-            await broker.publish(
+            await events.emit(
                 exec_id,
-                BrokerMessage(
-                    event_type="message",
-                    data={
-                        "synth_id": synth_id,
-                        "turn_number": turn,
-                        "speaker": msg.speaker,
-                        "text": msg.text,
-                        "sentiment": msg.sentiment,
-                    },
-                    timestamp=datetime.now(UTC)))
+                "message",
+                {
+                    "synth_id": synth_id,
+                    "turn_number": turn,
+                    "speaker": msg.speaker,
+                    "text": msg.text,
+                    "sentiment": msg.sentiment,
+                })
 
         async def on_transcription_complete(exec_id: str, successful: int, failed: int) -> None:
             """Publish transcription_completed event before summary generation."""
-            await broker.publish(
+            await events.emit(
                 exec_id,
-                BrokerMessage(
-                    event_type="transcription_completed",
-                    data={
-                        "successful_count": successful,
-                        "failed_count": failed,
-                    },
-                    timestamp=datetime.now(UTC)))
+                "transcription_completed",
+                {
+                    "successful_count": successful,
+                    "failed_count": failed,
+                })
 
         async def on_summary_start(exec_id: str) -> None:
             """Update execution status to generating_summary when summary starts."""
@@ -435,26 +461,22 @@ class ResearchService:
 
         async def on_avatar_generation_start(count: int) -> None:
             """Publish avatar_generation_started event."""
-            await broker.publish(
+            await events.emit(
                 exec_id,
-                BrokerMessage(
-                    event_type="avatar_generation_started",
-                    data={
-                        "count": count,
-                    },
-                    timestamp=datetime.now(UTC)))
+                "avatar_generation_started",
+                {
+                    "count": count,
+                })
             logger.debug(f"Published avatar_generation_started for {count} synths")
 
         async def on_avatar_generation_complete(count: int) -> None:
             """Publish avatar_generation_completed event."""
-            await broker.publish(
+            await events.emit(
                 exec_id,
-                BrokerMessage(
-                    event_type="avatar_generation_completed",
-                    data={
-                        "count": count,
-                    },
-                    timestamp=datetime.now(UTC)))
+                "avatar_generation_completed",
+                {
+                    "count": count,
+                })
             logger.debug(f"Published avatar_generation_completed for {count} synths")
 
         async def on_interview_complete(
@@ -479,17 +501,25 @@ class ResearchService:
             logger.debug(f"Saved transcript for {synth_id}")
 
             # Then publish the event to notify frontend
-            await broker.publish(
+            await events.emit(
                 exec_id,
-                BrokerMessage(
-                    event_type="interview_completed",
-                    data={
-                        "synth_id": synth_id,
-                        "total_turns": total_turns,
-                    },
-                    timestamp=datetime.now(UTC)))
+                "interview_completed",
+                {
+                    "synth_id": synth_id,
+                    "total_turns": total_turns,
+                })
             logger.debug(f"Published interview_completed for {synth_id}")
 
+        async def on_summary_partial(content: str, interview_count: int) -> None:
+            """Publish the running synthesis to SSE subscribers."""
+            await events.emit(
+                exec_id,
+                "summary_partial",
+                {
+                    "content": content,
+                    "interview_count": interview_count,
+                })
+
         try:
             # Fetch materials from experiment if experiment_id is provided
             materials = None
@@ -514,8 +544,15 @@ class ResearchService:
                 # First, call the original callback to notify SSE subscribers
                 await on_transcription_complete(exec_id, successful, failed)
 
+            # Summary is built online: each completed interview is folded into a
+            # running synthesis, so only the final call remains after the batch
+            incremental_summarizer = IncrementalSummarizer(
+                topic_guide_name=summary_title or guide_name,
+                model="gpt-4.1-mini",
+                on_partial=on_summary_partial)
+
             # Run the batch interviews (without summary generation first)
-            # We'll generate summary separately after saving transcripts
+            # We'll finalize the summary separately after saving transcripts
             result = await run_batch_interviews(
                 interview_guide=interview_guide_data,
                 max_interviews=synth_count,
@@ -536,7 +573,8 @@ class ResearchService:
                 additional_context=additional_context,
                 guide_name=guide_name,
                 analysis_id=analysis_id,
-                materials=materials)
+                materials=materials,
+                incremental_summarizer=incremental_summarizer)
 
             # Transcripts are now saved immediately in on_interview_complete callback
             # This ensures they're available as soon as the user clicks on a completed card
@@ -552,16 +590,12 @@ class ResearchService:
 
                 from synth_lab.domain.entities.experiment_document import DocumentType
                 from synth_lab.services.document_service import DocumentService
-                from synth_lab.services.research_agentic.summarizer import summarize_interviews
 
                 logger.info(
-                    f"Generating summary for {len(result.successful_interviews)} interviews"
+                    f"Finalizing summary for {len(result.successful_interviews)} interviews"
                 )
                 try:
-                    summary_content = await summarize_interviews(
-                        interview_results=result.successful_interviews,
-                        topic_guide_name=summary_title or guide_name,
-                        model="gpt-4.1-mini")
+                    summary_content = await incremental_summarizer.finalize()
                     logger.info(f"Summary generated: {len(summary_content)} chars")
 
                     # Get execution to find experiment_id
@@ -603,7 +637,7 @@ class ResearchService:
             logger.info(f"Research execution {exec_id} completed successfully")
 
             # Signal end of execution to SSE subscribers
-            await broker.close_execution(exec_id)
+            await events.close(exec_id)
 
         except Exception as e:
             logger.error(f"Research execution {exec_id} failed: {e}")
@@ -612,7 +646,7 @@ class ResearchService:
                 status=ExecutionStatus.FAILED,
                 failed_count=synth_count)
             # Signal end of execution to SSE subscribers even on failure
-            await broker.close_execution(exec_id)
+            await events.close(exec_id)
 
 
 if __name__ == "__main__":
@@ -339,6 +339,9 @@ class ResearchSummaryGeneratorService:
         """
         Async version of generate_for_execution.
 
+        Runs as a single-document ResearchDocumentBuilder build (transcripts
+        loaded in one query, only the interviewed synths loaded).
+
         Args:
             exec_id: ID of the execution.
             model: LLM model to use.
@@ -346,169 +349,18 @@ class ResearchSummaryGeneratorService:
         Returns:
             ExperimentDocument with generated summary.
         """
+        from synth_lab.services.document_builder import ResearchDocumentBuilder
 
-        research_repo = self._get_research_repo()
-        document_repo = self._get_document_repo()
-        experiment_repo = self._get_experiment_repo()
-
-        # 1. Get execution
-        execution = research_repo.get_execution(exec_id)
-
-        # 2. Validate status
-        if execution.status.value not in self.COMPLETED_STATUSES:
-            raise ExecutionNotCompletedError(exec_id, execution.status.value)
-
-        # 3. Validate experiment link
-        if not execution.experiment_id:
-            raise NotLinkedToExperimentError(exec_id)
-
-        # 4. Get transcripts
-        transcripts = research_repo.get_transcripts(exec_id)
-        if not transcripts.data:
-            raise NoTranscriptsError(exec_id)
-
-        transcript_count = len(transcripts.data)
-
-        with _tracer.start_as_current_span(
-            f"Generate Research Summary: {execution.topic_name}",
-            attributes={
-                SpanAttributes.OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.CHAIN.value,
-                "exec_id": exec_id,
-                "experiment_id": execution.experiment_id,
-                "topic_name": execution.topic_name,
-                "transcript_count": transcript_count,
-                "model": model,
-            },
-        ) as span:
-            # 5. Check for existing generation in progress
-            existing = document_repo.get_by_experiment(
-                execution.experiment_id,
-                DocumentType.RESEARCH_SUMMARY,
-                source_id=exec_id,
-            )
-            if existing and existing.status == DocumentStatus.GENERATING:
-                raise SummaryGenerationInProgressError(exec_id)
-
-            # 6. Create pending document
-            pending_doc = document_repo.create_pending(
-                experiment_id=execution.experiment_id,
-                document_type=DocumentType.RESEARCH_SUMMARY,
-                source_id=exec_id,
-                model=model,
-            )
-
-            if pending_doc is None:
-                raise SummaryGenerationInProgressError(exec_id)
-
-            metadata = {
-                "source": "research",
-                "exec_id": exec_id,
-                "transcript_count": transcript_count,
-                "topic_name": execution.topic_name,
-            }
-
-            try:
-                # 7. Load synths for enrichment
-                all_synths = load_synths()
-                synths_by_id = {s["id"]: s for s in all_synths}
-
-                # 8. Convert transcripts to InterviewResult format
-                interview_results: list[tuple[InterviewResult, dict]] = []
-                for transcript_summary in transcripts.data:
-                    transcript = research_repo.get_transcript(
-                        exec_id, transcript_summary.synth_id
-                    )
-
-                    messages = [
-                        ConversationMessage(
-                            speaker=msg.speaker,
-                            text=msg.text,
-                            internal_notes=msg.internal_notes,
-                        )
-                        for msg in transcript.messages
-                    ]
-
-                    interview_result = InterviewResult(
-                        messages=messages,
-                        synth_id=transcript.synth_id,
-                        synth_name=transcript.synth_name or transcript.synth_id,
-                        topic_guide_name=execution.topic_name,
-                        trace_path=None,
-                        total_turns=transcript.turn_count,
-                    )
-
-                    synth_data = synths_by_id.get(
-                        transcript.synth_id,
-                        {"id": transcript.synth_id, "nome": transcript.synth_name},
-                    )
-
-                    interview_results.append((interview_result, synth_data))
-
-                # 9. Get experiment name for summary title
-                summary_title = execution.topic_name
-                experiment = experiment_repo.get_by_id(execution.experiment_id)
-                if experiment:
-                    summary_title = experiment.name
-
-                # 10. Generate summary via LLM (async)
-                self._logger.info(
-                    f"Generating summary for {exec_id} with "
-                    f"{transcript_count} transcripts"
-                )
-
-                content = await summarize_interviews(
-                    interview_results=interview_results,
-                    topic_guide_name=summary_title,
-                    model=model,
-                )
-
-                if span:
-                    span.set_attribute("summary_length", len(content))
-
-                # 11. Generate summary image and append to content
-                import asyncio
-
-                image_service = self._get_image_service()
-                content = asyncio.run(
-                    image_service.generate_and_append_image(
-                        markdown_content=content,
-                        experiment_id=execution.experiment_id,
-                        doc_id=pending_doc.id,
-                    )
-                )
-
-                # 12. Update document with content
-                document_repo.update_status(
-                    experiment_id=execution.experiment_id,
-                    document_type=DocumentType.RESEARCH_SUMMARY,
-                    status=DocumentStatus.COMPLETED,
-                    source_id=exec_id,
-                    markdown_content=content,
-                    metadata=metadata,
-                )
-
-                self._logger.info(
-                    f"Generated summary for execution {exec_id} "
-                    f"({transcript_count} transcripts, {len(content)} chars)"
-                )
-
-                return document_repo.get_by_experiment(
-                    execution.experiment_id,
-                    DocumentType.RESEARCH_SUMMARY,
-                    source_id=exec_id,
-                )
-
-            except Exception as e:
-                self._logger.error(f"Failed to generate summary for {exec_id}: {e}")
-                document_repo.update_status(
-                    experiment_id=execution.experiment_id,
-                    document_type=DocumentType.RESEARCH_SUMMARY,
-                    status=DocumentStatus.FAILED,
-                    source_id=exec_id,
-                    error_message=str(e),
-                    metadata=metadata,
-                )
-                raise
+        builder = ResearchDocumentBuilder(
+            research_repo=self._get_research_repo(),
+            document_repo=self._get_document_repo(),
+            experiment_repo=self._get_experiment_repo(),
+            image_service=self._get_image_service(),
+        )
+        result = await builder.build(
+            exec_id, model=model, documents=(DocumentType.RESEARCH_SUMMARY,)
+        )
+        return result.raise_for(DocumentType.RESEARCH_SUMMARY)
 
     def get_summary(self, exec_id: str) -> ExperimentDocument | None:
         """
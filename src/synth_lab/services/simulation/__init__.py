@@ -10,9 +10,11 @@ Main components:
 - engine: Monte Carlo simulation engine
 - chart_data_service: UX Research analysis chart data generation
 - feature_extraction: Feature extraction utilities for ML algorithms
+- correlation: Vectorized attribute x metric correlation matrices
 - clustering_service: K-Means and Hierarchical clustering
 - outlier_service: Extreme cases and outlier detection
 - explainability_service: SHAP and PDP analysis
+- outcome_model: Closed-form expected outcomes (exact SHAP/PDP backend)
 """
 
 from synth_lab.services.simulation.chart_data_service import ChartDataService
@@ -20,10 +22,12 @@ from synth_lab.services.simulation.clustering_service import ClusteringService
 from synth_lab.services.simulation.explainability_service import ExplainabilityService
 from synth_lab.services.simulation.feature_extraction import (
     DEFAULT_FEATURES,
+    extract_columns,
     extract_features,
     get_attribute_value,
     get_available_attributes,
     get_outcome_value)
+from synth_lab.services.simulation.outcome_model import OutcomeModel
 from synth_lab.services.simulation.outlier_service import OutlierService
 
 __all__ = [
@@ -32,8 +36,10 @@ __all__ = [
     "ClusteringService",
     "OutlierService",
     "ExplainabilityService",
+    "OutcomeModel",
     # Feature extraction
     "DEFAULT_FEATURES",
+    "extract_columns",
     "extract_features",
     "get_attribute_value",
     "get_available_attributes",
@@ -11,6 +11,9 @@ References:
     - Spec: specs/016-feature-impact-simulation/spec.md
     - Research: specs/016-feature-impact-simulation/research.md (Decision Tree section)
 
+Rules for all leaves come from one traversal of the fitted tree and leaf
+membership from tree.apply; results are cached per analysis and parameters.
+
 Sample usage:
     from synth_lab.services.simulation.analyzer import RegionAnalyzer
 
@@ -26,13 +29,85 @@ Expected output:
     "capability_mean < 0.48 AND trust_mean < 0.4"
 """
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 from loguru import logger
 from sklearn.tree import DecisionTreeClassifier
 
-from synth_lab.domain.entities import RegionAnalysis, RegionRule
+from synth_lab.domain.entities import RegionAnalysis, RegionRule, SynthOutcome
+from synth_lab.services.simulation.feature_extraction import extract_columns
+
+# Latent traits used to describe regions
+REGION_FEATURES = [
+    "capability_mean",
+    "trust_mean",
+    "friction_tolerance_mean",
+    "exploration_prob",
+]
+
+# Max cached region analyses (one per analysis/parameter set)
+REGION_CACHE_MAX_ENTRIES = 64
+
+
+@dataclass
+class RegionAnalysisResult:
+    """Regions found for one analysis, with the synths that fall in each."""
+
+    regions: list[RegionAnalysis]
+    # Synth IDs per region (same order as regions), closest to the region centroid first
+    members: list[list[str]]
+
+
+class RegionCache:
+    """
+    Thread-safe LRU cache of region analyses.
+
+    Keyed by analysis ID and analyzer parameters. Outcomes of a completed
+    analysis do not change (re-running creates a new analysis ID).
+    """
+
+    def __init__(self, max_entries: int = REGION_CACHE_MAX_ENTRIES):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of analyses kept (least recently used evicted).
+        """
+        self._entries: OrderedDict[tuple, RegionAnalysisResult] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> RegionAnalysisResult | None:
+        """Get cached result (or None)."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def set(self, key: tuple, result: RegionAnalysisResult) -> None:
+        """Store result, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared across RegionAnalyzer instances (routers create one per request)
+_region_cache = RegionCache()
 
 
 class RegionAnalyzer:
@@ -63,7 +138,7 @@ class RegionAnalyzer:
 
     def analyze_regions(
         self,
-        outcomes: list[dict[str, Any]],
+        outcomes: list[dict[str, Any]] | list[SynthOutcome],
         simulation_id: str,
         min_failure_rate: float = 0.5) -> list[RegionAnalysis]:
         """
@@ -73,31 +148,66 @@ class RegionAnalyzer:
         that lead to high failure rates.
 
         Args:
-            outcomes: List of synth outcomes with attributes and rates
+            outcomes: List of synth outcomes (dicts or SynthOutcome) with attributes and rates
             simulation_id: ID of the simulation being analyzed
             min_failure_rate: Minimum failure rate to consider a region problematic
 
         Returns:
             List of RegionAnalysis with interpretable rules
 
+        Raises:
+            ValueError: If outcomes list is empty or malformed
+        """
+        return self.analyze(outcomes, simulation_id, min_failure_rate).regions
+
+    def analyze(
+        self,
+        outcomes: list[dict[str, Any]] | list[SynthOutcome],
+        simulation_id: str,
+        min_failure_rate: float = 0.5) -> RegionAnalysisResult:
+        """
+        Analyze high-failure regions, keeping the synths in each region.
+
+        Results are cached per (simulation_id, parameters).
+
+        Args:
+            outcomes: List of synth outcomes (dicts or SynthOutcome)
+            simulation_id: ID of the simulation being analyzed
+            min_failure_rate: Minimum failure rate to consider a region problematic
+
+        Returns:
+            RegionAnalysisResult with regions sorted by failure rate (descending)
+
         Raises:
             ValueError: If outcomes list is empty or malformed
         """
         if not outcomes:
             raise ValueError("Outcomes list cannot be empty")
 
+        cache_key = (
+            simulation_id,
+            len(outcomes),
+            min_failure_rate,
+            self.max_depth,
+            self.min_samples_leaf,
+            self.min_samples_split,
+        )
+        cached = _region_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         self.logger.info(f"Analyzing {len(outcomes)} outcomes for simulation {simulation_id}")
 
         # Extract features and labels
-        X, feature_names = self._extract_features(outcomes)
-        y = self._extract_labels(outcomes, min_failure_rate)
+        X, rates, synth_ids = self._extract_columns(outcomes)
+        y = self._threshold_labels(rates["failed_rate"], min_failure_rate)
 
         if len(X) < self.min_samples_split:
             self.logger.warning(
                 f"Not enough samples ({len(X)}) for analysis. "
                 f"Need at least {self.min_samples_split}"
             )
-            return []
+            return RegionAnalysisResult(regions=[], members=[])
 
         # Train decision tree classifier
         clf = DecisionTreeClassifier(
@@ -111,18 +221,53 @@ class RegionAnalyzer:
         clf.fit(X, y)
 
         # Extract rules for high-failure regions using REAL outcome data
-        regions = self._extract_rules(
+        result = self._extract_rules(
             tree=clf,
-            feature_names=feature_names,
+            feature_names=list(REGION_FEATURES),
             X=X,
-            outcomes=outcomes,
+            rates=rates,
+            synth_ids=synth_ids,
             simulation_id=simulation_id,
             min_failure_rate=min_failure_rate)
 
-        self.logger.info(f"Found {len(regions)} high-failure regions")
-        return regions
+        self.logger.info(f"Found {len(result.regions)} high-failure regions")
+        _region_cache.set(cache_key, result)
+        return result
+
+    def _extract_columns(
+        self, outcomes: list[dict[str, Any]] | list[SynthOutcome]
+    ) -> tuple[np.ndarray, dict[str, np.ndarray], list[str]]:
+        """
+        Extract feature matrix, outcome rates and synth IDs in one pass.
+
+        Args:
+            outcomes: List of synth outcomes (dicts or SynthOutcome)
+
+        Returns:
+            Tuple of (feature_matrix, rates by name, synth_ids)
+        """
+        rate_names = ["failed_rate", "success_rate", "did_not_try_rate"]
 
-    def _extract_features(self, outcomes: list[dict[str, Any]]) -> tuple[np.ndarray, list[str]]:
+        if isinstance(outcomes[0], SynthOutcome):
+            columns = extract_columns(outcomes, REGION_FEATURES + rate_names)
+            synth_ids = [o.synth_id for o in outcomes]
+        else:
+            columns = np.empty((len(outcomes), len(REGION_FEATURES) + len(rate_names)))
+            synth_ids = []
+            for i, outcome in enumerate(outcomes):
+                latent = outcome.get("synth_attributes", {}).get("latent_traits", {})
+                columns[i] = [latent.get(f, 0.5) for f in REGION_FEATURES] + [
+                    outcome.get(r, 0.0) for r in rate_names
+                ]
+                synth_ids.append(outcome.get("synth_id", str(i)))
+
+        n_features = len(REGION_FEATURES)
+        rates = {name: columns[:, n_features + i] for i, name in enumerate(rate_names)}
+        return columns[:, :n_features], rates, synth_ids
+
+    def _extract_features(
+        self, outcomes: list[dict[str, Any]] | list[SynthOutcome]
+    ) -> tuple[np.ndarray, list[str]]:
         """
         Extract feature matrix from outcomes.
 
@@ -135,240 +280,199 @@ class RegionAnalyzer:
         Returns:
             Tuple of (feature_matrix, feature_names)
         """
-        features = []
-        feature_names = [
-            "capability_mean",
-            "trust_mean",
-            "friction_tolerance_mean",
-            "exploration_prob",
-        ]
-
-        for outcome in outcomes:
-            attrs = outcome.get("synth_attributes", {})
-            latent = attrs.get("latent_traits", {})
-
-            # Extract latent traits in consistent order
-            row = [
-                latent.get("capability_mean", 0.5),
-                latent.get("trust_mean", 0.5),
-                latent.get("friction_tolerance_mean", 0.5),
-                latent.get("exploration_prob", 0.5),
-            ]
-            features.append(row)
-
-        return np.array(features), feature_names
+        X, _, _ = self._extract_columns(outcomes)
+        return X, list(REGION_FEATURES)
 
     def _extract_labels(
-        self, outcomes: list[dict[str, Any]], min_failure_rate: float
+        self, outcomes: list[dict[str, Any]] | list[SynthOutcome], min_failure_rate: float
     ) -> np.ndarray:
         """
         Extract binary labels (failed vs not-failed).
 
+        Args:
+            outcomes: List of synth outcomes
+            min_failure_rate: Minimum failure rate to identify as problematic
+
+        Returns:
+            Binary label array (1 = high failure, 0 = low failure)
+        """
+        _, rates, _ = self._extract_columns(outcomes)
+        return self._threshold_labels(rates["failed_rate"], min_failure_rate)
+
+    def _threshold_labels(self, failure_rates: np.ndarray, min_failure_rate: float) -> np.ndarray:
+        """
+        Label synths as high failure (1) or not (0).
+
         Uses adaptive threshold based on data distribution to ensure
         both classes are represented for decision tree learning.
 
         Args:
-            outcomes: List of synth outcomes
+            failure_rates: Failure rate per synth
             min_failure_rate: Minimum failure rate to identify as problematic
 
         Returns:
             Binary label array (1 = high failure, 0 = low failure)
         """
-        failure_rates = [o.get("failed_rate", 0.0) for o in outcomes]
-
         # Use adaptive threshold to ensure we have both classes
         # Take the maximum of:
         # 1. The provided min_failure_rate
         # 2. The 60th percentile of actual failure rates (ensures ~40% high-failure samples)
-        threshold = max(min_failure_rate, np.percentile(failure_rates, 60))
+        percentile_60 = np.percentile(failure_rates, 60)
+        threshold = max(min_failure_rate, percentile_60)
 
         # If even the 60th percentile is below min_failure_rate,
         # use median to ensure we have contrast
-        if threshold >= max(failure_rates):
+        if threshold >= np.max(failure_rates):
             threshold = np.median(failure_rates)
 
         self.logger.debug(
             f"Using adaptive threshold {threshold:.3f} for labels "
             f"(min_failure_rate={min_failure_rate:.3f}, "
             f"median={np.median(failure_rates):.3f}, "
-            f"60th percentile={np.percentile(failure_rates, 60):.3f})"
+            f"60th percentile={percentile_60:.3f})"
         )
 
-        labels = []
-        for outcome in outcomes:
-            failed_rate = outcome.get("failed_rate", 0.0)
-            # Binary classification: high failure (1) vs low failure (0)
-            label = 1 if failed_rate >= threshold else 0
-            labels.append(label)
-
-        return np.array(labels)
+        # Binary classification: high failure (1) vs low failure (0)
+        return (failure_rates >= threshold).astype(int)
 
     def _extract_rules(
         self,
         tree: DecisionTreeClassifier,
         feature_names: list[str],
         X: np.ndarray,
-        outcomes: list[dict[str, Any]],
+        rates: dict[str, np.ndarray],
+        synth_ids: list[str],
         simulation_id: str,
-        min_failure_rate: float) -> list[RegionAnalysis]:
+        min_failure_rate: float) -> RegionAnalysisResult:
         """
         Extract interpretable rules from decision tree.
 
-        Uses leaf node assignments to calculate REAL failure rates from
-        the original outcomes data.
+        Leaf membership comes from tree.apply and the leaf rules from a single
+        traversal of the tree; rates are the REAL rates of the synths in each leaf.
 
         Args:
             tree: Trained DecisionTreeClassifier
             feature_names: Names of features
             X: Feature matrix
-            outcomes: Original outcomes list (for calculating real rates)
+            rates: Outcome rates by name (failed_rate, success_rate, did_not_try_rate)
+            synth_ids: Synth IDs in the same order as X rows
             simulation_id: Simulation ID
             min_failure_rate: Minimum failure rate threshold
 
         Returns:
-            List of RegionAnalysis objects
+            RegionAnalysisResult with regions sorted by failure rate (descending)
         """
-        regions = []
-
-        # Get leaf assignment for each sample
+        # Leaf assignment for each sample and per-leaf aggregates
         leaf_ids = tree.apply(X)
-
-        # Get tree structure for rule extraction
-        tree_structure = tree.tree_
-
-        # Group samples by leaf
-        from collections import defaultdict
-
-        leaf_to_indices: dict[int, list[int]] = defaultdict(list)
-        for idx, leaf_id in enumerate(leaf_ids):
-            leaf_to_indices[leaf_id].append(idx)
+        n_nodes = tree.tree_.node_count
+        counts = np.bincount(leaf_ids, minlength=n_nodes)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = {
+                name: np.bincount(leaf_ids, weights=values, minlength=n_nodes) / counts
+                for name, values in rates.items()
+            }
 
         # Calculate baseline failure rate
-        baseline_failure = np.mean([o.get("failed_rate", 0.0) for o in outcomes])
-
-        # Extract path for each leaf
-        def get_path_to_leaf(node: int, target_leaf: int, path: list) -> list | None:
-            """Get the decision path from root to a specific leaf."""
-            if node == target_leaf:
-                return path
-
-            if tree_structure.feature[node] == -2:  # Leaf but not target
-                return None
-
-            feature_idx = tree_structure.feature[node]
-            threshold_val = tree_structure.threshold[node]
-            feature_name = feature_names[feature_idx]
-
-            # Try left child (<=)
-            left = tree_structure.children_left[node]
-            result = get_path_to_leaf(
-                left,
-                target_leaf,
-                path
-                + [
-                    RegionRule(
-                        attribute=feature_name,
-                        operator="<=",
-                        threshold=round(threshold_val, 3))
-                ])
-            if result is not None:
-                return result
-
-            # Try right child (>)
-            right = tree_structure.children_right[node]
-            return get_path_to_leaf(
-                right,
-                target_leaf,
-                path
-                + [
-                    RegionRule(
-                        attribute=feature_name,
-                        operator=">",
-                        threshold=round(threshold_val, 3))
-                ])
-
-        # Process each leaf
-        for leaf_id, sample_indices in leaf_to_indices.items():
-            if len(sample_indices) < self.min_samples_leaf:
+        baseline_failure = float(np.mean(rates["failed_rate"]))
+
+        found: list[tuple[RegionAnalysis, list[str]]] = []
+        for leaf_id, rules in self._leaf_rules(tree, feature_names).items():
+            n_samples = int(counts[leaf_id])
+            if n_samples < self.min_samples_leaf:
                 continue  # Skip small leaves
 
-            # Calculate REAL rates from outcomes
-            leaf_outcomes = [outcomes[i] for i in sample_indices]
-            avg_failed = np.mean([o.get("failed_rate", 0.0) for o in leaf_outcomes])
-            avg_success = np.mean([o.get("success_rate", 0.0) for o in leaf_outcomes])
-            avg_did_not_try = np.mean([o.get("did_not_try_rate", 0.0) for o in leaf_outcomes])
+            avg_failed = float(means["failed_rate"][leaf_id])
 
             # Only include high-failure regions
             if avg_failed < min_failure_rate:
                 continue
 
-            # Get rules for this leaf
-            rules = get_path_to_leaf(0, leaf_id, [])
-            if rules is None:
-                continue
-
-            # Simplify redundant rules
-            simplified_rules = self._simplify_rules(rules)
-
-            n_samples = len(sample_indices)
             synth_percentage = round((n_samples / len(X)) * 100, 1)
             failure_delta = round(avg_failed - baseline_failure, 3)
 
             region = RegionAnalysis(
                 simulation_id=simulation_id,
-                rules=simplified_rules,
-                rule_text=self.format_rule_text(simplified_rules),
+                rules=rules,
+                rule_text=self.format_rule_text(rules),
                 synth_count=n_samples,
                 synth_percentage=synth_percentage,
-                did_not_try_rate=round(avg_did_not_try, 3),
+                did_not_try_rate=round(float(means["did_not_try_rate"][leaf_id]), 3),
                 failed_rate=round(avg_failed, 3),
-                success_rate=round(avg_success, 3),
+                success_rate=round(float(means["success_rate"][leaf_id]), 3),
                 failure_delta=failure_delta)
-            regions.append(region)
+
+            # Members ordered by distance to the region centroid (most typical first)
+            indices = np.flatnonzero(leaf_ids == leaf_id)
+            points = X[indices]
+            distances = ((points - points.mean(axis=0)) ** 2).sum(axis=1)
+            members = [synth_ids[i] for i in indices[np.argsort(distances, kind="stable")]]
+            found.append((region, members))
 
         # Sort by failure rate descending
-        regions.sort(key=lambda r: r.failed_rate, reverse=True)
+        found.sort(key=lambda item: item[0].failed_rate, reverse=True)
 
-        return regions
+        return RegionAnalysisResult(
+            regions=[region for region, _ in found],
+            members=[members for _, members in found])
 
-    def _simplify_rules(self, rules: list[RegionRule]) -> list[RegionRule]:
+    def _leaf_rules(
+        self, tree: DecisionTreeClassifier, feature_names: list[str]
+    ) -> dict[int, list[RegionRule]]:
         """
-        Simplify redundant rules.
+        Collect the rules of every leaf in a single traversal.
 
-        For example: "x <= 0.5 AND x <= 0.3" becomes "x <= 0.3"
-        And: "x > 0.3 AND x > 0.5" becomes "x > 0.5"
+        Each path keeps only the tightest bound per attribute and direction
+        (e.g. "x <= 0.5 AND x <= 0.3" is "x <= 0.3"). Rules are ordered by the
+        attribute's first split on the path, "<=" before ">".
 
         Args:
-            rules: List of RegionRule objects
+            tree: Trained DecisionTreeClassifier
+            feature_names: Names of features
 
         Returns:
-            Simplified list of rules
+            Rules by leaf node ID
         """
-        from collections import defaultdict
+        structure = tree.tree_
+        n_features = len(feature_names)
+        leaf_rules: dict[int, list[RegionRule]] = {}
+
+        # (node, lower bounds (>), upper bounds (<=), attributes in first-split order)
+        stack = [(0, np.full(n_features, -np.inf), np.full(n_features, np.inf), ())]
+        while stack:
+            node, lower, upper, order = stack.pop()
+            left = structure.children_left[node]
+            if left == -1:  # Leaf
+                rules = []
+                for feature_idx in order:
+                    if np.isfinite(upper[feature_idx]):
+                        rules.append(
+                            RegionRule(
+                                attribute=feature_names[feature_idx],
+                                operator="<=",
+                                threshold=round(float(upper[feature_idx]), 3)))
+                    if np.isfinite(lower[feature_idx]):
+                        rules.append(
+                            RegionRule(
+                                attribute=feature_names[feature_idx],
+                                operator=">",
+                                threshold=round(float(lower[feature_idx]), 3)))
+                leaf_rules[node] = rules
+                continue
 
-        # Group by attribute
-        by_attribute: dict[str, list[RegionRule]] = defaultdict(list)
-        for rule in rules:
-            by_attribute[rule.attribute].append(rule)
-
-        simplified = []
-        for attribute, attr_rules in by_attribute.items():
-            # Separate by operator
-            le_rules = [r for r in attr_rules if r.operator == "<="]
-            gt_rules = [r for r in attr_rules if r.operator == ">"]
-
-            # Keep only the tightest bound for each direction
-            if le_rules:
-                # Keep smallest threshold for <=
-                min_rule = min(le_rules, key=lambda r: r.threshold)
-                simplified.append(min_rule)
-
-            if gt_rules:
-                # Keep largest threshold for >
-                max_rule = max(gt_rules, key=lambda r: r.threshold)
-                simplified.append(max_rule)
-
-        return simplified
+            feature_idx = int(structure.feature[node])
+            threshold = float(structure.threshold[node])
+            if feature_idx not in order:
+                order = (*order, feature_idx)
+
+            left_upper = upper.copy()
+            left_upper[feature_idx] = min(upper[feature_idx], threshold)
+            right_lower = lower.copy()
+            right_lower[feature_idx] = max(lower[feature_idx], threshold)
+
+            stack.append((structure.children_right[node], right_lower, upper, order))
+            stack.append((left, lower, left_upper, order))
+
+        return leaf_rules
 
     def format_rule_text(self, rules: list[RegionRule]) -> str:
         """
@@ -40,7 +40,12 @@ from synth_lab.domain.entities import (
     TryVsSuccessPoint)
 from synth_lab.domain.entities.experiment import (
     ScorecardData)
-from synth_lab.services.simulation.feature_extraction import get_attribute_value
+from synth_lab.services.simulation.correlation import CorrelationMethod, correlation_matrix
+from synth_lab.services.simulation.feature_extraction import extract_columns, get_attribute_value
+from synth_lab.services.simulation.outcome_aggregates import (
+    QUADRANTS,
+    OutcomeAggregates,
+    as_aggregates)
 
 
 class ChartDataService:
@@ -57,9 +62,11 @@ class ChartDataService:
     def get_try_vs_success(
         self,
         simulation_id: str,
-        outcomes: list[SynthOutcome],
+        outcomes: list[SynthOutcome] | OutcomeAggregates,
         x_threshold: float = 0.5,
-        y_threshold: float = 0.5) -> TryVsSuccessChart:
+        y_threshold: float = 0.5,
+        limit: int | None = None,
+        offset: int = 0) -> TryVsSuccessChart:
         """
         Generate Try vs Success scatter plot data.
 
@@ -73,65 +80,60 @@ class ChartDataService:
         - discovery_issue: low attempt, high success (X < threshold, Y >= threshold)
         - low_value: low attempt, low success (X < threshold, Y < threshold)
 
+        Quadrant counts always cover all synths; limit/offset only page the points.
+
         Args:
             simulation_id: ID of the simulation.
-            outcomes: List of SynthOutcome entities.
+            outcomes: List of SynthOutcome entities (or their aggregates).
             x_threshold: X-axis threshold for quadrant division.
             y_threshold: Y-axis threshold for quadrant division.
+            limit: Maximum number of points to return (None = all).
+            offset: Number of points to skip.
 
         Returns:
             TryVsSuccessChart with points and quadrant counts.
         """
+        agg = as_aggregates(outcomes)
         logger.info(
-            f"Generating Try vs Success chart for {simulation_id} with {len(outcomes)} synths"
+            f"Generating Try vs Success chart for {simulation_id} with {len(agg)} synths"
         )
 
-        points: list[TryVsSuccessPoint] = []
+        codes = agg.quadrants(x_threshold, y_threshold)
+        counts = np.bincount(codes, minlength=len(QUADRANTS))
         quadrant_counts = {
-            "low_value": 0,
-            "usability_issue": 0,
-            "discovery_issue": 0,
-            "ok": 0,
+            quadrant: int(counts[QUADRANTS.index(quadrant)])
+            for quadrant in ("low_value", "usability_issue", "discovery_issue", "ok")
         }
 
-        for outcome in outcomes:
-            attempt_rate = 1.0 - outcome.did_not_try_rate
-            success_rate = outcome.success_rate
-
-            # Determine quadrant
-            if attempt_rate >= x_threshold:
-                if success_rate >= y_threshold:
-                    quadrant = "ok"
-                else:
-                    quadrant = "usability_issue"
-            else:
-                if success_rate >= y_threshold:
-                    quadrant = "discovery_issue"
-                else:
-                    quadrant = "low_value"
-
-            point = TryVsSuccessPoint(
-                synth_id=outcome.synth_id,
+        stop = None if limit is None else offset + limit
+        page = slice(offset, stop)
+        attempt_rates = (1.0 - agg.did_not_try_rate[page]).tolist()
+        success_rates = agg.success_rate[page].tolist()
+        points = [
+            TryVsSuccessPoint(
+                synth_id=synth_id,
                 attempt_rate=attempt_rate,
                 success_rate=success_rate,
-                quadrant=quadrant)
-            points.append(point)
-            quadrant_counts[quadrant] += 1
+                quadrant=QUADRANTS[code])
+            for synth_id, attempt_rate, success_rate, code in zip(
+                agg.synth_ids[page], attempt_rates, success_rates, codes[page].tolist())
+        ]
 
         return TryVsSuccessChart(
             simulation_id=simulation_id,
             points=points,
             quadrant_counts=quadrant_counts,
             quadrant_thresholds={"x": x_threshold, "y": y_threshold},
-            total_synths=len(outcomes))
+            total_synths=len(agg))
 
     def get_outcome_distribution(
         self,
         simulation_id: str,
-        outcomes: list[SynthOutcome],
+        outcomes: list[SynthOutcome] | OutcomeAggregates,
         sort_by: Literal["success_rate", "failed_rate", "did_not_try_rate"] = "success_rate",
         order: Literal["asc", "desc"] = "desc",
-        limit: int = 50) -> OutcomeDistributionChart:
+        limit: int = 50,
+        offset: int = 0) -> OutcomeDistributionChart:
         """
         Generate outcome distribution chart data.
 
@@ -139,58 +141,49 @@ class ChartDataService:
 
         Args:
             simulation_id: ID of the simulation.
-            outcomes: List of SynthOutcome entities.
+            outcomes: List of SynthOutcome entities (or their aggregates).
             sort_by: Field to sort by.
             order: Sort order (asc or desc).
             limit: Maximum number of synths to return.
+            offset: Number of sorted synths to skip.
 
         Returns:
             OutcomeDistributionChart with sorted distributions.
         """
         logger.info(
             f"Generating distribution chart for {simulation_id}, "
-            f"sort_by={sort_by}, order={order}, limit={limit}"
+            f"sort_by={sort_by}, order={order}, limit={limit}, offset={offset}"
         )
-
-        # Build distributions
-        distributions: list[SynthDistribution] = []
-        success_rates: list[float] = []
-        failed_rates: list[float] = []
-        did_not_try_rates: list[float] = []
-
-        for outcome in outcomes:
-            sort_key = getattr(outcome, sort_by)
-            dist = SynthDistribution(
-                synth_id=outcome.synth_id,
-                did_not_try_rate=outcome.did_not_try_rate,
-                failed_rate=outcome.failed_rate,
-                success_rate=outcome.success_rate,
+        agg = as_aggregates(outcomes)
+
+        # Sort (stable, like list.sort) and page before building models
+        selected = agg.order(sort_by, descending=order == "desc")[offset:offset + limit]
+        sort_keys = agg.rate(sort_by)[selected].tolist()
+        distributions = [
+            SynthDistribution(
+                synth_id=agg.synth_ids[i],
+                did_not_try_rate=did_not_try_rate,
+                failed_rate=failed_rate,
+                success_rate=success_rate,
                 sort_key=sort_key)
-            distributions.append(dist)
-            success_rates.append(outcome.success_rate)
-            failed_rates.append(outcome.failed_rate)
-            did_not_try_rates.append(outcome.did_not_try_rate)
-
-        # Sort
-        reverse = order == "desc"
-        distributions.sort(key=lambda d: d.sort_key, reverse=reverse)
-
-        # Limit
-        distributions = distributions[:limit]
+            for i, did_not_try_rate, failed_rate, success_rate, sort_key in zip(
+                selected.tolist(),
+                agg.did_not_try_rate[selected].tolist(),
+                agg.failed_rate[selected].tolist(),
+                agg.success_rate[selected].tolist(),
+                sort_keys)
+        ]
 
-        # Calculate summary
         summary = {
-            "avg_success": float(np.mean(success_rates)) if success_rates else 0.0,
-            "avg_failed": float(np.mean(failed_rates)) if failed_rates else 0.0,
-            "avg_did_not_try": float(np.mean(did_not_try_rates)) if did_not_try_rates else 0.0,
-            "median_success": float(np.median(success_rates)) if success_rates else 0.0,
-            "std_success": float(np.std(success_rates)) if success_rates else 0.0,
+            key: agg.summary[key]
+            for key in (
+                "avg_success", "avg_failed", "avg_did_not_try", "median_success", "std_success")
         }
 
         # Get worst/best performers (from full list, not limited)
-        all_sorted = sorted(outcomes, key=lambda o: o.success_rate)
-        worst_performers = [o.synth_id for o in all_sorted[:10]]
-        best_performers = [o.synth_id for o in all_sorted[-10:][::-1]]
+        by_success = agg.order("success_rate")
+        worst_performers = [agg.synth_ids[i] for i in by_success[:10].tolist()]
+        best_performers = [agg.synth_ids[i] for i in by_success[-10:][::-1].tolist()]
 
         return OutcomeDistributionChart(
             simulation_id=simulation_id,
@@ -198,7 +191,7 @@ class ChartDataService:
             summary=summary,
             worst_performers=worst_performers,
             best_performers=best_performers,
-            total_synths=len(outcomes))
+            total_synths=len(agg))
 
     # =========================================================================
     # Phase 2: Localização de Problemas (User Story 2)
@@ -551,90 +544,86 @@ class ChartDataService:
         "domain_expertise": "Expertise no Domínio",
     }
 
+    # Attributes analyzed by default (same order as X_AXIS_OPTIONS in frontend)
+    CORRELATION_ATTRIBUTES: list[str] = [
+        "capability_mean",
+        "trust_mean",
+        "friction_tolerance_mean",
+        "exploration_prob",
+        "digital_literacy",
+        "similar_tool_experience",
+        "motor_ability",
+        "time_availability",
+        "domain_expertise",
+    ]
+
     def get_attribute_correlations(
         self,
         simulation_id: str,
-        outcomes: list[SynthOutcome]) -> AttributeCorrelationChart:
+        outcomes: list[SynthOutcome],
+        attributes: list[str] | None = None,
+        method: CorrelationMethod = "pearson",
+        synth_ids: list[str] | None = None) -> AttributeCorrelationChart:
         """
         Calculate correlation of each synth attribute with attempt_rate and success_rate.
 
-        Returns correlations sorted by absolute correlation with success_rate (descending).
+        The whole attribute x metric matrix is computed in one vectorized pass,
+        so custom attribute sets and subgroups are cheap to compute on demand.
 
         Args:
             simulation_id: ID of the simulation.
             outcomes: List of SynthOutcome entities.
+            attributes: Attributes to analyze (default: CORRELATION_ATTRIBUTES).
+            method: "pearson" or "spearman" (rank) correlation.
+            synth_ids: Restrict to this subgroup of synths (default: all).
 
         Returns:
-            AttributeCorrelationChart with correlations for each attribute.
+            AttributeCorrelationChart with correlations for each attribute,
+            in the order requested.
+
+        Raises:
+            ValueError: If an attribute or method is unknown.
         """
         logger.info(f"Calculating attribute correlations for {simulation_id}")
 
+        if synth_ids is not None:
+            selected = set(synth_ids)
+            outcomes = [o for o in outcomes if o.synth_id in selected]
+
+        all_attributes = attributes or self.CORRELATION_ATTRIBUTES
+
         if not outcomes or len(outcomes) < 3:
             return AttributeCorrelationChart(
                 simulation_id=simulation_id,
                 correlations=[],
-                total_synths=len(outcomes))
-
-        # Calculate attempt_rate and success_rate for each synth
-        attempt_rates = np.array([1.0 - o.did_not_try_rate for o in outcomes])
-        success_rates = np.array([o.success_rate for o in outcomes])
-
-        # All attributes to analyze
-        all_attributes = [
-            "capability_mean",
-            "trust_mean",
-            "friction_tolerance_mean",
-            "exploration_prob",
-            "digital_literacy",
-            "similar_tool_experience",
-            "motor_ability",
-            "time_availability",
-            "domain_expertise",
+                total_synths=len(outcomes),
+                method=method)
+
+        columns = extract_columns(outcomes, [*all_attributes, "attempt_rate", "success_rate"])
+        n_attrs = len(all_attributes)
+        r, p = correlation_matrix(columns[:, :n_attrs], columns[:, n_attrs:], method=method)
+
+        correlations = [
+            AttributeCorrelation(
+                attribute=attr,
+                attribute_label=self.ATTRIBUTE_LABELS.get(attr, attr),
+                correlation_attempt=float(r[i, 0]),
+                correlation_success=float(r[i, 1]),
+                p_value_attempt=float(p[i, 0]),
+                p_value_success=float(p[i, 1]),
+                is_significant_attempt=bool(p[i, 0] < 0.05),
+                is_significant_success=bool(p[i, 1] < 0.05))
+            for i, attr in enumerate(all_attributes)
         ]
 
-        correlations: list[AttributeCorrelation] = []
-
-        for attr in all_attributes:
-            # Extract attribute values
-            attr_values = np.array([get_attribute_value(o, attr) for o in outcomes])
-
-            # Calculate correlation with attempt_rate
-            try:
-                corr_attempt, p_attempt = stats.pearsonr(attr_values, attempt_rates)
-                # Handle NaN (occurs when variance is zero)
-                if np.isnan(corr_attempt) or np.isnan(p_attempt):
-                    corr_attempt, p_attempt = 0.0, 1.0
-            except Exception:
-                corr_attempt, p_attempt = 0.0, 1.0
-
-            # Calculate correlation with success_rate
-            try:
-                corr_success, p_success = stats.pearsonr(attr_values, success_rates)
-                # Handle NaN (occurs when variance is zero)
-                if np.isnan(corr_success) or np.isnan(p_success):
-                    corr_success, p_success = 0.0, 1.0
-            except Exception:
-                corr_success, p_success = 0.0, 1.0
-
-            correlations.append(
-                AttributeCorrelation(
-                    attribute=attr,
-                    attribute_label=self.ATTRIBUTE_LABELS.get(attr, attr),
-                    correlation_attempt=float(corr_attempt),
-                    correlation_success=float(corr_success),
-                    p_value_attempt=float(p_attempt),
-                    p_value_success=float(p_success),
-                    is_significant_attempt=p_attempt < 0.05,
-                    is_significant_success=p_success < 0.05)
-            )
-
         # Keep fixed order (same as X_AXIS_OPTIONS in frontend)
         # No sorting - order matches dropdown for consistency
 
         return AttributeCorrelationChart(
             simulation_id=simulation_id,
             correlations=correlations,
-            total_synths=len(outcomes))
+            total_synths=len(outcomes),
+            method=method)
 
     # =========================================================================
     # Sankey Flow Chart (Outcome Flow Visualization)
@@ -802,7 +791,7 @@ class ChartDataService:
     def get_sankey_flow(
         self,
         analysis_id: str,
-        outcomes: list[SynthOutcome],
+        outcomes: list[SynthOutcome] | OutcomeAggregates,
         scorecard: FeatureScorecard | ScorecardData) -> SankeyFlowChart:
         """
         Generate Sankey flow chart data for outcome flow visualization.
@@ -814,15 +803,16 @@ class ChartDataService:
 
         Args:
             analysis_id: Analysis run ID.
-            outcomes: List of SynthOutcome entities.
+            outcomes: List of SynthOutcome entities (or their aggregates).
             scorecard: Feature scorecard for gap calculation.
 
         Returns:
             SankeyFlowChart with nodes and links.
         """
-        logger.info(f"Generating Sankey flow chart for {analysis_id} with {len(outcomes)} synths")
+        agg = as_aggregates(outcomes)
+        logger.info(f"Generating Sankey flow chart for {analysis_id} with {len(agg)} synths")
 
-        if not outcomes:
+        if len(agg) == 0:
             return SankeyFlowChart(
                 analysis_id=analysis_id,
                 nodes=[],
@@ -830,17 +820,13 @@ class ChartDataService:
                 total_synths=0,
                 outcome_counts=OutcomeCounts(did_not_try=0, failed=0, success=0))
 
-        total_synths = len(outcomes)
-
-        # Step 1: Calculate average rates across all synths (matching distribution chart)
-        avg_did_not_try = sum(o.did_not_try_rate for o in outcomes) / total_synths
-        avg_failed = sum(o.failed_rate for o in outcomes) / total_synths
-        avg_success = sum(o.success_rate for o in outcomes) / total_synths
+        total_synths = len(agg)
 
-        # Convert rates to counts (rounded to maintain whole numbers)
-        did_not_try_count = round(avg_did_not_try * total_synths)
-        failed_count = round(avg_failed * total_synths)
-        success_count = round(avg_success * total_synths)
+        # Step 1: Average rates across all synths (matching distribution chart),
+        # converted to counts: avg_rate * total_synths == sum of rates
+        did_not_try_count = round(agg.summary["sum_did_not_try"])
+        failed_count = round(agg.summary["sum_failed"])
+        success_count = round(agg.summary["sum_success"])
 
         # Adjust for rounding to ensure total matches
         total_counted = did_not_try_count + failed_count + success_count
@@ -860,26 +846,8 @@ class ChartDataService:
             success=success_count)
 
         # Step 2: Diagnose root causes using rate-weighted distribution
-        # For each synth, weight the root cause by their did_not_try_rate or failed_rate
-        root_cause_weights: dict[str, float] = {
-            # did_not_try causes (from P(attempt) formula)
-            "effort_barrier": 0.0,
-            "risk_barrier": 0.0,
-            # failed causes (from P(success|attempt) formula)
-            "capability_barrier": 0.0,
-            "patience_barrier": 0.0,
-        }
-
-        for o in outcomes:
-            # Weight by did_not_try_rate for did_not_try causes
-            if o.did_not_try_rate > 0:
-                cause = self.diagnose_did_not_try(o, scorecard)
-                root_cause_weights[cause] += o.did_not_try_rate
-
-            # Weight by failed_rate for failed causes
-            if o.failed_rate > 0:
-                cause = self.diagnose_failed(o, scorecard)
-                root_cause_weights[cause] += o.failed_rate
+        # (same rules as diagnose_did_not_try / diagnose_failed, vectorized)
+        root_cause_weights = agg.root_cause_weights(scorecard)
 
         # Convert weighted sums to counts proportional to outcome counts
         # did_not_try causes (only 2: effort and risk)
@@ -924,7 +892,6 @@ class ChartDataService:
 
         # Step 3: Build nodes
         nodes: list[SankeyNode] = []
-        total_synths = len(outcomes)
 
         # Level 1: Population
         nodes.append(
@@ -23,8 +23,11 @@ Sample usage:
 
 Expected output:
     Dict mapping cluster_id to descriptive name (2-4 words in Portuguese)
+
+Concurrent requests for identical cluster profiles share one in-flight LLM call.
 """
 
+import hashlib
 import json
 
 from loguru import logger
@@ -34,6 +37,7 @@ from synth_lab.domain.entities.cluster_result import ClusterProfile
 from synth_lab.infrastructure.config import REASONING_MODEL
 from synth_lab.infrastructure.llm_client import LLMClient, get_llm_client
 from synth_lab.infrastructure.phoenix_tracing import get_tracer
+from synth_lab.infrastructure.single_flight import get_single_flight
 
 # Phoenix/OpenTelemetry tracer for observability
 _tracer = get_tracer("cluster-labeling-service")
@@ -82,6 +86,17 @@ class ClusterLabelingService:
         if not profiles:
             return {}
 
+        # Identical profiles give identical prompts: share the in-flight call
+        prompt = self._build_prompt(profiles)
+        prompt_digest = hashlib.sha256(prompt.encode()).hexdigest()
+        return get_single_flight().do(
+            ("cluster_labels", prompt_digest),
+            lambda: self._generate_labels(profiles, prompt))
+
+    def _generate_labels(
+        self, profiles: list[ClusterProfile], prompt: str
+    ) -> dict[int, dict[str, str]]:
+        """Generate labels with one LLM call (no coalescing)."""
         span_name = f"ClusterLabeling | {len(profiles)} clusters"
         with _tracer.start_as_current_span(
             span_name,
@@ -93,8 +108,6 @@ class ClusterLabelingService:
             }):
             self.logger.info(f"Generating labels for {len(profiles)} clusters")
 
-            prompt = self._build_prompt(profiles)
-
             try:
                 response_str = self.llm.complete_json(
                     messages=[{"role": "user", "content": prompt}],
@@ -3,16 +3,37 @@ Clustering service for UX Research analysis.
 
 Provides K-Means and Hierarchical clustering for persona segmentation.
 
+Auto-K (elbow) search scales to large populations:
+    - Fits for each k run in parallel threads
+    - Above SCALABLE_ELBOW_THRESHOLD synths, fits use MiniBatchKMeans warm-started
+      from a shared k-means++ seeding (the first k seeds initialize k)
+    - Silhouette is estimated on a fixed-size sample
+    - Elbow curves are cached per (analysis, feature set, data fingerprint)
+
+Hierarchical clustering scales the same way:
+    - Above SCALABLE_HIERARCHY_THRESHOLD synths, synths are pre-clustered into
+      MICRO_CLUSTERS micro-clusters (MiniBatchKMeans) and the linkage is built
+      on their centroids (dendrogram leaves are micro-clusters)
+    - The full linkage stays on the result, so cut_dendrogram never recomputes it
+    - truncate_dendrogram limits the payload to the top levels of the tree
+
 References:
     - scikit-learn K-Means: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.KMeans.html
+    - MiniBatchKMeans: https://scikit-learn.org/stable/modules/generated/sklearn.cluster.MiniBatchKMeans.html
     - scipy hierarchical: https://docs.scipy.org/doc/scipy/reference/cluster.hierarchy.html
     - Spec: specs/017-analysis-ux-research/spec.md
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
 import numpy as np
 from loguru import logger
 from scipy.cluster import hierarchy
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans, kmeans_plusplus
 from sklearn.decomposition import PCA
 from sklearn.metrics import silhouette_score
 from sklearn.preprocessing import StandardScaler
@@ -34,6 +55,92 @@ from synth_lab.services.simulation.cluster_labeling_service import (
     ClusterLabelingService)
 from synth_lab.services.simulation.feature_extraction import get_attribute_value
 
+# Above this many synths, elbow fits use warm-started MiniBatchKMeans
+SCALABLE_ELBOW_THRESHOLD = 2000
+
+# Silhouette is estimated on this many points (exact below it)
+SILHOUETTE_SAMPLE_SIZE = 2000
+
+# MiniBatchKMeans batch size for large populations
+MINIBATCH_SIZE = 1024
+
+# Parallel workers for per-k elbow fits
+ELBOW_MAX_WORKERS = 4
+
+# Max cached elbow curves (one per analysis/feature set)
+ELBOW_CACHE_MAX_ENTRIES = 128
+
+# Above this many synths, hierarchical clustering links micro-cluster centroids
+SCALABLE_HIERARCHY_THRESHOLD = 2000
+
+# Number of micro-clusters (dendrogram leaves) for large populations
+MICRO_CLUSTERS = 300
+
+
+@dataclass
+class LinkageTree:
+    """Full linkage of a hierarchical result, kept server-side for cuts."""
+
+    linkage_matrix: np.ndarray
+    synth_ids: list[str]
+    leaf_of_synth: np.ndarray  # Leaf index per synth (identity when leaves are synths)
+
+
+class ElbowCache:
+    """
+    Thread-safe LRU cache of elbow curves.
+
+    Keys combine the analysis ID, the feature set, max_k and a fingerprint of
+    the scaled feature matrix, so a re-run analysis never reuses a stale curve.
+    """
+
+    def __init__(self, max_entries: int = ELBOW_CACHE_MAX_ENTRIES):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of curves kept (least recently used evicted).
+        """
+        self._entries: OrderedDict[tuple, list[ElbowDataPoint]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        analysis_id: str, features: list[str], max_k: int, X_scaled: np.ndarray
+    ) -> tuple:
+        """Build cache key for an elbow curve."""
+        fingerprint = hashlib.sha1(np.ascontiguousarray(X_scaled).tobytes()).hexdigest()
+        return (analysis_id, tuple(features), max_k, X_scaled.shape[0], fingerprint)
+
+    def get(self, key: tuple) -> list[ElbowDataPoint] | None:
+        """Get cached curve (or None)."""
+        with self._lock:
+            curve = self._entries.get(key)
+            if curve is not None:
+                self._entries.move_to_end(key)
+            return curve
+
+    def set(self, key: tuple, curve: list[ElbowDataPoint]) -> None:
+        """Store curve, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = curve
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached curves."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared across ClusteringService instances (routers create one per request)
+_elbow_cache = ElbowCache()
+
 
 class ClusteringService:
     """
@@ -99,7 +206,11 @@ class ClusteringService:
         X_scaled = scaler.fit_transform(X)
 
         # Calculate elbow data and detect recommended K
-        elbow_data = self._calculate_elbow(X_scaled, max_k=min(10, len(outcomes) - 1))
+        elbow_data = self._calculate_elbow(
+            X_scaled,
+            max_k=min(10, len(outcomes) - 1),
+            cache_key=ElbowCache.make_key(
+                simulation_id, features, min(10, len(outcomes) - 1), X_scaled))
         recommended_k = self._detect_knee_point(elbow_data)
 
         # Use automatic K detection if n_clusters not provided
@@ -135,7 +246,7 @@ class ClusteringService:
             )
             silhouette = 0.0
         else:
-            silhouette = silhouette_score(X_scaled, labels)
+            silhouette = self._silhouette(X_scaled, labels)
 
         # Build cluster profiles
         clusters = self._build_cluster_profiles(
@@ -190,22 +301,78 @@ class ClusteringService:
         scaler = StandardScaler()
         X_scaled = scaler.fit_transform(X)
 
+        n_micro_clusters = None
+        if len(X_scaled) > SCALABLE_HIERARCHY_THRESHOLD:
+            # Link micro-cluster centroids instead of O(N^2) linkage on all synths
+            leaf_points, leaf_counts, leaf_of_synth = self._micro_cluster(X_scaled)
+            leaf_synth_ids: list[str | None] = [None] * len(leaf_points)
+            n_micro_clusters = len(leaf_points)
+            logger.info(f"Linking {n_micro_clusters} micro-clusters of {len(X_scaled)} synths")
+        else:
+            leaf_points = X_scaled
+            leaf_counts = np.ones(len(X_scaled), dtype=int)
+            leaf_of_synth = np.arange(len(X_scaled))
+            leaf_synth_ids = list(synth_ids)
+
         # Perform hierarchical clustering
-        linkage_matrix = hierarchy.linkage(X_scaled, method=linkage_method)
+        linkage_matrix = hierarchy.linkage(leaf_points, method=linkage_method)
 
         # Build dendrogram nodes
-        nodes = self._build_dendrogram_nodes(linkage_matrix, synth_ids)
+        nodes = self._build_dendrogram_nodes(linkage_matrix, leaf_synth_ids, leaf_counts)
 
         # Suggest good cut points
-        suggested_cuts = self._suggest_cuts(X_scaled=X_scaled, linkage_matrix=linkage_matrix)
+        suggested_cuts = self._suggest_cuts(
+            X_scaled=X_scaled, linkage_matrix=linkage_matrix, leaf_of_synth=leaf_of_synth)
 
-        return HierarchicalResult(
+        result = HierarchicalResult(
             simulation_id=simulation_id,
             linkage_method=linkage_method,
             features_used=features,
             nodes=nodes,
             linkage_matrix=linkage_matrix.tolist(),
-            suggested_cuts=suggested_cuts)
+            suggested_cuts=suggested_cuts,
+            n_micro_clusters=n_micro_clusters)
+        result._linkage_tree = LinkageTree(
+            linkage_matrix=linkage_matrix, synth_ids=synth_ids, leaf_of_synth=leaf_of_synth)
+        return result
+
+    def truncate_dendrogram(
+        self,
+        hierarchical_result: HierarchicalResult,
+        max_depth: int) -> HierarchicalResult:
+        """
+        Limit a dendrogram to its top levels for display.
+
+        Subtrees below max_depth are collapsed into leaf nodes that keep their
+        synth count. The full linkage stays on the result for cuts.
+
+        Args:
+            hierarchical_result: Full hierarchical result.
+            max_depth: Number of levels to keep below the root.
+
+        Returns:
+            HierarchicalResult with truncated nodes and no linkage matrix.
+        """
+        if not hierarchical_result.nodes:
+            return hierarchical_result
+
+        node_by_id = {node.id: node for node in hierarchical_result.nodes}
+        kept: list[DendrogramNode] = []
+        stack = [(max(node_by_id), 0)]
+        while stack:
+            node_id, depth = stack.pop()
+            node = node_by_id[node_id]
+            if node.left_child is None or depth < max_depth:
+                kept.append(node)
+                if node.left_child is not None:
+                    stack.append((node.left_child, depth + 1))
+                    stack.append((node.right_child, depth + 1))
+            else:
+                kept.append(node.model_copy(update={"left_child": None, "right_child": None}))
+
+        kept.sort(key=lambda node: node.id)
+        return hierarchical_result.model_copy(
+            update={"nodes": kept, "linkage_matrix": [], "truncated_depth": max_depth})
 
     # =========================================================================
     # Convenience Wrapper Methods (for router compatibility)
@@ -282,9 +449,13 @@ class ClusteringService:
         scaler = StandardScaler()
         X_scaled = scaler.fit_transform(X)
 
-        # Calculate elbow data
+        # Calculate elbow data (cached per analysis and feature set)
         actual_max_k = min(max_k, len(outcomes) - 1)
-        return self._calculate_elbow(X_scaled, max_k=actual_max_k)
+        analysis_id = outcomes[0].analysis_id or "unknown"
+        return self._calculate_elbow(
+            X_scaled,
+            max_k=actual_max_k,
+            cache_key=ElbowCache.make_key(analysis_id, features, actual_max_k, X_scaled))
 
     def radar_comparison(
         self,
@@ -305,41 +476,66 @@ class ClusteringService:
     def cut_dendrogram(
         self,
         hierarchical_result: HierarchicalResult,
-        n_clusters: int) -> HierarchicalResult:
+        n_clusters: int,
+        outcomes: list[SynthOutcome] | None = None) -> HierarchicalResult:
         """
         Cut dendrogram at specified number of clusters.
 
         Args:
             hierarchical_result: Original hierarchical result.
             n_clusters: Number of clusters to cut into.
+            outcomes: Synth outcomes, needed only when the result has no
+                server-side linkage and its leaves are not synths (see
+                needs_outcomes_to_cut).
 
         Returns:
             Updated HierarchicalResult with cluster assignments.
         """
-        linkage_matrix = np.array(hierarchical_result.linkage_matrix)
-
-        # Cut the dendrogram
-        labels = hierarchy.fcluster(linkage_matrix, n_clusters, criterion="maxclust")
+        tree = hierarchical_result._linkage_tree
+        if tree is None and not self.needs_outcomes_to_cut(hierarchical_result):
+            # Result rebuilt from JSON: leaves are synths, in node order
+            synth_ids = [node.synth_id for node in hierarchical_result.nodes if node.synth_id]
+            tree = LinkageTree(
+                linkage_matrix=np.array(hierarchical_result.linkage_matrix),
+                synth_ids=synth_ids,
+                leaf_of_synth=np.arange(len(synth_ids)))
+        elif tree is None:
+            # Micro-cluster leaves (or a truncated tree) carry no synth membership:
+            # relink the outcomes with the same features and method
+            if not outcomes:
+                raise ValueError(
+                    "Cutting a micro-clustered or truncated dendrogram requires its outcomes")
+            tree = self.cluster_hierarchical(
+                simulation_id=hierarchical_result.simulation_id,
+                outcomes=outcomes,
+                features=hierarchical_result.features_used,
+                linkage_method=hierarchical_result.linkage_method)._linkage_tree
+
+        # Cut the dendrogram (over leaves), then map leaves to synths
+        leaf_labels = hierarchy.fcluster(tree.linkage_matrix, n_clusters, criterion="maxclust")
 
         # Convert labels to 0-indexed
-        labels = labels - 1
+        labels = leaf_labels[tree.leaf_of_synth] - 1
 
-        # Build synth to cluster mapping
-        # Extract synth_ids from leaf nodes
-        synth_ids = [node.synth_id for node in hierarchical_result.nodes if node.synth_id]
+        cluster_assignments = {
+            synth_id: int(label) for synth_id, label in zip(tree.synth_ids, labels)
+        }
 
-        cluster_assignments = {synth_id: int(label) for synth_id, label in zip(synth_ids, labels)}
+        # Return updated result (keeps the server-side linkage)
+        return hierarchical_result.model_copy(
+            update={"cluster_assignments": cluster_assignments, "n_clusters": n_clusters})
 
-        # Return updated result
-        return HierarchicalResult(
-            simulation_id=hierarchical_result.simulation_id,
-            linkage_method=hierarchical_result.linkage_method,
-            features_used=hierarchical_result.features_used,
-            nodes=hierarchical_result.nodes,
-            linkage_matrix=hierarchical_result.linkage_matrix,
-            suggested_cuts=hierarchical_result.suggested_cuts,
-            cluster_assignments=cluster_assignments,
-            n_clusters=n_clusters)
+    @staticmethod
+    def needs_outcomes_to_cut(hierarchical_result: HierarchicalResult) -> bool:
+        """
+        Whether cut_dendrogram needs the outcomes to cut this result.
+
+        True for results without the server-side linkage (rebuilt from JSON)
+        whose leaves are micro-clusters or whose linkage was truncated away.
+        """
+        return hierarchical_result._linkage_tree is None and (
+            hierarchical_result.n_micro_clusters is not None
+            or not hierarchical_result.linkage_matrix)
 
     def get_radar_chart(
         self,
@@ -507,37 +703,115 @@ class ClusteringService:
 
         return np.array(X), synth_ids
 
-    def _calculate_elbow(self, X_scaled: np.ndarray, max_k: int = 10) -> list[ElbowDataPoint]:
+    def _calculate_elbow(
+        self,
+        X_scaled: np.ndarray,
+        max_k: int = 10,
+        cache_key: tuple | None = None) -> list[ElbowDataPoint]:
         """
         Calculate elbow method data for k from 2 to max_k.
 
+        Fits for each k run in parallel. Large populations use MiniBatchKMeans
+        warm-started from a shared k-means++ seeding and a sampled silhouette.
+
         Args:
             X_scaled: Normalized feature matrix.
             max_k: Maximum k to test.
+            cache_key: Optional ElbowCache key; cached curves are returned as-is.
 
         Returns:
             List of ElbowDataPoint entities.
         """
-        elbow_data = []
-
-        for k in range(2, max_k + 1):
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            labels = kmeans.fit_predict(X_scaled)
-
-            inertia = kmeans.inertia_
+        if cache_key is not None:
+            cached = _elbow_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Elbow cache hit for {cache_key[0]}")
+                return list(cached)
+
+        k_values = list(range(2, max_k + 1))
+        if not k_values:
+            return []
+
+        # Shared seeding: the first k k-means++ seeds are a valid seeding for k
+        seeds = None
+        if len(X_scaled) > SCALABLE_ELBOW_THRESHOLD:
+            seeds, _ = kmeans_plusplus(X_scaled, n_clusters=max_k, random_state=42)
+
+        def fit(k: int) -> ElbowDataPoint:
+            if seeds is not None:
+                model = MiniBatchKMeans(
+                    n_clusters=k,
+                    init=seeds[:k],
+                    n_init=1,
+                    batch_size=MINIBATCH_SIZE,
+                    random_state=42)
+                labels = model.fit_predict(X_scaled)
+            else:
+                model = KMeans(n_clusters=k, random_state=42, n_init=10)
+                labels = model.fit_predict(X_scaled)
 
             # silhouette_score requires at least 2 distinct clusters
-            n_unique_labels = len(np.unique(labels))
-            if n_unique_labels < 2:
+            if len(np.unique(labels)) < 2:
                 silhouette = 0.0
             else:
-                silhouette = silhouette_score(X_scaled, labels)
+                silhouette = self._silhouette(X_scaled, labels)
+
+            return ElbowDataPoint(k=k, inertia=float(model.inertia_), silhouette=float(silhouette))
+
+        with ThreadPoolExecutor(max_workers=min(ELBOW_MAX_WORKERS, len(k_values))) as pool:
+            elbow_data = list(pool.map(fit, k_values))
+
+        if cache_key is not None:
+            _elbow_cache.set(cache_key, elbow_data)
+
+        return list(elbow_data)
 
-            elbow_data.append(
-                ElbowDataPoint(k=k, inertia=float(inertia), silhouette=float(silhouette))
+    def _silhouette(self, X_scaled: np.ndarray, labels: np.ndarray) -> float:
+        """
+        Silhouette score, estimated on a fixed sample for large populations.
+
+        Args:
+            X_scaled: Normalized feature matrix.
+            labels: Cluster labels (at least 2 distinct).
+
+        Returns:
+            Silhouette score (exact when len(X_scaled) <= SILHOUETTE_SAMPLE_SIZE).
+        """
+        if len(X_scaled) <= SILHOUETTE_SAMPLE_SIZE:
+            return float(silhouette_score(X_scaled, labels))
+        try:
+            return float(
+                silhouette_score(
+                    X_scaled, labels, sample_size=SILHOUETTE_SAMPLE_SIZE, random_state=42)
             )
+        except ValueError:
+            # Sample drew a single cluster (tiny clusters in huge populations)
+            return 0.0
 
-        return elbow_data
+    def _micro_cluster(
+        self, X_scaled: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pre-cluster synths into micro-clusters for scalable linkage.
+
+        Args:
+            X_scaled: Normalized feature matrix.
+
+        Returns:
+            Tuple of (centroids, synth count per micro-cluster, micro-cluster per synth).
+            Empty micro-clusters are dropped.
+        """
+        model = MiniBatchKMeans(
+            n_clusters=min(MICRO_CLUSTERS, len(X_scaled)),
+            batch_size=MINIBATCH_SIZE,
+            random_state=42)
+        _, leaf_of_synth = np.unique(model.fit_predict(X_scaled), return_inverse=True)
+
+        counts = np.bincount(leaf_of_synth)
+        centroids = np.zeros((len(counts), X_scaled.shape[1]))
+        np.add.at(centroids, leaf_of_synth, X_scaled)
+        centroids /= counts[:, None]
+        return centroids, counts, leaf_of_synth
 
     def _detect_knee_point(self, elbow_data: list[ElbowDataPoint]) -> int:
         """
@@ -717,24 +991,30 @@ class ClusteringService:
                 return f"Cluster {cluster_id + 1}"
 
     def _build_dendrogram_nodes(
-        self, linkage_matrix: np.ndarray, synth_ids: list[str]
-    ) -> list[DendrogramNode]:
+        self,
+        linkage_matrix: np.ndarray,
+        synth_ids: list[str | None],
+        leaf_counts: np.ndarray | None = None) -> list[DendrogramNode]:
         """
         Build dendrogram nodes from scipy linkage matrix.
 
         Args:
             linkage_matrix: Scipy linkage matrix.
-            synth_ids: List of synth IDs (leaf nodes).
+            synth_ids: Synth ID per leaf (None for micro-cluster leaves).
+            leaf_counts: Synths per leaf (default: 1 per leaf).
 
         Returns:
-            List of DendrogramNode entities.
+            List of DendrogramNode entities (counts are synth counts).
         """
         n_leaves = len(synth_ids)
+        if leaf_counts is None:
+            leaf_counts = np.ones(n_leaves, dtype=int)
+        counts = [int(c) for c in leaf_counts]
         nodes = []
 
         # Add leaf nodes
         for i, synth_id in enumerate(synth_ids):
-            nodes.append(DendrogramNode(id=i, synth_id=synth_id, distance=0.0, count=1))
+            nodes.append(DendrogramNode(id=i, synth_id=synth_id, distance=0.0, count=counts[i]))
 
         # Add internal nodes from linkage matrix
         for i, row in enumerate(linkage_matrix):
@@ -742,7 +1022,8 @@ class ClusteringService:
             left_child = int(row[0])
             right_child = int(row[1])
             distance = float(row[2])
-            count = int(row[3])
+            count = counts[left_child] + counts[right_child]
+            counts.append(count)
 
             nodes.append(
                 DendrogramNode(
@@ -755,29 +1036,36 @@ class ClusteringService:
 
         return nodes
 
-    def _suggest_cuts(self, X_scaled: np.ndarray, linkage_matrix: np.ndarray) -> list[SuggestedCut]:
+    def _suggest_cuts(
+        self,
+        X_scaled: np.ndarray,
+        linkage_matrix: np.ndarray,
+        leaf_of_synth: np.ndarray | None = None) -> list[SuggestedCut]:
         """
         Suggest good cut points for the dendrogram.
 
         Args:
             X_scaled: Normalized feature matrix.
             linkage_matrix: Scipy linkage matrix.
+            leaf_of_synth: Leaf index per synth when leaves are micro-clusters.
 
         Returns:
             List of SuggestedCut entities.
         """
         suggested_cuts = []
 
-        # Try cuts for k=2 to k=min(10, n_samples-1)
-        max_k = min(10, len(X_scaled) - 1)
+        # Try cuts for k=2 to k=min(10, n_leaves-1)
+        max_k = min(10, len(linkage_matrix))
 
         for k in range(2, max_k + 1):
             # Cut at k clusters
             labels = hierarchy.fcluster(linkage_matrix, k, criterion="maxclust")
+            if leaf_of_synth is not None:
+                labels = labels[leaf_of_synth]
 
-            # Calculate silhouette score
+            # Calculate silhouette score (sampled for large populations)
             try:
-                silhouette = silhouette_score(X_scaled, labels)
+                silhouette = self._silhouette(X_scaled, labels)
             except ValueError:
                 # Skip if too few samples per cluster
                 continue
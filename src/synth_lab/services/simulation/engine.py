@@ -17,6 +17,10 @@ Sample usage:
     engine = MonteCarloEngine(seed=42)
     results = engine.run_simulation(synths, scorecard, scenario, n_executions=100)
 
+    # With standard errors and 95% confidence intervals
+    results = engine.run_simulation(synths, scorecard, scenario, confidence_level=0.95)
+    results.aggregated_intervals["success"].ci_low
+
 Expected output:
     SimulationResults with outcomes per synth and aggregated outcomes
 """
@@ -33,6 +37,14 @@ from synth_lab.services.simulation.probability import (
     calculate_p_success,
     sample_outcome)
 from synth_lab.services.simulation.sample_state import sample_user_state
+from synth_lab.services.simulation.uncertainty import (
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    RateInterval,
+    binomial_std_error,
+    bootstrap_mean_intervals,
+    wilson_interval)
+
+OUTCOME_TYPES = ("did_not_try", "failed", "success")
 
 
 @dataclass
@@ -44,6 +56,8 @@ class SynthOutcomeResult:
     failed_rate: float
     success_rate: float
     synth_attributes: dict[str, Any] = field(default_factory=dict)
+    # Wilson intervals per outcome type (only when confidence_level is set)
+    intervals: dict[str, RateInterval] = field(default_factory=dict)
 
 
 @dataclass
@@ -57,6 +71,9 @@ class SimulationResults:
     total_synths: int
     n_executions: int
     execution_time_seconds: float
+    # Bootstrap intervals per outcome type (only when confidence_level is set)
+    aggregated_intervals: dict[str, RateInterval] = field(default_factory=dict)
+    confidence_level: float | None = None
 
 
 class MonteCarloEngine:
@@ -85,17 +102,23 @@ class MonteCarloEngine:
         synths: list[dict[str, Any]],
         scorecard: FeatureScorecard,
         scenario: Scenario,
-        n_executions: int = 100) -> SimulationResults:
+        n_executions: int = 100,
+        confidence_level: float | None = None,
+        n_bootstrap: int = DEFAULT_BOOTSTRAP_RESAMPLES) -> SimulationResults:
         """
         Run Monte Carlo simulation.
 
         For each synth, executes M simulation runs and aggregates outcomes.
+        With confidence_level, per-synth rates get Wilson intervals and
+        aggregated rates get bootstrap intervals over synths.
 
         Args:
             synths: List of synth dicts with simulation_attributes
             scorecard: Feature scorecard with dimension scores
             scenario: Scenario with modifiers
             n_executions: Number of executions per synth
+            confidence_level: Confidence level for intervals (None = point estimates only)
+            n_bootstrap: Bootstrap resamples for aggregated intervals
 
         Returns:
             SimulationResults with per-synth and aggregated outcomes
@@ -127,8 +150,9 @@ class MonteCarloEngine:
         total_did_not_try = 0.0
         total_failed = 0.0
         total_success = 0.0
+        counts = np.zeros((len(synths), len(OUTCOME_TYPES)), dtype=np.int64)
 
-        for synth in synths:
+        for i, synth in enumerate(synths):
             # Extract latent traits from simulation_attributes
             sim_attrs = synth.get("simulation_attributes", {})
             latent_traits = sim_attrs.get("latent_traits", {})
@@ -148,6 +172,7 @@ class MonteCarloEngine:
                 scorecard_scores=scorecard_scores,
                 scenario=scenario_dict,
                 n_executions=n_executions)
+            counts[i] = [outcomes[outcome_type] for outcome_type in OUTCOME_TYPES]
 
             # Calculate rates with 3 decimal precision
             did_not_try_rate = round(outcomes["did_not_try"] / n_executions, 3)
@@ -174,6 +199,11 @@ class MonteCarloEngine:
         aggregated_failed = round(total_failed / n_synths, 3) if n_synths > 0 else 0.0
         aggregated_success = round(total_success / n_synths, 3) if n_synths > 0 else 0.0
 
+        aggregated_intervals: dict[str, RateInterval] = {}
+        if confidence_level is not None and n_synths > 0:
+            aggregated_intervals = self._attach_intervals(
+                synth_outcomes, counts, n_executions, confidence_level, n_bootstrap)
+
         execution_time = time.perf_counter() - start_time
 
         return SimulationResults(
@@ -183,7 +213,56 @@ class MonteCarloEngine:
             aggregated_success=aggregated_success,
             total_synths=n_synths,
             n_executions=n_executions,
-            execution_time_seconds=execution_time)
+            execution_time_seconds=execution_time,
+            aggregated_intervals=aggregated_intervals,
+            confidence_level=confidence_level)
+
+    def _attach_intervals(
+        self,
+        synth_outcomes: list[SynthOutcomeResult],
+        counts: np.ndarray,
+        n_executions: int,
+        confidence_level: float,
+        n_bootstrap: int) -> dict[str, RateInterval]:
+        """
+        Compute per-synth and aggregated intervals from outcome counts.
+
+        Per-synth Wilson intervals are computed for all synths and outcome
+        types in one vectorized call; aggregated intervals bootstrap the
+        per-synth rates (in parallel chunks).
+
+        Args:
+            synth_outcomes: Per-synth results (intervals are set in place).
+            counts: Outcome counts, shape (n_synths, 3) in OUTCOME_TYPES order.
+            n_executions: Executions per synth.
+            confidence_level: Confidence level.
+            n_bootstrap: Bootstrap resamples.
+
+        Returns:
+            Aggregated intervals keyed by outcome type.
+        """
+        rates = counts / n_executions
+        std_errors = binomial_std_error(rates, n_executions)
+        lows, highs = wilson_interval(counts, n_executions, confidence_level)
+
+        for i, synth_outcome in enumerate(synth_outcomes):
+            synth_outcome.intervals = {
+                outcome_type: RateInterval(
+                    estimate=float(rates[i, j]),
+                    std_error=float(std_errors[i, j]),
+                    ci_low=float(lows[i, j]),
+                    ci_high=float(highs[i, j])).rounded()
+                for j, outcome_type in enumerate(OUTCOME_TYPES)
+            }
+
+        # Seed the bootstrap from the engine RNG so seeded runs are reproducible
+        seed = np.random.SeedSequence(int(self.rng.integers(2**63)))
+        aggregated = bootstrap_mean_intervals(
+            rates, confidence=confidence_level, n_resamples=n_bootstrap, seed=seed)
+        return {
+            outcome_type: interval.rounded()
+            for outcome_type, interval in zip(OUTCOME_TYPES, aggregated)
+        }
 
     def _run_synth_executions(
         self,
@@ -4,6 +4,12 @@ Explainability service for UX Research analysis using SHAP and PDP.
 Provides SHAP (SHapley Additive exPlanations) for understanding individual
 synth predictions and Partial Dependence Plots for understanding feature effects.
 
+Two backends:
+    - Surrogate (default): GradientBoostingRegressor + SHAP TreeExplainer + sklearn PDP
+    - Exact: when an OutcomeModel is given, attributions and PDP curves are computed
+      from the simulation's own closed-form model (no training, exact Shapley values,
+      PDP confidence bands)
+
 References:
     - SHAP: https://github.com/shap/shap
     - SHAP Paper: https://arxiv.org/abs/1705.07874
@@ -34,6 +40,7 @@ from synth_lab.services.simulation.feature_extraction import (
     DEFAULT_FEATURES,
     extract_features,
     get_attribute_value)
+from synth_lab.services.simulation.outcome_model import OutcomeModel
 
 # Minimum synths required for reliable SHAP analysis
 MIN_SYNTHS_FOR_SHAP = 20
@@ -46,12 +53,56 @@ class ExplainabilityService:
     Trains a GradientBoostingRegressor internally to predict success_rate,
     then uses SHAP TreeExplainer for individual explanations and sklearn
     partial_dependence for feature effect analysis.
+
+    If an OutcomeModel is provided, the exact backend is used instead.
     """
 
-    def __init__(self):
-        """Initialize ExplainabilityService with empty cache."""
+    def __init__(self, outcome_model: OutcomeModel | None = None):
+        """
+        Initialize ExplainabilityService with empty cache.
+
+        Args:
+            outcome_model: Optional closed-form simulation model. When set,
+                SHAP and PDP are computed exactly from it (no surrogate).
+        """
+        self.outcome_model = outcome_model
         self._model_cache: dict[str, tuple[GradientBoostingRegressor, float]] = {}
         self._shap_values_cache: dict[str, np.ndarray] = {}
+        self._exact_cache: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray, float]] = {}
+
+    def _exact_attributions(
+        self,
+        simulation_id: str,
+        outcomes: list[SynthOutcome],
+        features: list[str] | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """
+        Exact Shapley values from the simulation model (cached per feature set).
+
+        Args:
+            simulation_id: Simulation identifier.
+            outcomes: List of SynthOutcome entities.
+            features: Feature names to use. Defaults to observables.
+
+        Returns:
+            Tuple of (shap_values N x d, baseline per synth, predictions, R² vs observed).
+        """
+        feature_names = features or DEFAULT_FEATURES
+        cache_key = f"{simulation_id}:{','.join(feature_names)}"
+        if cache_key in self._exact_cache:
+            return self._exact_cache[cache_key]
+
+        X, base = self.outcome_model.feature_matrix(outcomes, feature_names)
+        shap_values, baseline = self.outcome_model.shapley_values(X, feature_names, base)
+        predictions = self.outcome_model.predict(X, feature_names, base)
+
+        # R² of the exact expectation against observed (Monte Carlo) success rates
+        y = np.array([o.success_rate for o in outcomes])
+        ss_tot = float(np.sum((y - y.mean()) ** 2))
+        score = 1.0 - float(np.sum((y - predictions) ** 2)) / ss_tot if ss_tot > 0 else 1.0
+
+        logger.info(f"Computed exact attributions for {simulation_id}, R²={score:.3f}")
+        self._exact_cache[cache_key] = (shap_values, baseline, predictions, score)
+        return self._exact_cache[cache_key]
 
     def _train_model(
         self,
@@ -154,6 +205,10 @@ class ExplainabilityService:
         if target_outcome is None:
             raise ValueError(f"Synth {synth_id} not found in outcomes")
 
+        if self.outcome_model is not None:
+            return self._explain_synth_exact(
+                simulation_id, outcomes, target_idx, features)
+
         # Train model
         model, score = self._train_model(outcomes, features)
 
@@ -222,6 +277,48 @@ class ExplainabilityService:
             explanation_text=explanation_text,
             model_type="gradient_boosting")
 
+    def _explain_synth_exact(
+        self,
+        simulation_id: str,
+        outcomes: list[SynthOutcome],
+        target_idx: int,
+        features: list[str] | None = None) -> ShapExplanation:
+        """Build ShapExplanation from exact simulation-model attributions."""
+        feature_names = features or DEFAULT_FEATURES
+        shap_values, baseline, predictions, _ = self._exact_attributions(
+            simulation_id, outcomes, feature_names)
+        X, _ = self.outcome_model.feature_matrix(outcomes, feature_names)
+        target_outcome = outcomes[target_idx]
+
+        contributions = [
+            ShapContribution(
+                feature_name=feature_name,
+                feature_value=float(X[target_idx, i]),
+                shap_value=float(shap_values[target_idx, i]),
+                baseline_value=float(np.mean(X[:, i])),
+                impact="positive" if shap_values[target_idx, i] > 0 else "negative")
+            for i, feature_name in enumerate(feature_names)
+        ]
+        contributions.sort(key=lambda c: abs(c.shap_value), reverse=True)
+
+        baseline_prediction = float(baseline[target_idx])
+        predicted_success_rate = float(predictions[target_idx])
+
+        return ShapExplanation(
+            synth_id=target_outcome.synth_id,
+            simulation_id=simulation_id,
+            predicted_success_rate=predicted_success_rate,
+            actual_success_rate=target_outcome.success_rate,
+            baseline_prediction=baseline_prediction,
+            contributions=contributions,
+            explanation_text=self._generate_explanation_text(
+                synth_id=target_outcome.synth_id,
+                contributions=contributions,
+                predicted=predicted_success_rate,
+                actual=target_outcome.success_rate,
+                baseline=baseline_prediction),
+            model_type="simulation_model")
+
     def _generate_explanation_text(
         self,
         synth_id: str,
@@ -313,6 +410,13 @@ class ExplainabilityService:
                 f"SHAP requires at least {MIN_SYNTHS_FOR_SHAP} synths, got {len(outcomes)}"
             )
 
+        if self.outcome_model is not None:
+            feature_names = features or DEFAULT_FEATURES
+            shap_values, _, _, score = self._exact_attributions(
+                simulation_id, outcomes, feature_names)
+            return self._build_shap_summary(
+                simulation_id, shap_values, feature_names, len(outcomes), score)
+
         # Train model
         model, score = self._train_model(outcomes, features)
 
@@ -332,6 +436,17 @@ class ExplainabilityService:
         else:
             shap_values = self._shap_values_cache[cache_key]
 
+        return self._build_shap_summary(
+            simulation_id, shap_values, feature_names, len(outcomes), score)
+
+    def _build_shap_summary(
+        self,
+        simulation_id: str,
+        shap_values: np.ndarray,
+        feature_names: list[str],
+        total_synths: int,
+        score: float) -> ShapSummary:
+        """Rank features by mean absolute SHAP value."""
         # Calculate mean absolute SHAP values per feature
         mean_abs_shap = np.mean(np.abs(shap_values), axis=0)
 
@@ -353,7 +468,7 @@ class ExplainabilityService:
             simulation_id=simulation_id,
             feature_importances=feature_importances,
             top_features=top_features,
-            total_synths=len(outcomes),
+            total_synths=total_synths,
             model_score=score)
 
     def calculate_pdp(
@@ -398,6 +513,10 @@ class ExplainabilityService:
             except ValueError:
                 raise ValueError(f"Feature '{feature}' not found in synth attributes")
 
+        if self.outcome_model is not None:
+            return self._calculate_pdp_exact(
+                simulation_id, outcomes, feature, features, grid_resolution)
+
         # Train model
         model, score = self._train_model(outcomes, features)
 
@@ -453,6 +572,48 @@ class ExplainabilityService:
             effect_strength=effect_strength,
             baseline_value=baseline_value)
 
+    def _calculate_pdp_exact(
+        self,
+        simulation_id: str,
+        outcomes: list[SynthOutcome],
+        feature: str,
+        features: list[str],
+        grid_resolution: int) -> PDPResult:
+        """PDP curve with confidence band from the exact simulation model."""
+        X, base = self.outcome_model.feature_matrix(outcomes, features)
+        feature_idx = features.index(feature)
+
+        # Same grid as sklearn partial_dependence: 5th-95th percentile
+        column = X[:, feature_idx]
+        unique_values = np.unique(column)
+        if len(unique_values) < grid_resolution:
+            grid = unique_values
+        else:
+            low, high = np.percentile(column, [5, 95])
+            grid = np.linspace(low, high, grid_resolution)
+
+        mean, lower, upper = self.outcome_model.partial_dependence(
+            X, features, base, feature_idx, grid)
+
+        pdp_values = [
+            PDPPoint(
+                feature_value=float(grid[i]),
+                predicted_success=float(mean[i]),
+                confidence_lower=float(lower[i]),
+                confidence_upper=float(upper[i]))
+            for i in range(len(grid))
+        ]
+        effect_type, effect_strength = self._classify_effect(list(mean))
+
+        return PDPResult(
+            simulation_id=simulation_id,
+            feature_name=feature,
+            feature_display_name=feature.replace("_", " ").title(),
+            pdp_values=pdp_values,
+            effect_type=effect_type,
+            effect_strength=effect_strength,
+            baseline_value=float(np.mean(column)))
+
     def _classify_effect(
         self,
         values: list[float]) -> tuple[str, float]:
@@ -143,6 +143,47 @@ def get_attribute_value(outcome: SynthOutcome, attribute: str) -> float:
     raise ValueError(f"Unknown attribute: {attribute}")
 
 
+def extract_columns(outcomes: list[SynthOutcome], columns: list[str]) -> np.ndarray:
+    """
+    Extract attribute and outcome columns into one matrix in a single pass.
+
+    Accepts the same names as get_attribute_value (latent traits, observables,
+    outcome rates and attempt_rate).
+
+    Args:
+        outcomes: List of SynthOutcome entities.
+        columns: Column names to extract.
+
+    Returns:
+        numpy array of shape (n_samples, n_columns).
+
+    Raises:
+        ValueError: If a column name is unknown.
+    """
+    available = get_available_attributes()
+    latent = set(available["latent_traits"])
+    observable = set(available["observables"])
+    outcome_fields = set(available["outcomes"])
+
+    getters = []
+    for column in columns:
+        if column in latent:
+            getters.append(lambda o, c=column: getattr(o.synth_attributes.latent_traits, c))
+        elif column in observable:
+            getters.append(lambda o, c=column: getattr(o.synth_attributes.observables, c))
+        elif column in outcome_fields:
+            getters.append(lambda o, c=column: getattr(o, c))
+        elif column == "attempt_rate":
+            getters.append(lambda o: 1.0 - o.did_not_try_rate)
+        else:
+            raise ValueError(f"Unknown attribute: {column}")
+
+    X = np.empty((len(outcomes), len(columns)), dtype=np.float64)
+    for i, outcome in enumerate(outcomes):
+        X[i] = [getter(outcome) for getter in getters]
+    return X
+
+
 def get_available_attributes() -> dict[str, list[str]]:
     """
     Get list of available attributes for analysis.
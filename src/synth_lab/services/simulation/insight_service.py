@@ -46,6 +46,7 @@ from synth_lab.domain.entities.chart_insight import (
     SimulationInsights)
 from synth_lab.infrastructure.llm_client import LLMClient, get_llm_client
 from synth_lab.infrastructure.phoenix_tracing import get_tracer
+from synth_lab.infrastructure.single_flight import get_single_flight
 from synth_lab.repositories.insight_repository import InsightRepository
 
 # Phoenix/OpenTelemetry tracer for observability
@@ -101,6 +102,17 @@ class InsightService:
         Raises:
             InsightGenerationError: If LLM call fails
         """
+        return get_single_flight().do(
+            ("simulation_insight", simulation_id, chart_type, force),
+            lambda: self._generate_insight(simulation_id, chart_type, chart_data, force))
+
+    def _generate_insight(
+        self,
+        simulation_id: str,
+        chart_type: ChartType,
+        chart_data: dict[str, Any],
+        force: bool) -> ChartInsight:
+        """Return persisted insight or generate one via LLM (no coalescing)."""
         span_name = f"SimInsight {chart_type} | sim_{simulation_id[:12]}"
         with _tracer.start_as_current_span(
             span_name,
@@ -278,6 +290,12 @@ Return JSON:
         Returns:
             Executive summary text, or None if no insights available
         """
+        return get_single_flight().do(
+            ("simulation_executive_summary", simulation_id, force),
+            lambda: self._generate_executive_summary(simulation_id, force))
+
+    def _generate_executive_summary(self, simulation_id: str, force: bool) -> str | None:
+        """Return persisted summary or generate one via LLM (no coalescing)."""
         span_name = f"SimSummary | sim_{simulation_id[:12]}"
         with _tracer.start_as_current_span(
             span_name,
@@ -0,0 +1,329 @@
+"""
+Shared outcome aggregation for overview charts.
+
+Turns an analysis' outcome list into column arrays once (rates, the latent
+traits used for root-cause diagnosis, and rank orders), with summary means
+and quantiles precomputed. Try vs Success, Outcome Distribution and Sankey
+read from the same aggregate instead of each looping over the outcome list.
+
+Aggregates are cached per analysis ID; outcomes of a completed analysis do
+not change (re-running creates a new analysis ID).
+
+References:
+    - Charts: services/simulation/chart_data_service.py
+    - Sankey diagnosis: specs/025-sankey-diagram/research.md
+
+Sample usage:
+    from synth_lab.services.simulation.outcome_aggregates import get_outcome_aggregates
+
+    aggregates = get_outcome_aggregates("ana_12345678", lambda: load_outcomes("ana_12345678"))
+    aggregates.summary["median_success"]  # 0.43
+    aggregates.quadrants(0.5, 0.5)        # array of quadrant codes per synth
+
+Expected output:
+    OutcomeAggregates with one entry per synth, built once per analysis.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from synth_lab.domain.entities import FeatureScorecard, SynthOutcome
+from synth_lab.domain.entities.experiment import ScorecardData
+
+# Max analyses kept in memory (least recently used evicted)
+AGGREGATE_CACHE_MAX_ENTRIES = 32
+
+# Quadrant codes, indexed by (attempt >= x) * 2 + (success >= y)
+QUADRANTS = ("low_value", "discovery_issue", "usability_issue", "ok")
+
+# Baseline motivation used by the P(attempt) diagnosis (not stored per synth)
+BASELINE_MOTIVATION = 0.5
+
+
+@dataclass(frozen=True)
+class OutcomeAggregates:
+    """Column view of an analysis' outcomes with precomputed summaries."""
+
+    synth_ids: list[str]
+    did_not_try_rate: np.ndarray
+    failed_rate: np.ndarray
+    success_rate: np.ndarray
+    has_attributes: np.ndarray
+    trust_mean: np.ndarray
+    capability_mean: np.ndarray
+    friction_tolerance_mean: np.ndarray
+    summary: dict[str, float] = field(default_factory=dict)
+    _orders: dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_outcomes(cls, outcomes: list[SynthOutcome]) -> "OutcomeAggregates":
+        """
+        Build aggregates in a single pass over the outcomes.
+
+        Args:
+            outcomes: List of SynthOutcome entities.
+
+        Returns:
+            OutcomeAggregates for the outcomes.
+        """
+        n = len(outcomes)
+        rates = np.empty((n, 3), dtype=np.float64)
+        traits = np.full((n, 3), np.nan, dtype=np.float64)
+        for i, o in enumerate(outcomes):
+            rates[i] = (o.did_not_try_rate, o.failed_rate, o.success_rate)
+            if o.synth_attributes is not None:
+                latent = o.synth_attributes.latent_traits
+                traits[i] = (latent.trust_mean, latent.capability_mean,
+                             latent.friction_tolerance_mean)
+
+        aggregates = cls(
+            synth_ids=[o.synth_id for o in outcomes],
+            did_not_try_rate=rates[:, 0],
+            failed_rate=rates[:, 1],
+            success_rate=rates[:, 2],
+            has_attributes=~np.isnan(traits[:, 0]),
+            trust_mean=traits[:, 0],
+            capability_mean=traits[:, 1],
+            friction_tolerance_mean=traits[:, 2])
+        aggregates.summary.update(_summarize(rates))
+        return aggregates
+
+    def __len__(self) -> int:
+        return len(self.synth_ids)
+
+    def rate(self, name: str) -> np.ndarray:
+        """Rate column by field name (did_not_try_rate, failed_rate, success_rate)."""
+        if name not in ("did_not_try_rate", "failed_rate", "success_rate"):
+            raise ValueError(f"Unknown rate: {name}")
+        return getattr(self, name)
+
+    def order(self, name: str, descending: bool = False) -> np.ndarray:
+        """
+        Stable sort order of a rate column (computed once, then reused).
+
+        Ties keep the original outcome order in both directions.
+        """
+        key = (name, descending)
+        cached = self._orders.get(key)
+        if cached is None:
+            values = self.rate(name)
+            cached = np.argsort(-values if descending else values, kind="stable")
+            self._orders[key] = cached
+        return cached
+
+    def quadrants(self, x_threshold: float, y_threshold: float) -> np.ndarray:
+        """Quadrant code per synth (index into QUADRANTS)."""
+        attempt_rate = 1.0 - self.did_not_try_rate
+        return (attempt_rate >= x_threshold) * 2 + (self.success_rate >= y_threshold)
+
+    def root_cause_weights(self, scorecard: FeatureScorecard | ScorecardData) -> dict[str, float]:
+        """
+        Rate-weighted root-cause totals for did_not_try and failed outcomes.
+
+        Vectorized form of ChartDataService.diagnose_did_not_try and
+        diagnose_failed: each synth adds its did_not_try_rate to its attempt
+        barrier and its failed_rate to its success barrier. Ties go to
+        effort_barrier and capability_barrier; synths without attributes use
+        those as fallback.
+        """
+        effort_gap = 1.5 * scorecard.initial_effort.score - 2.0 * BASELINE_MOTIVATION
+        risk_gap = 2.0 * scorecard.perceived_risk.score - 1.5 * self.trust_mean
+        is_risk = self.has_attributes & (risk_gap > effort_gap)
+
+        capability_gap = scorecard.complexity.score - self.capability_mean
+        patience_gap = scorecard.time_to_value.score - self.friction_tolerance_mean
+        is_patience = self.has_attributes & (patience_gap > capability_gap)
+
+        dnt = self.did_not_try_rate
+        failed = self.failed_rate
+        return {
+            "effort_barrier": float(dnt[~is_risk].sum()),
+            "risk_barrier": float(dnt[is_risk].sum()),
+            "capability_barrier": float(failed[~is_patience].sum()),
+            "patience_barrier": float(failed[is_patience].sum()),
+        }
+
+
+def _summarize(rates: np.ndarray) -> dict[str, float]:
+    """Means, sums and success quantiles of the (n, 3) rate matrix."""
+    if len(rates) == 0:
+        return {
+            "avg_success": 0.0,
+            "avg_failed": 0.0,
+            "avg_did_not_try": 0.0,
+            "median_success": 0.0,
+            "std_success": 0.0,
+            "sum_did_not_try": 0.0,
+            "sum_failed": 0.0,
+            "sum_success": 0.0,
+        }
+
+    sums = rates.sum(axis=0)
+    means = sums / len(rates)
+    success = rates[:, 2]
+    return {
+        "avg_success": float(means[2]),
+        "avg_failed": float(means[1]),
+        "avg_did_not_try": float(means[0]),
+        "median_success": float(np.median(success)),
+        "std_success": float(np.std(success)),
+        "sum_did_not_try": float(sums[0]),
+        "sum_failed": float(sums[1]),
+        "sum_success": float(sums[2]),
+    }
+
+
+def as_aggregates(outcomes: "list[SynthOutcome] | OutcomeAggregates") -> OutcomeAggregates:
+    """Accept either an outcome list or prebuilt aggregates."""
+    if isinstance(outcomes, OutcomeAggregates):
+        return outcomes
+    return OutcomeAggregates.from_outcomes(outcomes)
+
+
+class OutcomeAggregateCache:
+    """Thread-safe LRU cache of outcome aggregates keyed by analysis ID."""
+
+    def __init__(self, max_entries: int = AGGREGATE_CACHE_MAX_ENTRIES):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of analyses kept (least recently used evicted).
+        """
+        self._entries: OrderedDict[str, OutcomeAggregates] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, analysis_id: str) -> OutcomeAggregates | None:
+        """Get cached aggregates (or None)."""
+        with self._lock:
+            aggregates = self._entries.get(analysis_id)
+            if aggregates is not None:
+                self._entries.move_to_end(analysis_id)
+            return aggregates
+
+    def set(self, analysis_id: str, aggregates: OutcomeAggregates) -> None:
+        """Store aggregates, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[analysis_id] = aggregates
+            self._entries.move_to_end(analysis_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, analysis_id: str) -> None:
+        """Drop the aggregates of an analysis."""
+        with self._lock:
+            self._entries.pop(analysis_id, None)
+
+    def clear(self) -> None:
+        """Remove all cached aggregates."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_aggregate_cache = OutcomeAggregateCache()
+
+
+def get_outcome_aggregate_cache() -> OutcomeAggregateCache:
+    """Get the process-wide outcome aggregate cache."""
+    return _aggregate_cache
+
+
+def get_outcome_aggregates(
+    analysis_id: str, load_outcomes: Callable[[], list[SynthOutcome]]
+) -> OutcomeAggregates:
+    """
+    Get the aggregates of an analysis, loading and building them on a miss.
+
+    Args:
+        analysis_id: Analysis ID (cache key).
+        load_outcomes: Loads the analysis outcomes when not cached.
+
+    Returns:
+        OutcomeAggregates for the analysis.
+    """
+    aggregates = _aggregate_cache.get(analysis_id)
+    if aggregates is None:
+        aggregates = OutcomeAggregates.from_outcomes(load_outcomes())
+        _aggregate_cache.set(analysis_id, aggregates)
+    return aggregates
+
+
+if __name__ == "__main__":
+    import sys
+
+    from synth_lab.domain.entities.simulation_attributes import (
+        SimulationAttributes,
+        SimulationLatentTraits,
+        SimulationObservables,
+    )
+
+    all_validation_failures = []
+    total_tests = 0
+
+    def make_outcome(synth_id: str, dnt: float, failed: float, trust: float) -> SynthOutcome:
+        return SynthOutcome(
+            synth_id=synth_id,
+            analysis_id="ana_12345678",
+            did_not_try_rate=dnt,
+            failed_rate=failed,
+            success_rate=round(1.0 - dnt - failed, 6),
+            synth_attributes=SimulationAttributes(
+                latent_traits=SimulationLatentTraits(
+                    capability_mean=0.5,
+                    trust_mean=trust,
+                    friction_tolerance_mean=0.5,
+                    exploration_prob=0.5),
+                observables=SimulationObservables(
+                    digital_literacy=0.5,
+                    similar_tool_experience=0.5,
+                    motor_ability=0.5,
+                    time_availability=0.5,
+                    domain_expertise=0.5)))
+
+    outcomes = [
+        make_outcome("s1", 0.1, 0.2, 0.9),
+        make_outcome("s2", 0.6, 0.2, 0.1),
+        make_outcome("s3", 0.2, 0.5, 0.5),
+    ]
+    agg = OutcomeAggregates.from_outcomes(outcomes)
+
+    # Test 1: Summary statistics
+    total_tests += 1
+    if abs(agg.summary["avg_did_not_try"] - 0.3) > 1e-9:
+        all_validation_failures.append(f"avg_did_not_try: {agg.summary['avg_did_not_try']}")
+
+    # Test 2: Quadrants
+    total_tests += 1
+    codes = [QUADRANTS[c] for c in agg.quadrants(0.5, 0.5)]
+    if codes != ["ok", "low_value", "usability_issue"]:
+        all_validation_failures.append(f"Quadrants: {codes}")
+
+    # Test 3: Stable descending order
+    total_tests += 1
+    if agg.order("failed_rate", descending=True).tolist() != [2, 0, 1]:
+        all_validation_failures.append(f"Order: {agg.order('failed_rate', descending=True)}")
+
+    # Test 4: Cache builds once
+    total_tests += 1
+    loads = []
+    get_outcome_aggregates("ana_val00001", lambda: loads.append(1) or outcomes)
+    get_outcome_aggregates("ana_val00001", lambda: loads.append(1) or outcomes)
+    if len(loads) != 1:
+        all_validation_failures.append(f"Expected 1 load, got {len(loads)}")
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
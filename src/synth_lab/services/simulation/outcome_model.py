@@ -0,0 +1,378 @@
+"""
+Exact (closed-form) outcome model for explainability.
+
+Evaluates the Monte Carlo simulation's own probability model
+(probability.py + sample_state.py) in expectation, vectorized over synths,
+instead of fitting a surrogate to simulated success rates:
+
+    E[success] = E[P(attempt)] * E[P(success | attempt)]
+
+Both factors are independent (attempt uses trust/exploration, success uses
+capability/friction tolerance). Expectations over the Normal state noise
+(with the simulation's clipping to [0, 1]) use Gauss-Hermite quadrature;
+exploration is a Bernoulli mixture.
+
+Features can be observables or latent traits. Observable changes propagate
+to latent traits through the linear derivation in DERIVATION_WEIGHTS, applied
+as an offset from each synth's stored latent traits.
+
+References:
+    - Simulation model: services/simulation/probability.py, sample_state.py
+    - Derivation: gen_synth/simulation_attributes.py (derive_latent_traits)
+    - Gauss-Hermite quadrature: https://numpy.org/doc/stable/reference/generated/numpy.polynomial.hermite_e.hermegauss.html
+    - Baseline Shapley: https://arxiv.org/abs/1908.08474
+
+Sample usage:
+    model = OutcomeModel.from_scorecard(experiment.scorecard_data, sigma=0.05)
+    X, base = model.feature_matrix(outcomes, features)
+    predictions = model.predict(X, features, base)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from numpy.polynomial.hermite_e import hermegauss
+
+from synth_lab.domain.constants.derivation_weights import DERIVATION_WEIGHTS
+from synth_lab.domain.entities import SynthOutcome
+from synth_lab.services.simulation.probability import attempt_probability, success_probability
+
+OBSERVABLE_NAMES = [
+    "digital_literacy",
+    "similar_tool_experience",
+    "motor_ability",
+    "time_availability",
+    "domain_expertise",
+]
+
+LATENT_NAMES = [
+    "capability_mean",
+    "trust_mean",
+    "friction_tolerance_mean",
+    "exploration_prob",
+]
+
+# Quadrature nodes per noise dimension
+QUADRATURE_NODES = 16
+
+# Baseline scenario (same values as the analysis execution default)
+BASELINE_SCENARIO = {
+    "motivation_modifier": 0.0,
+    "trust_modifier": 0.0,
+    "friction_modifier": 0.0,
+    "task_criticality": 0.5,
+}
+
+
+def _derivation_jacobian() -> np.ndarray:
+    """
+    d(latent) / d(observable) matrix (4 x 5) from DERIVATION_WEIGHTS.
+
+    novelty_preference = 1 - similar_tool_experience, so its weight enters
+    with a negative sign on similar_tool_experience.
+    """
+    jacobian = np.zeros((len(LATENT_NAMES), len(OBSERVABLE_NAMES)))
+    for i, latent in enumerate(LATENT_NAMES):
+        for source, weight in DERIVATION_WEIGHTS[latent].items():
+            if source == "novelty_preference":
+                jacobian[i, OBSERVABLE_NAMES.index("similar_tool_experience")] -= weight
+            else:
+                jacobian[i, OBSERVABLE_NAMES.index(source)] += weight
+    return jacobian
+
+
+DERIVATION_JACOBIAN = _derivation_jacobian()
+
+
+@dataclass
+class BaseAttributes:
+    """Stored observables (N x 5) and latent traits (N x 4) of each synth."""
+
+    observables: np.ndarray
+    latent: np.ndarray
+
+
+@dataclass
+class OutcomeModel:
+    """
+    Closed-form expected outcomes of the Monte Carlo simulation.
+
+    Attributes:
+        scorecard_scores: complexity, initial_effort, perceived_risk, time_to_value
+        scenario: trust/friction/motivation modifiers and task_criticality
+        sigma: Standard deviation of state sampling noise
+        n_nodes: Gauss-Hermite nodes per noise dimension
+    """
+
+    scorecard_scores: dict[str, float]
+    scenario: dict[str, float] = field(default_factory=lambda: dict(BASELINE_SCENARIO))
+    sigma: float = 0.05
+    n_nodes: int = QUADRATURE_NODES
+
+    def __post_init__(self) -> None:
+        nodes, weights = hermegauss(self.n_nodes)
+        self._nodes = nodes
+        self._weights = weights / weights.sum()
+
+    @classmethod
+    def from_scorecard(
+        cls,
+        scorecard_data,
+        sigma: float,
+        scenario: dict[str, float] | None = None) -> "OutcomeModel":
+        """
+        Build model from an experiment's embedded scorecard (ScorecardData).
+
+        Args:
+            scorecard_data: Experiment.scorecard_data with dimension scores.
+            sigma: Analysis noise (AnalysisConfig.sigma).
+            scenario: Scenario modifiers. Defaults to the baseline scenario.
+
+        Returns:
+            OutcomeModel for the analysis.
+        """
+        return cls(
+            scorecard_scores={
+                "complexity": scorecard_data.complexity.score,
+                "initial_effort": scorecard_data.initial_effort.score,
+                "perceived_risk": scorecard_data.perceived_risk.score,
+                "time_to_value": scorecard_data.time_to_value.score,
+            },
+            scenario=dict(scenario or BASELINE_SCENARIO),
+            sigma=sigma)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Simulation inputs, for storing with the analysis run."""
+        return {
+            "scorecard_scores": dict(self.scorecard_scores),
+            "scenario": dict(self.scenario),
+            "sigma": self.sigma,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OutcomeModel":
+        """Rebuild a model stored with to_dict()."""
+        return cls(
+            scorecard_scores=dict(data["scorecard_scores"]),
+            scenario=dict(data["scenario"]),
+            sigma=float(data["sigma"]))
+
+    # =========================================================================
+    # Expectations over noise
+    # =========================================================================
+
+    def _noisy(self, means: np.ndarray, modifier: float = 0.0) -> np.ndarray:
+        """Clipped noisy values at quadrature nodes: shape (*means.shape, n_nodes)."""
+        values = means[..., None] + self.sigma * self._nodes + modifier
+        return np.clip(values, 0.0, 1.0)
+
+    def expected_outcomes(self, latent: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Expected outcome probabilities per synth.
+
+        Args:
+            latent: Latent traits matrix (N x 4, LATENT_NAMES order).
+
+        Returns:
+            Dict with p_did_not_try, p_failed, p_success arrays (length N).
+        """
+        latent = np.clip(np.asarray(latent, dtype=float), 0.0, 1.0)
+        capability, trust, friction, exploration = latent.T
+        scores = self.scorecard_scores
+        w = self._weights
+
+        motivation = float(
+            np.clip(
+                self.scenario.get("task_criticality", 0.5)
+                + self.scenario.get("motivation_modifier", 0.0),
+                0.0,
+                1.0)
+        )
+
+        # E[P(attempt)]: trust noise x Bernoulli(exploration_prob)
+        trust_nodes = self._noisy(trust, self.scenario.get("trust_modifier", 0.0))
+        risk = scores.get("perceived_risk", 0.5)
+        effort = scores.get("initial_effort", 0.5)
+        p_attempt_explore = attempt_probability(motivation, trust_nodes, 1.0, risk, effort) @ w
+        p_attempt_stay = attempt_probability(motivation, trust_nodes, 0.0, risk, effort) @ w
+        p_attempt = exploration * p_attempt_explore + (1.0 - exploration) * p_attempt_stay
+
+        # E[P(success | attempt)]: capability x friction noise (2-D product rule)
+        capability_nodes = self._noisy(capability)[:, :, None]
+        friction_nodes = self._noisy(friction, self.scenario.get("friction_modifier", 0.0))[
+            :, None, :
+        ]
+        p_success_given = success_probability(
+            capability_nodes,
+            friction_nodes,
+            scores.get("complexity", 0.5),
+            scores.get("time_to_value", 0.5))
+        p_success_given = np.einsum("nij,i,j->n", p_success_given, w, w)
+
+        return {
+            "p_did_not_try": 1.0 - p_attempt,
+            "p_failed": p_attempt * (1.0 - p_success_given),
+            "p_success": p_attempt * p_success_given,
+        }
+
+    # =========================================================================
+    # Feature space
+    # =========================================================================
+
+    @staticmethod
+    def feature_matrix(
+        outcomes: list[SynthOutcome], features: list[str]
+    ) -> tuple[np.ndarray, BaseAttributes]:
+        """
+        Extract feature values and stored attributes of each synth.
+
+        Args:
+            outcomes: Synth outcomes.
+            features: Feature names (observables and/or latent traits).
+
+        Returns:
+            Tuple of (X: N x len(features), BaseAttributes).
+
+        Raises:
+            ValueError: If a feature is not a simulation attribute.
+        """
+        unknown = [f for f in features if f not in OBSERVABLE_NAMES and f not in LATENT_NAMES]
+        if unknown:
+            raise ValueError(f"Features not in simulation model: {unknown}")
+
+        observables = np.array(
+            [
+                [getattr(o.synth_attributes.observables, name) for name in OBSERVABLE_NAMES]
+                for o in outcomes
+            ],
+            dtype=float)
+        latent = np.array(
+            [
+                [getattr(o.synth_attributes.latent_traits, name) for name in LATENT_NAMES]
+                for o in outcomes
+            ],
+            dtype=float)
+
+        columns = {name: observables[:, i] for i, name in enumerate(OBSERVABLE_NAMES)}
+        columns.update({name: latent[:, i] for i, name in enumerate(LATENT_NAMES)})
+        X = np.column_stack([columns[f] for f in features])
+        return X, BaseAttributes(observables=observables, latent=latent)
+
+    def latent_for(
+        self, X: np.ndarray, features: list[str], base: BaseAttributes
+    ) -> np.ndarray:
+        """
+        Latent traits implied by feature values X for each synth.
+
+        Latent features replace the stored value; observable features shift
+        latent traits by the derivation Jacobian times the observable change.
+        """
+        latent = base.latent.copy()
+        for j, name in enumerate(features):
+            if name in LATENT_NAMES:
+                latent[:, LATENT_NAMES.index(name)] = X[:, j]
+
+        obs_delta = np.zeros_like(base.observables)
+        for j, name in enumerate(features):
+            if name in OBSERVABLE_NAMES:
+                i = OBSERVABLE_NAMES.index(name)
+                obs_delta[:, i] = X[:, j] - base.observables[:, i]
+
+        return np.clip(latent + obs_delta @ DERIVATION_JACOBIAN.T, 0.0, 1.0)
+
+    def predict(self, X: np.ndarray, features: list[str], base: BaseAttributes) -> np.ndarray:
+        """
+        Expected success rate for feature values X.
+
+        Args:
+            X: Feature matrix (N x len(features)).
+            features: Feature names matching X columns.
+            base: Stored attributes of the same N synths.
+
+        Returns:
+            Expected success rate per synth (length N).
+        """
+        return self.expected_outcomes(self.latent_for(X, features, base))["p_success"]
+
+    # =========================================================================
+    # Attributions and partial dependence
+    # =========================================================================
+
+    def shapley_values(
+        self,
+        X: np.ndarray,
+        features: list[str],
+        base: BaseAttributes,
+        baseline: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Exact baseline Shapley values of the expected success rate.
+
+        Enumerates all 2^d feature coalitions; features outside a coalition
+        take the baseline value. Contributions of each synth sum to
+        predict(x) - predict(baseline).
+
+        Args:
+            X: Feature matrix (N x d).
+            features: Feature names.
+            base: Stored attributes of the same N synths.
+            baseline: Reference feature vector (default: feature means).
+
+        Returns:
+            Tuple of (Shapley values N x d, prediction at the baseline per synth).
+        """
+        n, d = X.shape
+        if baseline is None:
+            baseline = X.mean(axis=0)
+
+        # Value of every coalition (bitmask over features)
+        values = np.empty((1 << d, n))
+        for mask in range(1 << d):
+            in_coalition = np.array([(mask >> j) & 1 for j in range(d)], dtype=bool)
+            X_masked = np.where(in_coalition, X, baseline)
+            values[mask] = self.predict(X_masked, features, base)
+
+        # Shapley weight |S|! (d - |S| - 1)! / d! for coalitions without j
+        factorials = np.cumprod([1.0] + list(range(1, d + 1)))
+        shap = np.zeros((n, d))
+        for mask in range(1 << d):
+            size = bin(mask).count("1")
+            for j in range(d):
+                if mask & (1 << j):
+                    continue
+                weight = factorials[size] * factorials[d - size - 1] / factorials[d]
+                shap[:, j] += weight * (values[mask | (1 << j)] - values[mask])
+
+        return shap, values[0]
+
+    def partial_dependence(
+        self,
+        X: np.ndarray,
+        features: list[str],
+        base: BaseAttributes,
+        feature_idx: int,
+        grid: np.ndarray,
+        z: float = 1.96) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Exact partial dependence with a confidence band over the population.
+
+        Args:
+            X: Feature matrix (N x d).
+            features: Feature names.
+            base: Stored attributes of the same N synths.
+            feature_idx: Column of the feature to vary.
+            grid: Values to evaluate.
+            z: Normal quantile for the band (1.96 = 95%).
+
+        Returns:
+            Tuple of (mean, lower, upper) arrays over the grid.
+        """
+        ice = np.empty((len(grid), X.shape[0]))
+        for g, value in enumerate(grid):
+            X_grid = X.copy()
+            X_grid[:, feature_idx] = value
+            ice[g] = self.predict(X_grid, features, base)
+
+        mean = ice.mean(axis=1)
+        stderr = ice.std(axis=1, ddof=1) / np.sqrt(X.shape[0]) if X.shape[0] > 1 else 0.0
+        return mean, np.clip(mean - z * stderr, 0.0, 1.0), np.clip(mean + z * stderr, 0.0, 1.0)
@@ -4,6 +4,10 @@ Outlier detection service for UX Research analysis.
 Identifies extreme cases and statistical outliers in simulation outcomes
 to help researchers select interesting synths for qualitative interviews.
 
+Isolation Forest anomaly scores do not depend on contamination (it only sets
+the decision threshold), so the fitted forest and its scores are cached per
+(analysis, feature set); changing contamination just re-thresholds them.
+
 References:
     - Isolation Forest: scikit-learn.org/stable/modules/generated/sklearn.ensemble.IsolationForest.html
     - Outlier Detection: scikit-learn.org/stable/modules/outlier_detection.html
@@ -16,6 +20,10 @@ Expected Output:
     OutlierResult: Statistical outliers via Isolation Forest
 """
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
 import numpy as np
 from sklearn.ensemble import IsolationForest
 
@@ -26,6 +34,68 @@ from synth_lab.domain.entities import (
     OutlierSynth,
     SynthOutcome)
 
+# Max cached forests (one per analysis/feature set)
+FOREST_CACHE_MAX_ENTRIES = 64
+
+
+@dataclass
+class ForestScores:
+    """Fitted Isolation Forest and anomaly scores for one analysis."""
+
+    forest: IsolationForest
+    scores: np.ndarray
+    synth_ids: list[str]
+    index_of: dict[str, int]
+    features_used: list[str]
+
+
+class ForestScoreCache:
+    """
+    Thread-safe LRU cache of fitted forests and their anomaly scores.
+
+    Keyed by (analysis_id, feature set). Outcomes of a completed analysis do
+    not change (re-running creates a new analysis ID).
+    """
+
+    def __init__(self, max_entries: int = FOREST_CACHE_MAX_ENTRIES):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of forests kept (least recently used evicted).
+        """
+        self._entries: OrderedDict[tuple, ForestScores] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> ForestScores | None:
+        """Get cached forest scores (or None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: tuple, entry: ForestScores) -> None:
+        """Store forest scores, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached forests."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared across OutlierService instances (routers create one per request)
+_forest_cache = ForestScoreCache()
+
 
 class OutlierService:
     """Service for identifying extreme cases and outliers in simulations."""
@@ -54,25 +124,18 @@ class OutlierService:
         if len(outcomes) < 10:
             raise ValueError(f"Extreme cases requires at least 10 synths, got {len(outcomes)}")
 
-        # Sort by success rate (ascending) for worst failures
-        sorted_by_failure = sorted(
-            outcomes, key=lambda x: x.success_rate, reverse=False
-        )
-
-        # Sort by success rate (descending) for best successes
-        sorted_by_success = sorted(outcomes, key=lambda x: x.success_rate, reverse=True)
-
-        # Get top N from each category
+        # Top-k selection (O(N)) instead of full sorts
         n_actual = min(n_per_category, len(outcomes))
+        success_rates = np.array([o.success_rate for o in outcomes])
 
         worst_failures = [
-            self._create_extreme_synth(synth, "worst_failure")
-            for synth in sorted_by_failure[:n_actual]
+            self._create_extreme_synth(outcomes[idx], "worst_failure")
+            for idx in self._top_k_indices(success_rates, n_actual, largest=False)
         ]
 
         best_successes = [
-            self._create_extreme_synth(synth, "best_success")
-            for synth in sorted_by_success[:n_actual]
+            self._create_extreme_synth(outcomes[idx], "best_success")
+            for idx in self._top_k_indices(success_rates, n_actual, largest=True)
         ]
 
         # Find unexpected cases (high capability but failed OR low capability but succeeded)
@@ -109,33 +172,25 @@ class OutlierService:
         if len(outcomes) < 10:
             raise ValueError(f"Outlier detection requires at least 10 synths, got {len(outcomes)}")
 
-        # Extract features
-        X, synth_ids, features_used = self._extract_features(outcomes, features)
-
-        # Train Isolation Forest
-        iso_forest = IsolationForest(
-            contamination=contamination,
-            random_state=42,
-            n_estimators=100)
-
-        # Fit and predict (-1 = outlier, 1 = inlier)
-        predictions = iso_forest.fit_predict(X)
-        anomaly_scores = iso_forest.score_samples(X)
+        entry = self._get_forest_scores(simulation_id, outcomes, features)
+        anomaly_scores = entry.scores
+        if any(o.synth_id != sid for o, sid in zip(outcomes, entry.synth_ids)):
+            # Outcomes passed in a different order than when cached
+            anomaly_scores = anomaly_scores[[entry.index_of[o.synth_id] for o in outcomes]]
 
-        # Extract outliers
-        outlier_indices = np.where(predictions == -1)[0]
+        # Same threshold as IsolationForest(contamination=...).fit_predict
+        threshold = np.percentile(anomaly_scores, 100.0 * contamination)
+        outlier_indices = np.where(anomaly_scores < threshold)[0]
         outlier_synths = []
 
         for idx in outlier_indices:
-            synth_id = synth_ids[idx]
-            synth = next(o for o in outcomes if o.synth_id == synth_id)
-
+            synth = outcomes[idx]
             outlier_type = self._classify_outlier_type(synth)
             explanation = self._generate_outlier_explanation(synth, outlier_type)
 
             outlier_synths.append(
                 OutlierSynth(
-                    synth_id=synth_id,
+                    synth_id=synth.synth_id,
                     outlier_type=outlier_type,
                     anomaly_score=float(anomaly_scores[idx]),
                     success_rate=synth.success_rate,
@@ -156,7 +211,63 @@ class OutlierService:
             outliers=outlier_synths,
             total_synths=len(outcomes),
             n_outliers=len(outlier_synths),
+            features_used=entry.features_used)
+
+    def _get_forest_scores(
+        self,
+        simulation_id: str,
+        outcomes: list[SynthOutcome],
+        features: list[str] | None = None) -> ForestScores:
+        """
+        Get the fitted forest and anomaly scores for an analysis (cached).
+
+        Args:
+            simulation_id: Simulation identifier (cache key).
+            outcomes: List of synth outcomes.
+            features: Features to use (default: latent traits + outcomes).
+
+        Returns:
+            ForestScores with scores aligned to the fitted synth order.
+        """
+        key = (simulation_id, tuple(features) if features else None, len(outcomes))
+        entry = _forest_cache.get(key)
+        if entry is not None:
+            return entry
+
+        X, synth_ids, features_used = self._extract_features(outcomes, features)
+
+        # contamination only sets offset_; scores are computed once
+        iso_forest = IsolationForest(random_state=42, n_estimators=100)
+        iso_forest.fit(X)
+
+        entry = ForestScores(
+            forest=iso_forest,
+            scores=iso_forest.score_samples(X),
+            synth_ids=synth_ids,
+            index_of={synth_id: i for i, synth_id in enumerate(synth_ids)},
             features_used=features_used)
+        _forest_cache.set(key, entry)
+        return entry
+
+    @staticmethod
+    def _top_k_indices(values: np.ndarray, k: int, largest: bool) -> np.ndarray:
+        """
+        Indices of the k smallest (or largest) values, sorted, via argpartition.
+
+        Ties keep the original order (like a stable sort).
+        """
+        if k <= 0:
+            return np.array([], dtype=int)
+        keys = -values if largest else values
+        if k < len(keys):
+            # kth smallest key; ties at the boundary go to the earliest indices
+            kth = keys[np.argpartition(keys, k - 1)[k - 1]]
+            below = np.flatnonzero(keys < kth)
+            tied = np.flatnonzero(keys == kth)[: k - len(below)]
+            candidates = np.concatenate([below, tied])
+        else:
+            candidates = np.arange(len(keys))
+        return candidates[np.lexsort((candidates, keys[candidates]))]
 
     def _create_extreme_synth(self, outcome: SynthOutcome, category: str) -> ExtremeSynth:
         """Create ExtremeSynth entity with profile and questions."""
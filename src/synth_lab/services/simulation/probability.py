@@ -9,6 +9,7 @@ Functions:
 - calculate_p_attempt(): Probability user attempts the feature
 - calculate_p_success(): Probability of success given attempt
 - sample_outcome(): Sample outcome based on probabilities
+- attempt_probability() / success_probability(): Vectorized (numpy) versions
 
 References:
     - Spec: specs/016-feature-impact-simulation/spec.md
@@ -37,6 +38,25 @@ from synth_lab.services.simulation.sample_state import UserState
 # Type alias for outcomes
 Outcome = Literal["did_not_try", "failed", "success"]
 
+# Logit weights for P(attempt) (from research.md calibration)
+ATTEMPT_WEIGHTS = {
+    "motivation": 2.0,
+    "trust": 1.5,
+    "risk": 2.0,
+    "effort": 1.5,
+    "explore": 1.0,
+    "intercept": 0.0,
+}
+
+# Logit weights for P(success | attempt) (from research.md calibration)
+SUCCESS_WEIGHTS = {
+    "capability": 2.5,
+    "friction": 1.5,
+    "complexity": 2.0,
+    "ttv": 1.5,
+    "intercept": 0.0,
+}
+
 
 def sigmoid(x: float) -> float:
     """
@@ -99,26 +119,10 @@ def calculate_p_attempt(
     perceived_risk = scorecard_scores.get("perceived_risk", 0.5)
     initial_effort = scorecard_scores.get("initial_effort", 0.5)
 
-    # Weights (from research.md calibration)
-    w_motivation = 2.0
-    w_trust = 1.5
-    w_risk = 2.0
-    w_effort = 1.5
-    w_explore = 1.0
-    intercept = 0.0
-
-    # Calculate logit
-    logit = (
-        w_motivation * motivation
-        + w_trust * trust
-        - w_risk * perceived_risk
-        - w_effort * initial_effort
-        + w_explore * explores
-        + intercept
+    return float(
+        attempt_probability(motivation, trust, explores, perceived_risk, initial_effort)
     )
 
-    return sigmoid(logit)
-
 
 def calculate_p_success(
     user_state: UserState,
@@ -154,23 +158,70 @@ def calculate_p_success(
     complexity = scorecard_scores.get("complexity", 0.5)
     time_to_value = scorecard_scores.get("time_to_value", 0.5)
 
-    # Weights (from research.md calibration)
-    w_capability = 2.5
-    w_friction = 1.5
-    w_complexity = 2.0
-    w_ttv = 1.5
-    intercept = 0.0
+    return float(success_probability(capability, friction_tolerance, complexity, time_to_value))
+
 
-    # Calculate logit
+def attempt_probability(
+    motivation: float | np.ndarray,
+    trust: float | np.ndarray,
+    explores: float | np.ndarray,
+    perceived_risk: float,
+    initial_effort: float) -> np.ndarray:
+    """
+    Vectorized P(attempt) for arrays of user states.
+
+    Same formula as calculate_p_attempt(); inputs broadcast with numpy rules.
+
+    Args:
+        motivation: Motivation value(s)
+        trust: Trust value(s)
+        explores: Exploration indicator(s) (0/1)
+        perceived_risk: Scorecard perceived_risk score
+        initial_effort: Scorecard initial_effort score
+
+    Returns:
+        np.ndarray: P(attempt) with the broadcast shape of the inputs
+    """
+    w = ATTEMPT_WEIGHTS
     logit = (
-        w_capability * capability
-        + w_friction * friction_tolerance
-        - w_complexity * complexity
-        - w_ttv * time_to_value
-        + intercept
+        w["motivation"] * np.asarray(motivation, dtype=float)
+        + w["trust"] * np.asarray(trust, dtype=float)
+        - w["risk"] * perceived_risk
+        - w["effort"] * initial_effort
+        + w["explore"] * np.asarray(explores, dtype=float)
+        + w["intercept"]
     )
+    return 1.0 / (1.0 + np.exp(-logit))
+
+
+def success_probability(
+    capability: float | np.ndarray,
+    friction_tolerance: float | np.ndarray,
+    complexity: float,
+    time_to_value: float) -> np.ndarray:
+    """
+    Vectorized P(success | attempt) for arrays of user states.
+
+    Same formula as calculate_p_success(); inputs broadcast with numpy rules.
 
-    return sigmoid(logit)
+    Args:
+        capability: Capability value(s)
+        friction_tolerance: Friction tolerance value(s)
+        complexity: Scorecard complexity score
+        time_to_value: Scorecard time_to_value score
+
+    Returns:
+        np.ndarray: P(success | attempt) with the broadcast shape of the inputs
+    """
+    w = SUCCESS_WEIGHTS
+    logit = (
+        w["capability"] * np.asarray(capability, dtype=float)
+        + w["friction"] * np.asarray(friction_tolerance, dtype=float)
+        - w["complexity"] * complexity
+        - w["ttv"] * time_to_value
+        + w["intercept"]
+    )
+    return 1.0 / (1.0 + np.exp(-logit))
 
 
 def sample_outcome(
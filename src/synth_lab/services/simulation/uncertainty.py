@@ -0,0 +1,303 @@
+"""
+Uncertainty estimates for Monte Carlo outcome rates.
+
+Per-synth rates are binomial proportions over M executions: their standard
+error and Wilson score interval are computed for all synths at once.
+Aggregate rates (mean over synths) get a percentile bootstrap interval over
+synths; resamples are split into chunks with independent random streams
+and computed in a shared thread pool (numpy releases the GIL). Two
+simulations of the same synths are compared by bootstrapping the paired
+per-synth difference; many simulations are compared pairwise from one set of
+resample counts.
+
+References:
+    - Engine: services/simulation/engine.py
+    - Wilson (1927), "Probable inference, the law of succession, and
+      statistical inference"
+    - Efron & Tibshirani (1993), "An Introduction to the Bootstrap"
+
+Sample usage:
+    from synth_lab.services.simulation.uncertainty import bootstrap_mean_interval, wilson_interval
+
+    low, high = wilson_interval(np.array([42, 7]), n=100, confidence=0.95)
+    interval = bootstrap_mean_interval(per_synth_success, confidence=0.95, seed=42)
+
+Expected output:
+    RateInterval(estimate=0.41, std_error=0.012, ci_low=0.387, ci_high=0.434)
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+
+# Default number of bootstrap resamples for aggregate intervals
+DEFAULT_BOOTSTRAP_RESAMPLES = 1000
+
+# Resamples per parallel chunk (small jobs run in a single chunk)
+BOOTSTRAP_CHUNK_SIZE = 250
+
+# Threads for resample chunks
+BOOTSTRAP_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RateInterval:
+    """Point estimate of a rate with standard error and confidence interval."""
+
+    estimate: float
+    std_error: float
+    ci_low: float
+    ci_high: float
+
+    def rounded(self, digits: int = 3) -> "RateInterval":
+        """Copy rounded like the engine's reported rates."""
+        return RateInterval(
+            estimate=round(self.estimate, digits),
+            std_error=round(self.std_error, digits),
+            ci_low=round(self.ci_low, digits),
+            ci_high=round(self.ci_high, digits))
+
+
+def z_score(confidence: float) -> float:
+    """Two-sided normal critical value for a confidence level."""
+    if not 0.0 < confidence < 1.0:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    return float(stats.norm.ppf(0.5 + confidence / 2.0))
+
+
+def binomial_std_error(rates: np.ndarray, n: int) -> np.ndarray:
+    """Standard error of binomial proportions estimated from n trials."""
+    rates = np.asarray(rates, dtype=np.float64)
+    return np.sqrt(rates * (1.0 - rates) / n)
+
+
+def wilson_interval(
+    counts: np.ndarray, n: int, confidence: float = 0.95
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Wilson score interval for binomial counts (vectorized).
+
+    Unlike the normal approximation it stays inside [0, 1] and behaves well
+    for rates near 0 or 1, which are common for individual synths.
+
+    Args:
+        counts: Event counts, any shape.
+        n: Number of trials per count.
+        confidence: Confidence level.
+
+    Returns:
+        Tuple of (lower, upper) arrays with the shape of counts.
+    """
+    z = z_score(confidence)
+    p = np.asarray(counts, dtype=np.float64) / n
+    z2n = z * z / n
+    center = (p + z2n / 2.0) / (1.0 + z2n)
+    half_width = z * np.sqrt(p * (1.0 - p) / n + z2n / (4.0 * n)) / (1.0 + z2n)
+    return np.clip(center - half_width, 0.0, 1.0), np.clip(center + half_width, 0.0, 1.0)
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Get or create the thread pool shared by all bootstrap calls."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(
+                max_workers=BOOTSTRAP_MAX_WORKERS, thread_name_prefix="bootstrap")
+        return _pool
+
+
+def _bootstrap_means(
+    values: np.ndarray, n_resamples: int, seed: np.random.SeedSequence
+) -> np.ndarray:
+    """Means of n_resamples bootstrap resamples of the rows of values."""
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(values), size=(n_resamples, len(values)))
+    return values[idx].mean(axis=1)
+
+
+def bootstrap_mean_intervals(
+    values: np.ndarray,
+    confidence: float = 0.95,
+    n_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    seed: int | np.random.SeedSequence | None = None) -> list[RateInterval]:
+    """
+    Percentile bootstrap intervals for the column means of values.
+
+    Synths (rows) are resampled with replacement; all columns share the same
+    resamples, so intervals of rates that sum to 1 stay consistent.
+
+    Args:
+        values: Array of shape (n_synths, n_rates).
+        confidence: Confidence level.
+        n_resamples: Number of bootstrap resamples.
+        seed: Seed (or SeedSequence) for reproducibility.
+
+    Returns:
+        One RateInterval per column.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    n_rows, n_cols = values.shape
+    if n_rows == 0:
+        return [RateInterval(0.0, 0.0, 0.0, 0.0) for _ in range(n_cols)]
+
+    estimates = values.mean(axis=0)
+    if n_rows == 1:
+        return [RateInterval(float(e), 0.0, float(e), float(e)) for e in estimates]
+
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    chunk_sizes = [BOOTSTRAP_CHUNK_SIZE] * (n_resamples // BOOTSTRAP_CHUNK_SIZE)
+    if n_resamples % BOOTSTRAP_CHUNK_SIZE:
+        chunk_sizes.append(n_resamples % BOOTSTRAP_CHUNK_SIZE)
+    seeds = root.spawn(len(chunk_sizes))
+
+    if len(chunk_sizes) == 1 or BOOTSTRAP_MAX_WORKERS == 1:
+        means = np.concatenate(
+            [_bootstrap_means(values, size, seq) for size, seq in zip(chunk_sizes, seeds)])
+    else:
+        chunks = _get_pool().map(
+            _bootstrap_means, [values] * len(chunk_sizes), chunk_sizes, seeds)
+        means = np.concatenate(list(chunks))
+
+    alpha = (1.0 - confidence) / 2.0
+    lows, highs = np.quantile(means, [alpha, 1.0 - alpha], axis=0)
+    std_errors = means.std(axis=0, ddof=1)
+    return [
+        RateInterval(
+            estimate=float(estimates[j]),
+            std_error=float(std_errors[j]),
+            ci_low=float(lows[j]),
+            ci_high=float(highs[j]))
+        for j in range(n_cols)
+    ]
+
+
+def bootstrap_mean_interval(
+    values: np.ndarray,
+    confidence: float = 0.95,
+    n_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    seed: int | np.random.SeedSequence | None = None) -> RateInterval:
+    """Percentile bootstrap interval for the mean of a 1-D array."""
+    return bootstrap_mean_intervals(
+        np.asarray(values)[:, None], confidence, n_resamples, seed)[0]
+
+
+def paired_difference_interval(
+    values: np.ndarray,
+    baseline: np.ndarray,
+    confidence: float = 0.95,
+    n_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    seed: int | np.random.SeedSequence | None = None) -> RateInterval:
+    """
+    Percentile bootstrap interval for the mean paired difference values - baseline.
+
+    Each synth's difference is resampled as a unit, so variance shared by both
+    simulations (the synth's traits) cancels. The difference is significant
+    when the interval excludes 0.
+
+    Args:
+        values: Per-synth rates of one simulation.
+        baseline: Rates of the same synths, in the same order, in the other.
+        confidence: Confidence level.
+        n_resamples: Number of bootstrap resamples.
+        seed: Seed (or SeedSequence) for reproducibility.
+    """
+    differences = np.asarray(values, dtype=np.float64) - np.asarray(baseline, dtype=np.float64)
+    return bootstrap_mean_interval(differences, confidence, n_resamples, seed)
+
+
+def paired_difference_lower_bounds(
+    values: np.ndarray,
+    confidence: float = 0.95,
+    n_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    seed: int | np.random.SeedSequence | None = None) -> np.ndarray:
+    """
+    Lower bootstrap bounds of the mean paired difference for every pair of simulations.
+
+    All pairs share one set of synth resamples, drawn as per-synth counts. The
+    resampled mean of a difference is then the difference of resampled means,
+    so each simulation's resampled means come from a single matrix product.
+
+    Args:
+        values: Array of shape (n_simulations, n_synths); every row holds the
+            rates of the same synths, in the same order.
+        confidence: Confidence level (two-sided, as in paired_difference_interval).
+        n_resamples: Number of bootstrap resamples.
+        seed: Seed (or SeedSequence) for reproducibility.
+
+    Returns:
+        Array of shape (n_simulations, n_simulations) whose [i, j] entry is the
+        lower bound of mean(values[i] - values[j]); i beats j when it is > 0.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_synths = values.shape[1]
+    if n_synths < 2:
+        means = values.mean(axis=1) if n_synths else np.zeros(len(values))
+        return means[:, None] - means[None, :]
+
+    rng = np.random.default_rng(seed)
+    counts = rng.multinomial(n_synths, np.full(n_synths, 1.0 / n_synths), size=n_resamples)
+    resampled = values @ counts.T / n_synths
+    differences = resampled[:, None, :] - resampled[None, :, :]
+    return np.quantile(differences, (1.0 - confidence) / 2.0, axis=2)
+
+
+if __name__ == "__main__":
+    import sys
+
+    all_validation_failures = []
+    total_tests = 0
+
+    # Test 1: Wilson interval contains the estimate and stays in [0, 1]
+    total_tests += 1
+    low, high = wilson_interval(np.array([0, 50, 100]), n=100)
+    if not (np.all(low >= 0) and np.all(high <= 1) and low[1] < 0.5 < high[1]):
+        all_validation_failures.append(f"Wilson bounds: {low}, {high}")
+    if not (low[0] < 1e-12 and high[0] > 0.0):
+        all_validation_failures.append(f"Wilson at p=0 should have positive upper bound: {high[0]}")
+
+    # Test 2: Bootstrap is reproducible and covers the mean
+    total_tests += 1
+    rng = np.random.default_rng(0)
+    sample = rng.uniform(0.2, 0.6, size=200)
+    a = bootstrap_mean_interval(sample, seed=42)
+    b = bootstrap_mean_interval(sample, seed=42)
+    if a != b:
+        all_validation_failures.append(f"Bootstrap not reproducible: {a} vs {b}")
+    if not a.ci_low < a.estimate < a.ci_high:
+        all_validation_failures.append(f"Interval does not cover estimate: {a}")
+
+    # Test 3: Standard error close to analytical value
+    total_tests += 1
+    expected_se = sample.std(ddof=1) / np.sqrt(len(sample))
+    if abs(a.std_error - expected_se) > expected_se * 0.2:
+        all_validation_failures.append(f"SE {a.std_error:.4f} far from {expected_se:.4f}")
+
+    # Test 4: Paired difference of a consistent small gain excludes 0
+    total_tests += 1
+    gain = paired_difference_interval(sample + 0.01, sample, seed=42)
+    if not (gain.ci_low > 0.0 and abs(gain.estimate - 0.01) < 1e-9):
+        all_validation_failures.append(f"Paired difference: {gain}")
+
+    # Test 5: Pairwise bounds rank a consistent gain above its baseline only
+    total_tests += 1
+    bounds = paired_difference_lower_bounds(np.stack([sample, sample + 0.01]), seed=42)
+    if not (bounds[1, 0] > 0.0 and bounds[0, 1] < 0.0 and bounds.shape == (2, 2)):
+        all_validation_failures.append(f"Pairwise bounds: {bounds}")
+
+    if all_validation_failures:
+        print(f"VALIDATION FAILED - {len(all_validation_failures)} of {total_tests} tests failed:")
+        for failure in all_validation_failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    else:
+        print(f"VALIDATION PASSED - All {total_tests} tests produced expected results")
+        sys.exit(0)
@@ -26,7 +26,8 @@ For documentation, see: specs/008-trace-visualizer/quickstart.md
 """
 
 from .models import SpanStatus, SpanType, Step, Trace, Turn
-from .persistence import load_trace, save_trace
+from .persistence import load_trace, save_trace, save_trace_async
+from .stream import TraceReader, TraceStreamWriter
 from .tracer import Span, Tracer
 
 __all__ = [
@@ -38,5 +39,8 @@ __all__ = [
     "Turn",
     "Step",
     "save_trace",
+    "save_trace_async",
     "load_trace",
+    "TraceReader",
+    "TraceStreamWriter",
 ]
@@ -24,13 +24,23 @@ print(f"Loaded trace: {trace.trace_id}")
 ```
 """
 
+import atexit
 import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
 
+from loguru import logger
+
 from .models import SpanStatus, SpanType, Step, Trace, Turn
 
+# Single background writer shared by the process (writes are I/O bound and ordered)
+_writer: ThreadPoolExecutor | None = None
+_writer_lock = threading.Lock()
+_pending_writes: set[Future] = set()
+
 
 def save_trace(trace: Trace, path: str) -> None:
     """
@@ -62,14 +72,79 @@ def save_trace(trace: Trace, path: str) -> None:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
+def _get_writer() -> ThreadPoolExecutor:
+    """Get or create the background trace writer."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-writer")
+            atexit.register(flush_pending_writes)
+        return _writer
+
+
+def _write_trace_dict(data: Dict[str, Any], path: str) -> None:
+    """Write an already-serialized trace dict to disk."""
+    file_path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, "w") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def save_trace_async(trace: Trace, path: str) -> Future:
+    """
+    Save trace to JSON file in a background writer thread.
+
+    The trace is converted to a dict immediately (snapshot), so later changes
+    to the Trace object do not affect the written file.
+
+    Args:
+        trace: Trace object to save
+        path: Output file path (recommend .trace.json extension)
+
+    Returns:
+        Future resolved when the file is written (errors are logged)
+
+    Example:
+        future = save_trace_async(trace, "output/traces/conv-123.trace.json")
+        future.result()  # optional: wait for the write
+    """
+    data = trace.to_dict()
+    future = _get_writer().submit(_write_trace_dict, data, path)
+    _pending_writes.add(future)
+
+    def _on_done(f: Future) -> None:
+        _pending_writes.discard(f)
+        if f.exception() is not None:
+            logger.warning(f"Failed to save trace {path}: {f.exception()}")
+
+    future.add_done_callback(_on_done)
+    return future
+
+
+def flush_pending_writes(timeout: float | None = None) -> None:
+    """
+    Wait for all background trace writes to finish.
+
+    Args:
+        timeout: Optional maximum time to wait per pending write (seconds)
+    """
+    for future in list(_pending_writes):
+        try:
+            future.result(timeout=timeout)
+        except Exception:
+            pass  # Already logged by the done callback
+
+
 def load_trace(path: str) -> Trace:
     """
     Load trace from JSON file.
 
     Deserializes JSON back to Trace object with all entities.
+    Streamed traces (.jsonl) are read with stream.TraceReader; use the reader
+    directly to load individual turns lazily.
 
     Args:
-        path: Path to .trace.json file
+        path: Path to .trace.json or .trace.jsonl file
 
     Returns:
         Trace object reconstructed from JSON
@@ -88,6 +163,11 @@ def load_trace(path: str) -> Trace:
     if not file_path.exists():
         raise FileNotFoundError(f"Trace file not found: {path}")
 
+    if file_path.suffix == ".jsonl":
+        from .stream import TraceReader
+
+        return TraceReader(path).load_trace()
+
     # Load JSON data
     with open(file_path) as f:
         data = json.load(f)
@@ -0,0 +1,384 @@
+"""
+Streaming (append-only) trace persistence.
+
+Writes traces incrementally as line-delimited JSON (.trace.jsonl) while the
+conversation runs, plus a sidecar offset index (.trace.jsonl.idx) so readers
+can load a single turn without parsing the whole file.
+
+File layout (one JSON record per line):
+- {"record": "trace", ...}  header (trace_id, start_time, metadata)
+- {"record": "step", ...}   one completed step (written when the span ends)
+- {"record": "turn", ...}   turn summary with byte offsets of its steps
+- {"record": "end", ...}    trace end_time/duration (absent if interrupted)
+
+Index layout (one JSON record per line, one per turn):
+- {"turn_number": 1, "turn_id": "...", "offset": 1234, "length": 210}
+
+If the index is missing (e.g. copied without it), TraceReader rebuilds it by
+scanning the trace file once.
+
+References:
+- JSON Lines: https://jsonlines.org/
+- JSON schema: specs/008-trace-visualizer/data-model.md
+
+Sample usage:
+```python
+from synth_lab.trace_visualizer import Tracer
+from synth_lab.trace_visualizer.stream import TraceReader
+
+tracer = Tracer(trace_id="conv-123", stream_path="output/traces/conv-123.trace.jsonl")
+# ... record turns and spans (written as they complete) ...
+tracer.close_stream()
+
+reader = TraceReader("output/traces/conv-123.trace.jsonl")
+turn = reader.load_turn(3)  # reads only turn 3
+trace = reader.load_trace()  # full Trace object
+```
+"""
+
+import json
+from concurrent.futures import Future
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from .models import Step, Trace, Turn
+from .persistence import _deserialize_step, _get_writer, _pending_writes
+
+TRACE_STREAM_FORMAT = "synth-lab-trace-stream/1"
+INDEX_SUFFIX = ".idx"
+
+
+def _encode_line(record: Dict[str, Any]) -> bytes:
+    """Encode a record as one UTF-8 JSON line."""
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _append_bytes(path: Path, data: bytes, truncate: bool = False) -> None:
+    """Append (or write, if truncate) raw bytes to a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb" if truncate else "ab") as f:
+        f.write(data)
+
+
+class TraceStreamWriter:
+    """
+    Append-only writer for .trace.jsonl files.
+
+    Records are encoded in the caller (so byte offsets are known immediately)
+    and appended by the shared background trace writer, which runs writes in
+    submission order without blocking the event loop.
+
+    Sample input:
+    ```python
+    writer = TraceStreamWriter("trace.jsonl", trace_id="conv-123", start_time=now)
+    writer.write_step(turn, step)
+    writer.write_turn(turn)
+    writer.close(tracer.trace)
+    ```
+
+    Expected output:
+    - trace.jsonl with header, step, turn and end records
+    - trace.jsonl.idx with one offset entry per turn
+    """
+
+    def __init__(
+        self,
+        path: str,
+        trace_id: str,
+        start_time: datetime,
+        metadata: Optional[Dict[str, str]] = None,
+        background: bool = True,
+    ):
+        """
+        Initialize writer and write the trace header.
+
+        Args:
+            path: Output file path (.trace.jsonl recommended)
+            trace_id: Trace identifier
+            start_time: Trace start time
+            metadata: Optional trace metadata
+            background: Append in the background writer thread (False = inline)
+        """
+        self.path = Path(path)
+        self.index_path = Path(f"{path}{INDEX_SUFFIX}")
+        self._background = background
+        self._offset = 0
+        self._step_offsets: Dict[str, list[list[int]]] = {}
+        self._closed = False
+        self._last_write: Optional[Future] = None
+
+        header = _encode_line({
+            "record": "trace",
+            "format": TRACE_STREAM_FORMAT,
+            "trace_id": trace_id,
+            "start_time": start_time.isoformat(),
+            "metadata": metadata or {},
+        })
+        self._submit(self.path, header, truncate=True)
+        self._submit(self.index_path, b"", truncate=True)
+        self._offset = len(header)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the end record has been written."""
+        return self._closed
+
+    def _submit(self, path: Path, data: bytes, truncate: bool = False) -> None:
+        """Write bytes inline or through the background writer."""
+        if not self._background:
+            _append_bytes(path, data, truncate)
+            return
+
+        future = _get_writer().submit(_append_bytes, path, data, truncate)
+        _pending_writes.add(future)
+
+        def _on_done(f: Future) -> None:
+            _pending_writes.discard(f)
+            if f.exception() is not None:
+                logger.warning(f"Failed to append to trace {path}: {f.exception()}")
+
+        future.add_done_callback(_on_done)
+        self._last_write = future
+
+    def _append(self, record: Dict[str, Any]) -> tuple[int, int]:
+        """Append a record to the trace file and return its (offset, length)."""
+        if self._closed:
+            raise RuntimeError(f"Trace stream already closed: {self.path}")
+        line = _encode_line(record)
+        offset = self._offset
+        self._offset += len(line)
+        self._submit(self.path, line)
+        return offset, len(line)
+
+    def write_step(self, turn: Turn, step: Step) -> None:
+        """
+        Append a completed step.
+
+        Args:
+            turn: Turn the step belongs to
+            step: Completed step
+        """
+        offset, length = self._append({
+            "record": "step",
+            "turn_id": turn.turn_id,
+            "turn_number": turn.turn_number,
+            **step.to_dict(),
+        })
+        self._step_offsets.setdefault(turn.turn_id, []).append([offset, length])
+
+    def write_turn(self, turn: Turn) -> None:
+        """
+        Append a completed turn summary and its index entry.
+
+        Args:
+            turn: Completed turn (its steps must already be written)
+        """
+        offset, length = self._append({
+            "record": "turn",
+            "turn_id": turn.turn_id,
+            "turn_number": turn.turn_number,
+            "start_time": turn.start_time.isoformat(),
+            "end_time": turn.end_time.isoformat(),
+            "duration_ms": turn.duration_ms,
+            "steps": self._step_offsets.pop(turn.turn_id, []),
+        })
+        self._submit(self.index_path, _encode_line({
+            "turn_number": turn.turn_number,
+            "turn_id": turn.turn_id,
+            "offset": offset,
+            "length": length,
+        }))
+
+    def close(self, trace: Trace) -> Optional[Future]:
+        """
+        Append the end record. Further writes raise RuntimeError.
+
+        Args:
+            trace: Final trace (for end_time and duration_ms)
+
+        Returns:
+            Future of the last background write (None when writing inline)
+        """
+        if self._closed:
+            return self._last_write
+        self._append({
+            "record": "end",
+            "end_time": trace.end_time.isoformat(),
+            "duration_ms": trace.duration_ms,
+        })
+        self._closed = True
+        return self._last_write if self._background else None
+
+
+class TraceReader:
+    """
+    Lazy reader for .trace.jsonl files.
+
+    Only the header and the index are read on open; turns and steps are read
+    on demand by seeking to their byte offsets.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a streamed trace.
+
+        Args:
+            path: Path to .trace.jsonl file
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If the file is not a streamed trace
+        """
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Trace file not found: {path}")
+
+        with open(self.path, "rb") as f:
+            first_line = f.readline()
+        try:
+            self.header = json.loads(first_line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid trace stream header: {e}")
+        if self.header.get("record") != "trace":
+            raise ValueError(f"Not a streamed trace file: {path}")
+
+        self._index = self._load_index()
+
+    @property
+    def trace_id(self) -> str:
+        """Trace identifier from the header."""
+        return self.header["trace_id"]
+
+    @property
+    def metadata(self) -> Dict[str, str]:
+        """Trace metadata from the header."""
+        return self.header.get("metadata", {})
+
+    @property
+    def turn_numbers(self) -> list[int]:
+        """Turn numbers available in the trace, in write order."""
+        return list(self._index)
+
+    def _load_index(self) -> Dict[int, tuple[int, int]]:
+        """Load the sidecar index, rebuilding it from the trace if missing or stale."""
+        index_path = Path(f"{self.path}{INDEX_SUFFIX}")
+        index: Dict[int, tuple[int, int]] = {}
+        if index_path.exists():
+            with open(index_path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # Partial last line (interrupted write)
+                    index[entry["turn_number"]] = (entry["offset"], entry["length"])
+            if index or self.path.stat().st_size == 0:
+                return index
+        return self._scan_index()
+
+    def _scan_index(self) -> Dict[int, tuple[int, int]]:
+        """Build the turn index by scanning the trace file once."""
+        index: Dict[int, tuple[int, int]] = {}
+        offset = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if b'"record": "turn"' in line:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    index[record["turn_number"]] = (offset, len(line))
+                offset += len(line)
+        return index
+
+    def _read_record(self, f, offset: int, length: int) -> Dict[str, Any]:
+        """Read one record at a byte offset."""
+        f.seek(offset)
+        return json.loads(f.read(length))
+
+    def load_turn(self, turn_number: int) -> Turn:
+        """
+        Load a single turn with its steps.
+
+        Args:
+            turn_number: Turn number (1-indexed)
+
+        Returns:
+            Turn object
+
+        Raises:
+            KeyError: If the turn is not in the trace
+            ValueError: If records are invalid
+        """
+        if turn_number not in self._index:
+            raise KeyError(f"Turn {turn_number} not found in {self.path}")
+
+        with open(self.path, "rb") as f:
+            return self._load_turn(f, *self._index[turn_number])
+
+    def _load_turn(self, f, offset: int, length: int) -> Turn:
+        """Load a turn record and its steps from an open file."""
+        try:
+            record = self._read_record(f, offset, length)
+            steps = [
+                _deserialize_step(self._read_record(f, step_offset, step_length))
+                for step_offset, step_length in record["steps"]
+            ]
+            return Turn(
+                turn_id=record["turn_id"],
+                turn_number=record["turn_number"],
+                start_time=datetime.fromisoformat(record["start_time"]),
+                end_time=datetime.fromisoformat(record["end_time"]),
+                duration_ms=record["duration_ms"],
+                steps=steps,
+            )
+        except KeyError as e:
+            raise ValueError(f"Invalid turn record: missing field {e}")
+
+    def load_trace(self) -> Trace:
+        """
+        Load the full trace.
+
+        Traces without an end record (interrupted interviews) use the last
+        turn's end_time.
+
+        Returns:
+            Trace object with all indexed turns
+        """
+        with open(self.path, "rb") as f:
+            turns = [self._load_turn(f, *entry) for entry in self._index.values()]
+            end_record = self._read_end_record(f)
+
+        start_time = datetime.fromisoformat(self.header["start_time"])
+        if end_record is not None:
+            end_time = datetime.fromisoformat(end_record["end_time"])
+            duration_ms = end_record["duration_ms"]
+        else:
+            end_time = turns[-1].end_time if turns else start_time
+            duration_ms = int((end_time - start_time).total_seconds() * 1000)
+
+        return Trace(
+            trace_id=self.trace_id,
+            start_time=start_time,
+            end_time=end_time,
+            duration_ms=duration_ms,
+            turns=turns,
+            metadata=self.metadata,
+        )
+
+    def _read_end_record(self, f) -> Optional[Dict[str, Any]]:
+        """Read the end record from the tail of the file, if present."""
+        size = self.path.stat().st_size
+        f.seek(max(0, size - 4096))
+        lines = f.read().splitlines()
+        if not lines:
+            return None
+        try:
+            record = json.loads(lines[-1])
+        except json.JSONDecodeError:
+            return None
+        return record if record.get("record") == "end" else None
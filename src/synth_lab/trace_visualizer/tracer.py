@@ -29,11 +29,20 @@ tracer.save_trace("output/traces/weather.trace.json")
 """
 
 import uuid
+from concurrent.futures import Future
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any, Dict, Generator, Optional
 
 from .models import SpanStatus, SpanType, Step, Trace, Turn
+from .stream import TraceStreamWriter
+
+
+def _truncate_value(value: Any, max_chars: Optional[int]) -> Any:
+    """Truncate string values longer than max_chars (None = no limit)."""
+    if max_chars is None or not isinstance(value, str) or len(value) <= max_chars:
+        return value
+    return value[:max_chars] + f"... (truncated, {len(value)} chars total)"
 
 
 class Span:
@@ -44,9 +53,10 @@ class Span:
     Provides methods to set attributes and status during span execution.
     """
 
-    def __init__(self, step: Step):
+    def __init__(self, step: Step, max_attribute_chars: Optional[int] = None):
         """Initialize span with reference to Step being recorded."""
         self._step = step
+        self._max_attribute_chars = max_attribute_chars
 
     def set_attribute(self, key: str, value: Any) -> None:
         """
@@ -60,7 +70,7 @@ class Span:
             span.set_attribute("response", "The weather is sunny")
             span.set_attribute("tokens_output", 42)
         """
-        self._step.attributes[key] = value
+        self._step.attributes[key] = _truncate_value(value, self._max_attribute_chars)
 
     def set_status(self, status: str | SpanStatus) -> None:
         """
@@ -106,6 +116,9 @@ class Tracer:
         self,
         trace_id: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
+        max_attribute_chars: Optional[int] = None,
+        stream_path: Optional[str] = None,
+        max_retained_turns: Optional[int] = None,
     ):
         """
         Initialize tracer.
@@ -113,21 +126,61 @@ class Tracer:
         Args:
             trace_id: Unique trace identifier (auto-generated if None)
             metadata: Optional trace metadata
+            max_attribute_chars: Optional limit for string attribute values.
+                Longer values are truncated, bounding the memory held by
+                long-running traces (e.g. full prompts repeated every turn).
+            stream_path: Optional .trace.jsonl path. Steps and turns are
+                appended to it as they complete (see stream.TraceStreamWriter);
+                call close_stream() when the conversation ends.
+            max_retained_turns: Optional number of completed turns kept in
+                memory when streaming. Older turns are already in the stream
+                file and are dropped from memory, so a long conversation holds
+                a bounded number of spans. Requires stream_path.
 
         Example:
             tracer = Tracer()  # Auto-generate ID
             tracer = Tracer(trace_id="custom-id")
             tracer = Tracer(metadata={"user_id": "123"})
+            tracer = Tracer(max_attribute_chars=20_000)
+            tracer = Tracer(stream_path="output/traces/conv.trace.jsonl")
+            tracer = Tracer(stream_path="conv.trace.jsonl", max_retained_turns=5)
+
+        Raises:
+            ValueError: If max_retained_turns is set without stream_path or is < 1
         """
+        if max_retained_turns is not None:
+            if stream_path is None:
+                raise ValueError("max_retained_turns requires stream_path")
+            if max_retained_turns < 1:
+                raise ValueError("max_retained_turns must be >= 1")
+
         if trace_id is None:
             trace_id = str(uuid.uuid4())
 
         self._trace_id = trace_id
         self._metadata = metadata or {}
+        self._max_attribute_chars = max_attribute_chars
         self._turns: list[Turn] = []
+        self._max_retained_turns = max_retained_turns
+        self._dropped_turns = 0
+        self._first_turn_start: Optional[datetime] = None
         self._current_turn: Optional[Turn] = None
         self._trace_start_time: Optional[datetime] = None
         self._trace_end_time: Optional[datetime] = None
+        self._stream: Optional[TraceStreamWriter] = None
+
+        if stream_path is not None:
+            self._stream = TraceStreamWriter(
+                stream_path,
+                trace_id=trace_id,
+                start_time=datetime.now(timezone.utc),
+                metadata=self._metadata,
+            )
+
+    @property
+    def dropped_turns(self) -> int:
+        """Number of completed turns dropped from memory (only in the stream file)."""
+        return self._dropped_turns
 
     @property
     def trace(self) -> Trace:
@@ -135,7 +188,8 @@ class Tracer:
         Access underlying Trace object (read-only).
 
         Returns:
-            Trace object with current trace data
+            Trace object with current trace data (only the retained turns
+            when max_retained_turns dropped older ones)
 
         Example:
             print(f"Trace ID: {tracer.trace.trace_id}")
@@ -143,7 +197,7 @@ class Tracer:
         """
         # Calculate trace timestamps and duration
         if self._turns:
-            start_time = self._turns[0].start_time
+            start_time = self._first_turn_start or self._turns[0].start_time
             end_time = self._turns[-1].end_time
             duration_ms = int((end_time - start_time).total_seconds() * 1000)
         else:
@@ -219,9 +273,20 @@ class Tracer:
             turn.duration_ms = duration_ms
 
             # Add turn to trace
+            if self._first_turn_start is None:
+                self._first_turn_start = turn.start_time
             self._turns.append(turn)
             self._current_turn = None
 
+            if self._stream is not None:
+                self._stream.write_turn(turn)
+                # Streamed turns are on disk; keep only the most recent in memory
+                if self._max_retained_turns is not None:
+                    excess = len(self._turns) - self._max_retained_turns
+                    if excess > 0:
+                        del self._turns[:excess]
+                        self._dropped_turns += excess
+
     @contextmanager
     def start_span(
         self,
@@ -261,6 +326,8 @@ class Tracer:
         if isinstance(span_type, str):
             span_type = SpanType(span_type)
 
+        turn = self._current_turn
+
         # Generate span_id
         span_id = str(uuid.uuid4())
 
@@ -275,11 +342,14 @@ class Tracer:
             end_time=start_time,  # Will be updated on exit
             duration_ms=0,  # Will be calculated on exit
             status=SpanStatus.SUCCESS,  # Default status
-            attributes=attributes or {},
+            attributes={
+                key: _truncate_value(value, self._max_attribute_chars)
+                for key, value in (attributes or {}).items()
+            },
         )
 
         # Create Span wrapper
-        span = Span(step)
+        span = Span(step, max_attribute_chars=self._max_attribute_chars)
 
         try:
             yield span
@@ -291,8 +361,11 @@ class Tracer:
             step.end_time = end_time
             step.duration_ms = duration_ms
 
-            # Add step to current turn
-            self._current_turn.steps.append(step)
+            # Add step to the turn it was started in
+            turn.steps.append(step)
+
+            if self._stream is not None:
+                self._stream.write_step(turn, step)
 
     def save_trace(self, path: str) -> None:
         """
@@ -307,12 +380,62 @@ class Tracer:
             tracer.save_trace("output/traces/weather.trace.json")
 
         Raises:
-            RuntimeError: If no turns recorded (empty trace)
+            RuntimeError: If no turns recorded (empty trace) or turns were
+                dropped from memory (use the streamed file instead)
             OSError: If file cannot be written
         """
         from .persistence import save_trace
 
+        self._check_complete()
+
+        save_trace(self.trace, path)
+
+    def save_trace_async(self, path: str) -> Future:
+        """
+        Save trace to JSON file in a background writer thread.
+
+        The trace is snapshotted immediately; serialization to disk does not
+        block the caller (e.g. the asyncio event loop running interviews).
+
+        Args:
+            path: Output file path (.trace.json recommended)
+
+        Returns:
+            Future resolved when the file is written
+
+        Raises:
+            RuntimeError: If no turns recorded (empty trace) or turns were
+                dropped from memory
+        """
+        from .persistence import save_trace_async
+
+        self._check_complete()
+
+        return save_trace_async(self.trace, path)
+
+    def _check_complete(self) -> None:
         if not self._turns:
             raise RuntimeError("Cannot save empty trace - record at least one turn")
+        if self._dropped_turns:
+            raise RuntimeError(
+                f"Cannot save trace - {self._dropped_turns} turns were dropped from memory; "
+                "the full trace is in the stream file")
 
-        save_trace(self.trace, path)
+    def close_stream(self) -> Optional[Future]:
+        """
+        Finish the streamed trace file (no-op if not streaming).
+
+        Appends the end record; steps and turns were already written as they
+        completed, so this does not serialize the whole trace.
+
+        Returns:
+            Future resolved when pending appends are written (None if not streaming)
+
+        Example:
+            tracer = Tracer(stream_path="output/traces/conv.trace.jsonl")
+            # ... record turns ...
+            tracer.close_stream()
+        """
+        if self._stream is None:
+            return None
+        return self._stream.close(self.trace)
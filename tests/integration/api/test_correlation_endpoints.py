@@ -0,0 +1,30 @@
+"""
+Integration tests for the attribute correlations chart endpoint.
+
+References:
+    - Analysis Router: src/synth_lab/api/routers/analysis.py
+    - Correlations: src/synth_lab/services/simulation/correlation.py
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from synth_lab.api.main import app
+
+
+@pytest.fixture
+def client():
+    """Create test client."""
+    return TestClient(app)
+
+
+class TestAttributeCorrelationsValidation:
+    """Query parameter validation."""
+
+    def test_unknown_method_is_rejected(self, client):
+        """Methods other than pearson/spearman are a 422, not a server error."""
+        response = client.get(
+            "/experiments/exp_12345678/analysis/charts/attribute-correlations?method=kendall")
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["query", "method"]
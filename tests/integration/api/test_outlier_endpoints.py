@@ -31,6 +31,15 @@ from synth_lab.domain.entities.simulation_attributes import (
     SimulationLatentTraits,
     SimulationObservables,
 )
+from synth_lab.services.analysis.chart_response_cache import get_chart_response_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_chart_response_cache():
+    """Isolate tests from chart responses cached by other tests."""
+    get_chart_response_cache().clear()
+    yield
+    get_chart_response_cache().clear()
 
 
 @pytest.fixture
@@ -389,6 +398,71 @@ class TestOutlierDetectionEndpoint:
             assert data["n_outliers"] > 5
 
 
+class TestChartResponseCache:
+    """Chart responses are cached with strong ETags."""
+
+    def test_repeated_request_is_304_without_database(
+        self,
+        client,
+        experiment_id,
+        mock_completed_analysis,
+        mock_experiment,
+        sample_outcomes,
+    ):
+        """Conditional GET with the ETag returns 304 without loading anything."""
+        with (
+            patch("synth_lab.api.routers.analysis.get_analysis_service") as mock_analysis_svc,
+            patch("synth_lab.api.routers.analysis.get_experiment_service") as mock_exp_svc,
+            patch("synth_lab.api.routers.analysis.get_outcome_repository") as mock_outcome_repo,
+        ):
+            mock_analysis_svc.return_value.get_analysis.return_value = mock_completed_analysis
+            mock_exp_svc.return_value.get_experiment.return_value = mock_experiment
+            mock_outcome_repo.return_value.get_outcomes.return_value = (sample_outcomes, 50)
+
+            url = f"/experiments/{experiment_id}/analysis/outliers?contamination=0.2"
+            first = client.get(url)
+            etag = first.headers["etag"]
+
+            second = client.get(url, headers={"If-None-Match": etag})
+            third = client.get(url)
+
+            assert first.status_code == 200
+            assert second.status_code == 304
+            assert second.headers["etag"] == etag
+            assert third.status_code == 200
+            assert third.json() == first.json()
+            assert mock_analysis_svc.return_value.get_analysis.call_count == 1
+            assert mock_outcome_repo.return_value.get_outcomes.call_count == 1
+
+    def test_parameters_are_cached_separately(
+        self,
+        client,
+        experiment_id,
+        mock_completed_analysis,
+        mock_experiment,
+        sample_outcomes,
+    ):
+        """Different parameters get different responses and ETags."""
+        with (
+            patch("synth_lab.api.routers.analysis.get_analysis_service") as mock_analysis_svc,
+            patch("synth_lab.api.routers.analysis.get_experiment_service") as mock_exp_svc,
+            patch("synth_lab.api.routers.analysis.get_outcome_repository") as mock_outcome_repo,
+        ):
+            mock_analysis_svc.return_value.get_analysis.return_value = mock_completed_analysis
+            mock_exp_svc.return_value.get_experiment.return_value = mock_experiment
+            mock_outcome_repo.return_value.get_outcomes.return_value = (sample_outcomes, 50)
+
+            base = f"/experiments/{experiment_id}/analysis/outliers"
+            low = client.get(f"{base}?contamination=0.1")
+            high = client.get(
+                f"{base}?contamination=0.2", headers={"If-None-Match": low.headers["etag"]}
+            )
+
+            assert high.status_code == 200
+            assert high.headers["etag"] != low.headers["etag"]
+            assert high.json()["contamination"] == 0.2
+
+
 if __name__ == "__main__":
     """Run integration tests."""
     pytest.main([__file__, "-v"])
@@ -287,6 +287,36 @@ class TestResearchRepositoryTranscripts:
         assert saved_transcript.messages[1]["internal_notes"] == "greeting"
 
 
+class TestResearchRepositoryEvents:
+    """Tests for the execution event log used for SSE replay."""
+
+    def test_events_are_sequenced_and_ranged(self, research_repository: ResearchRepository):
+        """Appended events get increasing seq; get_events returns only later ones."""
+        exec_id = "test_exec_events"
+        research_repository.create_execution(
+            exec_id=exec_id,
+            topic_name="Event Log",
+            synth_count=1,
+        )
+
+        appended = [
+            research_repository.append_event(
+                exec_id, "message", {"synth_id": "s1", "text": f"t{i}"}
+            )
+            for i in range(3)
+        ]
+
+        seqs = [e.seq for e in appended]
+        assert seqs == sorted(seqs) and len(set(seqs)) == 3
+
+        all_events = research_repository.get_events(exec_id)
+        assert [e.seq for e in all_events] == seqs
+        assert all_events[0].data == {"synth_id": "s1", "text": "t0"}
+
+        resumed = research_repository.get_events(exec_id, after_seq=seqs[0])
+        assert [e.data["text"] for e in resumed] == ["t1", "t2"]
+
+
 if __name__ == "__main__":
     """
     Run validation to ensure tests are properly configured.
@@ -313,3 +343,4 @@ if __name__ == "__main__":
     print("")
     print("Run with: pytest tests/integration/repositories/test_research_repository.py -v")
     sys.exit(0)
+
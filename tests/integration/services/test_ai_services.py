@@ -71,7 +71,7 @@ class TestAvatarServiceIntegration:
 
         # Mock avatar generation to avoid OpenAI API call
         with patch(
-            "synth_lab.gen_synth.avatar_generator.generate_avatars"
+            "synth_lab.services.avatar_jobs.generate_block"
         ) as mock_generate:
             # Mock the avatar generation to create dummy files
             def mock_avatar_gen(synths=None, **kwargs):
@@ -116,7 +116,7 @@ class TestAvatarServiceIntegration:
 
         # Mock avatar generation
         with patch(
-            "synth_lab.gen_synth.avatar_generator.generate_avatars"
+            "synth_lab.services.avatar_jobs.generate_block"
         ) as mock_generate:
 
             def mock_avatar_gen(synths=None, **kwargs):
@@ -153,7 +153,7 @@ class TestAvatarServiceIntegration:
         complete_callback = AsyncMock()
 
         # Mock avatar generation
-        with patch("synth_lab.gen_synth.avatar_generator.generate_avatars") as mock_gen:
+        with patch("synth_lab.services.avatar_jobs.generate_block") as mock_gen:
             # Mock should return list of paths
             mock_gen.return_value = [str(avatars_dir / "synth_callback_001.png")]
 
@@ -487,7 +487,7 @@ class TestAIServicesErrorHandling:
         service = AvatarService(avatars_dir=avatars_dir)
 
         # Mock avatar generation
-        with patch("synth_lab.gen_synth.avatar_generator.generate_avatars"):
+        with patch("synth_lab.services.avatar_jobs.generate_block"):
             result = await service.ensure_avatars_for_synths(synths_data)
 
             # Should only generate for synth with ID
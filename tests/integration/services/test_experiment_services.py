@@ -81,6 +81,72 @@ class TestExperimentServiceIntegration:
         assert all(exp.id is not None for exp in result.data)
         assert all(exp.name is not None for exp in result.data)
 
+    def test_list_experiments_keyset_pages_cover_all_rows_once(self, db_session):
+        """Cursor pages return every matching experiment exactly once, ties included."""
+        from synth_lab.models.pagination import PaginationParams
+
+        repo = ExperimentRepository(session=db_session)
+        service = ExperimentService(repository=repo)
+
+        # Setup: Same created_at for all rows so ordering relies on the id tie-breaker
+        created_at = datetime.now().isoformat()
+        for i in range(5):
+            db_session.add(Experiment(
+                id=f"exp_4d5e6f{i:02d}",
+                name=f"Keyset Page Experiment {i}",
+                hypothesis=f"Hypothesis {i}",
+                status="active",
+                created_at=created_at,
+            ))
+        db_session.commit()
+
+        # Execute: Walk the pages using next_cursor
+        seen = []
+        params = PaginationParams(limit=2, search="Keyset Page")
+        while True:
+            result = service.list_experiments(params)
+            seen.extend(exp.id for exp in result.data)
+            if not result.pagination.has_next:
+                break
+            params = PaginationParams(
+                limit=2, search="Keyset Page", cursor=result.pagination.next_cursor)
+
+        # Verify
+        assert result.pagination.total == 5
+        assert seen == sorted(seen, reverse=True), "Ties should be ordered by id"
+        assert sorted(seen) == [f"exp_4d5e6f{i:02d}" for i in range(5)]
+
+    def test_experiment_detail_summary_counts(self, db_session):
+        """get_experiment_detail returns flags and counts from a single summary query."""
+        from synth_lab.models.orm.experiment import InterviewGuide
+
+        db_session.add(Experiment(
+            id="exp_7a8b9c01",
+            name="Summary Experiment",
+            hypothesis="Summary hypothesis",
+            status="active",
+            scorecard_data=None,
+            created_at=datetime.now().isoformat(),
+        ))
+        db_session.add(InterviewGuide(
+            experiment_id="exp_7a8b9c01",
+            context_definition="Context",
+            created_at=datetime.now().isoformat(),
+        ))
+        db_session.commit()
+
+        repo = ExperimentRepository(session=db_session)
+        service = ExperimentService(repository=repo)
+        summary = service.get_experiment_detail("exp_7a8b9c01")
+
+        assert summary is not None
+        assert summary.has_scorecard is False
+        assert summary.has_interview_guide is True
+        assert summary.has_analysis is False
+        assert summary.interview_count == 0
+        assert summary.tags == []
+        assert service.get_experiment_detail("exp_00000000") is None
+
     def test_update_experiment_modifies_database_record(self, db_session):
         """Test that updating an experiment persists changes to database."""
         # Setup: Create experiment with valid ID format (exp_[8 hex chars])
@@ -288,6 +288,91 @@ class TestExplorationServiceIntegration:
         with pytest.raises(ExplorationNotFoundError):
             service.get_exploration("expl_00000000")
 
+    def test_path_and_subtree_queries(self, db_session):
+        """Ancestor paths and filtered subtree pages come from single CTE queries."""
+        # Setup: root -> a -> b, root -> c (dominated)
+        experiment = Experiment(
+            id="exp_e9a8b7c6",
+            name="Tree Query Test",
+            hypothesis="Testing tree queries",
+            status="active",
+            created_at=datetime.now().isoformat(),
+        )
+        analysis = AnalysisRun(
+            id="ana_a9b8c7d6",
+            experiment_id="exp_e9a8b7c6",
+            config={"n_synths": 100},
+            status="completed",
+            started_at=datetime.now().isoformat(),
+            total_synths=100,
+            aggregated_outcomes={
+                "did_not_try_rate": 0.15,
+                "failed_rate": 0.20,
+                "success_rate": 0.65,
+            },
+        )
+        exploration = Exploration(
+            id="expl_a9b8c7d6",
+            experiment_id="exp_e9a8b7c6",
+            baseline_analysis_id="ana_a9b8c7d6",
+            goal={"metric": "success_rate", "operator": ">=", "value": 0.80},
+            config={"beam_width": 3, "max_depth": 5},
+            status="running",
+            current_depth=2,
+            total_nodes=4,
+            total_llm_calls=0,
+            started_at=datetime.now().isoformat(),
+        )
+        db_session.add_all([experiment, analysis, exploration])
+        params = {
+            "complexity": 0.5, "initial_effort": 0.5, "perceived_risk": 0.5, "time_to_value": 0.5,
+        }
+        tree = [
+            ("node_000000a0", None, 0, "active"),
+            ("node_000000a1", "node_000000a0", 1, "active"),
+            ("node_000000a2", "node_000000a1", 2, "active"),
+            ("node_000000a3", "node_000000a0", 1, "dominated"),
+        ]
+        for node_id, parent_id, depth, node_status in tree:
+            db_session.add(ScenarioNode(
+                id=node_id,
+                exploration_id="expl_a9b8c7d6",
+                parent_id=parent_id,
+                depth=depth,
+                scorecard_params=params,
+                node_status=node_status,
+                created_at=datetime.now().isoformat(),
+            ))
+            db_session.flush()
+        db_session.commit()
+
+        repo = ExplorationRepository(session=db_session)
+        service = create_exploration_service(db_session)
+
+        # Path: root to leaf in depth order
+        path = repo.get_path_to_node("node_000000a2")
+        assert [n.id for n in path] == ["node_000000a0", "node_000000a1", "node_000000a2"]
+
+        # Subtree limited to one level below node a1
+        nodes, total = repo.get_subtree("expl_a9b8c7d6", root_id="node_000000a1", max_depth=0)
+        assert [n.id for n in nodes] == ["node_000000a1"]
+        assert total == 1
+
+        # Status filter and pagination over the whole tree
+        nodes, total = repo.get_subtree("expl_a9b8c7d6", statuses=["active"], limit=2, offset=1)
+        assert total == 3
+        assert [n.id for n in nodes] == ["node_000000a1", "node_000000a2"]
+
+        # Full tree via service: counts derived from the loaded nodes
+        tree_data = service.get_exploration_tree("expl_a9b8c7d6")
+        assert tree_data["total_nodes"] == 4
+        assert tree_data["node_count_by_status"]["dominated"] == 1
+        present = {s: c for s, c in repo.count_nodes_by_status("expl_a9b8c7d6").items() if c}
+        assert tree_data["node_count_by_status"] == present
+
+        with pytest.raises(ExplorationNotFoundError):
+            service.get_exploration_tree("expl_a9b8c7d6", root_node_id="node_000000ff")
+
 
 @pytest.mark.integration
 class TestActionCatalogServiceIntegration:
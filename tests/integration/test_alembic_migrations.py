@@ -47,6 +47,8 @@ EXPECTED_TABLES = {
     "experiment_materials",  # Added in 20260106_0218
     "tags",  # Added in 20260106_1103
     "experiment_tags",  # Added in 20260106_1103
+    "broker_payloads",  # Added in 20261018_1100
+    "research_events",  # Added in 20261019_0900
 }
 
 
@@ -33,6 +33,18 @@ from synth_lab.domain.entities.simulation_attributes import (
     SimulationLatentTraits,
     SimulationObservables,
 )
+from synth_lab.services.analysis.chart_response_cache import get_chart_response_cache
+from synth_lab.services.simulation.outcome_aggregates import get_outcome_aggregate_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_chart_response_cache():
+    """Isolate tests from chart responses cached by other tests."""
+    get_chart_response_cache().clear()
+    get_outcome_aggregate_cache().clear()
+    yield
+    get_chart_response_cache().clear()
+    get_outcome_aggregate_cache().clear()
 
 
 @pytest.fixture
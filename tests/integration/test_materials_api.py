@@ -235,16 +235,17 @@ class TestConfirmEndpoint:
         # Mock S3 existence check
         mock_check_exists.return_value = True
 
-        # Mock thumbnail and description generation
-        with patch("synth_lab.services.material_service.MaterialService.generate_thumbnail"):
-            with patch("synth_lab.services.material_service.MaterialService.generate_description"):
-                response = client.post(
-                    "/experiments/exp_44556677/materials/confirm",
-                    json={
-                        "material_id": "mat_fedcba987654",
-                        "object_key": "materials/exp_44556677/mat_fedcba987654.png",
-                    },
-                )
+        # Mock background thumbnail and description generation
+        with patch(
+            "synth_lab.services.material_service.MaterialService.schedule_media_processing"
+        ):
+            response = client.post(
+                "/experiments/exp_44556677/materials/confirm",
+                json={
+                    "material_id": "mat_fedcba987654",
+                    "object_key": "materials/exp_44556677/mat_fedcba987654.png",
+                },
+            )
 
         assert response.status_code == 200
         data = response.json()
@@ -0,0 +1,162 @@
+"""
+Unit tests for batch-prefetched interview context.
+
+Tests that run_batch_interviews loads synths, outcomes and analysis
+statistics once per batch instead of once per interview.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from synth_lab.domain.entities import SynthOutcome
+from synth_lab.domain.entities.simulation_attributes import (
+    SimulationAttributes,
+    SimulationLatentTraits,
+    SimulationObservables,
+)
+from synth_lab.services.research_agentic import batch_runner
+from synth_lab.services.research_agentic.runner import (
+    InterviewGuideData,
+    InterviewResult,
+    SimulationPrefetch,
+    _format_simulation_context_for_outcome,
+    prefetch_simulation_data,
+)
+
+
+def create_synth_outcome(synth_id: str, success_rate: float = 0.5) -> SynthOutcome:
+    """Helper to create SynthOutcome with simulation attributes."""
+    return SynthOutcome(
+        synth_id=synth_id,
+        analysis_id="ana_12345678",
+        did_not_try_rate=0.2,
+        failed_rate=0.8 - success_rate,
+        success_rate=success_rate,
+        synth_attributes=SimulationAttributes(
+            observables=SimulationObservables(
+                digital_literacy=0.5,
+                similar_tool_experience=0.5,
+                motor_ability=0.8,
+                time_availability=0.5,
+                domain_expertise=0.5,
+            ),
+            latent_traits=SimulationLatentTraits(
+                capability_mean=0.5,
+                trust_mean=0.5,
+                friction_tolerance_mean=0.5,
+                exploration_prob=0.5,
+            ),
+        ),
+    )
+
+
+class TestPrefetchSimulationData:
+    """Tests for prefetch_simulation_data."""
+
+    def test_uses_one_query_per_kind(self):
+        """Outcomes and statistics are fetched once for all synths."""
+        repo = MagicMock()
+        repo.__enter__.return_value = repo
+        repo.get_by_synths_and_analysis.return_value = {
+            "s1": create_synth_outcome("s1", 0.6),
+        }
+        repo.get_analysis_statistics.return_value = {"avg_success_rate": 0.4}
+
+        with patch(
+            "synth_lab.repositories.synth_outcome_repository.SynthOutcomeRepository",
+            return_value=repo,
+        ):
+            data = prefetch_simulation_data(["s1", "s2"], "ana_12345678")
+
+        repo.get_by_synths_and_analysis.assert_called_once_with(["s1", "s2"], "ana_12345678")
+        repo.get_analysis_statistics.assert_called_once_with("ana_12345678")
+        assert set(data.outcomes) == {"s1"}
+        assert data.avg_success_rate == 0.4
+
+    def test_returns_empty_prefetch_on_error(self):
+        """Database errors degrade to an empty prefetch."""
+        with patch(
+            "synth_lab.repositories.synth_outcome_repository.SynthOutcomeRepository",
+            side_effect=RuntimeError("db down"),
+        ):
+            data = prefetch_simulation_data(["s1"], "ana_12345678")
+
+        assert data.outcomes == {}
+        assert data.avg_success_rate is None
+
+    def test_format_context_without_outcome(self):
+        """Synths without outcome produce no simulation context."""
+        assert _format_simulation_context_for_outcome(None) == ""
+
+    def test_format_context_with_outcome(self):
+        """Synths with outcome produce a simulation context."""
+        assert _format_simulation_context_for_outcome(create_synth_outcome("s1")) != ""
+
+
+class TestLoadAllSynths:
+    """Tests for SQL-side sampling in load_all_synths."""
+
+    def test_samples_in_sql_when_limit_given(self):
+        """With a limit, only the sampled synths are loaded."""
+        with (
+            patch("synth_lab.gen_synth.storage.sample_synths", return_value=[]) as sample,
+            patch("synth_lab.gen_synth.storage.load_synths") as load,
+        ):
+            batch_runner.load_all_synths(synth_group_id="grp_1", limit=10)
+
+        sample.assert_called_once_with(limit=10, synth_group_id="grp_1", synth_ids=None)
+        load.assert_not_called()
+
+    def test_loads_group_without_limit(self):
+        """Without a limit, the whole group is loaded."""
+        with patch("synth_lab.gen_synth.storage.load_synths", return_value=[]) as load:
+            batch_runner.load_all_synths(synth_group_id="grp_1")
+
+        load.assert_called_once_with(synth_group_id="grp_1")
+
+
+class TestRunBatchInterviewsPrefetch:
+    """Tests that run_batch_interviews shares prefetched data with each interview."""
+
+    @pytest.mark.asyncio
+    async def test_interviews_receive_prefetched_data(self):
+        """Each interview receives its synth and the shared simulation data."""
+        synths = [{"id": f"s{i}", "nome": f"Synth {i}"} for i in range(3)]
+        prefetch = SimulationPrefetch(analysis_id="ana_12345678")
+        calls = []
+
+        async def fake_run_interview(**kwargs):
+            calls.append(kwargs)
+            return InterviewResult(
+                messages=[],
+                synth_id=kwargs["synth_id"],
+                synth_name=kwargs["synth"]["nome"],
+                topic_guide_name="guide",
+                trace_path=None,
+                total_turns=0,
+            )
+
+        async def no_avatars(**kwargs):
+            return None
+
+        with (
+            patch.object(batch_runner, "load_all_synths", return_value=synths) as load,
+            patch.object(
+                batch_runner, "prefetch_simulation_data", return_value=prefetch
+            ) as prefetch_fn,
+            patch.object(batch_runner, "run_interview", side_effect=fake_run_interview),
+            patch.object(batch_runner, "_ensure_avatars_for_synths", side_effect=no_avatars),
+        ):
+            result = await batch_runner.run_batch_interviews(
+                interview_guide=InterviewGuideData(questions="Q1"),
+                max_interviews=3,
+                generate_summary=False,
+                analysis_id="ana_12345678",
+            )
+
+        load.assert_called_once_with(synth_group_id=None, limit=3, synth_ids=None)
+        prefetch_fn.assert_called_once()
+        assert result.total_completed == 3
+        assert all(c["simulation_data"] is prefetch for c in calls)
+        assert {c["synth"]["id"] for c in calls} == {"s0", "s1", "s2"}
@@ -0,0 +1,135 @@
+"""
+Unit tests for the incremental (online) interview summarizer.
+
+Tests that completed interviews are folded into a running synthesis,
+that partial syntheses are published, that finalize() produces
+the report from the running synthesis without calling the LLM for real,
+and that small batches fall back to a single summary call.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from synth_lab.services.research_agentic import incremental_summarizer as module
+from synth_lab.services.research_agentic.incremental_summarizer import IncrementalSummarizer
+from synth_lab.services.research_agentic.runner import ConversationMessage, InterviewResult
+
+
+def make_result(synth_id: str) -> InterviewResult:
+    """Create a minimal interview result."""
+    return InterviewResult(
+        messages=[
+            ConversationMessage(speaker="Interviewer", text="Como foi?"),
+            ConversationMessage(speaker="Interviewee", text=f"Resposta de {synth_id}"),
+        ],
+        synth_id=synth_id,
+        synth_name=f"Synth {synth_id}",
+        topic_guide_name="guide",
+        trace_path=None,
+        total_turns=1,
+    )
+
+
+class TestIncrementalSummarizer:
+    """Tests for IncrementalSummarizer."""
+
+    async def test_folds_interviews_and_finalizes(self):
+        """Each completed interview ends up in the running synthesis."""
+        partials = []
+        fold_inputs = []
+
+        async def fake_digest(formatted, model):
+            return [f"digest:{formatted.splitlines()[0]}"]
+
+        async def fake_fold(name, instructions, model, user_input):
+            fold_inputs.append(instructions)
+            return f"synthesis#{len(fold_inputs)}"
+
+        async def on_partial(content, count):
+            partials.append((content, count))
+
+        final_run = AsyncMock(return_value=MagicMock(final_output="# Síntese final"))
+
+        with (
+            patch.object(module, "digest_interviews", side_effect=fake_digest),
+            patch.object(module, "run_text_agent", side_effect=fake_fold),
+            patch.object(module.Runner, "run", final_run),
+        ):
+            summarizer = IncrementalSummarizer(
+                topic_guide_name="guide", on_partial=on_partial)
+            for synth_id in ["s1", "s2", "s3"]:
+                summarizer.add(make_result(synth_id), {"nome": synth_id})
+                await asyncio.sleep(0)
+
+            summary = await summarizer.finalize()
+
+        assert summary == "# Síntese final"
+        assert summarizer.interview_count == 3
+        assert summarizer.folded_count == 3
+        assert partials[-1][1] == 3
+        final_agent = final_run.call_args.args[0]
+        assert summarizer.running_synthesis in final_agent.instructions
+
+    async def test_unfolded_digests_reach_final_summary(self):
+        """Digests that could not be folded are sent to the final summarizer."""
+
+        async def fake_digest(formatted, model):
+            return ["digest-sem-fold"]
+
+        final_run = AsyncMock(return_value=MagicMock(final_output="ok"))
+
+        with (
+            patch.object(module, "digest_interviews", side_effect=fake_digest),
+            patch.object(module, "run_text_agent", side_effect=RuntimeError("llm down")),
+            patch.object(module.Runner, "run", final_run),
+        ):
+            summarizer = IncrementalSummarizer(topic_guide_name="guide")
+            summarizer.add(make_result("s1"), {"nome": "s1"})
+            await summarizer.finalize()
+
+        assert summarizer.folded_count == 0
+        final_agent = final_run.call_args.args[0]
+        assert "digest-sem-fold" in final_agent.instructions
+
+    async def test_small_batch_uses_single_summary_call(self):
+        """With the opt-out threshold, batches up to it skip digests and folds."""
+        digest = AsyncMock()
+        fold = AsyncMock()
+        single = AsyncMock(return_value="# Síntese única")
+
+        with (
+            patch.object(module, "digest_interviews", digest),
+            patch.object(module, "run_text_agent", fold),
+            patch.object(module, "summarize_interviews", single),
+        ):
+            summarizer = IncrementalSummarizer(topic_guide_name="guide", online_threshold=2)
+            for synth_id in ["s1", "s2"]:
+                summarizer.add(make_result(synth_id), {"nome": synth_id})
+                await asyncio.sleep(0)
+
+            summary = await summarizer.finalize()
+
+        assert summary == "# Síntese única"
+        digest.assert_not_called()
+        fold.assert_not_called()
+        interviews = single.call_args.args[0]
+        assert [result.synth_id for result, _ in interviews] == ["s1", "s2"]
+
+    async def test_crossing_threshold_digests_buffered_interviews(self):
+        """Interviews buffered below the threshold are digested once it is crossed."""
+        digested = []
+
+        async def fake_digest(formatted, model):
+            digested.append(formatted)
+            return ["digest"]
+
+        with (
+            patch.object(module, "digest_interviews", side_effect=fake_digest),
+            patch.object(module, "run_text_agent", AsyncMock(return_value="synthesis")),
+        ):
+            summarizer = IncrementalSummarizer(topic_guide_name="guide", online_threshold=2)
+            for synth_id in ["s1", "s2", "s3"]:
+                summarizer.add(make_result(synth_id), {"nome": synth_id})
+            await asyncio.sleep(0.01)
+
+        assert len(digested) == 3
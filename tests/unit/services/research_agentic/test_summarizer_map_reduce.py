@@ -0,0 +1,87 @@
+"""
+Unit tests for map-reduce interview summarization.
+
+Tests digest caching (map stage) and hierarchical merging (reduce stage)
+without calling the LLM.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from synth_lab.services.research_agentic import summarizer
+from synth_lab.services.research_agentic.summarizer import (
+    InterviewDigestCache,
+    digest_interviews,
+    reduce_digests,
+)
+
+
+@pytest.fixture
+def fake_agent():
+    """Patch the LLM call with a deterministic fake and record calls."""
+    calls = []
+
+    async def run(name, instructions, model, user_input):
+        calls.append(name)
+        return f"{name}#{len(calls)}"
+
+    with patch.object(summarizer, "run_text_agent", side_effect=run):
+        yield calls
+
+
+class TestInterviewDigestCache:
+    """Tests for InterviewDigestCache."""
+
+    def test_key_depends_on_model_and_content(self):
+        """Different model or content produce different keys."""
+        key = InterviewDigestCache.make_key("entrevista", "gpt-4o-mini")
+        assert key == InterviewDigestCache.make_key("entrevista", "gpt-4o-mini")
+        assert key != InterviewDigestCache.make_key("entrevista", "gpt-4.1-mini")
+        assert key != InterviewDigestCache.make_key("outra", "gpt-4o-mini")
+
+    def test_evicts_least_recently_used(self):
+        """Cache keeps at most max_entries digests."""
+        cache = InterviewDigestCache(max_entries=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        assert len(cache) == 2
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+
+
+class TestDigestInterviews:
+    """Tests for the map stage."""
+
+    async def test_only_new_interviews_are_digested(self, fake_agent):
+        """Re-summarizing after adding interviews digests only the new ones."""
+        cache = InterviewDigestCache()
+
+        first = await digest_interviews(["i1", "i2"], cache=cache)
+        assert len(fake_agent) == 2
+
+        second = await digest_interviews(["i1", "i2", "i3"], cache=cache)
+        assert len(fake_agent) == 3
+        assert second[:2] == first
+
+
+class TestReduceDigests:
+    """Tests for the reduce stage."""
+
+    async def test_small_input_is_not_merged(self, fake_agent):
+        """Inputs within chunk_size are returned unchanged."""
+        result = await reduce_digests(["d1", "d2"], "guide", chunk_size=4)
+        assert result == ["d1", "d2"]
+        assert fake_agent == []
+
+    async def test_merges_hierarchically(self, fake_agent):
+        """Large inputs are merged level by level until they fit."""
+        digests = [f"d{i}" for i in range(20)]
+        result = await reduce_digests(digests, "guide", chunk_size=3)
+
+        # 20 -> 7 -> 3 partial syntheses
+        assert len(result) == 3
+        assert len(fake_agent) == 10
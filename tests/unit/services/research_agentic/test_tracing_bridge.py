@@ -0,0 +1,53 @@
+"""
+Unit tests for the process-wide trace router.
+
+Tests that SDK events are dispatched only to the processor registered
+for their trace_id, and that routes are cleaned up.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from synth_lab.services.research_agentic.tracing_bridge import TraceRouter
+
+
+class TestTraceRouter:
+    """Tests for TraceRouter."""
+
+    def test_routes_spans_by_trace_id(self):
+        """Each span reaches only the processor of its own trace."""
+        router = TraceRouter()
+        first, second = MagicMock(), MagicMock()
+        router.register("trace_a", first)
+        router.register("trace_b", second)
+
+        span = SimpleNamespace(trace_id="trace_b")
+        router.on_span_start(span)
+        router.on_span_end(span)
+
+        first.on_span_start.assert_not_called()
+        second.on_span_start.assert_called_once_with(span)
+        second.on_span_end.assert_called_once_with(span)
+
+    def test_ignores_unrouted_traces(self):
+        """Events of traces without a processor are dropped."""
+        router = TraceRouter()
+        processor = MagicMock()
+        router.register("trace_a", processor)
+
+        router.on_span_start(SimpleNamespace(trace_id="other"))
+        router.on_trace_start(SimpleNamespace(trace_id="other"))
+
+        processor.on_span_start.assert_not_called()
+        processor.on_trace_start.assert_not_called()
+
+    def test_route_context_unregisters_and_shuts_down(self):
+        """Leaving route() removes the route and shuts the processor down."""
+        router = TraceRouter()
+        processor = MagicMock()
+
+        with router.route("trace_a", processor):
+            assert router.route_count == 1
+
+        assert router.route_count == 0
+        processor.shutdown.assert_called_once()
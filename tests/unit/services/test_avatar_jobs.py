@@ -0,0 +1,146 @@
+"""
+Unit tests for the avatar generation job queue.
+
+Tests:
+- Synths queued by concurrent requests are deduplicated and batched into blocks of 9
+- Existing avatars and synths without id are skipped
+- Blocks run concurrently up to the worker limit
+- Failed blocks resolve to no avatar without failing callers
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from synth_lab.services.avatar_jobs import AvatarJobQueue, RequestRateLimiter
+
+
+def synths(*synth_ids: str) -> list[dict]:
+    """Minimal synth dictionaries."""
+    return [{"id": synth_id, "nome": synth_id} for synth_id in synth_ids]
+
+
+class FakeGenerator:
+    """Block generator that writes dummy avatars and records blocks."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.blocks: list[list[str]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, synths: list[dict], avatar_dir: Path, block_num: int) -> list[str]:
+        with self._lock:
+            self.blocks.append([s["id"] for s in synths])
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("image API down")
+            paths = []
+            for synth in synths:
+                path = avatar_dir / f"{synth['id']}.png"
+                path.write_bytes(b"png")
+                paths.append(str(path))
+            return paths
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_queue(avatar_dir: Path, generator: FakeGenerator, workers: int = 2) -> AvatarJobQueue:
+    """Queue without rate limiting and a short batch window."""
+    return AvatarJobQueue(
+        avatar_dir, workers=workers, min_interval=0, batch_window=0.05, generate=generator)
+
+
+class TestAvatarJobQueue:
+    """Tests for deduplication, batching and concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_blocks_and_results(self, tmp_path: Path) -> None:
+        generator = FakeGenerator()
+        queue = make_queue(tmp_path, generator)
+
+        first, second = await asyncio.gather(
+            queue.ensure(synths("a1", "a2", "a3", "a4", "a5")),
+            queue.ensure(synths("a4", "a5", "b1", "b2")),
+        )
+        await queue.stop()
+
+        assert generator.blocks == [["a1", "a2", "a3", "a4", "a5", "b1", "b2"]]
+        assert set(first) == {"a1", "a2", "a3", "a4", "a5"}
+        assert set(second) == {"a4", "a5", "b1", "b2"}
+        assert second["b1"] == tmp_path / "b1.png"
+        assert queue.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_skips_existing_avatars_and_missing_ids(self, tmp_path: Path) -> None:
+        (tmp_path / "old001.png").write_bytes(b"png")
+        generator = FakeGenerator()
+        queue = make_queue(tmp_path, generator)
+
+        result = await queue.ensure(synths("old001", "new001") + [{"nome": "Sem ID"}])
+        await queue.stop()
+
+        assert list(result) == ["new001"]
+        assert generator.blocks == [["new001"]]
+        assert (tmp_path / "old001.png").read_bytes() == b"png"
+
+    @pytest.mark.asyncio
+    async def test_blocks_run_concurrently_up_to_worker_limit(self, tmp_path: Path) -> None:
+        generator = FakeGenerator(delay=0.05)
+        queue = make_queue(tmp_path, generator, workers=2)
+
+        result = await queue.ensure(synths(*(f"s{i:03d}" for i in range(36))))
+        await queue.stop()
+
+        assert len(result) == 36
+        assert [len(block) for block in generator.blocks] == [9, 9, 9, 9]
+        assert generator.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_up_generates_in_background(self, tmp_path: Path) -> None:
+        generator = FakeGenerator()
+        queue = make_queue(tmp_path, generator)
+
+        assert queue.warm_up(synths("w1", "w2")) == 2
+        # Already pending: an interview asking for it waits for the same job
+        result = await queue.ensure(synths("w1"))
+        await queue.stop()
+
+        assert result == {"w1": tmp_path / "w1.png"}
+        assert generator.blocks == [["w1", "w2"]]
+
+    @pytest.mark.asyncio
+    async def test_failed_block_resolves_without_avatar(self, tmp_path: Path) -> None:
+        queue = make_queue(tmp_path, FakeGenerator(fail=True))
+
+        result = await queue.ensure(synths("f1", "f2"))
+        await queue.stop()
+
+        assert result == {}
+        assert queue.pending_count == 0
+
+
+class TestRequestRateLimiter:
+    """Tests for request spacing."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_requests(self) -> None:
+        limiter = RequestRateLimiter(min_interval=0.05)
+        start = time.monotonic()
+
+        async def acquire() -> float:
+            await limiter.acquire()
+            return time.monotonic() - start
+
+        times = sorted(await asyncio.gather(acquire(), acquire(), acquire()))
+        assert times[0] < 0.04
+        assert times[2] >= 0.09
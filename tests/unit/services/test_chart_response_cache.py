@@ -0,0 +1,124 @@
+"""
+Unit tests for the chart response cache.
+
+Tests:
+- Entries keyed by analysis, experiment version, chart and normalized params
+- ETags are stable for equal payloads and differ otherwise
+- LRU bound and experiment invalidation
+
+References:
+    - Cache: src/synth_lab/services/analysis/chart_response_cache.py
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from synth_lab.services.analysis.chart_response_cache import (
+    ChartResponseCache,
+    etag_matches,
+)
+
+
+class Chart(BaseModel):
+    """Minimal chart payload."""
+
+    value: float
+
+
+@pytest.fixture
+def cache() -> ChartResponseCache:
+    """Small cache for eviction tests."""
+    return ChartResponseCache(max_entries=3)
+
+
+class TestChartResponseCache:
+    """Tests for ChartResponseCache."""
+
+    def test_params_are_normalized(self, cache):
+        """Parameter order does not change the key."""
+        entry = cache.set(
+            "exp_1", "ana_1", "v1", "heatmap", {"bins": 5, "x_axis": "a"}, Chart(value=1))
+
+        assert cache.get("exp_1", "ana_1", "v1", "heatmap", {"x_axis": "a", "bins": 5}) is entry
+        assert cache.get("exp_1", "ana_1", "v1", "heatmap", {"x_axis": "a", "bins": 6}) is None
+        assert cache.get("exp_1", "ana_2", "v1", "heatmap", {"x_axis": "a", "bins": 5}) is None
+
+    def test_etag_depends_on_content(self, cache):
+        """Equal payloads share an ETag; different payloads do not."""
+        first = cache.set("exp_1", "ana_1", "v1", "scatter", {}, Chart(value=1))
+        same = cache.set("exp_1", "ana_1", "v1", "scatter", {"x": 1}, Chart(value=1))
+        other = cache.set("exp_1", "ana_1", "v1", "scatter", {"x": 2}, Chart(value=2))
+
+        assert first.etag == same.etag
+        assert first.etag != other.etag
+        assert first.etag.startswith('"') and first.etag.endswith('"')
+
+    def test_lru_eviction(self, cache):
+        """Least recently used entries are evicted beyond max_entries."""
+        for i in range(3):
+            cache.set("exp_1", "ana_1", "v1", "pdp", {"i": i}, Chart(value=i))
+        cache.get("exp_1", "ana_1", "v1", "pdp", {"i": 0})  # Touch oldest
+        cache.set("exp_1", "ana_1", "v1", "pdp", {"i": 3}, Chart(value=3))
+
+        assert len(cache) == 3
+        assert cache.get("exp_1", "ana_1", "v1", "pdp", {"i": 0}) is not None
+        assert cache.get("exp_1", "ana_1", "v1", "pdp", {"i": 1}) is None
+
+    def test_invalidate_experiment(self, cache):
+        """Invalidation drops the analysis lookup and only that experiment's charts."""
+        cache.set_current_analysis("exp_1", "ana_1", "v1")
+        cache.set("exp_1", "ana_1", "v1", "elbow", {}, Chart(value=1))
+        cache.set("exp_2", "ana_2", "v1", "elbow", {}, Chart(value=2))
+
+        cache.invalidate_experiment("exp_1")
+
+        assert cache.current_analysis("exp_1") is None
+        assert cache.get("exp_1", "ana_1", "v1", "elbow", {}) is None
+        assert cache.get("exp_2", "ana_2", "v1", "elbow", {}) is not None
+
+    def test_new_analysis_replaces_old_charts(self, cache):
+        """Recording a different analysis drops charts of the previous one."""
+        cache.set_current_analysis("exp_1", "ana_1", "v1")
+        cache.set("exp_1", "ana_1", "v1", "elbow", {}, Chart(value=1))
+
+        cache.set_current_analysis("exp_1", "ana_2", "v1")
+
+        assert cache.current_analysis("exp_1") == ("ana_2", "v1")
+        assert cache.get("exp_1", "ana_1", "v1", "elbow", {}) is None
+
+    def test_new_version_replaces_old_charts(self, cache):
+        """A new experiment version (scorecard edit elsewhere) gets new keys and ETags."""
+        cache.set_current_analysis("exp_1", "ana_1", "v1")
+        old = cache.set("exp_1", "ana_1", "v1", "sankey_flow", {}, Chart(value=1))
+
+        cache.set_current_analysis("exp_1", "ana_1", "v2")
+        new = cache.set("exp_1", "ana_1", "v2", "sankey_flow", {}, Chart(value=1))
+
+        assert cache.current_analysis("exp_1") == ("ana_1", "v2")
+        assert cache.get("exp_1", "ana_1", "v1", "sankey_flow", {}) is None
+        assert new.etag != old.etag
+
+    def test_analysis_lookup_expires(self):
+        """Experiment -> analysis lookups expire after the TTL."""
+        cache = ChartResponseCache(analysis_ttl_seconds=0.0)
+        cache.set_current_analysis("exp_1", "ana_1", "v1")
+
+        assert cache.current_analysis("exp_1") is None
+
+
+class TestEtagMatches:
+    """Tests for If-None-Match comparison."""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"x", "abc"', True),
+            ("*", True),
+            ('"x"', False),
+            (None, False),
+        ],
+    )
+    def test_matches(self, header, expected):
+        assert etag_matches(header, '"abc"') is expected
@@ -0,0 +1,169 @@
+"""
+Unit tests for the document build pipeline.
+
+Tests:
+- Stages run concurrently, respect dependencies and skip dependents of failures
+- The exploration image is generated from the partial, still-streaming summary
+- Both documents are saved with per-stage timings
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from synth_lab.domain.entities.experiment_document import DocumentStatus, DocumentType
+from synth_lab.domain.entities.exploration import Exploration, ExplorationStatus, Goal
+from synth_lab.domain.entities.scenario_node import (
+    ScenarioNode,
+    ScorecardParams,
+    SimulationResults,
+)
+from synth_lab.services import document_builder
+from synth_lab.services.document_builder import ExplorationDocumentBuilder
+from synth_lab.services.document_pipeline import DocumentPipeline, PipelineStage
+
+
+def make_node(depth: int, success: float, parent_id: str | None = None) -> ScenarioNode:
+    """Scenario node with fixed scorecard params."""
+    return ScenarioNode(
+        exploration_id="expl_abcd1234",
+        depth=depth,
+        parent_id=parent_id,
+        action_applied=None if parent_id is None else "Simplificar formulário",
+        scorecard_params=ScorecardParams(
+            complexity=0.4, initial_effort=0.3, perceived_risk=0.2, time_to_value=0.3
+        ),
+        simulation_results=SimulationResults(
+            success_rate=success, fail_rate=round(1 - success, 2), did_not_try_rate=0.0
+        ),
+    )
+
+
+class TestDocumentPipeline:
+    """Tests for stage scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(self) -> None:
+        started: list[str] = []
+        release = asyncio.Event()
+
+        async def slow(artifacts: dict) -> str:
+            started.append("slow")
+            await release.wait()
+            return "slow"
+
+        async def fast(artifacts: dict) -> str:
+            started.append("fast")
+            release.set()
+            return "fast"
+
+        async def join(artifacts: dict) -> str:
+            return artifacts["slow"] + artifacts["fast"]
+
+        result = await DocumentPipeline([
+            PipelineStage("slow", slow),
+            PipelineStage("fast", fast),
+            PipelineStage("join", join, after=("slow", "fast")),
+        ]).run()
+
+        assert started == ["slow", "fast"]
+        assert result.artifacts["join"] == "slowfast"
+        assert set(result.timings_ms) == {"slow", "fast", "join"}
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_dependents(self) -> None:
+        async def broken(artifacts: dict) -> None:
+            raise RuntimeError("llm down")
+
+        dependent = AsyncMock()
+        result = await DocumentPipeline([
+            PipelineStage("text", broken),
+            PipelineStage("image", dependent, after=("text",)),
+        ]).run()
+
+        dependent.assert_not_called()
+        assert str(result.error_for("image")) == "llm down"
+
+    def test_rejects_unknown_dependency(self) -> None:
+        with pytest.raises(ValueError):
+            DocumentPipeline([PipelineStage("image", AsyncMock(), after=("text",))])
+
+
+class TestExplorationDocumentBuilder:
+    """Tests for the exploration summary + PR-FAQ build."""
+
+    @pytest.mark.asyncio
+    async def test_image_starts_from_partial_summary(self, monkeypatch) -> None:
+        root = make_node(0, 0.5)
+        path = [root, make_node(1, 0.7, parent_id=root.id)]
+        monkeypatch.setattr(document_builder, "get_winning_path", lambda repo, eid: path)
+        monkeypatch.setattr(document_builder, "presign_material_urls", lambda materials: {})
+
+        exploration = Exploration(
+            experiment_id="exp_abcd1234",
+            baseline_analysis_id="ana_abcd1234",
+            status=ExplorationStatus.GOAL_ACHIEVED,
+            goal=Goal(value=0.7),
+        )
+        exploration_repo = MagicMock()
+        exploration_repo.get_exploration_by_id.return_value = exploration
+        experiment_repo = MagicMock()
+        experiment_repo.get_by_id.return_value = None
+        document_repo = MagicMock()
+        document_repo.get_by_experiment.return_value = None
+
+        # The summary stream blocks after its first sections until the image has started
+        image_started = threading.Event()
+        summary_head = "# Síntese\n## Resumo Executivo\nr\n## Características Principais\n"
+        summary_head += "c" * 1500 + "\n"
+
+        def complete_stream(messages, **kwargs):
+            yield summary_head
+            assert image_started.wait(timeout=5)
+            yield "## Impacto Esperado\nfim"
+
+        llm_client = MagicMock()
+        llm_client.complete_stream.side_effect = complete_stream
+        llm_client.complete_async = AsyncMock(return_value="# Checkout Expresso\nPRFAQ")
+
+        prompts: list[str] = []
+
+        async def generate_image(markdown_content, **kwargs):
+            prompts.append(markdown_content)
+            image_started.set()
+            return Path("/tmp/exp_abcd1234_doc.png")
+
+        image_service = MagicMock()
+        image_service.generate_image.side_effect = generate_image
+        image_service.append_image_to_markdown.side_effect = lambda md, p: md + "\n![img]"
+
+        builder = ExplorationDocumentBuilder(
+            exploration_repo=exploration_repo,
+            document_repo=document_repo,
+            experiment_repo=experiment_repo,
+            llm_client=llm_client,
+            image_service=image_service,
+        )
+        result = await builder.build(exploration.id)
+
+        assert result.errors == {}
+        assert prompts == [summary_head]
+        assert result.timings_ms["image"]["start"] < (
+            result.timings_ms["summary_text"]["start"]
+            + result.timings_ms["summary_text"]["duration"]
+        )
+
+        saved = {
+            call.kwargs["document_type"]: call.kwargs
+            for call in document_repo.update_status.call_args_list
+        }
+        summary = saved[DocumentType.EXPLORATION_SUMMARY]
+        assert summary["status"] == DocumentStatus.COMPLETED
+        assert summary["markdown_content"].endswith("fim\n![img]")
+        assert set(summary["metadata"]["stage_timings_ms"]) == {
+            "load", "summary_text", "image", "material_urls", "prfaq_text"
+        }
+        assert saved[DocumentType.EXPLORATION_PRFAQ]["markdown_content"].startswith("# Checkout")
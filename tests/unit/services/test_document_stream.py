@@ -0,0 +1,196 @@
+"""
+Unit tests for document token streaming.
+
+Tests:
+- DocumentStreamWriter batches tokens into contiguous deltas and persists partial text
+- Writes from a worker thread are published on the event loop
+- stream_document_events replays persisted text, skips duplicates and ends with the document
+- Generations start in the route, report errors on the stream and run without a reader
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from synth_lab.domain.entities.experiment_document import (
+    DocumentStatus,
+    DocumentType,
+    ExperimentDocument,
+)
+from synth_lab.services import document_stream
+from synth_lab.services.document_stream import (
+    DocumentStreamWriter,
+    document_channel,
+    stream_document_events,
+    stream_generation_events,
+)
+from synth_lab.services.message_broker import BrokerMessage, MessageBroker
+
+EXPERIMENT_ID = "exp_12345678"
+EXEC_ID = "exec_12345678"
+CHANNEL = document_channel(EXPERIMENT_ID, DocumentType.RESEARCH_SUMMARY, EXEC_ID)
+
+
+@pytest.fixture
+def broker() -> MessageBroker:
+    """In-memory broker without subscribers."""
+    broker = MessageBroker()
+    broker.clear()
+    broker.configure(backend="memory")
+    yield broker
+    broker.clear()
+
+
+def make_document(content: str, status: DocumentStatus) -> ExperimentDocument:
+    """Research summary document."""
+    return ExperimentDocument(
+        id="doc_12345678",
+        experiment_id=EXPERIMENT_ID,
+        document_type=DocumentType.RESEARCH_SUMMARY,
+        source_id=EXEC_ID,
+        markdown_content=content,
+        status=status,
+    )
+
+
+def parse_frames(frames: list[str]) -> list[tuple[str, dict]]:
+    """(event, data) of SSE frames."""
+    parsed = []
+    for frame in frames:
+        lines = dict(line.split(": ", 1) for line in frame.strip().split("\n"))
+        parsed.append((lines["event"], json.loads(lines["data"])))
+    return parsed
+
+
+def drain(queue) -> list:
+    """Messages currently in a subscriber queue."""
+    received = []
+    while not queue.empty():
+        received.append(queue.get_nowait())
+    return received
+
+
+class TestDocumentStreamWriter:
+    """Tests for batching, persistence and thread hand-off."""
+
+    @pytest.mark.asyncio
+    async def test_batches_contiguous_deltas(self, broker: MessageBroker) -> None:
+        queue = broker.subscribe(CHANNEL)
+        writer = DocumentStreamWriter(
+            CHANNEL, broker=broker, publish_interval=60, publish_max_chars=4)
+        for token in ["ab", "cd", "e", "fgh", "i"]:
+            writer.write(token)
+        writer.close()
+        await asyncio.sleep(0)
+
+        received = drain(queue)
+        deltas = [(m.data["offset"], m.data["text"]) for m in received[:-1]]
+        assert deltas == [(0, "abcd"), (4, "efgh"), (8, "i")]
+        assert received[-1] is None
+        assert writer.text == "abcdefghi"
+
+    @pytest.mark.asyncio
+    async def test_persist_failures_do_not_stop_generation(self, broker: MessageBroker) -> None:
+        saved: list[str] = []
+
+        def persist(text: str) -> None:
+            saved.append(text)
+            if len(saved) == 1:
+                raise RuntimeError("db down")
+
+        writer = DocumentStreamWriter(CHANNEL, persist=persist, broker=broker,
+                                      persist_interval=0)
+        writer.write("# T")
+        writer.write("\nfim")
+        assert saved == ["# T", "# T\nfim"]
+
+    @pytest.mark.asyncio
+    async def test_worker_thread_publishes_on_loop(self, broker: MessageBroker) -> None:
+        queue = broker.subscribe(CHANNEL)
+        writer = DocumentStreamWriter(CHANNEL, broker=broker, publish_max_chars=1)
+
+        def generate() -> None:
+            for token in ["a", "b", "c"]:
+                writer.write(token)
+            writer.close()
+
+        await asyncio.to_thread(generate)
+        await asyncio.sleep(0.01)
+
+        received = drain(queue)
+        assert "".join(m.data["text"] for m in received[:-1]) == "abc"
+        assert received[-1] is None
+
+
+class TestStreamDocumentEvents:
+    """Tests for snapshot, live deltas and completion."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_then_deduplicated_deltas(self, broker: MessageBroker) -> None:
+        documents = [make_document("# Sínt", DocumentStatus.GENERATING)]
+        events = stream_document_events(CHANNEL, lambda: documents[-1], broker=broker)
+
+        frames = [await events.__anext__()]
+        # A delta overlapping the persisted text only contributes its new part
+        await broker.publish(
+            CHANNEL, BrokerMessage("document_delta", {"offset": 0, "text": "# Sí"}))
+        await broker.publish(
+            CHANNEL, BrokerMessage("document_delta", {"offset": 4, "text": "ntese\n"}))
+        documents.append(make_document("# Síntese\nfim", DocumentStatus.COMPLETED))
+        await broker.close_execution(CHANNEL)
+        frames += [frame async for frame in events]
+
+        assert parse_frames(frames) == [
+            ("document_snapshot", {"offset": 0, "text": "# Sínt"}),
+            ("document_delta", {"offset": 6, "text": "ese\n"}),
+            ("document_completed", {
+                "status": "completed", "markdown_content": "# Síntese\nfim",
+                "error_message": None,
+            }),
+        ]
+        assert "id: 10\n" in frames[1]
+        assert broker.get_subscriber_count(CHANNEL) == 0
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_received_text(self, broker: MessageBroker) -> None:
+        document = make_document("abcdef", DocumentStatus.GENERATING)
+        events = stream_document_events(CHANNEL, lambda: document, resume_from=4, broker=broker)
+        frame = await events.__anext__()
+        await events.aclose()
+        assert parse_frames([frame]) == [("document_snapshot", {"offset": 4, "text": "ef"})]
+
+    @pytest.mark.asyncio
+    async def test_finished_document_completes_immediately(self, broker: MessageBroker) -> None:
+        document = make_document("# Final", DocumentStatus.COMPLETED)
+        frames = [frame async for frame in stream_document_events(
+            CHANNEL, lambda: document, broker=broker)]
+        assert [event for event, _ in parse_frames(frames)] == ["document_completed"]
+
+    @pytest.mark.asyncio
+    async def test_detached_generation_error(self, broker: MessageBroker) -> None:
+        async def generate() -> None:
+            raise ValueError("Executive summary generation already in progress")
+
+        frames = [frame async for frame in stream_generation_events(
+            CHANNEL, lambda: None, generate(), broker=broker)]
+        assert parse_frames(frames) == [
+            ("document_error", {"error": "Executive summary generation already in progress"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_generation_runs_without_reader(
+        self, broker: MessageBroker, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(document_stream, "ABANDONED_STREAM_GRACE_SECONDS", 0.0)
+        generated = asyncio.Event()
+
+        async def generate() -> None:
+            generated.set()
+
+        stream_generation_events(CHANNEL, lambda: None, generate(), broker=broker)
+        assert broker.get_subscriber_count(CHANNEL) == 1
+
+        await asyncio.wait_for(generated.wait(), timeout=1)
+        await asyncio.sleep(0.01)
+        assert broker.get_subscriber_count(CHANNEL) == 0
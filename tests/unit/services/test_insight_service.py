@@ -10,6 +10,9 @@ References:
 """
 
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -212,5 +215,70 @@ class TestGenerateInsight:
         assert result.summary == "Fallback summary text"
 
 
+class TestGenerateInsights:
+    """Test generate_insights (batched, single-flight)."""
+
+    def test_answers_several_charts_with_one_call(self, insight_service):
+        """Should send all charts in one prompt and store one insight per chart."""
+        insight_service.analysis_repo.get_by_id.return_value = None
+        insight_service.llm.complete_json.return_value = json.dumps({
+            "insights": {
+                "try_vs_success": {"resumo_key_findings": "Resumo tentativa"},
+                "outliers": {"resumo_key_findings": "Resumo outliers"},
+            }
+        })
+
+        results = insight_service.generate_insights(
+            "ana_12345678", {"try_vs_success": {"a": 1}, "outliers": {"b": 2}}
+        )
+
+        assert results["try_vs_success"].summary == "Resumo tentativa"
+        assert results["outliers"].summary == "Resumo outliers"
+        insight_service.llm.complete_json.assert_called_once()
+        prompt = insight_service.llm.complete_json.call_args.kwargs["messages"][0]["content"]
+        assert '<chart type="try_vs_success">' in prompt
+        assert '<chart type="outliers">' in prompt
+        assert insight_service.cache_repo.store_chart_insight.call_count == 2
+
+    def test_generates_missing_charts_individually(self, insight_service):
+        """Charts missing from the batched response fall back to one call each."""
+        insight_service.analysis_repo.get_by_id.return_value = None
+        insight_service.llm.complete_json.side_effect = [
+            json.dumps({"insights": {"try_vs_success": {"resumo_key_findings": "Ok"}}}),
+            json.dumps({"resumo_key_findings": "Individual"}),
+        ]
+
+        results = insight_service.generate_insights(
+            "ana_12345678", {"try_vs_success": {}, "outliers": {}}
+        )
+
+        assert results["try_vs_success"].summary == "Ok"
+        assert results["outliers"].summary == "Individual"
+        assert insight_service.llm.complete_json.call_count == 2
+
+    def test_concurrent_requests_share_one_call(self, insight_service):
+        """Concurrent requests for the same analysis and chart coalesce."""
+        insight_service.analysis_repo.get_by_id.return_value = None
+        release = threading.Event()
+
+        def slow_llm(**kwargs):
+            release.wait(timeout=5)
+            return json.dumps({"resumo_key_findings": "Compartilhado"})
+
+        insight_service.llm.complete_json.side_effect = slow_llm
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(insight_service.generate_insight, "ana_12345678", "outliers", {})
+                for _ in range(4)
+            ]
+            time.sleep(0.2)
+            release.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert {r.summary for r in results} == {"Compartilhado"}
+        insight_service.llm.complete_json.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
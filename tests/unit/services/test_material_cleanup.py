@@ -0,0 +1,130 @@
+"""
+Unit tests for orphaned material file cleanup.
+
+Runs against an in-memory S3 stand-in (ListObjectsV2 pagination and
+DeleteObjects) patched in as the storage client.
+
+Tests:
+- Listing continues past 1000 keys
+- Material IDs are checked with one repository query per page
+- Orphans are deleted in batches of at most 1000 keys; dry runs delete nothing
+- Failed deletions and progress are reported
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from synth_lab.services.material_cleanup import CleanupProgress, OrphanedFileCleanup
+
+
+class LocalS3:
+    """In-memory bucket with the list/delete calls used by the cleanup."""
+
+    def __init__(self, keys: list[str], undeletable: set[str] | None = None):
+        self.keys = set(keys)
+        self.undeletable = undeletable or set()
+        self.list_calls = 0
+        self.delete_batches: list[int] = []
+
+    def get_paginator(self, operation: str) -> "LocalS3":
+        assert operation == "list_objects_v2"
+        return self
+
+    def paginate(self, Bucket: str, Prefix: str, PaginationConfig: dict):
+        page_size = PaginationConfig["PageSize"]
+        after = ""
+        while True:
+            self.list_calls += 1
+            matching = sorted(k for k in self.keys if k.startswith(Prefix) and k > after)
+            page = matching[:page_size]
+            yield {"Contents": [{"Key": key} for key in page]} if page else {}
+            if len(matching) <= page_size:
+                return
+            after = page[-1]
+
+    def delete_objects(self, Bucket: str, Delete: dict) -> dict:
+        batch = [obj["Key"] for obj in Delete["Objects"]]
+        assert len(batch) <= 1000
+        self.delete_batches.append(len(batch))
+        errors = []
+        for key in batch:
+            if key in self.undeletable:
+                errors.append({"Key": key, "Code": "AccessDenied", "Message": "denied"})
+            else:
+                self.keys.discard(key)
+        return {"Errors": errors} if errors else {}
+
+
+def material_key(n: int, prefix: str = "materials", ext: str = "png") -> str:
+    return f"{prefix}/exp_0001/mat_{n:012d}.{ext}"
+
+
+@pytest.fixture
+def repository():
+    """Repository whose existing materials are the even-numbered ones."""
+    repo = MagicMock()
+    repo.get_existing_ids.side_effect = lambda ids: {
+        mid for mid in ids if int(mid.removeprefix("mat_")) % 2 == 0}
+    return repo
+
+
+def run_cleanup(s3: LocalS3, repository, dry_run: bool, **kwargs) -> dict:
+    with patch("synth_lab.infrastructure.storage_client.get_s3_client", return_value=s3):
+        return OrphanedFileCleanup(repository, **kwargs).run(dry_run=dry_run).to_dict()
+
+
+class TestOrphanedFileCleanup:
+    """Tests for pagination, bulk checks and batched deletes."""
+
+    def test_paginates_past_1000_keys_and_checks_one_query_per_page(self, repository) -> None:
+        s3 = LocalS3([material_key(n) for n in range(2500)])
+
+        result = run_cleanup(s3, repository, dry_run=True)
+
+        assert result["scanned_files"] == 2500
+        assert result["orphaned_materials"] == 1250
+        assert repository.get_existing_ids.call_count == 3
+        repository.get_by_id.assert_not_called()
+        # Dry run deletes nothing
+        assert s3.delete_batches == []
+        assert len(s3.keys) == 2500
+
+    def test_deletes_orphans_in_batches(self, repository) -> None:
+        keys = [material_key(n) for n in range(2400)]
+        keys += [material_key(n, "thumbnails") for n in range(10)]
+        s3 = LocalS3(keys)
+
+        result = run_cleanup(s3, repository, dry_run=False, page_size=1000)
+
+        assert result["orphaned_materials"] == 1200
+        assert result["orphaned_thumbnails"] == 5
+        assert result["deleted_files"] == 1205
+        # One DeleteObjects request per page with orphans
+        assert s3.delete_batches == [500, 500, 200, 5]
+        assert all(int(k.split("_")[-1].split(".")[0]) % 2 == 0 for k in s3.keys)
+
+    def test_reports_failed_deletions_and_ignores_unknown_keys(self, repository) -> None:
+        s3 = LocalS3(
+            [material_key(1), material_key(3), material_key(4), "materials/readme.txt"],
+            undeletable={material_key(3)},
+        )
+
+        result = run_cleanup(s3, repository, dry_run=False)
+
+        assert result["deleted_files"] == 1
+        assert result["failed_deletions"] == 1
+        assert s3.keys == {material_key(3), material_key(4), "materials/readme.txt"}
+
+    def test_reports_progress_per_page(self, repository) -> None:
+        s3 = LocalS3([material_key(n) for n in range(25)])
+        updates: list[tuple[str, int, int]] = []
+
+        def progress(totals: CleanupProgress) -> None:
+            updates.append((totals.prefix, totals.pages, totals.scanned))
+
+        run_cleanup(s3, repository, dry_run=True, page_size=10, progress=progress)
+
+        assert updates == [
+            ("materials/", 1, 10), ("materials/", 2, 20), ("materials/", 3, 25),
+        ]
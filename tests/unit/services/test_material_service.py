@@ -228,14 +228,13 @@ class TestConfirmUpload:
         )
         mock_repository.get_by_id.side_effect = [sample_material, updated_material]
 
-        # Mock thumbnail and description generation to avoid side effects
-        with patch.object(material_service, 'generate_thumbnail'):
-            with patch.object(material_service, 'generate_description'):
-                result = material_service.confirm_upload(
-                    experiment_id="exp_abc12345",
-                    material_id="mat_a1b2c3d4e5f6",
-                    object_key="materials/exp_abc12345/mat_a1b2c3d4e5f6.png",
-                )
+        # Mock media processing scheduling to avoid side effects
+        with patch.object(material_service, 'schedule_media_processing'):
+            result = material_service.confirm_upload(
+                experiment_id="exp_abc12345",
+                material_id="mat_a1b2c3d4e5f6",
+                object_key="materials/exp_abc12345/mat_a1b2c3d4e5f6.png",
+            )
 
         # Should verify object exists in S3
         mock_check_exists.assert_called_once_with(
@@ -298,10 +297,10 @@ class TestConfirmUpload:
         assert "does not belong" in str(exc_info.value)
 
     @patch("synth_lab.services.material_service.check_object_exists")
-    def test_triggers_thumbnail_generation(
+    def test_queues_thumbnail_and_description_generation(
         self, mock_check_exists, material_service, mock_repository, sample_material
     ):
-        """Should trigger thumbnail generation after confirmation."""
+        """Should queue thumbnail and description generation after confirmation."""
         mock_check_exists.return_value = True
         mock_repository.get_by_id.return_value = sample_material
 
@@ -310,21 +309,23 @@ class TestConfirmUpload:
         )
         mock_repository.get_by_id.side_effect = [sample_material, updated_material]
 
-        with patch.object(material_service, 'generate_thumbnail') as mock_thumb:
-            with patch.object(material_service, 'generate_description'):
+        with patch.object(material_service, 'schedule_media_processing') as mock_schedule:
+            with patch.object(material_service, 'generate_thumbnail') as mock_thumb:
                 material_service.confirm_upload(
                     experiment_id="exp_abc12345",
                     material_id="mat_a1b2c3d4e5f6",
                     object_key="materials/exp_abc12345/mat_a1b2c3d4e5f6.png",
                 )
 
-        mock_thumb.assert_called_once_with("mat_a1b2c3d4e5f6")
+        # Generation runs in the background, not on the request path
+        mock_schedule.assert_called_once_with("mat_a1b2c3d4e5f6")
+        mock_thumb.assert_not_called()
 
     @patch("synth_lab.services.material_service.check_object_exists")
     def test_handles_thumbnail_generation_failure_gracefully(
         self, mock_check_exists, material_service, mock_repository, sample_material
     ):
-        """Should not fail upload if thumbnail generation fails."""
+        """Should not fail upload if thumbnail generation cannot be queued."""
         mock_check_exists.return_value = True
         mock_repository.get_by_id.return_value = sample_material
 
@@ -333,14 +334,15 @@ class TestConfirmUpload:
         )
         mock_repository.get_by_id.side_effect = [sample_material, updated_material]
 
-        with patch.object(material_service, 'generate_thumbnail', side_effect=Exception("Thumbnail failed")):
-            with patch.object(material_service, 'generate_description'):
-                # Should not raise exception
-                result = material_service.confirm_upload(
-                    experiment_id="exp_abc12345",
-                    material_id="mat_a1b2c3d4e5f6",
-                    object_key="materials/exp_abc12345/mat_a1b2c3d4e5f6.png",
-                )
+        with patch.object(
+            material_service, 'schedule_media_processing', side_effect=Exception("Queue failed")
+        ):
+            # Should not raise exception
+            result = material_service.confirm_upload(
+                experiment_id="exp_abc12345",
+                material_id="mat_a1b2c3d4e5f6",
+                object_key="materials/exp_abc12345/mat_a1b2c3d4e5f6.png",
+            )
 
         # Should still return material
         assert result is not None
@@ -381,13 +383,34 @@ class TestGetLimits:
         assert result["can_upload"] is False
 
 
+def stored_object(content: bytes | None):
+    """download_object_to_file side effect writing content (None: object not found)."""
+
+    def download(object_key, path, byte_range=None, chunk_size=None):
+        if content is None:
+            return False
+        with open(path, "wb") as f:
+            f.write(content)
+        return True
+
+    return download
+
+
+@pytest.fixture
+def inline_media():
+    """Run media decoding tasks in-process instead of the process pool."""
+    with patch("synth_lab.services.media_processing.MEDIA_WORKERS", 0):
+        yield
+
+
+@pytest.mark.usefixtures("inline_media")
 class TestThumbnailGeneration:
     """Test thumbnail generation methods (T036)."""
 
-    @patch("synth_lab.services.material_service.get_object_bytes")
+    @patch("synth_lab.services.media_processing.download_object_to_file")
     @patch("synth_lab.services.material_service.upload_object")
     def test_generate_thumbnail_for_image(
-        self, mock_upload, mock_get_bytes, material_service, mock_repository, sample_material
+        self, mock_upload, mock_download, material_service, mock_repository, sample_material
     ):
         """Should generate thumbnail for image material."""
         # Mock S3 download - return a small PNG image bytes
@@ -398,7 +421,7 @@ class TestThumbnailGeneration:
         img = Image.new("RGB", (400, 400), color="red")
         img_bytes = BytesIO()
         img.save(img_bytes, format="PNG")
-        mock_get_bytes.return_value = img_bytes.getvalue()
+        mock_download.side_effect = stored_object(img_bytes.getvalue())
 
         # Mock successful upload
         mock_upload.return_value = True
@@ -409,8 +432,9 @@ class TestThumbnailGeneration:
 
         result = material_service.generate_thumbnail("mat_a1b2c3d4e5f6")
 
-        # Should download original file
-        mock_get_bytes.assert_called_once()
+        # Should stream original file to disk
+        mock_download.assert_called_once()
+        assert mock_download.call_args[0][0] == "materials/exp_abc12345/mat_a1b2c3d4e5f6.png"
 
         # Should upload thumbnail
         mock_upload.assert_called_once()
@@ -423,9 +447,10 @@ class TestThumbnailGeneration:
         assert result is not None
         assert "thumbnails/" in result
 
-    @patch("synth_lab.services.material_service.get_object_bytes")
+    @patch("synth_lab.services.media_processing.get_object_range")
+    @patch("synth_lab.services.media_processing.download_object_to_file")
     def test_generate_thumbnail_for_video_handles_errors_gracefully(
-        self, mock_get_bytes, material_service, mock_repository
+        self, mock_download, mock_get_range, material_service, mock_repository
     ):
         """Should handle video thumbnail generation errors gracefully."""
         from datetime import datetime, timezone
@@ -447,17 +472,18 @@ class TestThumbnailGeneration:
         mock_repository.get_by_id.return_value = video_material
 
         # Mock S3 download failure for video
-        mock_get_bytes.return_value = None
+        mock_get_range.return_value = None
+        mock_download.return_value = False
 
         result = material_service.generate_thumbnail("mat_fedcba987654")
 
         # Should return None on video processing errors
         assert result is None
 
-    @patch("synth_lab.services.material_service.get_object_bytes")
+    @patch("synth_lab.services.media_processing.download_object_to_file")
     @patch("synth_lab.services.material_service.upload_object")
     def test_generate_thumbnail_for_pdf(
-        self, mock_upload, mock_get_bytes, material_service, mock_repository
+        self, mock_upload, mock_download, material_service, mock_repository
     ):
         """Should generate thumbnail from PDF first page."""
         from datetime import datetime, timezone
@@ -476,13 +502,13 @@ class TestThumbnailGeneration:
             created_at=datetime.now(timezone.utc),
         )
 
-        mock_get_bytes.return_value = b"fake_pdf_data"
+        mock_download.side_effect = stored_object(b"fake_pdf_data")
         mock_upload.return_value = True
         mock_repository.get_by_id.return_value = pdf_material
         mock_repository.update_thumbnail.return_value = None
 
         # Mock pdf2image conversion
-        with patch("pdf2image.convert_from_bytes") as mock_convert:
+        with patch("pdf2image.convert_from_path") as mock_convert:
             from PIL import Image
 
             # Create a fake page image
@@ -508,22 +534,22 @@ class TestThumbnailGeneration:
 
         assert result is None
 
-    @patch("synth_lab.services.material_service.get_object_bytes")
+    @patch("synth_lab.services.media_processing.download_object_to_file")
     def test_generate_thumbnail_handles_s3_download_failure(
-        self, mock_get_bytes, material_service, mock_repository, sample_material
+        self, mock_download, material_service, mock_repository, sample_material
     ):
         """Should return None if S3 download fails."""
         mock_repository.get_by_id.return_value = sample_material
-        mock_get_bytes.return_value = None  # Simulate download failure
+        mock_download.return_value = False  # Simulate object not found
 
         result = material_service.generate_thumbnail("mat_a1b2c3d4e5f6")
 
         assert result is None
 
-    @patch("synth_lab.services.material_service.get_object_bytes")
+    @patch("synth_lab.services.media_processing.download_object_to_file")
     @patch("synth_lab.services.material_service.upload_object")
     def test_generate_thumbnail_handles_upload_failure(
-        self, mock_upload, mock_get_bytes, material_service, mock_repository, sample_material
+        self, mock_upload, mock_download, material_service, mock_repository, sample_material
     ):
         """Should return None if thumbnail upload fails."""
         from io import BytesIO
@@ -533,7 +559,7 @@ class TestThumbnailGeneration:
         img = Image.new("RGB", (100, 100), color="blue")
         img_bytes = BytesIO()
         img.save(img_bytes, format="PNG")
-        mock_get_bytes.return_value = img_bytes.getvalue()
+        mock_download.side_effect = stored_object(img_bytes.getvalue())
 
         # Mock upload failure
         mock_upload.return_value = False
@@ -0,0 +1,130 @@
+"""
+Unit tests for material media processing.
+
+Tests:
+- MP4 box parsing finds the moov box only when it precedes mdat
+- Fast-start videos are fetched with a ranged read, others in full
+- Partial downloads that cannot be decoded are retried with the full object
+- Missing objects return None
+"""
+
+import struct
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from synth_lab.domain.entities.experiment_material import FileType
+from synth_lab.services import media_processing
+from synth_lab.services.media_processing import mp4_moov_end, process_stored_media
+
+
+def box_header(box_type: bytes, size: int) -> bytes:
+    """Top-level MP4 box header."""
+    return struct.pack(">I4s", size, box_type)
+
+
+FAST_START = box_header(b"ftyp", 8) + box_header(b"moov", 992)
+MDAT_FIRST = box_header(b"ftyp", 8) + box_header(b"mdat", 50_000_000)
+
+
+@pytest.fixture(autouse=True)
+def inline_media():
+    """Run decoding tasks in-process."""
+    with patch.object(media_processing, "MEDIA_WORKERS", 0):
+        yield
+
+
+class FakeStorage:
+    """Records downloads and writes the requested bytes of an object."""
+
+    def __init__(self, content: bytes | None):
+        self.content = content
+        self.downloads: list[tuple[int, int] | None] = []
+
+    def get_range(self, object_key: str, first: int, last: int) -> bytes | None:
+        return None if self.content is None else self.content[first:last + 1]
+
+    def download(self, object_key, path, byte_range=None, chunk_size=None) -> bool:
+        self.downloads.append(byte_range)
+        if self.content is None:
+            return False
+        data = self.content
+        if byte_range is not None:
+            data = data[byte_range[0]:byte_range[1] + 1]
+        Path(path).write_bytes(data)
+        return True
+
+
+@pytest.fixture
+def storage(request) -> FakeStorage:
+    """Fake S3 with the content given by the test's parametrization."""
+    fake = FakeStorage(request.param)
+    with patch.object(media_processing, "get_object_range", fake.get_range), \
+            patch.object(media_processing, "download_object_to_file", fake.download):
+        yield fake
+
+
+def file_size(path: str) -> int:
+    """Decoding task returning the size of the local file."""
+    return Path(path).stat().st_size
+
+
+class TestMp4MoovEnd:
+    """Tests for top-level box parsing."""
+
+    def test_fast_start(self) -> None:
+        assert mp4_moov_end(FAST_START) == 1000
+
+    def test_mdat_first(self) -> None:
+        assert mp4_moov_end(MDAT_FIRST) is None
+
+    def test_not_mp4(self) -> None:
+        assert mp4_moov_end(b"%PDF-1.7\n") is None
+
+
+class TestProcessStoredMedia:
+    """Tests for ranged and full downloads."""
+
+    @pytest.mark.parametrize("storage", [FAST_START + b"\0" * 5000], indirect=True)
+    def test_fast_start_video_uses_ranged_read(self, storage: FakeStorage) -> None:
+        with patch.object(media_processing, "MEDIA_VIDEO_PREFIX_BYTES", 100):
+            size = process_stored_media("v.mp4", FileType.VIDEO, file_size)
+
+        assert storage.downloads == [(0, 1099)]
+        assert size == 1100
+
+    @pytest.mark.parametrize("storage", [MDAT_FIRST + b"\0" * 5000], indirect=True)
+    def test_mdat_first_video_downloads_all(self, storage: FakeStorage) -> None:
+        size = process_stored_media("v.mp4", FileType.VIDEO, file_size)
+
+        assert storage.downloads == [None]
+        assert size == len(storage.content)
+
+    @pytest.mark.parametrize("storage", [FAST_START + b"\0" * 5000], indirect=True)
+    def test_undecodable_prefix_falls_back_to_full_download(self, storage: FakeStorage) -> None:
+        def needs_full_file(path: str) -> int:
+            size = file_size(path)
+            if size < len(storage.content):
+                raise OSError("truncated video")
+            return size
+
+        with patch.object(media_processing, "MEDIA_VIDEO_PREFIX_BYTES", 100):
+            size = process_stored_media("v.mp4", FileType.VIDEO, needs_full_file)
+
+        assert storage.downloads == [(0, 1099), None]
+        assert size == len(storage.content)
+
+    @pytest.mark.parametrize("storage", [b"%PDF-1.7\n"], indirect=True)
+    def test_task_errors_on_full_file_propagate(self, storage: FakeStorage) -> None:
+        def broken(path: str) -> None:
+            raise ValueError("No pages extracted from document")
+
+        with pytest.raises(ValueError):
+            process_stored_media("d.pdf", FileType.DOCUMENT, broken)
+        assert storage.downloads == [None]
+
+    @pytest.mark.parametrize("storage", [None], indirect=True)
+    def test_missing_object_returns_none(self, storage: FakeStorage) -> None:
+        assert process_stored_media("i.png", FileType.IMAGE, file_size) is None
+        assert process_stored_media("v.mp4", FileType.VIDEO, file_size) is None
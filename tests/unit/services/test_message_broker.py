@@ -0,0 +1,93 @@
+"""
+Unit tests for the SSE message broker.
+
+Tests:
+- Bounded subscriber queues apply the overflow policy and always deliver the sentinel
+- In-memory backend fan-out through MessageBroker
+- NOTIFY payload encoding round trip
+"""
+
+import json
+
+import pytest
+
+from synth_lab.services.message_broker import (
+    BrokerMessage,
+    MessageBroker,
+    OverflowPolicy,
+    SubscriberQueue,
+    decode_message,
+    encode_message,
+)
+
+
+def make_message(i: int) -> BrokerMessage:
+    """Interview message with an index."""
+    return BrokerMessage(event_type="message", data={"i": i})
+
+
+@pytest.fixture
+def broker() -> MessageBroker:
+    """In-memory broker with small queues."""
+    broker = MessageBroker()
+    broker.clear()
+    broker.configure(backend="memory", queue_size=2, policy=OverflowPolicy.DROP_OLDEST)
+    yield broker
+    broker.clear()
+    broker.configure(queue_size=1000)
+
+
+class TestSubscriberQueue:
+    """Tests for overflow policies."""
+
+    def test_drop_oldest_keeps_latest(self) -> None:
+        queue = SubscriberQueue(2, OverflowPolicy.DROP_OLDEST)
+        for i in range(3):
+            queue.offer(make_message(i))
+        assert [queue.get_nowait().data["i"] for _ in range(2)] == [1, 2]
+        assert queue.dropped == 1
+
+    def test_drop_newest_still_delivers_sentinel(self) -> None:
+        queue = SubscriberQueue(2, OverflowPolicy.DROP_NEWEST)
+        for i in range(3):
+            queue.offer(make_message(i))
+        queue.offer(None)
+        assert queue.get_nowait().data["i"] == 1
+        assert queue.get_nowait() is None
+
+    def test_disconnect_ends_stream(self) -> None:
+        queue = SubscriberQueue(2, OverflowPolicy.DISCONNECT)
+        for i in range(3):
+            queue.offer(make_message(i))
+        assert queue.disconnected
+        assert queue.get_nowait() is None
+        assert not queue.offer(make_message(4))
+
+
+class TestMessageBroker:
+    """Tests for broker fan-out with the in-memory backend."""
+
+    @pytest.mark.asyncio
+    async def test_publish_does_not_block_on_full_queue(self, broker: MessageBroker) -> None:
+        queue = broker.subscribe("exec_1")
+        for i in range(5):
+            await broker.publish("exec_1", make_message(i))
+        await broker.close_execution("exec_1")
+
+        received = [queue.get_nowait(), queue.get_nowait()]
+        assert received[0].data["i"] == 4
+        assert received[1] is None
+
+    @pytest.mark.asyncio
+    async def test_publish_only_reaches_own_execution(self, broker: MessageBroker) -> None:
+        queue = broker.subscribe("exec_1")
+        await broker.publish("exec_2", make_message(0))
+        assert queue.empty()
+        broker.unsubscribe("exec_1", queue)
+        assert broker.get_subscriber_count("exec_1") == 0
+
+
+def test_notify_payload_round_trip() -> None:
+    message = BrokerMessage(event_type="summary_partial", data={"content": "Olá"})
+    assert decode_message(json.loads(encode_message("exec_1", message))) == message
+    assert decode_message(json.loads(encode_message("exec_1", None))) is None
@@ -0,0 +1,194 @@
+"""
+Unit tests for shared outcome aggregates.
+
+Checks that the vectorized aggregates reproduce the per-outcome chart logic
+(quadrants, sorting, Sankey root causes) and that point lists page correctly.
+
+References:
+    - Aggregates: src/synth_lab/services/simulation/outcome_aggregates.py
+    - Charts: src/synth_lab/services/simulation/chart_data_service.py
+"""
+
+import pytest
+
+from synth_lab.domain.entities import (
+    FeatureScorecard,
+    ScorecardDimension,
+    ScorecardIdentification,
+    SynthOutcome,
+)
+from synth_lab.domain.entities.simulation_attributes import (
+    SimulationAttributes,
+    SimulationLatentTraits,
+    SimulationObservables,
+)
+from synth_lab.services.simulation.chart_data_service import ChartDataService
+from synth_lab.services.simulation.outcome_aggregates import (
+    OutcomeAggregates,
+    get_outcome_aggregate_cache,
+    get_outcome_aggregates,
+)
+
+
+@pytest.fixture
+def chart_service() -> ChartDataService:
+    """Create chart data service instance."""
+    return ChartDataService()
+
+
+@pytest.fixture
+def scorecard() -> FeatureScorecard:
+    """Scorecard whose gaps depend on synth traits."""
+    return FeatureScorecard(
+        id="ab123456",
+        identification=ScorecardIdentification(
+            feature_name="Test Feature",
+            use_scenario="Test scenario for unit tests",
+        ),
+        description_text="A test feature description for unit tests",
+        perceived_risk=ScorecardDimension(score=0.6, min_uncertainty=0.5, max_uncertainty=0.7),
+        initial_effort=ScorecardDimension(score=0.7, min_uncertainty=0.6, max_uncertainty=0.8),
+        complexity=ScorecardDimension(score=0.5, min_uncertainty=0.4, max_uncertainty=0.6),
+        time_to_value=ScorecardDimension(score=0.6, min_uncertainty=0.5, max_uncertainty=0.7),
+    )
+
+
+def create_outcome(
+    synth_id: str,
+    did_not_try_rate: float,
+    failed_rate: float,
+    trust_mean: float = 0.5,
+    capability_mean: float = 0.5,
+    friction_tolerance_mean: float = 0.5,
+) -> SynthOutcome:
+    """Create a SynthOutcome; success_rate is the remainder."""
+    attributes = SimulationAttributes(
+        latent_traits=SimulationLatentTraits(
+            capability_mean=capability_mean,
+            trust_mean=trust_mean,
+            friction_tolerance_mean=friction_tolerance_mean,
+            exploration_prob=0.5,
+        ),
+        observables=SimulationObservables(
+            digital_literacy=0.5,
+            similar_tool_experience=0.5,
+            motor_ability=0.5,
+            time_availability=0.5,
+            domain_expertise=0.5,
+        ),
+    )
+    return SynthOutcome(
+        synth_id=synth_id,
+        analysis_id="ana_12345678",
+        did_not_try_rate=did_not_try_rate,
+        failed_rate=failed_rate,
+        success_rate=round(1.0 - did_not_try_rate - failed_rate, 6),
+        synth_attributes=attributes,
+    )
+
+
+@pytest.fixture
+def outcomes() -> list[SynthOutcome]:
+    """Mixed outcomes, including rate ties."""
+    return [
+        create_outcome("s1", 0.1, 0.2, trust_mean=0.9),
+        create_outcome("s2", 0.6, 0.2, trust_mean=0.1, capability_mean=0.1),
+        create_outcome("s3", 0.2, 0.5, friction_tolerance_mean=0.1),
+        create_outcome("s4", 0.2, 0.2),
+        create_outcome("s5", 0.3, 0.4),
+    ]
+
+
+class TestOutcomeAggregates:
+    """Tests for OutcomeAggregates built from outcomes."""
+
+    def test_summary_matches_outcomes(self, outcomes: list[SynthOutcome]) -> None:
+        """Means and median are computed once from all outcomes."""
+        agg = OutcomeAggregates.from_outcomes(outcomes)
+        assert len(agg) == 5
+        assert agg.summary["avg_did_not_try"] == pytest.approx(0.28)
+        assert agg.summary["sum_failed"] == pytest.approx(1.5)
+        assert agg.summary["median_success"] == pytest.approx(0.3)
+
+    def test_root_causes_match_scalar_diagnosis(
+        self,
+        chart_service: ChartDataService,
+        scorecard: FeatureScorecard,
+        outcomes: list[SynthOutcome],
+    ) -> None:
+        """Vectorized weights equal the per-outcome diagnose_* totals."""
+        expected = dict.fromkeys(
+            ["effort_barrier", "risk_barrier", "capability_barrier", "patience_barrier"], 0.0
+        )
+        for o in outcomes:
+            expected[chart_service.diagnose_did_not_try(o, scorecard)] += o.did_not_try_rate
+            expected[chart_service.diagnose_failed(o, scorecard)] += o.failed_rate
+
+        weights = OutcomeAggregates.from_outcomes(outcomes).root_cause_weights(scorecard)
+        assert weights == pytest.approx(expected)
+
+    def test_cache_builds_once_per_analysis(self, outcomes: list[SynthOutcome]) -> None:
+        """Outcomes are loaded and aggregated once per analysis ID."""
+        get_outcome_aggregate_cache().clear()
+        loads: list[int] = []
+
+        def load() -> list[SynthOutcome]:
+            loads.append(1)
+            return outcomes
+
+        first = get_outcome_aggregates("ana_aaaa0001", load)
+        second = get_outcome_aggregates("ana_aaaa0001", load)
+        assert first is second
+        assert len(loads) == 1
+
+        get_outcome_aggregate_cache().invalidate("ana_aaaa0001")
+        get_outcome_aggregates("ana_aaaa0001", load)
+        assert len(loads) == 2
+        get_outcome_aggregate_cache().clear()
+
+
+class TestChartsFromAggregates:
+    """Charts read the same results from outcomes or aggregates."""
+
+    def test_try_vs_success_pagination(
+        self, chart_service: ChartDataService, outcomes: list[SynthOutcome]
+    ) -> None:
+        """Points are paged; quadrant counts still cover all synths."""
+        full = chart_service.get_try_vs_success("ana_12345678", outcomes)
+        page = chart_service.get_try_vs_success(
+            "ana_12345678", OutcomeAggregates.from_outcomes(outcomes), limit=2, offset=1
+        )
+        assert [p.synth_id for p in full.points] == ["s1", "s2", "s3", "s4", "s5"]
+        assert page.points == full.points[1:3]
+        assert page.quadrant_counts == full.quadrant_counts
+        assert sum(page.quadrant_counts.values()) == 5
+        assert page.total_synths == 5
+
+    def test_distribution_sort_is_stable(
+        self, chart_service: ChartDataService, outcomes: list[SynthOutcome]
+    ) -> None:
+        """Ties keep outcome order in both directions, as with list.sort."""
+        desc = chart_service.get_outcome_distribution(
+            "ana_12345678", outcomes, sort_by="failed_rate", order="desc"
+        )
+        asc = chart_service.get_outcome_distribution(
+            "ana_12345678", outcomes, sort_by="failed_rate", order="asc", limit=3, offset=1
+        )
+        assert [d.synth_id for d in desc.distributions] == ["s3", "s5", "s1", "s2", "s4"]
+        assert [d.synth_id for d in asc.distributions] == ["s2", "s4", "s5"]
+        assert desc.worst_performers[0] == "s2"
+        assert desc.best_performers[0] == "s1"
+
+    def test_sankey_same_for_outcomes_and_aggregates(
+        self,
+        chart_service: ChartDataService,
+        scorecard: FeatureScorecard,
+        outcomes: list[SynthOutcome],
+    ) -> None:
+        """Sankey flow is identical whichever input is given."""
+        from_outcomes = chart_service.get_sankey_flow("ana_12345678", outcomes, scorecard)
+        from_aggregates = chart_service.get_sankey_flow(
+            "ana_12345678", OutcomeAggregates.from_outcomes(outcomes), scorecard
+        )
+        assert from_outcomes == from_aggregates
+        assert sum(link.value for link in from_outcomes.links if link.source == "population") == 5
@@ -0,0 +1,110 @@
+"""
+Unit tests for the persona prompt cache.
+
+Tests:
+- Rendered prompts are reused per (synth, version, exec_id, kind)
+- A new synth version drops the synth's older prompts
+- Interviewee prefix + history equals the full interviewee instructions
+"""
+
+from collections.abc import Callable
+
+from synth_lab.services.persona_prompt_cache import (
+    CHAT_SYSTEM_PROMPT,
+    INTERVIEWEE_PERSONA,
+    PersonaPrompt,
+    PersonaPromptCache,
+    synth_version,
+)
+from synth_lab.services.research_agentic.instructions import (
+    format_interviewee_history,
+    format_interviewee_instructions,
+    format_interviewee_prefix,
+)
+
+SYNTH = {
+    "id": "abc123",
+    "nome": "Maria Silva",
+    "demografia": {"idade": 34, "genero_biologico": "feminino", "ocupacao": "Professora"},
+    "psicografia": {"interesses": ["café", "leitura"]},
+}
+
+
+def render_counter() -> tuple[list[int], Callable[[], PersonaPrompt]]:
+    """Render function that counts its calls."""
+    calls: list[int] = []
+
+    def render() -> PersonaPrompt:
+        calls.append(1)
+        return PersonaPrompt(synth_name="Maria", text=f"Você é Maria ({len(calls)})")
+
+    return calls, render
+
+
+class TestPersonaPromptCache:
+    """Tests for lookup, versioning and eviction."""
+
+    def test_renders_once_per_key(self) -> None:
+        cache = PersonaPromptCache()
+        calls, render = render_counter()
+        version = synth_version(SYNTH)
+
+        first = cache.get_or_render("abc123", version, "exec_1", CHAT_SYSTEM_PROMPT, render)
+        second = cache.get_or_render("abc123", version, "exec_1", CHAT_SYSTEM_PROMPT, render)
+        other_exec = cache.get_or_render("abc123", version, "exec_2", CHAT_SYSTEM_PROMPT, render)
+
+        assert first is second
+        assert other_exec.text != first.text
+        assert len(calls) == 2
+        assert cache.known_version("abc123") == version
+
+    def test_version_changes_with_synth_data(self) -> None:
+        edited = {**SYNTH, "nome": "Maria Souza"}
+        assert synth_version(SYNTH) == synth_version(dict(reversed(SYNTH.items())))
+        assert synth_version(edited) != synth_version(SYNTH)
+
+    def test_new_version_drops_old_prompts(self) -> None:
+        cache = PersonaPromptCache()
+        _, render = render_counter()
+        old, new = synth_version(SYNTH), synth_version({**SYNTH, "nome": "Maria Souza"})
+        cache.set("abc123", old, None, INTERVIEWEE_PERSONA, render())
+        cache.set("abc123", old, "exec_1", CHAT_SYSTEM_PROMPT, render())
+
+        cache.set("abc123", new, None, INTERVIEWEE_PERSONA, render())
+
+        assert cache.get("abc123", old, "exec_1", CHAT_SYSTEM_PROMPT) is None
+        assert cache.known_version("abc123") == new
+        assert len(cache) == 1
+
+    def test_version_lookup_expires(self) -> None:
+        cache = PersonaPromptCache(version_ttl_seconds=0)
+        _, render = render_counter()
+        cache.set("abc123", "v1", None, INTERVIEWEE_PERSONA, render())
+        assert cache.known_version("abc123") is None
+        assert cache.get("abc123", "v1", None, INTERVIEWEE_PERSONA) is not None
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = PersonaPromptCache(max_entries=2)
+        _, render = render_counter()
+        cache.set("s1", "v", None, INTERVIEWEE_PERSONA, render())
+        cache.set("s2", "v", None, INTERVIEWEE_PERSONA, render())
+        cache.get("s1", "v", None, INTERVIEWEE_PERSONA)
+        cache.set("s3", "v", None, INTERVIEWEE_PERSONA, render())
+
+        assert cache.get("s2", "v", None, INTERVIEWEE_PERSONA) is None
+        assert cache.get("s1", "v", None, INTERVIEWEE_PERSONA) is not None
+
+
+class TestIntervieweePrefix:
+    """Tests for the stable interviewee instructions prefix."""
+
+    def test_prefix_plus_history_matches_full_instructions(self) -> None:
+        history = "Entrevistador: Como foi?\nMaria: Foi bom."
+        prefix = format_interviewee_prefix(SYNTH, initial_context="Usou o app ontem.")
+
+        full = format_interviewee_instructions(SYNTH, history, initial_context="Usou o app ontem.")
+
+        assert prefix + format_interviewee_history(history) == full
+        assert full.startswith(prefix)
+        assert "Usou o app ontem." in prefix
+        assert history not in prefix
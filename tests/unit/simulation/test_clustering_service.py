@@ -9,16 +9,20 @@ Tests:
 - Label suggestions for clusters
 """
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
 from synth_lab.domain.entities import (
+    HierarchicalResult,
     SimulationAttributes,
     SimulationLatentTraits,
     SimulationObservables,
     SynthOutcome,
 )
-from synth_lab.services.simulation.clustering_service import ClusteringService
+from synth_lab.services.simulation import clustering_service as clustering_module
+from synth_lab.services.simulation.clustering_service import ClusteringService, ElbowCache
 
 
 @pytest.fixture
@@ -457,3 +461,185 @@ class TestEdgeCases:
 if __name__ == "__main__":
     """Run tests with pytest."""
     pytest.main([__file__, "-v"])
+
+
+class TestScalableElbow:
+    """Test elbow caching and the large-population elbow path."""
+
+    @pytest.fixture(autouse=True)
+    def clear_elbow_cache(self):
+        """Isolate tests from curves cached by other tests."""
+        clustering_module._elbow_cache.clear()
+        yield
+        clustering_module._elbow_cache.clear()
+
+    @staticmethod
+    def blobs(n: int) -> np.ndarray:
+        """Three well-separated groups in 4 dimensions."""
+        rng = np.random.default_rng(0)
+        centers = np.array([[0, 0, 0, 0], [5, 5, 5, 5], [-5, 5, -5, 5]], dtype=float)
+        return centers[rng.integers(0, 3, size=n)] + rng.normal(0, 0.3, size=(n, 4))
+
+    def test_elbow_curve_is_cached(self):
+        """Second call with the same key does not refit."""
+        service = ClusteringService()
+        X = self.blobs(200)
+        key = ElbowCache.make_key("ana_1", ["a", "b", "c", "d"], 6, X)
+
+        first = service._calculate_elbow(X, max_k=6, cache_key=key)
+        with patch.object(clustering_module, "KMeans") as kmeans:
+            second = service._calculate_elbow(X, max_k=6, cache_key=key)
+
+        kmeans.assert_not_called()
+        assert second == first
+
+    def test_cache_key_changes_with_data(self):
+        """A re-run analysis (different data) gets a different key."""
+        X = self.blobs(50)
+        key = ElbowCache.make_key("ana_1", ["a"], 5, X)
+        assert key != ElbowCache.make_key("ana_1", ["a"], 5, X + 1)
+        assert key != ElbowCache.make_key("ana_1", ["b"], 5, X)
+
+    def test_large_population_uses_minibatch(self, monkeypatch):
+        """Above the threshold, warm-started MiniBatchKMeans finds the knee."""
+        monkeypatch.setattr(clustering_module, "SCALABLE_ELBOW_THRESHOLD", 100)
+        monkeypatch.setattr(clustering_module, "SILHOUETTE_SAMPLE_SIZE", 150)
+        service = ClusteringService()
+        X = self.blobs(600)
+
+        with patch.object(clustering_module, "KMeans") as kmeans:
+            elbow = service._calculate_elbow(X, max_k=8)
+
+        kmeans.assert_not_called()
+        assert [p.k for p in elbow] == list(range(2, 9))
+        assert service._detect_knee_point(elbow) == 3
+        assert max(elbow, key=lambda p: p.silhouette).k == 3
+
+
+class TestScalableHierarchy:
+    """Test micro-cluster linkage, truncation and cuts without recomputation."""
+
+    @staticmethod
+    def grouped_outcomes(n: int) -> tuple[list[SynthOutcome], np.ndarray]:
+        """Three well-separated groups of synths (latent traits in [0, 1])."""
+        rng = np.random.default_rng(1)
+        centers = np.array([[0.15] * 4, [0.85] * 4, [0.15, 0.85, 0.15, 0.85]])
+        groups = rng.integers(0, 3, size=n)
+        traits = np.clip(centers[groups] + rng.normal(0, 0.03, size=(n, 4)), 0.0, 1.0)
+        outcomes = [
+            SynthOutcome(
+                synth_id=f"synth_{i:04d}",
+                analysis_id="ana_0000abcd",
+                success_rate=0.5,
+                failed_rate=0.3,
+                did_not_try_rate=0.2,
+                synth_attributes=SimulationAttributes(
+                    observables=SimulationObservables(
+                        digital_literacy=0.5,
+                        similar_tool_experience=0.5,
+                        motor_ability=0.5,
+                        time_availability=0.5,
+                        domain_expertise=0.5,
+                    ),
+                    latent_traits=SimulationLatentTraits(
+                        capability_mean=float(row[0]),
+                        trust_mean=float(row[1]),
+                        friction_tolerance_mean=float(row[2]),
+                        exploration_prob=float(row[3]),
+                    ),
+                ),
+            )
+            for i, row in enumerate(traits)
+        ]
+        return outcomes, groups
+
+    def test_large_population_links_micro_clusters(self, monkeypatch):
+        """Above the threshold, leaves are micro-clusters covering all synths."""
+        monkeypatch.setattr(clustering_module, "SCALABLE_HIERARCHY_THRESHOLD", 100)
+        monkeypatch.setattr(clustering_module, "MICRO_CLUSTERS", 40)
+        monkeypatch.setattr(clustering_module, "SILHOUETTE_SAMPLE_SIZE", 200)
+        outcomes, groups = self.grouped_outcomes(600)
+
+        result = ClusteringService().cluster_hierarchical("ana_0000abcd", outcomes)
+
+        assert result.n_micro_clusters is not None
+        assert result.n_micro_clusters <= 40
+        assert len(result.linkage_matrix) == result.n_micro_clusters - 1
+        assert result.total_synths == 600
+        assert result.dendrogram_tree["count"] == 600
+        assert result.suggested_cuts[0].n_clusters == 3
+
+        cut = ClusteringService().cut_dendrogram(result, n_clusters=3)
+        assert len(cut.cluster_assignments) == 600
+        # Each true group lands in exactly one cluster
+        for group in range(3):
+            labels = {
+                cut.cluster_assignments[o.synth_id]
+                for o, g in zip(outcomes, groups)
+                if g == group
+            }
+            assert len(labels) == 1
+
+    def test_cut_reuses_server_side_linkage(self, sample_outcomes):
+        """cut_dendrogram neither recomputes nor re-parses the linkage."""
+        service = ClusteringService()
+        result = service.cluster_hierarchical("sim_test", sample_outcomes)
+
+        with patch.object(clustering_module.hierarchy, "linkage") as linkage:
+            cut = service.cut_dendrogram(result, n_clusters=3)
+
+        linkage.assert_not_called()
+        assert set(cut.cluster_assignments.values()) == {0, 1, 2}
+        assert "_linkage_tree" not in cut.model_dump()
+
+    def test_truncate_dendrogram(self, sample_outcomes):
+        """Truncation keeps the top levels and the synth counts."""
+        service = ClusteringService()
+        result = service.cluster_hierarchical("sim_test", sample_outcomes)
+
+        truncated = service.truncate_dendrogram(result, max_depth=2)
+
+        assert len(truncated.nodes) == 7  # root + 2 + 4
+        assert truncated.truncated_depth == 2
+        assert truncated.linkage_matrix == []
+        assert truncated.total_synths == len(sample_outcomes)
+        assert truncated.max_height == result.max_height
+
+        # Cutting a truncated view still uses the full linkage
+        cut = service.cut_dendrogram(truncated, n_clusters=4)
+        assert len(cut.cluster_assignments) == len(sample_outcomes)
+
+    def test_cut_truncated_result_from_json_raises(self, sample_outcomes):
+        """A truncated result rebuilt from JSON has no linkage to cut."""
+        service = ClusteringService()
+        truncated = service.truncate_dendrogram(
+            service.cluster_hierarchical("sim_test", sample_outcomes), max_depth=2
+        )
+        rebuilt = HierarchicalResult.model_validate(
+            truncated.model_dump(exclude={"total_synths", "max_height", "dendrogram_tree"})
+        )
+
+        with pytest.raises(ValueError, match="truncated"):
+            service.cut_dendrogram(rebuilt, n_clusters=3)
+
+    def test_cut_micro_clustered_result_from_json(self, monkeypatch):
+        """Micro-cluster leaves rebuilt from JSON are relinked from the outcomes."""
+        monkeypatch.setattr(clustering_module, "SCALABLE_HIERARCHY_THRESHOLD", 100)
+        monkeypatch.setattr(clustering_module, "MICRO_CLUSTERS", 40)
+        monkeypatch.setattr(clustering_module, "SILHOUETTE_SAMPLE_SIZE", 200)
+        outcomes, _ = self.grouped_outcomes(300)
+        service = ClusteringService()
+        result = service.cluster_hierarchical("ana_0000abcd", outcomes)
+        rebuilt = HierarchicalResult.model_validate(
+            result.model_dump(exclude={"total_synths", "max_height", "dendrogram_tree"})
+        )
+
+        assert service.needs_outcomes_to_cut(rebuilt)
+        assert not service.needs_outcomes_to_cut(result)
+        with pytest.raises(ValueError, match="outcomes"):
+            service.cut_dendrogram(rebuilt, n_clusters=3)
+
+        cut = service.cut_dendrogram(rebuilt, n_clusters=3, outcomes=outcomes)
+        expected = service.cut_dendrogram(result, n_clusters=3)
+        assert len(cut.cluster_assignments) == 300
+        assert cut.cluster_assignments == expected.cluster_assignments
@@ -0,0 +1,158 @@
+"""
+Unit tests for the vectorized correlation engine.
+
+Tests:
+- Pearson/Spearman matrices match scipy.stats pairwise results
+- Zero-variance columns report r=0, p=1
+- ChartDataService.get_attribute_correlations with custom attributes,
+  Spearman and subgroups
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from synth_lab.domain.entities import (
+    SimulationAttributes,
+    SimulationLatentTraits,
+    SimulationObservables,
+    SynthOutcome,
+)
+from synth_lab.services.simulation.chart_data_service import ChartDataService
+from synth_lab.services.simulation.correlation import correlation_matrix
+from synth_lab.services.simulation.feature_extraction import (
+    extract_columns,
+    get_attribute_value,
+)
+
+
+@pytest.fixture
+def sample_outcomes() -> list[SynthOutcome]:
+    """Create outcomes where success grows with capability."""
+    rng = np.random.default_rng(7)
+    outcomes = []
+    for i in range(60):
+        capability = float(rng.uniform(0.1, 0.9))
+        success = float(np.clip(capability * 0.8 + rng.normal(0, 0.05), 0.0, 0.8))
+        did_not_try = float(rng.uniform(0.0, 1.0 - success))
+        outcomes.append(
+            SynthOutcome(
+                synth_id=f"synth_{i:03d}",
+                analysis_id="ana_12345678",
+                success_rate=success,
+                failed_rate=1.0 - success - did_not_try,
+                did_not_try_rate=did_not_try,
+                synth_attributes=SimulationAttributes(
+                    observables=SimulationObservables(
+                        digital_literacy=float(rng.uniform()),
+                        similar_tool_experience=float(rng.uniform()),
+                        motor_ability=float(rng.uniform()),
+                        time_availability=float(rng.uniform()),
+                        domain_expertise=0.5,  # constant column
+                    ),
+                    latent_traits=SimulationLatentTraits(
+                        capability_mean=capability,
+                        trust_mean=float(rng.uniform()),
+                        friction_tolerance_mean=float(rng.uniform()),
+                        exploration_prob=float(rng.uniform()),
+                    ),
+                ),
+            )
+        )
+    return outcomes
+
+
+class TestCorrelationMatrix:
+    """Test correlation_matrix against scipy."""
+
+    @pytest.mark.parametrize(
+        "method,scipy_fn", [("pearson", stats.pearsonr), ("spearman", stats.spearmanr)]
+    )
+    def test_matches_scipy(self, method, scipy_fn):
+        """Every cell matches the pairwise scipy result."""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(40, 4))
+        Y = np.column_stack([X[:, 0] * 2 + rng.normal(size=40), rng.integers(0, 3, 40)])
+
+        r, p = correlation_matrix(X, Y, method=method)
+
+        for i in range(X.shape[1]):
+            for j in range(Y.shape[1]):
+                expected_r, expected_p = scipy_fn(X[:, i], Y[:, j])
+                assert r[i, j] == pytest.approx(expected_r, abs=1e-10)
+                assert p[i, j] == pytest.approx(expected_p, rel=1e-6, abs=1e-12)
+
+    def test_zero_variance_column(self):
+        """Constant columns give r=0 and p=1 instead of NaN."""
+        X = np.column_stack([np.full(10, 0.3), np.arange(10.0)])
+        Y = np.arange(10.0)[:, None]
+
+        r, p = correlation_matrix(X, Y)
+
+        assert r[0, 0] == 0.0 and p[0, 0] == 1.0
+        assert r[1, 0] == pytest.approx(1.0)
+
+    def test_rejects_mismatched_rows(self):
+        """X and Y must have the same number of samples."""
+        with pytest.raises(ValueError):
+            correlation_matrix(np.zeros((5, 2)), np.zeros((4, 1)))
+
+
+class TestAttributeCorrelations:
+    """Test ChartDataService.get_attribute_correlations."""
+
+    def test_extract_columns_matches_get_attribute_value(self, sample_outcomes):
+        """Columnar extraction returns the same values as per-synth lookup."""
+        columns = ["capability_mean", "motor_ability", "success_rate", "attempt_rate"]
+        X = extract_columns(sample_outcomes, columns)
+
+        for row, outcome in zip(X, sample_outcomes):
+            assert list(row) == pytest.approx(
+                [get_attribute_value(outcome, c) for c in columns]
+            )
+
+    def test_matches_pairwise_pearson(self, sample_outcomes):
+        """Default chart matches scipy.stats.pearsonr per attribute."""
+        chart = ChartDataService().get_attribute_correlations("ana_1", sample_outcomes)
+
+        assert [c.attribute for c in chart.correlations] == (
+            ChartDataService.CORRELATION_ATTRIBUTES
+        )
+        success = [o.success_rate for o in sample_outcomes]
+        for corr in chart.correlations:
+            values = [get_attribute_value(o, corr.attribute) for o in sample_outcomes]
+            if corr.attribute == "domain_expertise":
+                assert corr.correlation_success == 0.0 and corr.p_value_success == 1.0
+                continue
+            expected_r, expected_p = stats.pearsonr(values, success)
+            assert corr.correlation_success == pytest.approx(expected_r, abs=1e-10)
+            assert corr.p_value_success == pytest.approx(expected_p, rel=1e-6, abs=1e-12)
+
+        capability = chart.correlations[0]
+        assert capability.is_significant_success
+
+    def test_custom_attributes_spearman_and_subgroup(self, sample_outcomes):
+        """Custom attribute sets, Spearman and subgroups are honored."""
+        subgroup = [o.synth_id for o in sample_outcomes[:20]]
+        chart = ChartDataService().get_attribute_correlations(
+            "ana_1",
+            sample_outcomes,
+            attributes=["trust_mean", "capability_mean"],
+            method="spearman",
+            synth_ids=subgroup,
+        )
+
+        assert chart.method == "spearman"
+        assert chart.total_synths == 20
+        assert [c.attribute for c in chart.correlations] == ["trust_mean", "capability_mean"]
+        values = [o.synth_attributes.latent_traits.capability_mean for o in sample_outcomes[:20]]
+        success = [o.success_rate for o in sample_outcomes[:20]]
+        expected_r, _ = stats.spearmanr(values, success)
+        assert chart.correlations[1].correlation_success == pytest.approx(expected_r)
+
+    def test_unknown_attribute_raises(self, sample_outcomes):
+        """Unknown attributes raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown attribute"):
+            ChartDataService().get_attribute_correlations(
+                "ana_1", sample_outcomes, attributes=["not_an_attribute"]
+            )
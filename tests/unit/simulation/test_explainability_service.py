@@ -23,6 +23,10 @@ from synth_lab.domain.entities import (
     SynthOutcome,
 )
 from synth_lab.services.simulation.explainability_service import ExplainabilityService
+from synth_lab.services.simulation.feature_extraction import DEFAULT_FEATURES
+from synth_lab.services.simulation.outcome_model import OutcomeModel
+from synth_lab.services.simulation.probability import calculate_outcome_probabilities
+from synth_lab.services.simulation.sample_state import sample_user_state
 
 
 @pytest.fixture
@@ -489,3 +493,94 @@ class TestEdgeCases:
 if __name__ == "__main__":
     """Run tests with pytest."""
     pytest.main([__file__, "-v"])
+
+
+class TestExactBackend:
+    """Test the exact (simulation model) explainability backend."""
+
+    @pytest.fixture
+    def outcome_model(self) -> OutcomeModel:
+        return OutcomeModel(
+            scorecard_scores={
+                "complexity": 0.4,
+                "initial_effort": 0.3,
+                "perceived_risk": 0.2,
+                "time_to_value": 0.5,
+            },
+            sigma=0.1,
+        )
+
+    def test_expected_outcomes_match_monte_carlo(self, outcome_model):
+        """Closed-form expectation agrees with sampling the simulation."""
+        rng = np.random.default_rng(0)
+        traits = {
+            "capability_mean": 0.7,
+            "trust_mean": 0.4,
+            "friction_tolerance_mean": 0.6,
+            "exploration_prob": 0.3,
+        }
+        sampled = np.mean(
+            [
+                calculate_outcome_probabilities(
+                    sample_user_state(traits, outcome_model.scenario, 0.1, rng),
+                    outcome_model.scorecard_scores,
+                )["p_success"]
+                for _ in range(20000)
+            ]
+        )
+
+        exact = outcome_model.expected_outcomes(np.array([list(traits.values())]))
+        assert exact["p_success"][0] == pytest.approx(sampled, abs=0.005)
+        total = exact["p_success"] + exact["p_failed"] + exact["p_did_not_try"]
+        assert total[0] == pytest.approx(1.0)
+
+    def test_shap_values_are_additive(self, sample_outcomes, outcome_model):
+        """Contributions sum to prediction minus baseline for each synth."""
+        service = ExplainabilityService(outcome_model=outcome_model)
+        explanation = service.explain_synth(
+            simulation_id="sim_test",
+            outcomes=sample_outcomes,
+            synth_id="synth_010",
+        )
+
+        total = sum(c.shap_value for c in explanation.contributions)
+        assert explanation.model_type == "simulation_model"
+        assert total == pytest.approx(
+            explanation.predicted_success_rate - explanation.baseline_prediction, abs=1e-9
+        )
+
+    def test_summary_ranks_model_drivers(self, sample_outcomes, outcome_model):
+        """Digital literacy drives every latent trait, so it ranks first."""
+        service = ExplainabilityService(outcome_model=outcome_model)
+        summary = service.get_shap_summary(simulation_id="sim_test", outcomes=sample_outcomes)
+
+        assert summary.top_features[0] == "digital_literacy"
+        assert set(summary.feature_importances) == set(DEFAULT_FEATURES)
+
+    def test_pdp_has_confidence_band(self, sample_outcomes, outcome_model):
+        """Exact PDP returns a monotonic curve with confidence bounds."""
+        service = ExplainabilityService(outcome_model=outcome_model)
+        pdp = service.calculate_pdp(
+            simulation_id="sim_test",
+            outcomes=sample_outcomes,
+            feature="capability_mean",
+            features=["capability_mean", "trust_mean"],
+            grid_resolution=10,
+        )
+
+        assert pdp.effect_type == "monotonic_increasing"
+        for point in pdp.pdp_values:
+            assert point.confidence_lower <= point.predicted_success <= point.confidence_upper
+
+    def test_unknown_feature_rejected(self, sample_outcomes, outcome_model):
+        """Features outside the simulation model raise ValueError."""
+        with pytest.raises(ValueError):
+            OutcomeModel.feature_matrix(sample_outcomes, ["success_rate"])
+
+    def test_stored_model_round_trip(self, outcome_model):
+        """A model stored with the analysis run rebuilds identically."""
+        restored = OutcomeModel.from_dict(outcome_model.to_dict())
+
+        assert restored.scorecard_scores == outcome_model.scorecard_scores
+        assert restored.scenario == outcome_model.scenario
+        assert restored.sigma == outcome_model.sigma
@@ -6,10 +6,14 @@ Tests:
 - Outlier detection via Isolation Forest
 - Outlier type classification
 - Profile summaries and interview questions
+- Cached anomaly scores (contamination only re-thresholds)
 """
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
+from sklearn.ensemble import IsolationForest
 
 from synth_lab.domain.entities import (
     SimulationAttributes,
@@ -17,9 +21,18 @@ from synth_lab.domain.entities import (
     SimulationObservables,
     SynthOutcome,
 )
+from synth_lab.services.simulation import outlier_service as outlier_module
 from synth_lab.services.simulation.outlier_service import OutlierService
 
 
+@pytest.fixture(autouse=True)
+def clear_forest_cache():
+    """Isolate tests from forests cached by other tests."""
+    outlier_module._forest_cache.clear()
+    yield
+    outlier_module._forest_cache.clear()
+
+
 @pytest.fixture
 def sample_outcomes() -> list[SynthOutcome]:
     """Create sample synth outcomes with extreme cases and outliers."""
@@ -324,6 +337,78 @@ class TestOutlierDetection:
             assert len(outlier.explanation) > 10
 
 
+class TestCachedScoring:
+    """Test cached forest scores and top-k selection."""
+
+    def test_changing_contamination_does_not_refit(self, sample_outcomes):
+        """The forest is fitted once per analysis; contamination re-thresholds."""
+        service = OutlierService()
+
+        with patch.object(
+            outlier_module, "IsolationForest", wraps=IsolationForest
+        ) as forest_cls:
+            for contamination in (0.05, 0.1, 0.2):
+                service.detect_outliers(
+                    simulation_id="sim_test_001",
+                    outcomes=sample_outcomes,
+                    contamination=contamination,
+                )
+
+        assert forest_cls.call_count == 1
+
+    def test_matches_isolation_forest_fit_predict(self, sample_outcomes):
+        """Thresholding cached scores selects the same outliers as fit_predict."""
+        service = OutlierService()
+        X, synth_ids, _ = service._extract_features(sample_outcomes)
+
+        for contamination in (0.05, 0.1, 0.2):
+            forest = IsolationForest(
+                contamination=contamination, random_state=42, n_estimators=100
+            )
+            predictions = forest.fit_predict(X)
+            expected = {synth_ids[i] for i in np.where(predictions == -1)[0]}
+
+            result = service.detect_outliers(
+                simulation_id="sim_test_001",
+                outcomes=sample_outcomes,
+                contamination=contamination,
+            )
+
+            assert {o.synth_id for o in result.outliers} == expected
+
+    def test_reordered_outcomes_use_cached_scores(self, sample_outcomes):
+        """Outcomes in a different order map back to their cached scores."""
+        service = OutlierService()
+        first = service.detect_outliers(simulation_id="sim_test_001", outcomes=sample_outcomes)
+        second = service.detect_outliers(
+            simulation_id="sim_test_001", outcomes=list(reversed(sample_outcomes))
+        )
+
+        first_scores = {o.synth_id: o.anomaly_score for o in first.outliers}
+        second_scores = {o.synth_id: o.anomaly_score for o in second.outliers}
+        assert first_scores == second_scores
+
+    def test_extreme_cases_match_stable_sort(self, sample_outcomes):
+        """Top-k selection returns the same synths as a full stable sort, ties included."""
+        service = OutlierService()
+        # Force ties at the selection boundary
+        for outcome in sample_outcomes[20:30]:
+            outcome.success_rate = 0.5
+
+        result = service.get_extreme_cases(
+            simulation_id="sim_test_001", outcomes=sample_outcomes, n_per_category=25
+        )
+
+        by_failure = sorted(sample_outcomes, key=lambda x: x.success_rate)
+        by_success = sorted(sample_outcomes, key=lambda x: x.success_rate, reverse=True)
+        assert [s.synth_id for s in result.worst_failures] == [
+            s.synth_id for s in by_failure[:25]
+        ]
+        assert [s.synth_id for s in result.best_successes] == [
+            s.synth_id for s in by_success[:25]
+        ]
+
+
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
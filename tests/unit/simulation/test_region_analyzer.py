@@ -0,0 +1,134 @@
+"""
+Unit tests for region analysis (decision tree rules).
+
+Tests:
+- Leaf rules (single traversal) select exactly the synths in each region
+- Regions are cached per analysis and parameter set
+- SynthOutcome and dict inputs give the same regions
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from sklearn.tree import DecisionTreeClassifier
+
+from synth_lab.domain.entities import (
+    SimulationAttributes,
+    SimulationLatentTraits,
+    SimulationObservables,
+    SynthOutcome,
+)
+from synth_lab.services.simulation import analyzer as analyzer_module
+from synth_lab.services.simulation.analyzer import REGION_FEATURES, RegionAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def clear_region_cache():
+    """Isolate tests from regions cached by other tests."""
+    analyzer_module._region_cache.clear()
+    yield
+    analyzer_module._region_cache.clear()
+
+
+@pytest.fixture
+def sample_outcomes() -> list[SynthOutcome]:
+    """Failure driven by low capability and low trust (traits on a 0.02 grid)."""
+    rng = np.random.default_rng(5)
+    traits = rng.integers(0, 51, size=(800, 4)) * 0.02
+    outcomes = []
+    for i, row in enumerate(traits):
+        failed = float(np.clip(0.9 - 0.6 * row[0] - 0.3 * row[1], 0.0, 1.0))
+        success = (1.0 - failed) * 0.8
+        outcomes.append(
+            SynthOutcome(
+                synth_id=f"synth_{i:04d}",
+                analysis_id="ana_0000abcd",
+                success_rate=success,
+                failed_rate=failed,
+                did_not_try_rate=1.0 - failed - success,
+                synth_attributes=SimulationAttributes(
+                    observables=SimulationObservables(
+                        digital_literacy=0.5,
+                        similar_tool_experience=0.5,
+                        motor_ability=0.5,
+                        time_availability=0.5,
+                        domain_expertise=0.5,
+                    ),
+                    latent_traits=SimulationLatentTraits(
+                        **{name: float(v) for name, v in zip(REGION_FEATURES, row)}
+                    ),
+                ),
+            )
+        )
+    return outcomes
+
+
+def matches(outcome: SynthOutcome, rules) -> bool:
+    """Whether a synth satisfies every rule of a region."""
+    latent = outcome.synth_attributes.latent_traits
+    for rule in rules:
+        value = getattr(latent, rule.attribute)
+        if rule.operator == "<=" and not value <= rule.threshold:
+            return False
+        if rule.operator == ">" and not value > rule.threshold:
+            return False
+    return True
+
+
+class TestRegionAnalyzer:
+    """Tests for RegionAnalyzer.analyze."""
+
+    def test_rules_select_region_members(self, sample_outcomes):
+        """Each region's rules select exactly its members."""
+        result = RegionAnalyzer(max_depth=4).analyze(
+            sample_outcomes, "ana_0000abcd", min_failure_rate=0.3
+        )
+
+        assert result.regions
+        for region, members in zip(result.regions, result.members):
+            selected = {o.synth_id for o in sample_outcomes if matches(o, region.rules)}
+            assert selected == set(members)
+            assert region.synth_count == len(members)
+            # Tightest bound only: at most one rule per attribute and direction
+            keys = [(r.attribute, r.operator) for r in region.rules]
+            assert len(keys) == len(set(keys))
+
+        failed = [r.failed_rate for r in result.regions]
+        assert failed == sorted(failed, reverse=True)
+
+    def test_members_start_with_most_typical(self, sample_outcomes):
+        """Members are ordered by distance to the region centroid."""
+        result = RegionAnalyzer().analyze(sample_outcomes, "ana_0000abcd", 0.3)
+        by_id = {o.synth_id: o for o in sample_outcomes}
+
+        members = result.members[0]
+        X = np.array(
+            [[getattr(by_id[m].synth_attributes.latent_traits, f) for f in REGION_FEATURES]
+             for m in members]
+        )
+        distances = ((X - X.mean(axis=0)) ** 2).sum(axis=1)
+        assert np.all(np.diff(distances) >= 0)
+
+    def test_results_are_cached(self, sample_outcomes):
+        """Same analysis and parameters do not refit the tree."""
+        first = RegionAnalyzer().analyze(sample_outcomes, "ana_0000abcd", 0.3)
+
+        with patch.object(
+            analyzer_module, "DecisionTreeClassifier", wraps=DecisionTreeClassifier
+        ) as tree:
+            second = RegionAnalyzer().analyze(sample_outcomes, "ana_0000abcd", 0.3)
+            RegionAnalyzer(max_depth=4).analyze(sample_outcomes, "ana_0000abcd", 0.3)
+
+        assert second is first
+        assert tree.call_count == 1  # Only the new parameter set
+
+    def test_dict_and_entity_inputs_match(self, sample_outcomes):
+        """Dict outcomes (legacy input) give the same regions."""
+        dicts = [o.model_dump() for o in sample_outcomes]
+
+        from_entities = RegionAnalyzer().analyze_regions(sample_outcomes, "ana_a", 0.3)
+        from_dicts = RegionAnalyzer().analyze_regions(dicts, "ana_b", 0.3)
+
+        assert [r.rule_text for r in from_entities] == [r.rule_text for r in from_dicts]
+        assert [r.failed_rate for r in from_entities] == [r.failed_rate for r in from_dicts]
@@ -0,0 +1,277 @@
+"""
+Unit tests for outcome rate uncertainty.
+
+Tests:
+- Wilson intervals match the closed form and stay in [0, 1]
+- Parallel bootstrap is reproducible and close to the analytical SE
+- MonteCarloEngine attaches per-synth and aggregated intervals on request
+- Significance-aware comparisons used by exploration
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from synth_lab.domain.entities import (
+    FeatureScorecard,
+    Scenario,
+    ScorecardDimension,
+    ScorecardIdentification,
+)
+from synth_lab.domain.entities.scenario_node import (
+    ScenarioNode,
+    ScorecardParams,
+    SimulationResults,
+)
+from synth_lab.services.exploration.iteration_runner import IterationRunner, NodeWithSimulation
+from synth_lab.services.simulation.engine import MonteCarloEngine
+from synth_lab.services.simulation.uncertainty import (
+    bootstrap_mean_interval,
+    bootstrap_mean_intervals,
+    paired_difference_interval,
+    paired_difference_lower_bounds,
+    wilson_interval,
+)
+
+
+@pytest.fixture
+def scorecard() -> FeatureScorecard:
+    """Mid-range scorecard."""
+    return FeatureScorecard(
+        identification=ScorecardIdentification(feature_name="Test", use_scenario="Test"),
+        description_text="Test",
+        complexity=ScorecardDimension(score=0.4),
+        initial_effort=ScorecardDimension(score=0.3),
+        perceived_risk=ScorecardDimension(score=0.2),
+        time_to_value=ScorecardDimension(score=0.5),
+    )
+
+
+@pytest.fixture
+def scenario() -> Scenario:
+    """Baseline scenario."""
+    return Scenario(
+        id="baseline",
+        name="Baseline",
+        description="Test baseline",
+        motivation_modifier=0.0,
+        trust_modifier=0.0,
+        friction_modifier=0.0,
+        task_criticality=0.5,
+    )
+
+
+@pytest.fixture
+def synths() -> list[dict]:
+    """Synths with varying capability."""
+    return [
+        {
+            "id": f"synth_{i}",
+            "simulation_attributes": {
+                "latent_traits": {
+                    "capability_mean": 0.2 + i * 0.03,
+                    "trust_mean": 0.5,
+                    "friction_tolerance_mean": 0.5,
+                    "exploration_prob": 0.5,
+                },
+            },
+        }
+        for i in range(20)
+    ]
+
+
+def make_results(success: float, low: float | None, high: float | None) -> SimulationResults:
+    """SimulationResults with an optional success interval."""
+    return SimulationResults(
+        success_rate=success,
+        fail_rate=round(1.0 - success, 3),
+        did_not_try_rate=0.0,
+        success_ci_low=low,
+        success_ci_high=high,
+    )
+
+
+def make_paired_results(rates: np.ndarray) -> SimulationResults:
+    """SimulationResults with the mean of per-synth success rates."""
+    success = round(float(rates.mean()), 3)
+    return SimulationResults(
+        success_rate=success,
+        fail_rate=round(1.0 - success, 3),
+        did_not_try_rate=0.0,
+    )
+
+
+def synth_rates(rates: np.ndarray) -> dict[str, float]:
+    """Per-synth success rates by synth ID."""
+    return {f"synth_{i}": float(r) for i, r in enumerate(rates)}
+
+
+def make_node(
+    node_id: str, results: SimulationResults, parent_id: str | None = None
+) -> ScenarioNode:
+    """Scenario node with fixed scorecard params."""
+    return ScenarioNode(
+        id=node_id,
+        exploration_id="expl_12345678",
+        parent_id=parent_id,
+        depth=0 if parent_id is None else 1,
+        scorecard_params=ScorecardParams(
+            complexity=0.3, initial_effort=0.3, perceived_risk=0.2, time_to_value=0.3
+        ),
+        simulation_results=results,
+    )
+
+
+class TestWilsonInterval:
+    """Tests for the vectorized Wilson interval."""
+
+    def test_matches_closed_form(self) -> None:
+        """Known value: 50/100 at 95% is about [0.404, 0.596]."""
+        low, high = wilson_interval(np.array([50]), n=100, confidence=0.95)
+        assert low[0] == pytest.approx(0.4038, abs=1e-3)
+        assert high[0] == pytest.approx(0.5962, abs=1e-3)
+
+    def test_bounds_at_extremes(self) -> None:
+        """Rates of 0 and 1 keep a non-degenerate interval inside [0, 1]."""
+        low, high = wilson_interval(np.array([[0, 100]]), n=100)
+        assert low[0, 0] == pytest.approx(0.0, abs=1e-12)
+        assert 0.0 < high[0, 0] < 0.1
+        assert 0.9 < low[0, 1] < 1.0
+        assert high[0, 1] == pytest.approx(1.0, abs=1e-12)
+
+
+class TestBootstrap:
+    """Tests for the parallel bootstrap."""
+
+    def test_reproducible_with_seed(self) -> None:
+        """Same seed gives identical intervals across parallel chunks."""
+        values = np.random.default_rng(1).uniform(0.0, 1.0, size=(150, 3))
+        first = bootstrap_mean_intervals(values, n_resamples=1000, seed=7)
+        second = bootstrap_mean_intervals(values, n_resamples=1000, seed=7)
+        assert first == second
+
+    def test_paired_difference_cancels_shared_variance(self) -> None:
+        """A small consistent gain is significant paired, though marginals overlap."""
+        base = np.random.default_rng(4).uniform(0.1, 0.9, size=200)
+        gain = paired_difference_interval(base + 0.01, base, seed=5)
+        marginal = bootstrap_mean_interval(base, seed=5)
+        assert gain.estimate == pytest.approx(0.01)
+        assert gain.ci_low > 0.0
+        assert marginal.ci_high - marginal.ci_low > 0.02
+
+    def test_pairwise_bounds_from_shared_resamples(self) -> None:
+        """Every pair gets its paired lower bound from one set of resamples."""
+        base = np.random.default_rng(8).uniform(0.1, 0.9, size=200)
+        noise = np.tile([0.02, -0.02], 100)  # Zero mean, sd 0.02
+        values = np.stack([base, base + 0.01 + noise, base + noise])
+        bounds = paired_difference_lower_bounds(values, seed=5)
+        assert bounds.shape == (3, 3)
+        assert np.allclose(np.diag(bounds), 0.0)
+        # Normal approximation: 0.01 - 1.96 * 0.02 / sqrt(200)
+        assert bounds[1, 0] == pytest.approx(0.0072, abs=1.5e-3)
+        assert bounds[1, 2] == pytest.approx(0.01)
+        assert bounds[2, 0] < 0.0 and bounds[0, 2] < 0.0
+
+    def test_std_error_close_to_analytical(self) -> None:
+        """Bootstrap SE of the mean approximates sd / sqrt(n)."""
+        values = np.random.default_rng(2).uniform(0.2, 0.6, size=400)
+        interval = bootstrap_mean_interval(values, n_resamples=2000, seed=3)
+        expected = values.std(ddof=1) / np.sqrt(len(values))
+        assert interval.std_error == pytest.approx(expected, rel=0.15)
+        assert interval.ci_low < interval.estimate < interval.ci_high
+
+
+class TestEngineIntervals:
+    """Tests for intervals produced by MonteCarloEngine."""
+
+    def test_intervals_off_by_default(self, synths, scorecard, scenario) -> None:
+        """Without confidence_level, results carry no intervals."""
+        results = MonteCarloEngine(seed=42).run_simulation(synths, scorecard, scenario, 50)
+        assert results.aggregated_intervals == {}
+        assert results.synth_outcomes[0].intervals == {}
+
+    def test_intervals_do_not_change_point_estimates(self, synths, scorecard, scenario) -> None:
+        """Seeded point estimates are identical with and without intervals."""
+        plain = MonteCarloEngine(seed=42).run_simulation(synths, scorecard, scenario, 50)
+        with_ci = MonteCarloEngine(seed=42).run_simulation(
+            synths, scorecard, scenario, 50, confidence_level=0.95
+        )
+        assert with_ci.aggregated_success == plain.aggregated_success
+        assert with_ci.confidence_level == 0.95
+
+        success = with_ci.aggregated_intervals["success"]
+        assert success.ci_low <= with_ci.aggregated_success <= success.ci_high
+        assert success.std_error > 0.0
+        for outcome in with_ci.synth_outcomes:
+            interval = outcome.intervals["success"]
+            assert interval.ci_low <= outcome.success_rate <= interval.ci_high
+
+
+class TestSignificance:
+    """Tests for significance-aware exploration comparisons."""
+
+    def test_overlapping_intervals_not_significant(self) -> None:
+        """A higher point estimate within noise is not significantly better."""
+        a = make_results(0.42, 0.38, 0.46)
+        b = make_results(0.40, 0.36, 0.44)
+        assert not a.is_significantly_better_than(b)
+        assert make_results(0.50, 0.47, 0.53).is_significantly_better_than(b)
+
+    def test_falls_back_to_point_estimates(self) -> None:
+        """Without intervals, comparison is the plain point comparison."""
+        assert make_results(0.42, None, None).is_significantly_better_than(
+            make_results(0.40, 0.36, 0.44)
+        )
+
+    def test_keeps_children_without_paired_rates(self) -> None:
+        """Without per-synth rates, children are not pruned (no early stop)."""
+        parent = make_node("node_00000001", make_results(0.40, 0.36, 0.44))
+        noisy = make_node("node_00000002", make_results(0.42, 0.38, 0.46), parent.id)
+
+        repository = MagicMock()
+        runner = IterationRunner(
+            repository=repository,
+            tree_manager=MagicMock(),
+            proposal_service=MagicMock(),
+            confidence_level=0.95,
+        )
+
+        pruned = runner._prune_insignificant_children(
+            [parent], [NodeWithSimulation(node=noisy, sim_results=noisy.simulation_results)]
+        )
+        assert pruned == 0
+        assert noisy.is_active()
+        repository.update_node_status.assert_not_called()
+
+    def test_prunes_by_paired_difference(self) -> None:
+        """With per-synth rates, children are compared synth by synth."""
+        base = np.random.default_rng(6).uniform(0.1, 0.8, size=100)
+        noise = np.tile([0.02, -0.02], 50)  # Zero mean: no gain beyond noise
+        parent = make_node("node_00000001", make_paired_results(base))
+        noisy = make_node("node_00000002", make_paired_results(base + noise), parent.id)
+        better = make_node("node_00000003", make_paired_results(base + 0.02), parent.id)
+
+        runner = IterationRunner(
+            repository=MagicMock(),
+            tree_manager=MagicMock(),
+            proposal_service=MagicMock(),
+            seed=1,
+            confidence_level=0.95,
+        )
+        runner._synth_rates = {
+            parent.id: synth_rates(base),
+            noisy.id: synth_rates(base + noise),
+            better.id: synth_rates(base + 0.02),
+        }
+
+        pruned = runner._prune_insignificant_children(
+            [parent],
+            [
+                NodeWithSimulation(node=noisy, sim_results=noisy.simulation_results),
+                NodeWithSimulation(node=better, sim_results=better.simulation_results),
+            ],
+        )
+        assert pruned == 1
+        assert noisy.is_dominated()
+        assert better.is_active()
@@ -11,6 +11,15 @@ import pytest
 
 from synth_lab.models.chat import ChatMessageModel, ChatRequest, ChatResponse
 from synth_lab.models.synth import Demographics, SynthDetail
+from synth_lab.services.persona_prompt_cache import get_persona_prompt_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_persona_prompt_cache():
+    """Isolate tests from system prompts cached by other tests."""
+    get_persona_prompt_cache().clear()
+    yield
+    get_persona_prompt_cache().clear()
 
 
 class TestChatService:
@@ -232,3 +241,66 @@ class TestChatService:
 
             assert "Entrevistador: Pergunta?" in formatted
             assert "Você: Resposta." in formatted
+
+
+class TestChatServicePromptCache:
+    """Tests for reuse of the rendered chat system prompt."""
+
+    def _service(self, synth: SynthDetail, research_repo: MagicMock) -> tuple:
+        from synth_lab.services.chat.service import ChatService
+
+        synths_repo = MagicMock()
+        synths_repo.get_by_id.return_value = synth
+        llm_client = MagicMock()
+        llm_client.complete.return_value = "Oi!"
+        return ChatService(research_repo, synths_repo, llm_client), synths_repo, llm_client
+
+    def _synth(self, nome: str = "Stephany Lima") -> SynthDetail:
+        return SynthDetail(
+            id="syn123",
+            nome=nome,
+            descricao="Uma dona de casa dedicada",
+            created_at=datetime(2025, 1, 1),
+            demografia=Demographics(idade=56),
+        )
+
+    def _request(self, message: str) -> ChatRequest:
+        return ChatRequest(exec_id="batch_test_123", message=message, chat_history=[])
+
+    def test_follow_up_messages_reuse_system_prompt(self):
+        """Second message skips the database and sends the same system prompt."""
+        research_repo = MagicMock()
+        research_repo.get_transcript.return_value = MagicMock(messages=[])
+        service, synths_repo, llm_client = self._service(self._synth(), research_repo)
+
+        service.generate_response("syn123", self._request("Oi!"))
+        service.generate_response("syn123", self._request("Tudo bem?"))
+
+        synths_repo.get_by_id.assert_called_once_with("syn123")
+        research_repo.get_transcript.assert_called_once_with("batch_test_123", "syn123")
+        first, second = (c.kwargs["messages"] for c in llm_client.complete.call_args_list)
+        assert first[0]["content"] == second[0]["content"]
+        assert first[0]["content"].startswith("Você é Stephany Lima")
+
+    def test_edited_synth_renders_new_prompt(self):
+        """A changed synth (new version) is rendered again once its version is re-read."""
+        from synth_lab.services.chat.service import ChatService
+        from synth_lab.services.persona_prompt_cache import PersonaPromptCache
+
+        research_repo = MagicMock()
+        research_repo.get_transcript.return_value = MagicMock(messages=[])
+        synths_repo = MagicMock()
+        synths_repo.get_by_id.side_effect = [self._synth(), self._synth(), self._synth("Ana Souza")]
+        llm_client = MagicMock()
+        llm_client.complete.return_value = "Oi!"
+        service = ChatService(
+            research_repo, synths_repo, llm_client,
+            prompt_cache=PersonaPromptCache(version_ttl_seconds=0))
+
+        for message in ["Oi!", "Tudo bem?", "E agora?"]:
+            service.generate_response("syn123", self._request(message))
+
+        prompts = [c.kwargs["messages"][0]["content"] for c in llm_client.complete.call_args_list]
+        assert prompts[0] == prompts[1]
+        assert "Ana Souza" in prompts[2]
+        assert research_repo.get_transcript.call_count == 2
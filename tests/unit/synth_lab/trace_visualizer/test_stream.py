@@ -0,0 +1,165 @@
+"""
+Unit tests for streaming trace persistence (.trace.jsonl).
+
+Tests validate:
+- Tracer(stream_path=...) appends steps and turns as they complete
+- max_retained_turns bounds the turns kept in memory; the file keeps all
+- TraceReader loads single turns lazily via the offset index
+- Index is rebuilt when missing
+- Interrupted traces (no end record) are still readable
+- load_trace() dispatches .jsonl files to the stream reader
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from synth_lab.trace_visualizer.models import SpanType
+from synth_lab.trace_visualizer.persistence import flush_pending_writes, load_trace
+from synth_lab.trace_visualizer.stream import INDEX_SUFFIX, TraceReader
+from synth_lab.trace_visualizer.tracer import Tracer
+
+
+def record_turns(tracer: Tracer, count: int) -> None:
+    """Record `count` turns with two steps each."""
+    for number in range(1, count + 1):
+        with tracer.start_turn(turn_number=number):
+            with tracer.start_span(SpanType.LLM_CALL, {"prompt": f"q{number}"}) as span:
+                span.set_attribute("response", f"a{number}")
+            with tracer.start_span(SpanType.TOOL_CALL, {"tool_name": "t"}):
+                pass
+
+
+class TestTraceStreamWriter:
+    """Tests for incremental writes from the Tracer."""
+
+    def test_steps_are_written_before_trace_ends(self, tmp_path: Path):
+        """Completed turns are on disk while the trace is still open."""
+        path = tmp_path / "conv.trace.jsonl"
+        tracer = Tracer(trace_id="conv-1", metadata={"k": "v"}, stream_path=str(path))
+        record_turns(tracer, 2)
+        flush_pending_writes()
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["record"] for r in records] == [
+            "trace", "step", "step", "turn", "step", "step", "turn",
+        ]
+        assert records[0]["trace_id"] == "conv-1"
+        assert records[0]["metadata"] == {"k": "v"}
+
+    def test_close_stream_writes_end_record(self, tmp_path: Path):
+        """close_stream() appends the end record."""
+        path = tmp_path / "conv.trace.jsonl"
+        tracer = Tracer(stream_path=str(path))
+        record_turns(tracer, 1)
+        tracer.close_stream().result()
+
+        last = json.loads(path.read_text().splitlines()[-1])
+        assert last["record"] == "end"
+        assert last["duration_ms"] == tracer.trace.duration_ms
+
+    def test_close_stream_without_stream_is_noop(self):
+        """Tracers without stream_path return None."""
+        assert Tracer().close_stream() is None
+
+
+class TestTracerRetainedTurns:
+    """Tests for the in-memory turn cap of streaming tracers."""
+
+    def test_old_turns_are_dropped_from_memory_but_streamed(self, tmp_path: Path):
+        """Only the last turns stay in memory; the file has every turn."""
+        path = tmp_path / "conv.trace.jsonl"
+        tracer = Tracer(stream_path=str(path), max_retained_turns=2)
+        record_turns(tracer, 5)
+        tracer.close_stream().result()
+
+        assert [t.turn_number for t in tracer.trace.turns] == [4, 5]
+        assert tracer.dropped_turns == 3
+        loaded = load_trace(str(path))
+        assert [t.turn_number for t in loaded.turns] == [1, 2, 3, 4, 5]
+        assert loaded.duration_ms == tracer.trace.duration_ms
+
+    def test_save_trace_refuses_partial_trace(self, tmp_path: Path):
+        """A tracer that dropped turns cannot save an incomplete JSON trace."""
+        tracer = Tracer(stream_path=str(tmp_path / "c.trace.jsonl"), max_retained_turns=1)
+        record_turns(tracer, 2)
+        with pytest.raises(RuntimeError, match="dropped"):
+            tracer.save_trace(str(tmp_path / "c.trace.json"))
+
+    def test_requires_stream_path(self):
+        """Dropping turns without a stream file would lose them."""
+        with pytest.raises(ValueError):
+            Tracer(max_retained_turns=2)
+
+
+class TestTraceReader:
+    """Tests for lazy reading of streamed traces."""
+
+    def test_load_single_turn(self, tmp_path: Path):
+        """A single turn is loaded with its steps."""
+        path = tmp_path / "conv.trace.jsonl"
+        tracer = Tracer(stream_path=str(path))
+        record_turns(tracer, 3)
+        tracer.close_stream().result()
+
+        reader = TraceReader(str(path))
+        assert reader.turn_numbers == [1, 2, 3]
+
+        turn = reader.load_turn(2)
+        assert turn.turn_number == 2
+        assert [s.type for s in turn.steps] == [SpanType.LLM_CALL, SpanType.TOOL_CALL]
+        assert turn.steps[0].attributes["response"] == "a2"
+
+    def test_unknown_turn_raises(self, tmp_path: Path):
+        """Missing turns raise KeyError."""
+        path = tmp_path / "conv.trace.jsonl"
+        tracer = Tracer(stream_path=str(path))
+        record_turns(tracer, 1)
+        tracer.close_stream().result()
+
+        with pytest.raises(KeyError):
+            TraceReader(str(path)).load_turn(5)
+
+    def test_load_trace_matches_tracer(self, tmp_path: Path):
+        """Full load reproduces the recorded trace."""
+        path = tmp_path / "conv.trace.jsonl"
+        tracer = Tracer(trace_id="conv-2", stream_path=str(path))
+        record_turns(tracer, 2)
+        tracer.close_stream().result()
+
+        loaded = load_trace(str(path))
+        assert loaded.trace_id == "conv-2"
+        assert loaded.duration_ms == tracer.trace.duration_ms
+        assert [t.to_dict() for t in loaded.turns] == [t.to_dict() for t in tracer.trace.turns]
+
+    def test_rebuilds_missing_index(self, tmp_path: Path):
+        """Without the sidecar index, turns are found by scanning."""
+        path = tmp_path / "conv.trace.jsonl"
+        tracer = Tracer(stream_path=str(path))
+        record_turns(tracer, 2)
+        tracer.close_stream().result()
+        Path(f"{path}{INDEX_SUFFIX}").unlink()
+
+        reader = TraceReader(str(path))
+        assert reader.turn_numbers == [1, 2]
+        assert reader.load_turn(1).steps[0].attributes["prompt"] == "q1"
+
+    def test_interrupted_trace_is_readable(self, tmp_path: Path):
+        """Traces without end record use the last turn's end time."""
+        path = tmp_path / "conv.trace.jsonl"
+        tracer = Tracer(stream_path=str(path))
+        record_turns(tracer, 2)
+        flush_pending_writes()
+
+        trace = TraceReader(str(path)).load_trace()
+        assert len(trace.turns) == 2
+        assert trace.end_time == tracer.trace.turns[-1].end_time
+
+    def test_rejects_plain_json(self, tmp_path: Path):
+        """Non-stream files are rejected."""
+        path = tmp_path / "conv.trace.jsonl"
+        path.write_text(json.dumps({"trace_id": "x"}) + "\n")
+
+        with pytest.raises(ValueError):
+            TraceReader(str(path))
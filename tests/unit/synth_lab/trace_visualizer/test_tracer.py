@@ -321,3 +321,61 @@ class TestTracerTraceProperty:
 
         # trace object itself should be accessible
         assert tracer.trace is not None
+
+
+class TestTracerBoundedAttributes:
+    """Test max_attribute_chars truncation."""
+
+    def test_long_attributes_are_truncated(self):
+        """String attributes longer than the limit are truncated."""
+        tracer = Tracer(max_attribute_chars=10)
+
+        with tracer.start_turn(turn_number=1):
+            with tracer.start_span(SpanType.LLM_CALL, {"request": "x" * 50}) as span:
+                span.set_attribute("response", "y" * 50)
+                span.set_attribute("tokens", 42)
+
+        attrs = tracer.trace.turns[0].steps[0].attributes
+        assert attrs["request"].startswith("x" * 10)
+        assert "truncated, 50 chars total" in attrs["request"]
+        assert "truncated, 50 chars total" in attrs["response"]
+        assert attrs["tokens"] == 42
+
+    def test_no_limit_by_default(self):
+        """Attributes are kept in full when no limit is configured."""
+        tracer = Tracer()
+
+        with tracer.start_turn(turn_number=1):
+            with tracer.start_span(SpanType.LLM_CALL, {"request": "x" * 50}):
+                pass
+
+        assert tracer.trace.turns[0].steps[0].attributes["request"] == "x" * 50
+
+
+class TestTracerSaveTraceAsync:
+    """Test Tracer.save_trace_async() background writes."""
+
+    def test_save_trace_async_writes_file(self):
+        """save_trace_async writes the trace in the background."""
+        tracer = Tracer(trace_id="async-trace")
+
+        with tracer.start_turn(turn_number=1):
+            pass
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "nested" / "async.trace.json"
+            tracer.save_trace_async(str(path)).result(timeout=5)
+
+            with open(path) as f:
+                data = json.load(f)
+            assert data["trace_id"] == "async-trace"
+
+    def test_save_trace_async_rejects_empty_trace(self):
+        """Empty traces are rejected like save_trace."""
+        tracer = Tracer()
+
+        try:
+            tracer.save_trace_async("unused.trace.json")
+            assert False, "Expected RuntimeError"
+        except RuntimeError:
+            pass